@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Measure how long cache_flush blocks Redis for other clients.
+
+Loads --keys keys under a throwaway project prefix, then flushes them two ways
+while a second connection sends PING in a loop, as another project would:
+
+- lua: the script the tool used to run (KEYS for the pattern, then DEL for
+  each key) in a single EVAL
+- tool: CacheFlushTool (templates/claude-daemon/tools/cache.py), which uses
+  SCAN steps and pipelined UNLINK, resuming with the cursor until done
+
+Reports the flush wall time and the PING latency seen during it; the max
+PING is the longest stretch Redis was unavailable to everyone else.
+
+Usage (as root on a HostKit VPS, with the Claude daemon's virtualenv):
+    /var/lib/hostkit/claude/venv/bin/python scripts/bench_claude_cache_flush.py \\
+        --keys 1000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "claude-daemon"
+sys.path.insert(0, str(TEMPLATE_DIR))
+
+import redis.asyncio as redis  # noqa: E402
+from config import settings  # noqa: E402
+from tools.cache import CacheFlushTool, close_redis  # noqa: E402
+
+PROJECT = "benchflush"
+
+LUA_FLUSH = """
+local keys = redis.call('KEYS', ARGV[1])
+local count = 0
+for i, key in ipairs(keys) do
+    redis.call('DEL', key)
+    count = count + 1
+end
+return count
+"""
+
+
+async def load_keys(client: redis.Redis, count: int) -> None:
+    for start in range(0, count, 10_000):
+        async with client.pipeline(transaction=False) as pipe:
+            for i in range(start, min(start + 10_000, count)):
+                pipe.set(f"{PROJECT}:session:{i}", "x" * 64)
+            await pipe.execute()
+
+
+async def ping_loop(client: redis.Redis, stop: asyncio.Event) -> list[float]:
+    timings = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.ping()
+        timings.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.001)
+    return timings
+
+
+async def flush_lua(client: redis.Redis) -> int:
+    return await client.eval(LUA_FLUSH, 0, f"{PROJECT}:*")
+
+
+async def flush_tool() -> int:
+    tool = CacheFlushTool()
+    result = await tool.execute(PROJECT, confirm=True)
+    flushed = result.data["flushed_count"]
+    while result.success and not result.data["complete"]:
+        result = await tool.execute(PROJECT, confirm=True, cursor=result.data["cursor"])
+        flushed += result.data["flushed_count"]
+    if not result.success:
+        raise SystemExit(f"cache_flush failed: {result.error}")
+    return flushed
+
+
+async def measure(mode: str, client: redis.Redis, prober: redis.Redis, keys: int) -> None:
+    await load_keys(client, keys)
+    stop = asyncio.Event()
+    pings = asyncio.create_task(ping_loop(prober, stop))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    flushed = await (flush_lua(client) if mode == "lua" else flush_tool())
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    timings = sorted(await pings)
+    p99 = timings[max(0, int(len(timings) * 0.99) - 1)]
+    print(
+        f"{mode:<5} {flushed:>9} {elapsed:9.2f} {statistics.median(timings):9.2f} "
+        f"{p99:9.2f} {timings[-1]:9.1f}"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    client = redis.Redis.from_url(settings.REDIS_URL)
+    prober = redis.Redis.from_url(settings.REDIS_URL)
+
+    print(f"{'Mode':<5} {'keys':>9} {'flush s':>9} {'ping p50':>9} {'ping p99':>9} {'max ms':>9}")
+    for mode in ("lua", "tool"):
+        await measure(mode, client, prober, args.keys)
+
+    await close_redis()
+    await client.aclose()
+    await prober.aclose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=1_000_000, help="Keys to load and flush")
+    asyncio.run(main_async(parser.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
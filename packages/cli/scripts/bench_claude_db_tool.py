@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Measure db_read tool latency in the Claude daemon.
+
+Runs the same queries against a project's database two ways:
+
+- psql: a psql process per call with unaligned tuples-only output, as the
+  tool used to run every query
+- pool: DatabaseReadTool (templates/claude-daemon/tools/database.py), which
+  uses a per-project asyncpg pool and a server-side cursor
+
+Two workloads:
+
+- small: a catalog lookup returning a few rows, repeated --calls times
+- large: a query that matches --large-rows rows, read with the tool's
+  default 100-row limit (psql has to receive and print every row)
+
+Usage (as root on a HostKit VPS, with the Claude daemon's virtualenv):
+    /var/lib/hostkit/claude/venv/bin/python scripts/bench_claude_db_tool.py \\
+        --project myapp --calls 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "claude-daemon"
+sys.path.insert(0, str(TEMPLATE_DIR))
+
+from tools.database import (  # noqa: E402
+    DatabaseReadTool,
+    close_project_pools,
+    project_dsn,
+)
+
+SMALL_QUERY = "SELECT relname, relkind FROM pg_class ORDER BY oid LIMIT 5"
+
+
+def large_query(rows: int) -> str:
+    return f"SELECT g, md5(g::text) FROM generate_series(1, {rows}) AS g LIMIT {rows}"
+
+
+async def run_psql(dsn: str, query: str) -> int:
+    process = await asyncio.create_subprocess_exec(
+        "psql",
+        dsn,
+        "-c",
+        query,
+        "--no-align",
+        "--tuples-only",
+        "--field-separator=|",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise SystemExit(f"psql failed: {stderr.decode().strip()}")
+    return len(stdout.decode().splitlines())
+
+
+async def run_tool(tool: DatabaseReadTool, project: str, query: str) -> int:
+    result = await tool.execute(project, query=query)
+    if not result.success:
+        raise SystemExit(f"db_read failed: {result.error}")
+    return result.data["row_count"]
+
+
+async def timed(calls: int, fn) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, mode: str, timings: list[float], rows: int) -> None:
+    timings.sort()
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"{name:<7} {mode:<5} {statistics.median(timings):9.2f} {p95:9.2f} "
+        f"{timings[-1]:9.2f} {rows:>8}"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    dsn = project_dsn(args.project)
+    tool = DatabaseReadTool()
+
+    print(f"{'Query':<7} {'Mode':<5} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'rows':>8}")
+
+    rows = await run_psql(dsn, SMALL_QUERY)
+    report("small", "psql", await timed(args.calls, lambda: run_psql(dsn, SMALL_QUERY)), rows)
+
+    # First call creates the project's pool; measure warm calls like a running daemon
+    rows = await run_tool(tool, args.project, SMALL_QUERY)
+    timings = await timed(args.calls, lambda: run_tool(tool, args.project, SMALL_QUERY))
+    report("small", "pool", timings, rows)
+
+    query = large_query(args.large_rows)
+    rows = await run_psql(dsn, query)
+    report("large", "psql", await timed(args.large_calls, lambda: run_psql(dsn, query)), rows)
+    rows = await run_tool(tool, args.project, query)
+    timings = await timed(args.large_calls, lambda: run_tool(tool, args.project, query))
+    report("large", "pool", timings, rows)
+
+    await close_project_pools()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--project", required=True, help="Project with a database")
+    parser.add_argument("--calls", type=int, default=200, help="Small query calls per mode")
+    parser.add_argument(
+        "--large-rows", type=int, default=1_000_000, help="Rows the large query matches"
+    )
+    parser.add_argument("--large-calls", type=int, default=5, help="Large query calls per mode")
+    asyncio.run(main_async(parser.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
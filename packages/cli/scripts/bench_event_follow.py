@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Compare `events list --follow` with repeated polling for watching events.
+
+A writer thread emits events for one project into a throwaway database at
+random intervals while a watcher waits for them, either:
+
+- polling: what agents do today, one `hostkit events list` (the page query
+  plus the total count) every --poll-interval seconds. Each poll is also a
+  full CLI start; the cost of one start is measured separately and shown.
+- follow: EventService.follow, the id-cursor tail behind `--follow`.
+
+Reports delivery latency (emit to watcher seeing the event), the number of
+statements run against the database (follow's include its cheap
+`PRAGMA data_version` checks), reads of the events table per second and the
+event rows fetched.
+
+Usage:
+    python3 scripts/bench_event_follow.py --events 40 --poll-interval 2
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import hostkit.database as database  # noqa: E402
+from hostkit.services.event_service import EventService  # noqa: E402
+
+PROJECT = "benchapp"
+
+
+class CountingDatabase(database.Database):
+    """Database that counts the statements it runs."""
+
+    def __init__(self, db_path: Path) -> None:
+        super().__init__(db_path=db_path)
+        self.statements = 0
+        self.event_reads = 0
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    def _trace(self, sql: str) -> None:
+        with self._lock:
+            self.statements += 1
+            if sql.lstrip().upper().startswith("SELECT") and "FROM EVENTS" in sql.upper():
+                self.event_reads += 1
+
+    def list_events(self, *args, **kwargs):
+        rows = super().list_events(*args, **kwargs)
+        self.rows += len(rows)
+        return rows
+
+    def list_events_since_id(self, *args, **kwargs):
+        rows = super().list_events_since_id(*args, **kwargs)
+        self.rows += len(rows)
+        return rows
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        with super().connection() as conn:
+            conn.set_trace_callback(self._trace)
+            yield conn
+
+
+def write_events(db_path: Path, count: int, max_gap: float, emitted: dict[int, float]) -> None:
+    writer = database.Database(db_path=db_path)
+    for i in range(count):
+        time.sleep(random.uniform(0.05, max_gap))
+        event_id = writer.create_event(PROJECT, "deploy", "started", f"event {i}")
+        emitted[event_id] = time.monotonic()
+
+
+def watch_polling(service: EventService, count: int, interval: float) -> dict[int, float]:
+    seen: dict[int, float] = {}
+    while len(seen) < count:
+        events = service.query(PROJECT, limit=50)
+        service.count(PROJECT)
+        now = time.monotonic()
+        for event in events:
+            seen.setdefault(event.id, now)
+        time.sleep(interval)
+    return seen
+
+
+def watch_follow(service: EventService, count: int) -> dict[int, float]:
+    seen: dict[int, float] = {}
+    for event in service.follow(PROJECT):
+        seen[event.id] = time.monotonic()
+        if len(seen) >= count:
+            break
+    return seen
+
+
+def run(mode: str, args: argparse.Namespace) -> tuple[list[float], CountingDatabase, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "hostkit.db"
+        db = CountingDatabase(db_path)
+        db.initialize()
+        db.create_project(name=PROJECT, port=8001)
+        database._db = db
+        db.statements = db.event_reads = db.rows = 0
+
+        service = EventService()
+        emitted: dict[int, float] = {}
+        writer = threading.Thread(
+            target=write_events, args=(db_path, args.events, args.max_gap, emitted)
+        )
+        started = time.monotonic()
+        writer.start()
+        if mode == "polling":
+            seen = watch_polling(service, args.events, args.poll_interval)
+        else:
+            seen = watch_follow(service, args.events)
+        elapsed = time.monotonic() - started
+        writer.join()
+
+    latencies = [(seen[i] - emitted[i]) * 1000 for i in emitted]
+    return latencies, db, elapsed
+
+
+def cli_start_ms() -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "hostkit", "--help"],
+        capture_output=True,
+        timeout=60,
+        cwd=Path(__file__).resolve().parent.parent / "src",
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=40, help="Events to emit")
+    parser.add_argument("--max-gap", type=float, default=0.5, help="Max seconds between events")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Polling interval")
+    args = parser.parse_args()
+
+    print(
+        f"{'Mode':<9} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}"
+        f" {'SQL':>6} {'reads/s':>8} {'rows':>6}"
+    )
+    for mode in ("polling", "follow"):
+        latencies, db, elapsed = run(mode, args)
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"{mode:<9} {statistics.median(latencies):8.1f} {p95:8.1f} {latencies[-1]:8.1f}"
+            f" {db.statements:>6} {db.event_reads / elapsed:8.2f} {db.rows:>6}"
+        )
+    print(f"\nEach poll via the CLI also pays one process start: {cli_start_ms():.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Measure the cost of reading systemd state in HostKit's list commands.
+
+Runs `hostkit service list`, `hostkit project list` and `hostkit status --vps`
+in-process against the live system and counts the processes forked for them.
+Each command is run twice:
+
+- batched: the shared systemd client (hostkit.systemd), one `systemctl show`
+  for all units a command needs, cached for the invocation
+- per-unit: the same client with batching and caching disabled, so every
+  lookup forks its own systemctl, as the services did before (they used 2-3
+  forks per unit: is-active, is-enabled and show)
+
+Usage (as root on a HostKit VPS):
+    python3 scripts/bench_systemd_state.py --rounds 5
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from click.testing import CliRunner  # noqa: E402
+
+import hostkit.systemd as systemd  # noqa: E402
+from hostkit.cli import cli  # noqa: E402
+
+COMMANDS = {
+    "service list": ["--json", "service", "list"],
+    "project list": ["--json", "project", "list"],
+    "status --vps": ["--json", "status", "--vps"],
+}
+
+
+class PerUnitClient(systemd.SystemdClient):
+    """One uncached systemctl call per unit lookup."""
+
+    def units(self, names):
+        return {
+            name: self._show([systemd.unit_name(name)])[systemd.unit_name(name)]
+            for name in dict.fromkeys(names)
+        }
+
+
+class ForkCounter:
+    """Counts processes started through subprocess."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.systemctl = 0
+        self._popen = subprocess.Popen
+
+    def __enter__(self) -> "ForkCounter":
+        counter = self
+        original = self._popen
+
+        class CountingPopen(original):  # type: ignore[misc, valid-type]
+            def __init__(self, args, *a, **kw):
+                counter.total += 1
+                argv = [args] if isinstance(args, str) else list(args)
+                if argv and Path(str(argv[0])).name == "systemctl":
+                    counter.systemctl += 1
+                super().__init__(args, *a, **kw)
+
+        subprocess.Popen = CountingPopen  # type: ignore[misc]
+        return self
+
+    def __exit__(self, *exc) -> None:
+        subprocess.Popen = self._popen  # type: ignore[misc]
+
+
+def run(args: list[str], client: systemd.SystemdClient) -> tuple[float, int, int]:
+    systemd._systemd = client
+    runner = CliRunner()
+    with ForkCounter() as forks:
+        started = time.perf_counter()
+        result = runner.invoke(cli, args)
+        elapsed = time.perf_counter() - started
+    if result.exit_code != 0:
+        raise SystemExit(f"hostkit {' '.join(args)} failed:\n{result.output}")
+    return elapsed, forks.total, forks.systemctl
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5, help="Runs per command and mode")
+    args = parser.parse_args()
+
+    print(f"{'Command':<14} {'Mode':<9} {'ms':>8} {'Forks':>6} {'systemctl':>10}")
+    for name, command in COMMANDS.items():
+        for mode, factory in (("per-unit", PerUnitClient), ("batched", systemd.SystemdClient)):
+            timings = []
+            for _ in range(args.rounds):
+                elapsed, forks, systemctl = run(command, factory())
+                timings.append(elapsed)
+            best = min(timings) * 1000
+            print(f"{name:<14} {mode:<9} {best:8.1f} {forks:>6} {systemctl:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
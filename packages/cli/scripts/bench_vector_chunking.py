@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Measure chunking throughput of the vector service on large markdown.
+
+Generates a synthetic markdown document (headers, paragraphs of varying
+length, lists, code blocks and a few very long unbroken lines) and runs
+ChunkingService.chunk_text over it. Reports MB/s and how much work went to
+the tokenizer: encode calls and characters encoded relative to the
+document size (1.0x means the text was tokenized exactly once).
+
+Usage (with the vector service's virtualenv, which has tiktoken):
+    /var/lib/hostkit/vector/venv/bin/python scripts/bench_vector_chunking.py --mb 1,4,16
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "vector"
+
+WORDS = (
+    "the vector service splits each document into chunks of roughly five hundred "
+    "tokens before embedding them and storing the results alongside metadata for "
+    "search queries ranked by cosine distance within a collection"
+).split()
+
+
+class CountingTokenizer:
+    """Wraps a tiktoken encoding and counts what gets encoded."""
+
+    def __init__(self, encoding):
+        self._encoding = encoding
+        self.calls = 0
+        self.chars = 0
+
+    def encode(self, text, *args, **kwargs):
+        self.calls += 1
+        self.chars += len(text)
+        return self._encoding.encode(text, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._encoding, name)
+
+
+def sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 30))]
+    return " ".join(words).capitalize() + rng.choice([".", ".", ".", "?", "!"])
+
+
+def make_markdown(size: int, rng: random.Random) -> str:
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        kind = rng.random()
+        if kind < 0.08:
+            part = "#" * rng.randint(1, 3) + " " + sentence(rng).rstrip(".?!")
+        elif kind < 0.18:
+            part = "\n".join(f"- {sentence(rng)}" for _ in range(rng.randint(2, 8)))
+        elif kind < 0.24:
+            code = "\n".join(
+                f"    result_{i} = compute(value_{i}, limit={rng.randint(1, 999)})"
+                for i in range(rng.randint(5, 40))
+            )
+            part = f"```python\n{code}\n```"
+        elif kind < 0.25:
+            # No sentence breaks: forces a split by token count
+            part = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1000, 4000)))
+        else:
+            part = " ".join(sentence(rng) for _ in range(rng.randint(1, 25)))
+        parts.append(part)
+        length += len(part) + 2
+    return "\n\n".join(parts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", default="1,4,16", help="Comma-separated document sizes in MB")
+    parser.add_argument("--target-tokens", type=int, default=500)
+    parser.add_argument("--overlap-tokens", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    sys.path.insert(0, str(TEMPLATE_DIR))
+    from services.chunking import ChunkingService
+
+    service = ChunkingService(
+        target_tokens=args.target_tokens, overlap_tokens=args.overlap_tokens
+    )
+    tokenizer = CountingTokenizer(service.tokenizer)
+    service.tokenizer = tokenizer
+
+    print(f"{'MB':>6} {'Seconds':>8} {'MB/s':>7} {'Chunks':>7} {'Tokens':>10} "
+          f"{'Encodes':>8} {'Encoded':>8}")
+    for mb in (float(size) for size in args.mb.split(",")):
+        text = make_markdown(int(mb * 1024 * 1024), random.Random(args.seed))
+        tokenizer.calls = tokenizer.chars = 0
+
+        started = time.perf_counter()
+        chunks = service.chunk_text(text)
+        elapsed = time.perf_counter() - started
+
+        tokens = sum(chunk.token_count for chunk in chunks)
+        print(
+            f"{mb:6.1f} {elapsed:8.2f} {mb / elapsed:7.2f} {len(chunks):>7} {tokens:>10} "
+            f"{tokenizer.calls:>8} {tokenizer.chars / len(text):7.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Measure embedding throughput of the vector service at several concurrencies.
+
+Runs EmbeddingService.embed_texts over a synthetic document against an
+in-process fake of the OpenAI embeddings endpoint, so no API key is used and
+nothing is billed. The fake answers after a fixed latency, sends
+x-ratelimit-* headers and enforces requests/tokens per minute with 429s the
+way the real API does, so the numbers show both the gain from concurrency
+and the pacing once the rate limit is the bottleneck.
+
+Usage (with the vector service's virtualenv, which has openai and httpx):
+    /var/lib/hostkit/vector/venv/bin/python scripts/bench_vector_embeddings.py \\
+        --chunks 1000 --latency-ms 300 --concurrency 1,2,4,8,16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "vector"
+
+
+class FakeEmbeddingsAPI:
+    """Sliding one-minute window rate limiter in front of canned embeddings."""
+
+    def __init__(self, latency: float, dims: int, rpm: int, tpm: int):
+        self.latency = latency
+        self.dims = dims
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window: list[tuple[float, int]] = []
+        self.requests = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _headers(self, now: float, used_requests: int, used_tokens: int) -> dict:
+        reset = 60 - (now - self.window[0][0]) if self.window else 0.0
+        return {
+            "x-ratelimit-limit-requests": str(self.rpm),
+            "x-ratelimit-limit-tokens": str(self.tpm),
+            "x-ratelimit-remaining-requests": str(max(0, self.rpm - used_requests)),
+            "x-ratelimit-remaining-tokens": str(max(0, self.tpm - used_tokens)),
+            "x-ratelimit-reset-requests": f"{max(reset, 0.0):.3f}s",
+            "x-ratelimit-reset-tokens": f"{max(reset, 0.0):.3f}s",
+        }
+
+    async def handle(self, request):
+        import httpx
+
+        body = json.loads(request.content)
+        inputs = body["input"]
+        # ~4 characters per token, like English text through cl100k
+        tokens = sum(max(1, len(text) // 4) for text in inputs)
+
+        now = time.monotonic()
+        self.window = [(t, n) for t, n in self.window if now - t < 60]
+        used_tokens = sum(n for _, n in self.window)
+        self.requests += 1
+        if len(self.window) + 1 > self.rpm or used_tokens + tokens > self.tpm:
+            self.rejected += 1
+            headers = self._headers(now, len(self.window), used_tokens)
+            return httpx.Response(
+                429,
+                headers=headers,
+                json={"error": {"message": "Rate limit reached", "type": "tokens"}},
+            )
+        self.window.append((now, tokens))
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        headers = self._headers(now, len(self.window), used_tokens + tokens)
+        data = [
+            {"object": "embedding", "index": i, "embedding": [0.0] * self.dims}
+            for i in range(len(inputs))
+        ]
+        return httpx.Response(
+            200,
+            headers=headers,
+            json={
+                "object": "list",
+                "data": data,
+                "model": body["model"],
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            },
+        )
+
+
+def make_texts(count: int, words: int) -> list[str]:
+    vocab = "the vector service splits documents into chunks and embeds each".split()
+    return [
+        " ".join(vocab[(i + j) % len(vocab)] for j in range(words)) + f" #{i}"
+        for i in range(count)
+    ]
+
+
+async def run(args: argparse.Namespace, concurrency: int, texts: list[str]) -> dict:
+    import httpx
+    import services.embedding as embedding
+    from openai import AsyncOpenAI
+
+    fake = FakeEmbeddingsAPI(args.latency_ms / 1000, args.dims, args.rpm, args.tpm)
+    # Fresh budget per run; it starts from the configured limits like a new worker
+    embedding._rate_limit_budget = None
+    service = embedding.EmbeddingService(max_concurrency=concurrency)
+    service.dimensions = args.dims
+    service.client = AsyncOpenAI(
+        api_key="bench",
+        base_url="http://fake-openai.invalid/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(fake.handle)),
+    )
+
+    started = time.perf_counter()
+    result = await service.embed_texts(texts, retry_count=10)
+    elapsed = time.perf_counter() - started
+    await service.client.close()
+
+    assert len(result.embeddings) == len(texts)
+    return {
+        "elapsed": elapsed,
+        "requests": fake.requests,
+        "rejected": fake.rejected,
+        "max_in_flight": fake.max_in_flight,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=1000, help="Chunks in the document")
+    parser.add_argument("--words", type=int, default=380, help="Words per chunk (~500 tokens)")
+    parser.add_argument("--latency-ms", type=float, default=300, help="Fake API latency")
+    parser.add_argument("--dims", type=int, default=1536, help="Embedding dimensions")
+    parser.add_argument("--rpm", type=int, default=3000, help="Fake API requests per minute")
+    parser.add_argument("--tpm", type=int, default=1000000, help="Fake API tokens per minute")
+    parser.add_argument(
+        "--concurrency", default="1,2,4,8,16", help="Comma-separated concurrency levels"
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    os.environ["OPENAI_RPM_LIMIT"] = str(args.rpm)
+    os.environ["OPENAI_TPM_LIMIT"] = str(args.tpm)
+    sys.path.insert(0, str(TEMPLATE_DIR))
+
+    texts = make_texts(args.chunks, args.words)
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    print(
+        f"{args.chunks} chunks, {args.latency_ms:.0f}ms latency, "
+        f"limits {args.rpm} RPM / {args.tpm} TPM"
+    )
+    print(f"\n{'Concurrency':>11} {'Seconds':>8} {'Chunks/s':>9} {'Requests':>9} "
+          f"{'429s':>5} {'Peak':>5}")
+    for level in levels:
+        stats = asyncio.run(run(args, level, texts))
+        print(
+            f"{level:>11} {stats['elapsed']:8.2f} {args.chunks / stats['elapsed']:9.0f} "
+            f"{stats['requests']:>9} {stats['rejected']:>5} {stats['max_in_flight']:>5}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
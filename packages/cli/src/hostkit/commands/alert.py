@@ -636,3 +636,34 @@ def unmute_alerts(ctx: click.Context, project: str, channel: str | None) -> None
     except AlertServiceError as e:
         formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
         raise SystemExit(1)
+
+
+@alert.command("dispatch")
+@click.option("--limit", default=100, show_default=True, help="Maximum deliveries per run")
+@click.pass_context
+def dispatch_alerts(ctx: click.Context, limit: int) -> None:
+    """Deliver queued alerts.
+
+    Alerts are queued when events happen and delivered by this command,
+    which is started in the background after each alert and by the metrics
+    timer every minute to retry failed deliveries.
+
+    \b
+    Examples:
+      hostkit alert dispatch
+    """
+    formatter = get_formatter(ctx)
+
+    try:
+        result = AlertService().dispatch(limit=limit)
+    except AlertServiceError as e:
+        formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
+        raise SystemExit(1)
+
+    if formatter.json_mode:
+        formatter.success(data=result, message=f"Delivered {result['delivered']} alert(s)")
+    else:
+        click.echo(
+            f"Delivered {result['delivered']}, retrying {result['retrying']}, "
+            f"failed {result['failed']}"
+        )
@@ -833,8 +833,7 @@ def auth_sync(ctx: click.Context, project: str) -> None:
                 suggestion="Try disabling and re-enabling auth",
             )
 
-        auth_port = config.port
-        auth_url = f"http://127.0.0.1:{auth_port}"
+        auth_url = service.internal_auth_url(project, config.port)
 
         # Get external URL from domains
         db = get_db()
@@ -2,7 +2,7 @@
 
 import click
 
-from hostkit.access import project_owner
+from hostkit.access import project_owner, root_only
 from hostkit.output import OutputFormatter
 from hostkit.services.auto_pause_service import AutoPauseError, AutoPauseService
 
@@ -45,6 +45,11 @@ def autopause() -> None:
       hostkit autopause show myapp
       hostkit autopause set myapp --enabled --threshold 5 --window 10m
       hostkit autopause set myapp --disabled
+
+    \b
+    Idle suspend (scale-to-zero):
+      hostkit autopause idle myapp --enable --after 30m
+      hostkit autopause idle myapp --disable
     """
     pass
 
@@ -81,6 +86,7 @@ def show_config(ctx: click.Context, project: str) -> None:
                         "paused_at": config.paused_at,
                         "paused_reason": config.paused_reason,
                     },
+                    "idle": service.get_idle_status(project),
                 },
                 message="Auto-pause configuration retrieved",
             )
@@ -108,6 +114,9 @@ def show_config(ctx: click.Context, project: str) -> None:
             else:
                 click.echo(f"  {click.style('Running', fg='green')}")
 
+            if config.idle_suspend:
+                _echo_idle_status(service.get_idle_status(project))
+
             click.echo()
 
     except AutoPauseError as e:
@@ -202,3 +211,167 @@ def set_config(
     except AutoPauseError as e:
         formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
         raise SystemExit(1)
+
+
+def _echo_idle_status(status: dict) -> None:
+    """Print idle suspend state and cold start statistics."""
+    click.echo()
+    click.echo(click.style("Idle Suspend:", bold=True))
+    click.echo(f"  Suspend after:  {status['idle_minutes']} minutes without requests")
+    click.echo(f"  Last activity:  {status['last_activity_at'] or '-'}")
+    for unit in status["units"]:
+        state = click.style("running", fg="green") if unit["running"] else "suspended"
+        click.echo(f"  {unit['unit']:<32} :{unit['port']:<6} {state}")
+
+    cold = status["cold_starts"]
+    if cold["count_7d"]:
+        click.echo(
+            f"  Cold starts (7d): {cold['count_7d']}, "
+            f"p50 {cold['p50_ms']}ms, p95 {cold['p95_ms']}ms, max {cold['max_ms']}ms"
+        )
+    else:
+        click.echo("  Cold starts (7d): none")
+
+
+@autopause.command("idle")
+@click.argument("project")
+@click.option("--enable/--disable", "enable", default=None, help="Turn idle suspend on or off")
+@click.option("--after", "after_str", help="Idle time before suspending (e.g., 30m, 2h)")
+@click.pass_context
+@project_owner("project")
+def idle_config(
+    ctx: click.Context, project: str, enable: bool | None, after_str: str | None
+) -> None:
+    """Suspend a project's services while it receives no traffic.
+
+    The app and its auth/payment/sms/booking/chatbot services are stopped
+    after a period without requests in the Nginx access log and started again
+    by systemd socket activation on the next connection. The first request
+    after a suspend waits for the service to start (cold start); cold start
+    times are recorded and shown by 'hostkit autopause show'.
+
+    Apps must listen on the port given in the PORT environment variable.
+
+    \b
+    Examples:
+      hostkit autopause idle myapp --enable
+      hostkit autopause idle myapp --enable --after 2h
+      hostkit autopause idle myapp --disable
+      hostkit autopause idle myapp              # Show idle status
+    """
+    formatter = get_formatter(ctx)
+
+    idle_minutes = None
+    try:
+        if after_str:
+            idle_minutes = parse_duration(after_str)
+    except ValueError as e:
+        formatter.error(
+            code="INVALID_DURATION",
+            message=f"Invalid duration format: {e}",
+            suggestion="Use format: 30m, 1h, or just a number for minutes",
+        )
+        raise SystemExit(1)
+
+    try:
+        service = AutoPauseService()
+
+        if enable is True:
+            result = service.enable_idle_suspend(project, idle_minutes=idle_minutes)
+            message = f"Idle suspend enabled for '{project}'"
+        elif enable is False:
+            result = service.disable_idle_suspend(project)
+            message = f"Idle suspend disabled for '{project}'"
+        else:
+            if idle_minutes is not None:
+                service.set_idle_minutes(project, idle_minutes)
+            result = service.get_idle_status(project)
+            message = f"Idle suspend status for '{project}'"
+
+        if formatter.json_mode:
+            formatter.success(data=result, message=message)
+            return
+
+        click.echo(click.style(f"\n{message}", fg="green", bold=True))
+        if enable is None:
+            if result["idle_suspend"]:
+                _echo_idle_status(result)
+            else:
+                click.echo(f"  Not enabled. Run 'hostkit autopause idle {project} --enable'")
+        else:
+            for unit in result["units"]:
+                click.echo(f"  {unit['unit']:<32} :{unit['port']}")
+            if enable:
+                click.echo(
+                    f"\nServices stop after {result['idle_minutes']} minutes without requests "
+                    "and start on the next connection."
+                )
+        click.echo()
+
+    except AutoPauseError as e:
+        formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
+        raise SystemExit(1)
+
+
+@autopause.command("idle-check")
+@click.argument("project", required=False)
+@click.option("--all", "check_all", is_flag=True, help="Check all idle-suspend projects")
+@click.pass_context
+@root_only
+def idle_check(ctx: click.Context, project: str | None, check_all: bool) -> None:
+    """Stop services of projects that have been idle too long.
+
+    Runs every minute from the hostkit-metrics timer.
+
+    \b
+    Examples:
+      hostkit autopause idle-check --all
+      hostkit autopause idle-check myapp
+    """
+    formatter = get_formatter(ctx)
+
+    if not project and not check_all:
+        formatter.error(
+            code="NO_PROJECT",
+            message="Specify a project or --all",
+            suggestion="hostkit autopause idle-check --all",
+        )
+        raise SystemExit(1)
+
+    try:
+        service = AutoPauseService()
+        results = service.check_all_idle() if check_all else [service.check_idle(project)]
+    except AutoPauseError as e:
+        formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
+        raise SystemExit(1)
+
+    suspended = [r for r in results if r["action"] == "suspended"]
+    if formatter.json_mode:
+        formatter.success(
+            data={"results": results, "suspended": len(suspended)},
+            message=f"Checked {len(results)} project(s), suspended {len(suspended)}",
+        )
+    else:
+        for result in suspended:
+            click.echo(f"Suspended {result['project']}: {', '.join(result['units'])}")
+        click.echo(f"Checked {len(results)} project(s), suspended {len(suspended)}")
+
+
+@autopause.command("wake-wait", hidden=True)
+@click.argument("project")
+@click.argument("unit")
+@click.argument("internal_port", type=int)
+@click.pass_context
+@root_only
+def wake_wait(ctx: click.Context, project: str, unit: str, internal_port: int) -> None:
+    """Wait for a socket-activated service to come up (wake proxy ExecStartPre)."""
+    formatter = get_formatter(ctx)
+
+    try:
+        duration_ms = AutoPauseService().wait_for_wake(project, unit, internal_port)
+    except AutoPauseError as e:
+        formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
+        raise SystemExit(1)
+
+    if duration_ms is not None:
+        click.echo(f"{unit} cold start: {duration_ms}ms")
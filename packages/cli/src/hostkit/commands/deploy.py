@@ -305,6 +305,17 @@ def deploy(
         if hasattr(result, "iron_session_installed") and result.iron_session_installed:
             data["iron_session_installed"] = True
 
+        # Add timing and dependency cache info
+        timings = {}
+        if getattr(result, "duration_ms", None) is not None:
+            timings["total_ms"] = result.duration_ms
+        if getattr(result, "dependency_install_ms", None) is not None:
+            timings["dependencies_ms"] = result.dependency_install_ms
+        if timings:
+            data["timings"] = timings
+        if getattr(result, "dependency_cache", None):
+            data["dependency_cache"] = result.dependency_cache
+
         # Build status message
         status_parts = [f"Deployed to {target_label}"]
         if hasattr(result, "build_type") and result.build_type:
@@ -314,7 +325,13 @@ def deploy(
         if hasattr(result, "app_built") and result.app_built:
             status_parts.append("built")
         if result.dependencies_installed:
-            status_parts.append("dependencies installed")
+            deps_part = "dependencies installed"
+            if getattr(result, "dependency_install_ms", None) is not None:
+                deps_detail = f"{result.dependency_install_ms / 1000:.1f}s"
+                if getattr(result, "dependency_cache", None):
+                    deps_detail = f"cache {result.dependency_cache}, {deps_detail}"
+                deps_part += f" ({deps_detail})"
+            status_parts.append(deps_part)
         if hasattr(result, "iron_session_installed") and result.iron_session_installed:
             status_parts.append("iron-session added")
         if result.secrets_injected:
@@ -32,6 +32,7 @@ def docs_index(ctx: click.Context, force: bool) -> None:
 
     Parses CLAUDE.md and capabilities output into semantic chunks,
     then indexes them in the vector store for AI agent queries.
+    Only new and changed chunks are embedded; removed ones are deleted.
 
     Example:
         hostkit docs index           # Build index
@@ -55,9 +56,13 @@ def docs_index(ctx: click.Context, force: bool) -> None:
             click.echo("\nDocumentation Index Complete")
             click.echo("-" * 40)
             click.echo(f"  Total chunks: {result['chunks_total']}")
-            click.echo(f"  Ingested: {result['chunks_ingested']}")
+            click.echo(f"  Embedded: {result['chunks_ingested']}")
+            click.echo(f"  Unchanged: {result['chunks_unchanged']}")
+            if result["chunks_removed"] > 0:
+                click.echo(f"  Removed: {result['chunks_removed']}")
             if result["chunks_errors"] > 0:
                 click.echo(f"  Errors: {result['chunks_errors']}")
+            click.echo(f"  Tokens used: {result['tokens_used']}")
             click.echo("\n  Sources:")
             click.echo(f"    CLAUDE.md: {result['sources']['claude_md']} chunks")
             click.echo(f"    Capabilities: {result['sources']['capabilities']} chunks")
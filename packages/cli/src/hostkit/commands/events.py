@@ -1,10 +1,12 @@
 """Events command for HostKit CLI."""
 
+import json
+
 import click
 
 from hostkit.access import project_access
 from hostkit.output import OutputFormatter
-from hostkit.services.event_service import EventService, EventServiceError
+from hostkit.services.event_service import Event, EventService, EventServiceError
 
 
 @click.group(name="events")
@@ -36,6 +38,18 @@ def events(ctx: click.Context) -> None:
 @click.option("--until", help="Show events until time")
 @click.option("-n", "--limit", default=50, help="Maximum events to show")
 @click.option("--offset", default=0, help="Skip first N events")
+@click.option(
+    "--after-id",
+    type=int,
+    help="Show events after this event id (use the last id of the previous page)",
+)
+@click.option(
+    "-f",
+    "--follow",
+    is_flag=True,
+    help="Stream new events as they happen (NDJSON with --json)",
+)
+@click.option("--timeout", type=float, help="With --follow, stop after N seconds")
 @click.pass_context
 @project_access("project")
 def list_events(
@@ -47,9 +61,16 @@ def list_events(
     until: str | None,
     limit: int,
     offset: int,
+    after_id: int | None,
+    follow: bool,
+    timeout: float | None,
 ) -> None:
     """List events for a project.
 
+    With --follow, prints events as they are written instead (starting after
+    --after-id if given, otherwise with the next new event). --category and
+    --level still apply. In JSON mode each event is one line of JSON.
+
     Examples:
         hostkit events list myapp
         hostkit events list myapp --category deploy
@@ -58,10 +79,16 @@ def list_events(
         hostkit events list myapp --since 1h
         hostkit events list myapp --since 24h --category deploy
         hostkit events list myapp --since "2025-12-15" --until "2025-12-16"
+        hostkit events list myapp --after-id 1234
+        hostkit events list myapp --follow --category deploy
     """
     formatter: OutputFormatter = ctx.obj["formatter"]
     service = EventService()
 
+    if follow:
+        _follow_events(ctx, service, project, category, level, after_id, timeout)
+        return
+
     try:
         events_list = service.query(
             project_name=project,
@@ -71,6 +98,7 @@ def list_events(
             until=until,
             limit=limit,
             offset=offset,
+            after_id=after_id,
         )
 
         total_count = service.count(
@@ -93,6 +121,7 @@ def list_events(
                     },
                     "total_count": total_count,
                     "returned_count": len(events_list),
+                    "next_after_id": (events_list[-1].id if len(events_list) == limit else None),
                     "events": [e.to_dict() for e in events_list],
                 },
                 message=f"Retrieved {len(events_list)} events",
@@ -108,30 +137,67 @@ def list_events(
             click.echo("-" * 80)
 
             for event in events_list:
-                # Format timestamp
-                timestamp = event.created_at[:19] if event.created_at else ""
+                _echo_event(event, verbose=ctx.obj.get("verbose", False))
 
-                # Color by level
-                level_color = _get_level_color(event.level)
+            if len(events_list) == limit:
+                click.echo()
+                click.echo(f"More: hostkit events list {project} --after-id {events_list[-1].id}")
 
-                # Build event line
-                click.echo(
-                    f"{timestamp} "
-                    f"[{click.style(event.level.ljust(8), fg=level_color)}] "
-                    f"[{event.category.ljust(10)}] "
-                    f"{event.message}"
-                )
+    except EventServiceError as e:
+        formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
 
-                # Show data if present and in verbose mode
-                if event.data and ctx.obj.get("verbose"):
-                    import json
 
-                    click.echo(f"                              Data: {json.dumps(event.data)}")
+def _follow_events(
+    ctx: click.Context,
+    service: EventService,
+    project: str,
+    category: str | None,
+    level: str | None,
+    after_id: int | None,
+    timeout: float | None,
+) -> None:
+    """Stream events for `events list --follow`."""
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    json_mode = ctx.obj.get("json_mode")
+
+    if not json_mode:
+        click.echo(f"Following events for {project}... (Ctrl+C to stop)")
 
+    try:
+        for event in service.follow(
+            project_name=project,
+            category=category,
+            level=level.upper() if level else None,
+            after_id=after_id,
+            timeout=timeout,
+        ):
+            if json_mode:
+                click.echo(json.dumps(event.to_dict()))
+            else:
+                _echo_event(event, verbose=ctx.obj.get("verbose", False))
+    except KeyboardInterrupt:
+        pass
     except EventServiceError as e:
         formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
 
 
+def _echo_event(event: Event, verbose: bool = False) -> None:
+    """Print one event as a log line."""
+    timestamp = event.created_at[:19] if event.created_at else ""
+    level_color = _get_level_color(event.level)
+
+    click.echo(
+        f"{timestamp} "
+        f"[{click.style(event.level.ljust(8), fg=level_color)}] "
+        f"[{event.category.ljust(10)}] "
+        f"{event.message}"
+    )
+
+    # Show data if present and in verbose mode
+    if event.data and verbose:
+        click.echo(f"                              Data: {json.dumps(event.data)}")
+
+
 @events.command(name="show")
 @click.argument("event_id", type=int)
 @click.pass_context
@@ -172,8 +238,6 @@ def show_event(ctx: click.Context, event_id: int) -> None:
         if event.data:
             click.echo()
             click.echo("  Data:")
-            import json
-
             for key, value in event.data.items():
                 if isinstance(value, (dict, list)):
                     value = json.dumps(value)
@@ -196,46 +260,10 @@ def event_stats(ctx: click.Context, project: str, since: str) -> None:
     service = EventService()
 
     try:
-        # Get counts by category
-        categories = [
-            "deploy",
-            "health",
-            "auth",
-            "migrate",
-            "cron",
-            "worker",
-            "service",
-            "checkpoint",
-            "alert",
-            "sandbox",
-            "environment",
-            "project",
-        ]
-        stats = {}
-
-        for cat in categories:
-            count = service.count(project_name=project, category=cat, since=since)
-            if count > 0:
-                stats[cat] = count
-
-        # Get counts by level
-        levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        level_stats = {}
-        for level in levels:
-            # Count events at exactly this level (not "and above")
-            count = service.count(project_name=project, level=level, since=since)
-            # Subtract counts from higher levels to get exact count
-            level_stats[level] = count
-
-        # Calculate exact level counts (the DB query gives "level and above")
-        exact_level_counts = {}
-        for i, level in enumerate(levels):
-            if i == len(levels) - 1:
-                exact_level_counts[level] = level_stats[level]
-            else:
-                exact_level_counts[level] = level_stats[level] - level_stats[levels[i + 1]]
-
-        total = service.count(project_name=project, since=since)
+        result = service.stats(project_name=project, since=since)
+        total = result["total_events"]
+        stats = result["by_category"]
+        exact_level_counts = result["by_level"]
 
         if ctx.obj.get("json_mode"):
             formatter.success(
@@ -263,8 +291,7 @@ def event_stats(ctx: click.Context, project: str, since: str) -> None:
 
             click.echo()
             click.echo("  By level:")
-            for level in levels:
-                count = exact_level_counts[level]
+            for level, count in exact_level_counts.items():
                 if count > 0:
                     color = _get_level_color(level)
                     click.echo(f"    {click.style(level.ljust(8), fg=color)}: {count}")
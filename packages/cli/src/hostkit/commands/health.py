@@ -1,13 +1,19 @@
 """Health check command for HostKit projects."""
 
 import sys
+from collections.abc import Callable
 from datetime import datetime
 
 import click
 
-from hostkit.access import project_access
+from hostkit.access import AccessDeniedError, require_project_access, require_root
 from hostkit.services.alert_service import AlertService
-from hostkit.services.health_service import HealthCheck, HealthService, HealthServiceError
+from hostkit.services.health_service import (
+    FleetReport,
+    HealthCheck,
+    HealthService,
+    HealthServiceError,
+)
 
 
 def _format_status(status: str) -> str:
@@ -119,8 +125,45 @@ def _print_watch_line(health: HealthCheck) -> None:
     click.echo("  ".join(parts))
 
 
+def _print_fleet_report(report: FleetReport) -> None:
+    """Print a fleet health report as a table."""
+    click.echo(f"\nHealth Check for {len(report.checks)} projects")
+    click.echo("=" * 70)
+    click.echo(f"{'PROJECT':<24} {'STATUS':<10} {'HTTP':>5} {'TIME':>8} {'PROCESS':>8} {'DB':>4}")
+
+    for health in report.checks:
+        http = str(health.http_status) if health.http_status else "ERR"
+        response = f"{health.http_response_ms:.0f}ms" if health.http_response_ms else "-"
+        database = {True: "ok", False: "fail", None: "-"}[health.database_connected]
+        # Pad outside the color codes so columns line up
+        status = _format_status(health.overall) + " " * (10 - len(health.overall))
+        click.echo(
+            f"{health.project:<24} {status} "
+            f"{http:>5} {response:>8} {'up' if health.process_running else 'down':>8} "
+            f"{database:>4}"
+        )
+
+    click.echo()
+    click.echo(_fleet_summary(report))
+
+
+def _fleet_summary(report: FleetReport) -> str:
+    """One line with the number of projects per status."""
+    counts = report.summary
+    return (
+        f"{counts['healthy']} healthy, {counts['degraded']} degraded, "
+        f"{counts['unhealthy']} unhealthy ({report.duration_ms:.0f}ms)"
+    )
+
+
 @click.command("health")
-@click.argument("project")
+@click.argument("project", required=False)
+@click.option(
+    "--all",
+    "check_all",
+    is_flag=True,
+    help="Check every project concurrently (root only)",
+)
 @click.option(
     "--endpoint",
     "-e",
@@ -147,6 +190,12 @@ def _print_watch_line(health: HealthCheck) -> None:
     default=10,
     help="HTTP timeout in seconds (default: 10)",
 )
+@click.option(
+    "--jitter",
+    type=float,
+    default=0,
+    help="With --all --watch, add up to N random seconds to each interval",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -160,14 +209,15 @@ def _print_watch_line(health: HealthCheck) -> None:
     help="Send alerts to configured channels on health check failure",
 )
 @click.pass_context
-@project_access("project")
 def health(
     ctx: click.Context,
-    project: str,
+    project: str | None,
+    check_all: bool,
     endpoint: str,
     watch_interval: int | None,
     expect: str | None,
     timeout: int,
+    jitter: float,
     verbose: bool,
     alert_on_failure: bool,
 ) -> None:
@@ -182,6 +232,11 @@ def health(
     With --alert-on-failure, sends notifications to configured alert channels
     when the health check fails (unhealthy status).
 
+    With --all, checks every project at once and prints one report. Each
+    project gets --timeout seconds, so the whole check takes about as long as
+    the slowest project. With --watch, every round is also recorded in
+    hostkit.db (health_samples).
+
     Examples:
         hostkit health myapp
         hostkit health myapp --endpoint /api/health
@@ -189,16 +244,29 @@ def health(
         hostkit health myapp --expect "ok"
         hostkit health myapp --verbose
         hostkit health myapp --alert-on-failure
+        hostkit health --all
+        hostkit health --all --watch 60 --jitter 10
     """
     formatter = ctx.obj.get("formatter")
     json_mode = ctx.obj.get("json_mode", False)
 
+    if bool(project) == check_all:
+        raise click.UsageError("Give a PROJECT or --all")
+
+    try:
+        if project:
+            require_project_access(project)
+        else:
+            require_root()
+    except AccessDeniedError as e:
+        formatter.error(code="ACCESS_DENIED", message=e.message, suggestion=e.suggestion)
+        raise SystemExit(1)
+
     service = HealthService()
     alert_service = AlertService() if alert_on_failure else None
 
-    # Track previous state for watch mode to avoid alert spam
-    # Using a list to allow modification in nested functions
-    state = {"last_status": None}
+    # Track previous state per project for watch mode to avoid alert spam
+    last_status: dict[str, str] = {}
 
     def _send_health_alert(health_result: HealthCheck) -> None:
         """Send alert for health check failure."""
@@ -218,10 +286,11 @@ def health(
 
         try:
             alert_service.send_alert(
-                project_name=project,
+                project_name=health_result.project,
                 event_type="health",
                 event_status="failure",
                 data=data,
+                dedup_key=f"{endpoint}:{health_result.overall}",
             )
         except Exception:
             # Don't fail health check if alert fails
@@ -242,16 +311,35 @@ def health(
 
         try:
             alert_service.send_alert(
-                project_name=project,
+                project_name=health_result.project,
                 event_type="health",
                 event_status="success",
                 data=data,
+                dedup_key=endpoint,
             )
         except Exception:
             pass
 
+    def _alert_on_change(health_result: HealthCheck) -> str | None:
+        """Send an alert when a project becomes or stops being unhealthy."""
+        if not alert_on_failure:
+            return None
+        last = last_status.get(health_result.project)
+        last_status[health_result.project] = health_result.overall
+        if health_result.overall == "unhealthy" and last != "unhealthy":
+            _send_health_alert(health_result)
+            return "failure"
+        if health_result.overall != "unhealthy" and last == "unhealthy":
+            _send_recovery_alert(health_result)
+            return "recovery"
+        return None
+
     try:
-        if watch_interval:
+        if check_all:
+            _check_fleet(
+                ctx, service, endpoint, watch_interval, jitter, timeout, expect, _alert_on_change
+            )
+        elif watch_interval:
             # Watch mode
             if json_mode:
                 # In JSON mode, output each check as a JSON line
@@ -270,14 +358,7 @@ def health(
 
                             click.echo(json.dumps(health_result.to_dict()))
 
-                        # Send alerts on state change
-                        if alert_on_failure:
-                            last = state["last_status"]
-                            if health_result.overall == "unhealthy" and last != "unhealthy":
-                                _send_health_alert(health_result)
-                            elif health_result.overall != "unhealthy" and last == "unhealthy":
-                                _send_recovery_alert(health_result)
-                            state["last_status"] = health_result.overall
+                        _alert_on_change(health_result)
                 except KeyboardInterrupt:
                     pass
             else:
@@ -293,16 +374,11 @@ def health(
                     ):
                         _print_watch_line(health_result)
 
-                        # Send alerts on state change
-                        if alert_on_failure:
-                            last = state["last_status"]
-                            if health_result.overall == "unhealthy" and last != "unhealthy":
-                                _send_health_alert(health_result)
-                                click.echo(click.style("  → Alert sent", fg="yellow"))
-                            elif health_result.overall != "unhealthy" and last == "unhealthy":
-                                _send_recovery_alert(health_result)
-                                click.echo(click.style("  → Recovery alert sent", fg="green"))
-                            state["last_status"] = health_result.overall
+                        change = _alert_on_change(health_result)
+                        if change == "failure":
+                            click.echo(click.style("  → Alert sent", fg="yellow"))
+                        elif change == "recovery":
+                            click.echo(click.style("  → Recovery alert sent", fg="green"))
                 except KeyboardInterrupt:
                     click.echo("\nStopped watching.")
         else:
@@ -338,3 +414,51 @@ def health(
         if formatter:
             formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
         raise click.ClickException(e.message)
+
+
+def _check_fleet(
+    ctx: click.Context,
+    service: HealthService,
+    endpoint: str,
+    watch_interval: int | None,
+    jitter: float,
+    timeout: int,
+    expect: str | None,
+    alert_on_change: Callable[[HealthCheck], str | None],
+) -> None:
+    """Run `health --all`, once or continuously."""
+    formatter = ctx.obj.get("formatter")
+    json_mode = ctx.obj.get("json_mode", False)
+    options = {"endpoint": endpoint, "timeout": timeout, "expected_content": expect}
+
+    if not watch_interval:
+        report = service.check_fleet(**options)
+        for health_result in report.checks:
+            if health_result.overall == "unhealthy":
+                alert_on_change(health_result)
+
+        if json_mode:
+            formatter.success(data=report.to_dict(), message=_fleet_summary(report))
+        else:
+            _print_fleet_report(report)
+
+        if report.summary["unhealthy"]:
+            sys.exit(1)
+        return
+
+    if not json_mode:
+        _print_watch_header()
+    try:
+        for report in service.watch_fleet(interval=watch_interval, jitter=jitter, **options):
+            if json_mode:
+                formatter.success(data=report.to_dict(), message=_fleet_summary(report))
+            else:
+                timestamp = datetime.now().strftime("%H:%M:%S")
+                click.echo(f"[{timestamp}] {len(report.checks)} projects: {_fleet_summary(report)}")
+            for health_result in report.checks:
+                if not json_mode and health_result.overall != "healthy":
+                    _print_watch_line(health_result)
+                alert_on_change(health_result)
+    except KeyboardInterrupt:
+        if not json_mode:
+            click.echo("\nStopped watching.")
@@ -139,6 +139,54 @@ def payments_status(ctx: click.Context, project: str) -> None:
         raise SystemExit(1)
 
 
+@payments.command("replay-webhooks")
+@click.argument("project")
+@click.option("--event-id", "event_ids", multiple=True, help="Stripe event ID (repeatable)")
+@click.option("--since", default=None, help="Events received within a window (e.g. 1h, 7d)")
+@click.option("--type", "event_type", default=None, help="Only this event type")
+@click.pass_context
+@project_owner("project")
+def payments_replay_webhooks(
+    ctx: click.Context,
+    project: str,
+    event_ids: tuple[str, ...],
+    since: str | None,
+    event_type: str | None,
+) -> None:
+    """Re-process stored Stripe webhook events.
+
+    Webhook events are stored on receipt and applied in the background.
+    Without options, events that failed repeatedly are re-queued. With
+    --event-id or --since, already processed events are applied again
+    (handlers are idempotent). The payment service picks re-queued events
+    up within 30 seconds.
+
+    Example:
+        hostkit payments replay-webhooks myapp
+        hostkit payments replay-webhooks myapp --event-id evt_123
+        hostkit payments replay-webhooks myapp --since 24h --type charge.refunded
+    """
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    service = PaymentService()
+
+    try:
+        result = service.replay_webhook_events(
+            project=project,
+            event_ids=list(event_ids) or None,
+            since=since,
+            event_type=event_type,
+        )
+
+        formatter.success(
+            message=f"Re-queued {result['requeued']} webhook event(s) for '{project}'",
+            data=result,
+        )
+
+    except PaymentServiceError as e:
+        formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
+        raise SystemExit(1)
+
+
 @payments.command("logs")
 @click.argument("project")
 @click.option("--lines", "-n", default=100, help="Number of lines to show (default: 100)")
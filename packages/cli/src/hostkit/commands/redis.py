@@ -2,8 +2,15 @@
 
 import click
 
-from hostkit.output import OutputFormatter, format_uptime
-from hostkit.services.redis_service import RedisService, RedisServiceError
+from hostkit.output import OutputFormatter, format_bytes, format_uptime
+from hostkit.services.redis_service import (
+    PROFILE_MAX_OPS,
+    PROFILE_MAX_SAMPLES,
+    PROFILE_SCAN_COUNT,
+    PROFILE_TIME_BUDGET,
+    RedisService,
+    RedisServiceError,
+)
 
 
 @click.group()
@@ -131,6 +138,135 @@ def redis_keys(ctx: click.Context, project: str, pattern: str, limit: int) -> No
         raise SystemExit(1)
 
 
+@redis.command("profile")
+@click.argument("project")
+@click.option(
+    "--samples",
+    default=PROFILE_MAX_SAMPLES,
+    show_default=True,
+    help="Keys to sample for MEMORY USAGE, TYPE and TTL",
+)
+@click.option(
+    "--depth",
+    default=1,
+    show_default=True,
+    help="Key segments (split on ':') that make up a prefix",
+)
+@click.option("--top", default=20, show_default=True, help="Prefixes and big keys to show")
+@click.option(
+    "--big-key-kb",
+    default=1024,
+    show_default=True,
+    help="Flag sampled keys using at least this many KB",
+)
+@click.option(
+    "--budget",
+    default=PROFILE_TIME_BUDGET,
+    show_default=True,
+    help="Seconds to spend scanning before estimating from what was seen",
+)
+@click.option(
+    "--max-ops",
+    default=PROFILE_MAX_OPS,
+    show_default=True,
+    help="Redis commands per second the profiler may send",
+)
+@click.option(
+    "--scan-count",
+    default=PROFILE_SCAN_COUNT,
+    show_default=True,
+    help="Keys per SCAN step",
+)
+@click.pass_context
+def redis_profile(
+    ctx: click.Context,
+    project: str,
+    samples: int,
+    depth: int,
+    top: int,
+    big_key_kb: int,
+    budget: float,
+    max_ops: int,
+    scan_count: int,
+) -> None:
+    """Show which key prefixes use memory in a project's Redis database.
+
+    Scans the database in small SCAN steps, samples keys for MEMORY USAGE,
+    TYPE and TTL, and estimates memory per key prefix with 95% bounds.
+    Flags prefixes whose keys mostly have no TTL, and big keys. The scan is
+    paced and time-limited so it never holds up other projects.
+
+    Example:
+        hostkit redis profile myapp
+        hostkit redis profile myapp --depth 2 --top 10
+        hostkit redis profile myapp --samples 50000 --budget 60
+    """
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    service = RedisService()
+
+    try:
+        result = service.profile(
+            project,
+            max_samples=samples,
+            scan_count=scan_count,
+            time_budget=budget,
+            max_ops=max_ops,
+            depth=depth,
+            big_key_bytes=big_key_kb * 1024,
+            top=top,
+        )
+    except RedisServiceError as e:
+        formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
+        raise SystemExit(1)
+
+    if ctx.obj["json_mode"]:
+        formatter.success(message=f"Redis memory profile for '{project}'", data=result)
+        return
+
+    click.echo(f"\nRedis Memory Profile for '{project}' (db{result['redis_db']})")
+    click.echo("=" * 72)
+    coverage = "complete" if result["scan_complete"] else "stopped at time budget"
+    click.echo(
+        f"  Keys:        {result['total_keys']} "
+        f"({result['scanned_keys']} scanned, {coverage}; {result['sampled_keys']} sampled)"
+    )
+    click.echo(
+        f"  Memory:      ~{format_bytes(result['estimated_memory_bytes'])} "
+        f"({format_bytes(result['estimated_memory_low'])} - "
+        f"{format_bytes(result['estimated_memory_high'])}, 95%)"
+    )
+    click.echo(f"  Instance:    {format_bytes(result['instance_used_memory'])} used in total")
+    click.echo(f"  No TTL:      ~{result['estimated_no_ttl_keys']} key(s)")
+    click.echo(f"  Took:        {result['elapsed_ms']} ms, {result['commands']} command(s)")
+
+    if result["prefixes"]:
+        click.echo(f"\n  {'PREFIX':<28} {'KEYS':>9} {'MEMORY':>11} {'95% RANGE':>23} {'SHARE':>6}")
+        click.echo("  " + "-" * 80)
+        for row in result["prefixes"]:
+            if row["memory_low"] is None:
+                bounds = f"({row['sampled']} sampled)"
+            else:
+                bounds = f"{format_bytes(row['memory_low'])} - {format_bytes(row['memory_high'])}"
+            click.echo(
+                f"  {row['prefix'][:28]:<28} {row['keys']:>9} "
+                f"{format_bytes(row['memory_bytes']):>11} {bounds:>23} {row['share_pct']:>5}%"
+            )
+        if result["prefix_count"] > len(result["prefixes"]):
+            click.echo(f"  ... {result['prefix_count'] - len(result['prefixes'])} more prefix(es)")
+
+    if result["big_keys"]:
+        click.echo("\nBig Keys (sampled):")
+        click.echo("-" * 50)
+        for key in result["big_keys"]:
+            ttl = f"ttl {key['ttl_seconds']}s" if key["ttl_seconds"] is not None else "no ttl"
+            click.echo(f"  {key['key']}  {key['type']}  {format_bytes(key['memory_bytes'])}  {ttl}")
+
+    if result["warnings"]:
+        click.echo("\nWarnings:")
+        for warning in result["warnings"]:
+            click.echo(f"  ! {warning}")
+
+
 @redis.command("flush")
 @click.argument("project")
 @click.option("--force", is_flag=True, help="Confirm flushing all keys")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import subprocess
 from typing import TYPE_CHECKING, Any
 
 import click
@@ -10,6 +9,7 @@ import psutil
 
 from hostkit.database import get_db
 from hostkit.output import OutputFormatter, format_bytes, format_uptime
+from hostkit.systemd import get_systemd
 
 if TYPE_CHECKING:
     from hostkit.services.resource_service import (
@@ -40,17 +40,7 @@ def get_system_info() -> dict[str, Any]:
 
 def get_service_status(service_name: str) -> str:
     """Get systemd service status."""
-    try:
-        result = subprocess.run(
-            ["systemctl", "is-active", service_name],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        status = result.stdout.strip()
-        return status if status else "unknown"
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return "unknown"
+    return get_systemd().unit(service_name).active_state
 
 
 def get_services_status() -> dict[str, str]:
@@ -61,7 +51,8 @@ def get_services_status() -> dict[str, str]:
         "nginx": "nginx",
     }
 
-    return {name: get_service_status(systemd_name) for name, systemd_name in services.items()}
+    units = get_systemd().units(services.values())
+    return {name: units[systemd_name].active_state for name, systemd_name in services.items()}
 
 
 def get_projects_summary() -> dict[str, Any]:
@@ -1,15 +1,35 @@
 """Pre-deployment validation command for HostKit projects."""
 
+import queue
 import subprocess
+import threading
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import click
 
-from hostkit.access import project_access
+from hostkit.access import AccessDeniedError, require_project_access, require_root
 from hostkit.database import get_db
 from hostkit.output import OutputFormatter
+from hostkit.systemd import get_systemd
+
+# Seconds a single check may run before it is reported as timed out
+CHECK_TIMEOUT = 10
+
+# Threads shared by every check of every project in one run
+VALIDATE_WORKERS = 16
+
+# Service name -> directory in the project home that marks it enabled
+SERVICE_DIRS = {
+    "auth": ".auth",
+    "payments": ".payments",
+    "sms": ".sms",
+    "booking": ".booking",
+    "chatbot": ".chatbot",
+}
 
 
 @dataclass
@@ -41,6 +61,8 @@ class ValidationResult:
     issues: list[ValidationIssue] = field(default_factory=list)
     checks_passed: list[str] = field(default_factory=list)
     runtime: str | None = None
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    duration_ms: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -51,18 +73,139 @@ class ValidationResult:
             "issues": [i.to_dict() for i in self.issues],
             "error_count": sum(1 for i in self.issues if i.severity == "error"),
             "warning_count": sum(1 for i in self.issues if i.severity == "warning"),
+            "timings_ms": {name: round(ms, 1) for name, ms in self.timings_ms.items()},
+            "duration_ms": round(self.duration_ms, 1),
         }
 
 
+@dataclass
+class FleetValidation:
+    """Validation results for every project, from one concurrent run."""
+
+    results: list[ValidationResult]
+    duration_ms: float
+
+    @property
+    def summary(self) -> dict[str, int]:
+        return {
+            "total": len(self.results),
+            "valid": sum(1 for r in self.results if r.valid),
+            "invalid": sum(1 for r in self.results if not r.valid),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "projects": [r.to_dict() for r in self.results],
+            "summary": self.summary,
+            "duration_ms": round(self.duration_ms, 1),
+        }
+
+
+class HostLookups:
+    """Host-wide lookups made at most once per run and shared by all checks."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._listeners: dict[int, str] | None = None
+        self._listeners_loaded = False
+
+    def listeners(self) -> dict[int, str] | None:
+        """Listening TCP sockets by port, or None if ss is unavailable."""
+        with self._lock:
+            if not self._listeners_loaded:
+                self._listeners = _listening_sockets()
+                self._listeners_loaded = True
+            return self._listeners
+
+
+@dataclass
+class ValidationContext:
+    """Everything the checks need about one project, looked up once."""
+
+    project: str
+    runtime: str
+    port: int
+    home: Path
+    services: list[str]
+    env_vars: dict[str, str] | None  # None when .env is missing or unreadable
+    env_error: str | None  # "missing" or "permission"
+    lookups: HostLookups
+
+
 def _get_project_home(project_name: str) -> Path:
     """Get the home directory for a project."""
     return Path(f"/home/{project_name}")
 
 
-def _check_entrypoint(project_name: str, runtime: str, home: Path) -> list[ValidationIssue]:
+def _read_env(home: Path) -> tuple[dict[str, str] | None, str | None]:
+    """Parse the project's .env file. Returns (vars, error)."""
+    env_file = home / ".env"
+    if not env_file.exists():
+        return None, "missing"
+
+    env_vars = {}
+    try:
+        with open(env_file) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#") and "=" in line:
+                    key, _, value = line.partition("=")
+                    env_vars[key.strip()] = value.strip()
+    except PermissionError:
+        return None, "permission"
+    return env_vars, None
+
+
+def _listening_sockets() -> dict[int, str] | None:
+    """Listening TCP sockets by local port, from a single `ss` call."""
+    try:
+        result = subprocess.run(
+            ["ss", "-tlnpH"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+
+    listeners: dict[int, str] = {}
+    for line in result.stdout.splitlines():
+        fields = line.split()
+        if len(fields) < 4:
+            continue
+        _, _, port = fields[3].rpartition(":")
+        if port.isdigit():
+            listeners.setdefault(int(port), line)
+    return listeners
+
+
+def _build_context(project: dict[str, Any], lookups: HostLookups) -> ValidationContext:
+    """Look up what the checks need for one project."""
+    name = project["name"]
+    home = _get_project_home(name)
+    env_vars, env_error = _read_env(home)
+    return ValidationContext(
+        project=name,
+        runtime=project.get("runtime", "python"),
+        port=project.get("port", 8000),
+        home=home,
+        services=[s for s, dirname in SERVICE_DIRS.items() if (home / dirname).exists()],
+        env_vars=env_vars,
+        env_error=env_error,
+        lookups=lookups,
+    )
+
+
+def _unit_names(ctx: ValidationContext) -> list[str]:
+    """Systemd units the checks read for a project."""
+    return [f"hostkit-{ctx.project}"] + [f"hostkit-{ctx.project}-{s}" for s in ctx.services]
+
+
+def _check_entrypoint(ctx: ValidationContext) -> list[ValidationIssue]:
     """Check that the app entrypoint exists."""
     issues = []
-    app_path = home / "app"
+    runtime = ctx.runtime
+    app_path = ctx.home / "app"
 
     if not app_path.exists():
         issues.append(
@@ -148,9 +291,10 @@ def _check_entrypoint(project_name: str, runtime: str, home: Path) -> list[Valid
     return issues
 
 
-def _check_dependencies(project_name: str, runtime: str, home: Path) -> list[ValidationIssue]:
+def _check_dependencies(ctx: ValidationContext) -> list[ValidationIssue]:
     """Check that dependencies are installed."""
     issues = []
+    runtime, home = ctx.runtime, ctx.home
     app_path = home / "app"
 
     if runtime == "python":
@@ -223,35 +367,25 @@ def _check_dependencies(project_name: str, runtime: str, home: Path) -> list[Val
     return issues
 
 
-def _check_env_vars(
-    project_name: str, runtime: str, home: Path, services: list[str]
-) -> list[ValidationIssue]:
+def _check_env_vars(ctx: ValidationContext) -> list[ValidationIssue]:
     """Check that required environment variables are set."""
     issues = []
-    env_file = home / ".env"
+    services = ctx.services
+    env_vars = ctx.env_vars
 
-    if not env_file.exists():
+    if ctx.env_error == "missing":
         issues.append(
             ValidationIssue(
                 category="env",
                 severity="error",
                 message=".env file not found",
                 suggestion="Create .env file with required variables",
-                details={"expected": str(env_file)},
+                details={"expected": str(ctx.home / ".env")},
             )
         )
         return issues
 
-    # Parse .env file
-    env_vars = {}
-    try:
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, value = line.partition("=")
-                    env_vars[key.strip()] = value.strip()
-    except PermissionError:
+    if env_vars is None:
         issues.append(
             ValidationIssue(
                 category="env",
@@ -338,29 +472,13 @@ def _check_env_vars(
     return issues
 
 
-def _check_database(project_name: str) -> list[ValidationIssue]:
+def _check_database(ctx: ValidationContext) -> list[ValidationIssue]:
     """Check database connectivity and migrations."""
     issues = []
-    db = get_db()
-    project = db.get_project(project_name)
-
-    if not project:
-        return issues
+    project_name = ctx.project
 
     # Check if project has a database configured in .env
-    home = _get_project_home(project_name)
-    env_file = home / ".env"
-    has_database_url = False
-
-    if env_file.exists():
-        try:
-            with open(env_file) as f:
-                content = f.read()
-                has_database_url = "DATABASE_URL" in content
-        except PermissionError:
-            pass
-
-    if not has_database_url:
+    if not ctx.env_vars or "DATABASE_URL" not in ctx.env_vars:
         # No database configured - this is fine, just informational
         return issues
 
@@ -429,104 +547,176 @@ def _check_database(project_name: str) -> list[ValidationIssue]:
     return issues
 
 
-def _check_port(project_name: str, port: int) -> list[ValidationIssue]:
+def _check_port(ctx: ValidationContext) -> list[ValidationIssue]:
     """Check for port conflicts."""
     issues = []
 
-    # First check if this project's service is running
-    # If it is, skip the port check since the project itself is using the port
-    try:
-        result = subprocess.run(
-            ["systemctl", "is-active", f"hostkit-{project_name}"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.stdout.strip() == "active":
-            # Service is running, port is expected to be in use
-            return issues
-    except (subprocess.SubprocessError, FileNotFoundError):
-        pass
+    # If the project's service is running, the port is expected to be in use
+    if get_systemd().unit(f"hostkit-{ctx.project}").is_active:
+        return issues
+
+    # ss not available, skip check
+    listeners = ctx.lookups.listeners()
+    if listeners is None:
+        return issues
 
     # Check if port is in use by another process (project is not running)
-    try:
-        result = subprocess.run(
-            ["ss", "-tlnp", f"sport = {port}"],
-            capture_output=True,
-            text=True,
-            timeout=5,
+    listener = listeners.get(ctx.port)
+    if listener:
+        issues.append(
+            ValidationIssue(
+                category="port",
+                severity="error",
+                message=f"Port {ctx.port} is in use by another process",
+                suggestion="Check for conflicting services or change the project port",
+                details={"port": ctx.port, "process": listener[:200]},
+            )
         )
 
-        output = result.stdout.strip()
-        # If there's any output beyond the header, the port is in use
-        lines = [line for line in output.split("\n") if line and not line.startswith("State")]
-        if lines:
+    return issues
+
+
+def _check_services(ctx: ValidationContext) -> list[ValidationIssue]:
+    """Check that enabled services are running."""
+    issues = []
+    project_name = ctx.project
+
+    for service in ctx.services:
+        unit = get_systemd().unit(f"hostkit-{project_name}-{service}")
+        status = unit.active_state
+        # "unknown": systemctl unavailable
+        if status not in ("active", "activating", "unknown"):
             issues.append(
                 ValidationIssue(
-                    category="port",
-                    severity="error",
-                    message=f"Port {port} is in use by another process",
-                    suggestion="Check for conflicting services or change the project port",
-                    details={"port": port, "process": lines[0][:200]},
+                    category="services",
+                    severity="warning",
+                    message=f"{service.capitalize()} service is not running",
+                    suggestion=(
+                        f"Start with 'hostkit service start {project_name} --service {service}'"
+                    ),
+                    details={"service": service, "status": status},
                 )
             )
-    except (subprocess.SubprocessError, FileNotFoundError):
-        # ss not available, skip check
-        pass
 
     return issues
 
 
-def _check_services(project_name: str, home: Path) -> tuple[list[str], list[ValidationIssue]]:
-    """Check enabled services and return list of enabled services."""
-    issues = []
-    services = []
-
-    # Check for service directories
-    service_dirs = {
-        "auth": ".auth",
-        "payments": ".payments",
-        "sms": ".sms",
-        "booking": ".booking",
-        "chatbot": ".chatbot",
-    }
+# Checks run for every project; each is independent of the others
+CHECKS: list[tuple[str, Callable[[ValidationContext], list[ValidationIssue]]]] = [
+    ("services", _check_services),
+    ("entrypoint", _check_entrypoint),
+    ("dependencies", _check_dependencies),
+    ("port", _check_port),
+    ("database", _check_database),
+    ("env", _check_env_vars),
+]
+
 
-    for service, dirname in service_dirs.items():
-        service_path = home / dirname
-        if service_path.exists():
-            services.append(service)
+def _run_checks(
+    contexts: list[ValidationContext], timeout: float, workers: int
+) -> list[ValidationResult]:
+    """Run every check of every project concurrently on shared worker threads.
 
-            # Check service health
-            service_name = f"hostkit-{project_name}-{service}"
+    Each check gets `timeout` seconds from when it starts; one that runs
+    longer is reported as timed out and abandoned. Workers are daemon
+    threads, so an abandoned check (a hung psql, ss or systemctl) does not
+    keep the process alive, and a replacement worker takes its place.
+    """
+    run_started = time.monotonic()
+    tasks: queue.SimpleQueue = queue.SimpleQueue()
+    done: queue.SimpleQueue = queue.SimpleQueue()
+    started: dict[tuple[str, str], float] = {}
+    outcomes: dict[tuple[str, str], tuple[list[ValidationIssue], bool, float]] = {}
+    finished: dict[str, float] = {}
+
+    for ctx in contexts:
+        for name, check_fn in CHECKS:
+            tasks.put(((ctx.project, name), check_fn, ctx))
+    total = len(contexts) * len(CHECKS)
+
+    def worker() -> None:
+        while True:
             try:
-                result = subprocess.run(
-                    ["systemctl", "is-active", service_name],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                status = result.stdout.strip()
-                if status not in ("active", "activating"):
-                    issues.append(
-                        ValidationIssue(
-                            category="services",
-                            severity="warning",
-                            message=f"{service.capitalize()} service is not running",
-                            suggestion=(
-                                f"Start with 'hostkit service start"
-                                f" {project_name}"
-                                f" --service {service}'"
-                            ),
-                            details={"service": service, "status": status},
-                        )
+                key, check_fn, ctx = tasks.get_nowait()
+            except queue.Empty:
+                return
+            started[key] = time.monotonic()
+            try:
+                done.put((key, check_fn(ctx), None))
+            except Exception as e:
+                done.put((key, None, e))
+
+    def start_worker() -> None:
+        threading.Thread(target=worker, name="validate", daemon=True).start()
+
+    def record(key: tuple[str, str], issues: list[ValidationIssue], ok: bool) -> None:
+        now = time.monotonic()
+        outcomes[key] = (issues, ok, (now - started.get(key, now)) * 1000)
+        finished[key[0]] = (now - run_started) * 1000
+
+    for _ in range(min(workers, total)):
+        start_worker()
+
+    while len(outcomes) < total:
+        running = [(key, at) for key, at in list(started.items()) if key not in outcomes]
+        deadlines = [at + timeout for _, at in running]
+        wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else timeout
+        try:
+            key, issues, error = done.get(timeout=wait_for)
+        except queue.Empty:
+            pass
+        else:
+            # A check that already timed out keeps its timeout result
+            if key not in outcomes:
+                if error is None:
+                    record(key, issues, True)
+                else:
+                    issue = ValidationIssue(
+                        category=key[1],
+                        severity="warning",
+                        message=f"Check failed unexpectedly: {str(error)[:100]}",
                     )
-            except (subprocess.SubprocessError, FileNotFoundError):
-                pass
+                    record(key, [issue], False)
+
+        now = time.monotonic()
+        for key, at in running:
+            if key not in outcomes and now - at >= timeout:
+                issue = ValidationIssue(
+                    category=key[1],
+                    severity="warning",
+                    message=f"Check timed out after {timeout:g}s",
+                    suggestion="Run 'hostkit validate' again or raise --timeout",
+                )
+                record(key, [issue], False)
+                # The stuck worker is lost; keep the pool at full size
+                start_worker()
+
+    results = []
+    for ctx in contexts:
+        result = ValidationResult(project=ctx.project, valid=True, runtime=ctx.runtime)
+        for name, _ in CHECKS:
+            issues, ok, duration_ms = outcomes[(ctx.project, name)]
+            result.issues.extend(issues)
+            result.timings_ms[name] = duration_ms
+
+            # Check if this check passed (no errors)
+            has_errors = any(i.severity == "error" and i.category == name for i in issues)
+            if ok and not has_errors:
+                result.checks_passed.append(name)
+
+        # Determine overall validity (no errors)
+        result.valid = not any(i.severity == "error" for i in result.issues)
+        result.duration_ms = finished.get(ctx.project, 0.0)
+        results.append(result)
+    return results
 
-    return services, issues
 
+def _prefetch_units(contexts: list[ValidationContext]) -> None:
+    """Read every unit the checks need with one `systemctl show`."""
+    get_systemd().units(name for ctx in contexts for name in _unit_names(ctx))
 
-def validate_project(project_name: str) -> ValidationResult:
+
+def validate_project(project_name: str, timeout: float = CHECK_TIMEOUT) -> ValidationResult:
     """Run all validation checks for a project."""
     db = get_db()
     project = db.get_project(project_name)
@@ -543,49 +733,22 @@ def validate_project(project_name: str) -> ValidationResult:
         )
         return result
 
-    runtime = project.get("runtime", "python")
-    port = project.get("port", 8000)
-    home = _get_project_home(project_name)
-
-    result = ValidationResult(project=project_name, valid=True, runtime=runtime)
-
-    # Run checks
-    checks = [
-        ("entrypoint", lambda: _check_entrypoint(project_name, runtime, home)),
-        ("dependencies", lambda: _check_dependencies(project_name, runtime, home)),
-        ("port", lambda: _check_port(project_name, port)),
-        ("database", lambda: _check_database(project_name)),
-    ]
+    ctx = _build_context(project, HostLookups())
+    _prefetch_units([ctx])
+    return _run_checks([ctx], timeout, workers=len(CHECKS))[0]
 
-    # Get services and add service-specific checks
-    services, service_issues = _check_services(project_name, home)
-    result.issues.extend(service_issues)
 
-    # Add env check with service info
-    checks.append(("env", lambda: _check_env_vars(project_name, runtime, home, services)))
-
-    for check_name, check_fn in checks:
-        try:
-            issues = check_fn()
-            result.issues.extend(issues)
-
-            # Check if this check passed (no errors)
-            has_errors = any(i.severity == "error" and i.category == check_name for i in issues)
-            if not has_errors:
-                result.checks_passed.append(check_name)
-        except Exception as e:
-            result.issues.append(
-                ValidationIssue(
-                    category=check_name,
-                    severity="warning",
-                    message=f"Check failed unexpectedly: {str(e)[:100]}",
-                )
-            )
-
-    # Determine overall validity (no errors)
-    result.valid = not any(i.severity == "error" for i in result.issues)
-
-    return result
+def validate_all(
+    timeout: float = CHECK_TIMEOUT, workers: int = VALIDATE_WORKERS
+) -> FleetValidation:
+    """Validate every project at once, sharing host-wide lookups."""
+    started = time.monotonic()
+    lookups = HostLookups()
+    projects = sorted(get_db().list_projects(), key=lambda p: p["name"])
+    contexts = [_build_context(project, lookups) for project in projects]
+    _prefetch_units(contexts)
+    results = _run_checks(contexts, timeout, workers) if contexts else []
+    return FleetValidation(results=results, duration_ms=(time.monotonic() - started) * 1000)
 
 
 def _format_severity(severity: str) -> str:
@@ -672,22 +835,97 @@ def _print_validation(result: ValidationResult) -> None:
 
     if summary_parts:
         click.echo(f"Summary: {', '.join(summary_parts)}")
+    _print_timings(result)
 
     if not result.valid:
         click.echo()
         click.echo("Fix the errors above before deploying.")
 
 
+def _print_timings(result: ValidationResult) -> None:
+    """Print how long the checks took."""
+    if not result.timings_ms:
+        return
+    slowest = max(result.timings_ms, key=result.timings_ms.get)
+    click.echo(
+        f"Checked in {result.duration_ms:.0f}ms "
+        f"(slowest: {slowest} {result.timings_ms[slowest]:.0f}ms)"
+    )
+
+
+def _print_fleet(fleet: FleetValidation) -> None:
+    """Print the consolidated `validate --all` report."""
+    summary = fleet.summary
+    valid = click.style(f"{summary['valid']} valid", fg="green")
+    invalid = click.style(f"{summary['invalid']} invalid", fg="red" if summary["invalid"] else None)
+    click.echo()
+    click.echo(
+        f"Validation: {summary['total']} project(s)  {valid}, {invalid}"
+        f"  ({fleet.duration_ms:.0f}ms)"
+    )
+    click.echo()
+
+    if not fleet.results:
+        click.echo("No projects found.")
+        return
+
+    click.echo(f"  {'PROJECT':<24} {'STATUS':<9} {'ERRORS':>6} {'WARNINGS':>8}  SLOWEST CHECK")
+    click.echo("  " + "-" * 72)
+    for result in fleet.results:
+        errors = sum(1 for i in result.issues if i.severity == "error")
+        warnings = sum(1 for i in result.issues if i.severity == "warning")
+        status = click.style(
+            f"{'VALID' if result.valid else 'INVALID':<9}", fg="green" if result.valid else "red"
+        )
+        slowest = max(result.timings_ms, key=result.timings_ms.get)
+        click.echo(
+            f"  {result.project:<24} {status} {errors:>6} {warnings:>8}  "
+            f"{slowest} {result.timings_ms[slowest]:.0f}ms"
+        )
+
+    invalid = [r for r in fleet.results if not r.valid]
+    if invalid:
+        click.echo()
+        click.echo(click.style("Errors:", fg="red", bold=True))
+        for result in invalid:
+            for issue in result.issues:
+                if issue.severity != "error":
+                    continue
+                click.echo(f"  {result.project}: {issue.message}")
+                if issue.suggestion:
+                    click.echo(f"    → {click.style(issue.suggestion, fg='cyan')}")
+        click.echo()
+        click.echo("Run 'hostkit validate <project>' for the full report on a project.")
+
+
 @click.command("validate")
-@click.argument("project")
+@click.argument("project", required=False)
+@click.option(
+    "--all",
+    "validate_every",
+    is_flag=True,
+    help="Validate every project concurrently (root only)",
+)
+@click.option(
+    "--timeout",
+    type=float,
+    default=CHECK_TIMEOUT,
+    show_default=True,
+    help="Seconds each check may run before it is reported as timed out",
+)
 @click.option(
     "--fix",
     is_flag=True,
     help="Attempt to auto-fix common issues (coming soon)",
 )
 @click.pass_context
-@project_access("project")
-def validate(ctx: click.Context, project: str, fix: bool) -> None:
+def validate(
+    ctx: click.Context,
+    project: str | None,
+    validate_every: bool,
+    timeout: float,
+    fix: bool,
+) -> None:
     """Validate a project before deployment.
 
     Runs pre-flight checks to catch common issues:
@@ -700,14 +938,44 @@ def validate(ctx: click.Context, project: str, fix: bool) -> None:
     - Port: No conflicts with other services
     - Services: Enabled services are running
 
+    The checks run concurrently, each limited to --timeout seconds. With
+    --all, every project is validated at once and summarized in one report.
+
     \b
     Examples:
         hostkit validate myapp           # Run all checks
         hostkit --json validate myapp    # JSON output for automation
+        hostkit validate --all           # Every project, one report
     """
     formatter: OutputFormatter = ctx.obj["formatter"]
 
-    result = validate_project(project)
+    if bool(project) == validate_every:
+        raise click.UsageError("Give a PROJECT or --all")
+
+    try:
+        if project:
+            require_project_access(project)
+        else:
+            require_root()
+    except AccessDeniedError as e:
+        formatter.error(code="ACCESS_DENIED", message=e.message, suggestion=e.suggestion)
+        raise SystemExit(1)
+
+    if validate_every:
+        fleet = validate_all(timeout=timeout)
+        if formatter.json_mode:
+            summary = fleet.summary
+            formatter.success(
+                data=fleet.to_dict(),
+                message=f"Validated {summary['total']} project(s): {summary['invalid']} invalid",
+            )
+        else:
+            _print_fleet(fleet)
+        if fleet.summary["invalid"]:
+            raise SystemExit(1)
+        return
+
+    result = validate_project(project, timeout=timeout)
 
     if formatter.json_mode:
         formatter.success(data=result.to_dict(), message="Validation complete")
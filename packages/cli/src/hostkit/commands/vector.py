@@ -8,7 +8,7 @@ import sys
 import click
 
 from hostkit.access import project_access, project_owner, root_only
-from hostkit.output import OutputFormatter
+from hostkit.output import OutputFormatter, format_bytes
 from hostkit.services.vector_service import VectorService, VectorServiceError
 
 
@@ -407,6 +407,56 @@ def vector_collection_info(ctx: click.Context, project: str, collection: str) ->
         raise SystemExit(1)
 
 
+@vector.command("indexes")
+@click.argument("project")
+@click.pass_context
+@project_access("project")
+def vector_indexes(ctx: click.Context, project: str) -> None:
+    """Show vector index health for a project.
+
+    Each collection above the size threshold should have its own HNSW
+    index; smaller collections are searched exactly. Indexes are built
+    and retuned by the vector worker after ingestion.
+
+    Example:
+        hostkit vector indexes myapp
+    """
+    formatter: OutputFormatter = ctx.obj["formatter"]
+    service = VectorService()
+
+    try:
+        result = service.get_index_health(project)
+
+        if ctx.obj["json_mode"]:
+            formatter.success(
+                message=f"Vector indexes for '{project}'",
+                data=result,
+            )
+        else:
+            click.echo(f"\nVector Indexes: {project}")
+            click.echo(f"  pgvector: {result['pgvector_version'] or 'not installed'}")
+            click.echo(f"  Exact search below {result['min_rows']:,} chunks")
+            click.echo("-" * 90)
+            click.echo(
+                f"{'COLLECTION':<25} {'CHUNKS':>10} {'M/EF_C':>8} {'SIZE':>10} "
+                f"{'SCANS':>8}  {'STATUS'}"
+            )
+            click.echo("-" * 90)
+            for c in result["collections"]:
+                params = f"{c['m']}/{c['ef_construction']}" if c["m"] else "-"
+                size = format_bytes(c["size_bytes"]) if c["index"] else "-"
+                click.echo(
+                    f"{c['collection']:<25} {c['chunks']:>10,} {params:>8} {size:>10} "
+                    f"{c['scans']:>8}  {c['status']}"
+                )
+            for warning in result["warnings"]:
+                click.echo(f"\nWarning: {warning}")
+
+    except VectorServiceError as e:
+        formatter.error(code=e.code, message=e.message, suggestion=e.suggestion)
+        raise SystemExit(1)
+
+
 # =============================================================================
 # Document Ingestion
 # =============================================================================
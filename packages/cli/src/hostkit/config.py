@@ -44,6 +44,21 @@ class HostKitConfig:
     # Operator SSH keys - automatically added to all new projects
     operator_ssh_keys: list[str] = field(default_factory=list)
 
+    # Shared dependency cache (node_modules trees and pip wheelhouses keyed by lockfile)
+    dep_cache_dir: Path = field(default_factory=lambda: Path("/var/lib/hostkit/dep-cache"))
+    dep_cache_max_bytes: int = 10 * 1024 * 1024 * 1024  # 10 GiB
+
+    # Auth service runtime: one shared multi-tenant process pool instead of
+    # a dedicated uvicorn per project (applies to projects enabled afterwards)
+    auth_multi_tenant: bool = False
+    auth_shared_port: int = 8950
+    auth_shared_workers: int = 2
+
+    # Alert delivery: identical alerts to a channel within the window are sent
+    # once; the dispatcher delivers to this many channels in parallel
+    alert_coalesce_seconds: int = 300
+    alert_dispatch_workers: int = 8
+
     def __post_init__(self) -> None:
         """Convert string paths to Path objects if needed."""
         path_fields = [
@@ -55,6 +70,7 @@ class HostKitConfig:
             "db_path",
             "nginx_sites_available",
             "nginx_sites_enabled",
+            "dep_cache_dir",
         ]
         for field_name in path_fields:
             value = getattr(self, field_name)
@@ -103,6 +119,13 @@ class HostKitConfig:
             "admin_email": "admin_email",
             "vps_ip": "vps_ip",
             "operator_ssh_keys": "operator_ssh_keys",
+            "dep_cache_dir": "dep_cache_dir",
+            "dep_cache_max_bytes": "dep_cache_max_bytes",
+            "auth_multi_tenant": "auth_multi_tenant",
+            "auth_shared_port": "auth_shared_port",
+            "auth_shared_workers": "auth_shared_workers",
+            "alert_coalesce_seconds": "alert_coalesce_seconds",
+            "alert_dispatch_workers": "alert_dispatch_workers",
         }
 
         for yaml_key, field_name in mappings.items():
@@ -10,7 +10,7 @@ from typing import Any
 from hostkit.config import get_config
 
 # Schema version for migrations
-SCHEMA_VERSION = 24
+SCHEMA_VERSION = 30
 
 SCHEMA_SQL = """
 -- Schema version tracking
@@ -70,6 +70,7 @@ CREATE TABLE IF NOT EXISTS auth_services (
     email_enabled INTEGER NOT NULL DEFAULT 1,
     magic_link_enabled INTEGER NOT NULL DEFAULT 1,
     anonymous_enabled INTEGER NOT NULL DEFAULT 1,
+    shared_runtime INTEGER NOT NULL DEFAULT 0,
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL,
     FOREIGN KEY (project) REFERENCES projects(name) ON DELETE CASCADE
@@ -249,6 +250,42 @@ CREATE TABLE IF NOT EXISTS alert_history (
     FOREIGN KEY (project_name) REFERENCES projects(name) ON DELETE CASCADE
 );
 
+-- Alert outbox (queued deliveries, one row per alert and channel)
+CREATE TABLE IF NOT EXISTS alert_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_name TEXT NOT NULL,
+    channel_id INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    event_status TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    occurrences INTEGER NOT NULL DEFAULT 1,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TEXT NOT NULL,
+    last_error TEXT,
+    claim_token TEXT,
+    claimed_at TEXT,
+    created_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL,
+    delivered_at TEXT,
+    FOREIGN KEY (channel_id) REFERENCES alert_channels(id) ON DELETE CASCADE
+);
+
+-- Health samples (recorded by `hostkit health --all --watch`)
+CREATE TABLE IF NOT EXISTS health_samples (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_name TEXT NOT NULL,
+    overall TEXT NOT NULL,
+    http_status INTEGER,
+    response_ms REAL,
+    process_running INTEGER NOT NULL DEFAULT 0,
+    database_connected INTEGER,
+    error TEXT,
+    checked_at TEXT NOT NULL,
+    FOREIGN KEY (project_name) REFERENCES projects(name) ON DELETE CASCADE
+);
+
 -- Deploy history (every deploy attempt for rate limiting)
 CREATE TABLE IF NOT EXISTS deploy_history (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -284,11 +321,26 @@ CREATE TABLE IF NOT EXISTS auto_pause (
     paused INTEGER DEFAULT 0,
     paused_at TEXT,
     paused_reason TEXT,
+    idle_suspend INTEGER DEFAULT 0,
+    idle_minutes INTEGER DEFAULT 30,
+    idle_log_position INTEGER DEFAULT 0,
+    last_activity_at TEXT,
+    suspended_at TEXT,
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL,
     FOREIGN KEY (project_name) REFERENCES projects(name) ON DELETE CASCADE
 );
 
+-- Cold starts of idle-suspended services (socket activation wake-ups)
+CREATE TABLE IF NOT EXISTS cold_starts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_name TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    FOREIGN KEY (project_name) REFERENCES projects(name) ON DELETE CASCADE
+);
+
 -- Sandboxes table (temporary isolated project clones)
 CREATE TABLE IF NOT EXISTS sandboxes (
     id TEXT PRIMARY KEY,
@@ -418,6 +470,19 @@ CREATE TABLE IF NOT EXISTS image_generations (
     FOREIGN KEY (project) REFERENCES projects(name) ON DELETE CASCADE
 );
 
+-- Shared dependency cache entries (host-wide, keyed by lockfile hash)
+CREATE TABLE IF NOT EXISTS dependency_cache (
+    cache_key TEXT PRIMARY KEY,
+    ecosystem TEXT NOT NULL,
+    lockfile TEXT NOT NULL,
+    runtime_version TEXT,
+    path TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    last_used_at TEXT NOT NULL
+);
+
 -- Create indexes
 CREATE INDEX IF NOT EXISTS idx_domains_project ON domains(project);
 CREATE INDEX IF NOT EXISTS idx_backups_project ON backups(project);
@@ -445,7 +510,8 @@ CREATE INDEX IF NOT EXISTS idx_resource_limits_project ON resource_limits(projec
 CREATE INDEX IF NOT EXISTS idx_git_config_project ON git_config(project_name);
 CREATE INDEX IF NOT EXISTS idx_environments_project ON environments(project_name);
 CREATE INDEX IF NOT EXISTS idx_environments_user ON environments(linux_user);
-CREATE INDEX IF NOT EXISTS idx_events_project ON events(project_name);
+CREATE INDEX IF NOT EXISTS idx_events_project_time
+    ON events(project_name, created_at, category, level);
 CREATE INDEX IF NOT EXISTS idx_events_category ON events(category);
 CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at);
 CREATE INDEX IF NOT EXISTS idx_events_level ON events(level);
@@ -454,6 +520,14 @@ CREATE INDEX IF NOT EXISTS idx_metrics_type ON metrics(metric_type);
 CREATE INDEX IF NOT EXISTS idx_metrics_config_project ON metrics_config(project_name);
 CREATE INDEX IF NOT EXISTS idx_image_generations_project ON image_generations(project);
 CREATE INDEX IF NOT EXISTS idx_image_generations_created ON image_generations(created_at);
+CREATE INDEX IF NOT EXISTS idx_dependency_cache_last_used ON dependency_cache(last_used_at);
+CREATE INDEX IF NOT EXISTS idx_cold_starts_project ON cold_starts(project_name, started_at);
+CREATE INDEX IF NOT EXISTS idx_alert_outbox_due ON alert_outbox(status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS idx_alert_outbox_fingerprint
+    ON alert_outbox(channel_id, fingerprint, created_at);
+CREATE INDEX IF NOT EXISTS idx_health_samples_project
+    ON health_samples(project_name, checked_at);
+CREATE INDEX IF NOT EXISTS idx_health_samples_checked ON health_samples(checked_at);
 
 -- Voice service tables
 CREATE TABLE IF NOT EXISTS voice_projects (
@@ -1510,6 +1584,161 @@ class Database:
                 (24, datetime.utcnow().isoformat()),
             )
 
+        if from_version < 25:
+            # Add dependency_cache table for the shared lockfile-keyed install cache
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS dependency_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    ecosystem TEXT NOT NULL,
+                    lockfile TEXT NOT NULL,
+                    runtime_version TEXT,
+                    path TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL DEFAULT 0,
+                    hit_count INTEGER NOT NULL DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    last_used_at TEXT NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS "
+                "idx_dependency_cache_last_used "
+                "ON dependency_cache(last_used_at)"
+            )
+            conn.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (25, datetime.utcnow().isoformat()),
+            )
+
+        if from_version < 26:
+            # Add idle-suspend (scale-to-zero) state to auto_pause
+            for column in (
+                "idle_suspend INTEGER DEFAULT 0",
+                "idle_minutes INTEGER DEFAULT 30",
+                "idle_log_position INTEGER DEFAULT 0",
+                "last_activity_at TEXT",
+                "suspended_at TEXT",
+            ):
+                try:
+                    conn.execute(f"ALTER TABLE auto_pause ADD COLUMN {column}")
+                except sqlite3.OperationalError:
+                    pass  # Column already exists
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cold_starts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_name TEXT NOT NULL,
+                    unit TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    duration_ms INTEGER NOT NULL,
+                    FOREIGN KEY (project_name) REFERENCES projects(name) ON DELETE CASCADE
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS "
+                "idx_cold_starts_project "
+                "ON cold_starts(project_name, started_at)"
+            )
+            conn.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (26, datetime.utcnow().isoformat()),
+            )
+
+        if from_version < 27:
+            # Add alert_outbox so alerts are queued and delivered by a dispatcher
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS alert_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_name TEXT NOT NULL,
+                    channel_id INTEGER NOT NULL,
+                    event_type TEXT NOT NULL,
+                    event_status TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    occurrences INTEGER NOT NULL DEFAULT 1,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at TEXT NOT NULL,
+                    last_error TEXT,
+                    claim_token TEXT,
+                    claimed_at TEXT,
+                    created_at TEXT NOT NULL,
+                    last_seen_at TEXT NOT NULL,
+                    delivered_at TEXT,
+                    FOREIGN KEY (channel_id) REFERENCES alert_channels(id) ON DELETE CASCADE
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS "
+                "idx_alert_outbox_due "
+                "ON alert_outbox(status, next_attempt_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS "
+                "idx_alert_outbox_fingerprint "
+                "ON alert_outbox(channel_id, fingerprint, created_at)"
+            )
+            conn.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (27, datetime.utcnow().isoformat()),
+            )
+
+        if from_version < 28:
+            # Composite index for per-project, time-ordered event reads. It also
+            # covers category/level so counts and stats never touch the table.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS "
+                "idx_events_project_time "
+                "ON events(project_name, created_at, category, level)"
+            )
+            # Superseded by the composite index (same leading column)
+            conn.execute("DROP INDEX IF EXISTS idx_events_project")
+            conn.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (28, datetime.utcnow().isoformat()),
+            )
+
+        if from_version < 29:
+            # Add health_samples for continuous fleet health checks
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS health_samples (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_name TEXT NOT NULL,
+                    overall TEXT NOT NULL,
+                    http_status INTEGER,
+                    response_ms REAL,
+                    process_running INTEGER NOT NULL DEFAULT 0,
+                    database_connected INTEGER,
+                    error TEXT,
+                    checked_at TEXT NOT NULL,
+                    FOREIGN KEY (project_name) REFERENCES projects(name) ON DELETE CASCADE
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_health_samples_project "
+                "ON health_samples(project_name, checked_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_health_samples_checked "
+                "ON health_samples(checked_at)"
+            )
+            conn.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (29, datetime.utcnow().isoformat()),
+            )
+
+        if from_version < 30:
+            # Record which auth runtime served each project when it was enabled
+            try:
+                conn.execute(
+                    "ALTER TABLE auth_services "
+                    "ADD COLUMN shared_runtime INTEGER NOT NULL DEFAULT 0"
+                )
+            except sqlite3.OperationalError:
+                pass  # Column already exists
+            conn.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (30, datetime.utcnow().isoformat()),
+            )
+
     def get_schema_version(self) -> int:
         """Get the current schema version."""
         try:
@@ -1738,6 +1967,7 @@ class Database:
         email_enabled: bool = True,
         magic_link_enabled: bool = True,
         anonymous_enabled: bool = True,
+        shared_runtime: bool = False,
     ) -> dict[str, Any]:
         """Create an auth service record for a project."""
         now = datetime.utcnow().isoformat()
@@ -1749,8 +1979,8 @@ class Database:
                     google_client_id, google_web_client_id, google_client_secret,
                     apple_client_id, apple_team_id, apple_key_id,
                     email_enabled, magic_link_enabled, anonymous_enabled,
-                    created_at, updated_at
-                ) VALUES (?, 1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    shared_runtime, created_at, updated_at
+                ) VALUES (?, 1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     project,
@@ -1766,6 +1996,7 @@ class Database:
                     1 if email_enabled else 0,
                     1 if magic_link_enabled else 0,
                     1 if anonymous_enabled else 0,
+                    1 if shared_runtime else 0,
                     now,
                     now,
                 ),
@@ -3026,6 +3257,241 @@ class Database:
             )
             return cursor.rowcount
 
+    def create_alert_history_batch(self, entries: list[dict[str, Any]]) -> int:
+        """Create several alert history entries in one transaction."""
+        if not entries:
+            return 0
+        with self.transaction() as conn:
+            self._insert_alert_history(conn, entries)
+        return len(entries)
+
+    def _insert_alert_history(
+        self, conn: sqlite3.Connection, entries: list[dict[str, Any]]
+    ) -> None:
+        now = datetime.utcnow().isoformat()
+        conn.executemany(
+            """
+            INSERT INTO alert_history (
+                project_name, event_type, event_status, channel_name,
+                notification_sent, notification_error, payload, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    e["project_name"],
+                    e["event_type"],
+                    e["event_status"],
+                    e.get("channel_name"),
+                    1 if e.get("notification_sent") else 0,
+                    e.get("notification_error"),
+                    e.get("payload"),
+                    now,
+                )
+                for e in entries
+            ],
+        )
+
+    # Alert outbox operations
+    def enqueue_alert_deliveries(
+        self,
+        entries: list[dict[str, Any]],
+        coalesce_since: str,
+    ) -> dict[str, int]:
+        """Queue alert deliveries, coalescing repeats of a recent identical alert.
+
+        Each entry needs project_name, channel_id, event_type, event_status,
+        fingerprint and payload. An entry whose channel already has an alert
+        with the same fingerprint created after coalesce_since is folded into
+        it: a pending delivery takes the newer payload, one already sent only
+        has its occurrence count raised. A status change resets the window:
+        once the channel has been sent an alert with another status for the
+        same project and event type (a recovery after a failure), a repeat of
+        the earlier alert is queued again.
+
+        Returns:
+            Dict with queued and coalesced counts
+        """
+        now = datetime.utcnow().isoformat()
+        queued = coalesced = 0
+        with self.transaction() as conn:
+            for e in entries:
+                existing = conn.execute(
+                    """
+                    SELECT id, status FROM alert_outbox
+                    WHERE channel_id = ? AND fingerprint = ? AND created_at >= ?
+                    ORDER BY id DESC LIMIT 1
+                    """,
+                    (e["channel_id"], e["fingerprint"], coalesce_since),
+                ).fetchone()
+                if existing:
+                    flipped = conn.execute(
+                        """
+                        SELECT 1 FROM alert_outbox
+                        WHERE channel_id = ? AND project_name = ? AND event_type = ?
+                            AND event_status != ? AND id > ?
+                        LIMIT 1
+                        """,
+                        (
+                            e["channel_id"],
+                            e["project_name"],
+                            e["event_type"],
+                            e["event_status"],
+                            existing["id"],
+                        ),
+                    ).fetchone()
+                    if flipped:
+                        existing = None
+                if existing and existing["status"] == "pending":
+                    conn.execute(
+                        """
+                        UPDATE alert_outbox
+                        SET payload = ?, occurrences = occurrences + 1, last_seen_at = ?
+                        WHERE id = ?
+                        """,
+                        (e["payload"], now, existing["id"]),
+                    )
+                    coalesced += 1
+                elif existing:
+                    conn.execute(
+                        """
+                        UPDATE alert_outbox
+                        SET occurrences = occurrences + 1, last_seen_at = ?
+                        WHERE id = ?
+                        """,
+                        (now, existing["id"]),
+                    )
+                    coalesced += 1
+                else:
+                    conn.execute(
+                        """
+                        INSERT INTO alert_outbox (
+                            project_name, channel_id, event_type, event_status,
+                            fingerprint, payload, next_attempt_at, created_at, last_seen_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            e["project_name"],
+                            e["channel_id"],
+                            e["event_type"],
+                            e["event_status"],
+                            e["fingerprint"],
+                            e["payload"],
+                            now,
+                            now,
+                            now,
+                        ),
+                    )
+                    queued += 1
+        return {"queued": queued, "coalesced": coalesced}
+
+    def claim_alert_deliveries(
+        self,
+        claim_token: str,
+        stale_before: str,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Claim due alert deliveries for one dispatcher run.
+
+        Claims pending rows whose next attempt is due, plus rows left in
+        'sending' by a dispatcher that died before stale_before. The claim is
+        a single UPDATE, so concurrent dispatchers never get the same row.
+
+        Returns:
+            Claimed rows joined with their channel's type, name and config
+        """
+        now = datetime.utcnow().isoformat()
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE alert_outbox SET status = 'sending', claim_token = ?, claimed_at = ?
+                WHERE id IN (
+                    SELECT id FROM alert_outbox
+                    WHERE (status = 'pending' AND next_attempt_at <= ?)
+                       OR (status = 'sending' AND claimed_at < ?)
+                    ORDER BY id LIMIT ?
+                )
+                """,
+                (claim_token, now, now, stale_before, limit),
+            )
+            cursor = conn.execute(
+                """
+                SELECT o.*, c.name AS channel_name, c.channel_type, c.config AS channel_config
+                FROM alert_outbox o
+                JOIN alert_channels c ON c.id = o.channel_id
+                WHERE o.claim_token = ?
+                ORDER BY o.id
+                """,
+                (claim_token,),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def finish_alert_deliveries(
+        self,
+        updates: list[dict[str, Any]],
+        history: list[dict[str, Any]],
+    ) -> None:
+        """Record delivery outcomes and their history in one transaction.
+
+        Each update needs id, status, attempts, next_attempt_at and error.
+        """
+        now = datetime.utcnow().isoformat()
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                UPDATE alert_outbox
+                SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?,
+                    delivered_at = ?, claim_token = NULL
+                WHERE id = ?
+                """,
+                [
+                    (
+                        u["status"],
+                        u["attempts"],
+                        u["next_attempt_at"],
+                        u["error"],
+                        now if u["status"] == "delivered" else None,
+                        u["id"],
+                    )
+                    for u in updates
+                ],
+            )
+            self._insert_alert_history(conn, history)
+
+    def purge_alert_outbox(self, before: str) -> int:
+        """Delete finished outbox rows last seen before a timestamp. Returns count."""
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                """
+                DELETE FROM alert_outbox
+                WHERE status IN ('delivered', 'failed') AND last_seen_at < ?
+                """,
+                (before,),
+            )
+            return cursor.rowcount
+
+    # Health sample operations
+    def create_health_samples(self, samples: list[dict[str, Any]]) -> None:
+        """Record one health sample per project from a fleet check."""
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO health_samples (
+                    project_name, overall, http_status, response_ms,
+                    process_running, database_connected, error, checked_at
+                ) VALUES (
+                    :project_name, :overall, :http_status, :response_ms,
+                    :process_running, :database_connected, :error, :checked_at
+                )
+                """,
+                samples,
+            )
+
+    def delete_old_health_samples(self, before: str) -> int:
+        """Delete health samples taken before a timestamp. Returns count deleted."""
+        with self.transaction() as conn:
+            cursor = conn.execute("DELETE FROM health_samples WHERE checked_at < ?", (before,))
+            return cursor.rowcount
+
     # Deploy history operations (for rate limiting)
     def record_deploy(
         self,
@@ -3323,6 +3789,12 @@ class Database:
         paused_at: str | None = None,
         paused_reason: str | None = None,
         clear_pause: bool = False,
+        idle_suspend: bool | None = None,
+        idle_minutes: int | None = None,
+        idle_log_position: int | None = None,
+        last_activity_at: str | None = None,
+        suspended_at: str | None = None,
+        clear_suspended: bool = False,
     ) -> dict[str, Any] | None:
         """Update auto-pause configuration for a project.
 
@@ -3335,6 +3807,12 @@ class Database:
             paused_at: When paused (set automatically if paused=True)
             paused_reason: Why paused
             clear_pause: If True, clear paused state and reason
+            idle_suspend: Enable/disable scale-to-zero when idle
+            idle_minutes: Minutes without requests before suspending
+            idle_log_position: Nginx access log offset last checked for activity
+            last_activity_at: When a request was last seen
+            suspended_at: When the project's services were stopped for idleness
+            clear_suspended: If True, clear suspended_at (services woke up)
         """
         updates = []
         params = []
@@ -3363,6 +3841,23 @@ class Database:
             updates.append("paused = 0")
             updates.append("paused_at = NULL")
             updates.append("paused_reason = NULL")
+        if idle_suspend is not None:
+            updates.append("idle_suspend = ?")
+            params.append(1 if idle_suspend else 0)
+        if idle_minutes is not None:
+            updates.append("idle_minutes = ?")
+            params.append(idle_minutes)
+        if idle_log_position is not None:
+            updates.append("idle_log_position = ?")
+            params.append(idle_log_position)
+        if last_activity_at is not None:
+            updates.append("last_activity_at = ?")
+            params.append(last_activity_at)
+        if suspended_at is not None:
+            updates.append("suspended_at = ?")
+            params.append(suspended_at)
+        if clear_suspended:
+            updates.append("suspended_at = NULL")
 
         if not updates:
             return self.get_auto_pause_config(project_name)
@@ -3385,6 +3880,42 @@ class Database:
             return False
         return bool(config.get("paused", 0))
 
+    def list_idle_suspend_configs(self) -> list[dict[str, Any]]:
+        """List auto-pause rows of projects with idle-suspend enabled."""
+        with self.connection() as conn:
+            cursor = conn.execute(
+                "SELECT * FROM auto_pause WHERE idle_suspend = 1 ORDER BY project_name"
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def record_cold_start(
+        self, project_name: str, unit: str, started_at: str, duration_ms: int
+    ) -> None:
+        """Record how long a socket-activated service took to accept connections."""
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO cold_starts (project_name, unit, started_at, duration_ms)
+                VALUES (?, ?, ?, ?)
+                """,
+                (project_name, unit, started_at, duration_ms),
+            )
+
+    def list_cold_starts(
+        self, project_name: str, since: str | None = None, limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """List recent cold starts for a project, newest first."""
+        query = "SELECT * FROM cold_starts WHERE project_name = ?"
+        params: list[Any] = [project_name]
+        if since:
+            query += " AND started_at >= ?"
+            params.append(since)
+        query += " ORDER BY started_at DESC LIMIT ?"
+        params.append(limit)
+        with self.connection() as conn:
+            cursor = conn.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+
     def delete_auto_pause_config(self, project_name: str) -> bool:
         """Delete auto-pause configuration. Returns True if deleted."""
         with self.transaction() as conn:
@@ -3827,18 +4358,16 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def list_events(
+    def _event_filters(
         self,
         project_name: str,
         category: str | None = None,
         level: str | None = None,
         since: str | None = None,
         until: str | None = None,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> list[dict[str, Any]]:
-        """List events with optional filters."""
-        query = "SELECT * FROM events WHERE project_name = ?"
+    ) -> tuple[str, list[Any]]:
+        """Build the WHERE clause shared by the event queries."""
+        query = "project_name = ?"
         params: list[Any] = [project_name]
 
         if category:
@@ -3865,8 +4394,36 @@ class Database:
             query += " AND created_at <= ?"
             params.append(until)
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+        return query, params
+
+    def list_events(
+        self,
+        project_name: str,
+        category: str | None = None,
+        level: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List events with optional filters, newest first.
+
+        With after_id, returns the events that come after that event in this
+        order (keyset pagination), which stays an index range scan however
+        deep the page is, unlike a large OFFSET.
+        """
+        where, params = self._event_filters(project_name, category, level, since, until)
+
+        if after_id is not None:
+            where += " AND (created_at, id) < (SELECT created_at, id FROM events WHERE id = ?)"
+            params.append(after_id)
+
+        query = f"SELECT * FROM events WHERE {where} ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit)
+        if offset:
+            query += " OFFSET ?"
+            params.append(offset)
 
         with self.connection() as conn:
             cursor = conn.execute(query, params)
@@ -3881,47 +4438,85 @@ class Database:
         until: str | None = None,
     ) -> int:
         """Count events with optional filters."""
-        query = "SELECT COUNT(*) FROM events WHERE project_name = ?"
-        params: list[Any] = [project_name]
-
-        if category:
-            categories = [c.strip() for c in category.split(",")]
-            placeholders = ",".join("?" * len(categories))
-            query += f" AND category IN ({placeholders})"
-            params.extend(categories)
+        where, params = self._event_filters(project_name, category, level, since, until)
 
-        if level:
-            level_order = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3, "CRITICAL": 4}
-            min_level = level_order.get(level.upper(), 1)
-            levels = [line for line, v in level_order.items() if v >= min_level]
-            placeholders = ",".join("?" * len(levels))
-            query += f" AND level IN ({placeholders})"
-            params.extend(levels)
+        with self.connection() as conn:
+            cursor = conn.execute(f"SELECT COUNT(*) FROM events WHERE {where}", params)
+            result = cursor.fetchone()
+            return result[0] if result else 0
 
-        if since:
-            query += " AND created_at >= ?"
-            params.append(since)
+    def list_events_since_id(
+        self,
+        project_name: str,
+        after_id: int,
+        category: str | None = None,
+        level: str | None = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """List events with an id above after_id, oldest first (for tailing)."""
+        where, params = self._event_filters(project_name, category, level)
 
-        if until:
-            query += " AND created_at <= ?"
-            params.append(until)
+        with self.connection() as conn:
+            cursor = conn.execute(
+                f"SELECT * FROM events WHERE id > ? AND {where} ORDER BY id LIMIT ?",
+                [after_id, *params, limit],
+            )
+            return [dict(row) for row in cursor.fetchall()]
 
+    def get_last_event_id(self) -> int:
+        """Get the highest event id across all projects (0 if there are none)."""
         with self.connection() as conn:
-            cursor = conn.execute(query, params)
+            cursor = conn.execute("SELECT MAX(id) FROM events")
             result = cursor.fetchone()
-            return result[0] if result else 0
+            return result[0] if result and result[0] else 0
 
-    def delete_old_events(self, older_than_days: int = 30) -> int:
-        """Delete events older than the specified number of days."""
-        from datetime import timedelta
+    def event_counts(
+        self,
+        project_name: str,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Count events per (category, level) in one pass over the index."""
+        where, params = self._event_filters(project_name, since=since, until=until)
 
-        cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat()
-        with self.transaction() as conn:
+        with self.connection() as conn:
             cursor = conn.execute(
-                "DELETE FROM events WHERE created_at < ?",
-                (cutoff,),
+                f"""
+                SELECT category, level, COUNT(*) AS count
+                FROM events
+                WHERE {where}
+                GROUP BY category, level
+                """,
+                params,
             )
-            return cursor.rowcount
+            return [dict(row) for row in cursor.fetchall()]
+
+    def delete_old_events(self, older_than_days: int = 30, batch_size: int = 5000) -> int:
+        """Delete events older than the specified number of days.
+
+        Deletes oldest first in batches of batch_size rows, each in its own
+        short transaction, so event writers are never blocked for long.
+        Returns the total count deleted.
+        """
+        from datetime import timedelta
+
+        cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat()
+        deleted = 0
+        while True:
+            with self.transaction() as conn:
+                cursor = conn.execute(
+                    """
+                    DELETE FROM events WHERE id IN (
+                        SELECT id FROM events WHERE created_at < ?
+                        ORDER BY created_at LIMIT ?
+                    )
+                    """,
+                    (cutoff, batch_size),
+                )
+                batch = cursor.rowcount
+            deleted += batch
+            if batch < batch_size:
+                return deleted
 
     def delete_events_for_project(self, project_name: str) -> int:
         """Delete all events for a project. Returns count deleted."""
@@ -3932,6 +4527,72 @@ class Database:
             )
             return cursor.rowcount
 
+    # Dependency cache operations
+    def get_dependency_cache_entry(self, cache_key: str) -> dict[str, Any] | None:
+        """Get a dependency cache entry by key."""
+        with self.connection() as conn:
+            cursor = conn.execute(
+                "SELECT * FROM dependency_cache WHERE cache_key = ?",
+                (cache_key,),
+            )
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def upsert_dependency_cache_entry(
+        self,
+        cache_key: str,
+        ecosystem: str,
+        lockfile: str,
+        path: str,
+        size_bytes: int,
+        runtime_version: str | None = None,
+    ) -> dict[str, Any]:
+        """Create or replace a dependency cache entry."""
+        now = datetime.utcnow().isoformat()
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO dependency_cache (
+                    cache_key, ecosystem, lockfile, runtime_version, path,
+                    size_bytes, hit_count, created_at, last_used_at
+                ) VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    path = excluded.path,
+                    size_bytes = excluded.size_bytes,
+                    last_used_at = excluded.last_used_at
+                """,
+                (cache_key, ecosystem, lockfile, runtime_version, path, size_bytes, now, now),
+            )
+        return self.get_dependency_cache_entry(cache_key)  # type: ignore
+
+    def touch_dependency_cache_entry(self, cache_key: str) -> None:
+        """Record a cache hit (bumps LRU position and hit count)."""
+        now = datetime.utcnow().isoformat()
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE dependency_cache
+                SET last_used_at = ?, hit_count = hit_count + 1
+                WHERE cache_key = ?
+                """,
+                (now, cache_key),
+            )
+
+    def list_dependency_cache_entries(self) -> list[dict[str, Any]]:
+        """List dependency cache entries, least recently used first."""
+        with self.connection() as conn:
+            cursor = conn.execute("SELECT * FROM dependency_cache ORDER BY last_used_at ASC")
+            return [dict(row) for row in cursor.fetchall()]
+
+    def delete_dependency_cache_entry(self, cache_key: str) -> bool:
+        """Delete a dependency cache entry."""
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM dependency_cache WHERE cache_key = ?",
+                (cache_key,),
+            )
+            return cursor.rowcount > 0
+
 
 # Global database instance (loaded lazily)
 _db: Database | None = None
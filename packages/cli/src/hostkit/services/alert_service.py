@@ -2,21 +2,31 @@
 
 Provides event-driven alerting via webhooks, email, and Slack
 for deployment, migration, and health check events.
+
+send_alert() only queues deliveries in the alert_outbox table and starts a
+dispatcher in the background, so callers never wait on a channel. The
+dispatcher (`hostkit alert dispatch`, also run by the metrics timer) sends
+to all channels in parallel and retries failed deliveries with backoff.
 """
 
 import hashlib
 import hmac
 import json
 import smtplib
+import subprocess
+import sys
 import time
-import urllib.error
-import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Any
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from hostkit import __version__
 from hostkit.config import get_config
 from hostkit.database import get_db
@@ -102,6 +112,17 @@ class AlertServiceError(Exception):
 # Maximum channels per project
 MAX_CHANNELS_PER_PROJECT = 10
 
+# Delay before each retry of a failed delivery; a delivery is given up after
+# the last one
+RETRY_DELAYS_SECONDS = (30, 120, 600, 1800, 3600)
+
+# A delivery claimed this long ago by a dispatcher that never finished is
+# claimed again
+CLAIM_TIMEOUT_SECONDS = 300
+
+# Delivered and failed outbox rows are kept this long
+OUTBOX_RETENTION_DAYS = 7
+
 
 class AlertService:
     """Service for managing alert channels and sending notifications."""
@@ -469,6 +490,7 @@ class AlertService:
         secret: str | None = None,
         headers: dict[str, str] | None = None,
         timeout: int = 10,
+        session: requests.Session | None = None,
     ) -> tuple[bool, str | None]:
         """Send a webhook notification.
 
@@ -495,36 +517,55 @@ class AlertService:
             request_headers.update(headers)
 
         try:
-            req = urllib.request.Request(
+            response = (session or requests).post(
                 url,
                 data=payload_bytes,
                 headers=request_headers,
-                method="POST",
+                timeout=timeout,
             )
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                if 200 <= response.status < 300:
-                    return True, None
-                else:
-                    return False, f"HTTP {response.status}"
-        except urllib.error.HTTPError as e:
-            return False, f"HTTP {e.code}: {e.reason}"
-        except urllib.error.URLError as e:
-            return False, f"URL error: {e.reason}"
-        except TimeoutError:
+            return self._check_response(response)
+        except requests.exceptions.Timeout:
             return False, "Request timed out"
+        except requests.exceptions.ConnectionError as e:
+            return False, f"Connection error: {e}"
         except Exception as e:
             return False, str(e)
 
+    def _check_response(self, response: requests.Response) -> tuple[bool, str | None]:
+        """Map an HTTP response to (success, error_message)."""
+        if 200 <= response.status_code < 300:
+            return True, None
+        return False, f"HTTP {response.status_code}: {response.reason}"
+
     def _send_email(
         self,
         config: EmailConfig,
         event: AlertEvent,
+        smtp: smtplib.SMTP | None = None,
     ) -> tuple[bool, str | None]:
         """Send an email notification.
 
+        Args:
+            smtp: Open connection to reuse; a new one is opened if not given
+
         Returns:
             Tuple of (success, error_message)
         """
+        msg = self._build_email(config, event)
+
+        try:
+            if smtp is not None:
+                smtp.send_message(msg)
+            else:
+                # Send via local Postfix (no auth needed for local delivery)
+                with smtplib.SMTP("localhost", 25, timeout=10) as conn:
+                    conn.send_message(msg)
+            return True, None
+        except Exception as e:
+            return False, f"Email send failed: {e}"
+
+    def _build_email(self, config: EmailConfig, event: AlertEvent) -> MIMEMultipart:
+        """Build the plain text email for an event."""
         # Build email content
         subject = (
             f"{config.subject_prefix} {event.event_type.title()}"
@@ -561,19 +602,13 @@ class AlertService:
         msg["To"] = ", ".join(config.to)
         msg["Subject"] = subject
         msg.attach(MIMEText(body, "plain"))
-
-        try:
-            # Send via local Postfix (no auth needed for local delivery)
-            with smtplib.SMTP("localhost", 25) as smtp:
-                smtp.send_message(msg)
-            return True, None
-        except Exception as e:
-            return False, f"Email send failed: {e}"
+        return msg
 
     def _send_slack(
         self,
         config: SlackConfig,
         event: AlertEvent,
+        session: requests.Session | None = None,
     ) -> tuple[bool, str | None]:
         """Send a Slack notification using Block Kit.
 
@@ -646,26 +681,54 @@ class AlertService:
         payload_bytes = json.dumps(payload).encode("utf-8")
 
         try:
-            req = urllib.request.Request(
+            response = (session or requests).post(
                 config.webhook_url,
                 data=payload_bytes,
                 headers={"Content-Type": "application/json"},
-                method="POST",
+                timeout=10,
             )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if 200 <= response.status < 300:
-                    return True, None
-                else:
-                    return False, f"HTTP {response.status}"
-        except urllib.error.HTTPError as e:
-            return False, f"HTTP {e.code}: {e.reason}"
-        except urllib.error.URLError as e:
-            return False, f"URL error: {e.reason}"
-        except TimeoutError:
+            return self._check_response(response)
+        except requests.exceptions.Timeout:
             return False, "Request timed out"
+        except requests.exceptions.ConnectionError as e:
+            return False, f"Connection error: {e}"
         except Exception as e:
             return False, str(e)
 
+    def _deliver(
+        self,
+        channel_type: str,
+        config: ChannelConfig,
+        event: AlertEvent,
+        payload: dict[str, Any],
+        session: requests.Session | None = None,
+        smtp: smtplib.SMTP | None = None,
+    ) -> tuple[bool, str | None]:
+        """Send an event to one channel.
+
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if channel_type == "webhook":
+            if isinstance(config, WebhookConfig):
+                return self._send_webhook(
+                    url=config.url,
+                    payload=payload,
+                    secret=config.secret,
+                    headers=config.headers,
+                    session=session,
+                )
+            return False, "Invalid webhook config"
+        elif channel_type == "email":
+            if isinstance(config, EmailConfig):
+                return self._send_email(config, event, smtp=smtp)
+            return False, "Invalid email config"
+        elif channel_type == "slack":
+            if isinstance(config, SlackConfig):
+                return self._send_slack(config, event, session=session)
+            return False, "Invalid slack config"
+        return False, f"Unsupported channel type: {channel_type}"
+
     def test_channel(self, project_name: str, name: str) -> dict[str, Any]:
         """Send a test notification to a channel.
 
@@ -690,33 +753,7 @@ class AlertService:
         if channel.is_muted:
             muted_note = f" (Note: Channel is muted until {channel.muted_until})"
 
-        # Send based on channel type
-        if channel.channel_type == "webhook":
-            config = channel.config
-            if isinstance(config, WebhookConfig):
-                success, error = self._send_webhook(
-                    url=config.url,
-                    payload=payload,
-                    secret=config.secret,
-                    headers=config.headers,
-                )
-            else:
-                success, error = False, "Invalid webhook config"
-        elif channel.channel_type == "email":
-            config = channel.config
-            if isinstance(config, EmailConfig):
-                success, error = self._send_email(config, event)
-            else:
-                success, error = False, "Invalid email config"
-        elif channel.channel_type == "slack":
-            config = channel.config
-            if isinstance(config, SlackConfig):
-                success, error = self._send_slack(config, event)
-            else:
-                success, error = False, "Invalid slack config"
-        else:
-            success = False
-            error = f"Unsupported channel type: {channel.channel_type}"
+        success, error = self._deliver(channel.channel_type, channel.config, event, payload)
 
         # Record in history
         self.db.create_alert_history(
@@ -765,17 +802,25 @@ class AlertService:
         event_type: str,
         event_status: str,
         data: dict[str, Any],
+        dedup_key: str | None = None,
     ) -> dict[str, Any]:
-        """Send an alert to all enabled channels for a project.
+        """Queue an alert for all enabled channels of a project.
+
+        Delivery happens in a background dispatcher, so this returns as soon
+        as the alert is stored. An alert identical to one queued for the same
+        channel within the coalesce window is not sent again; its occurrence
+        count is raised instead.
 
         Args:
             project_name: Name of the project
             event_type: Type of event (deploy, migrate, health, etc.)
             event_status: Status (success, failure)
             data: Event-specific data
+            dedup_key: What makes two alerts identical, in addition to the
+                project, event type and status (default: the whole data dict)
 
         Returns:
-            Dict with send results
+            Dict with queue results
         """
         # Get enabled channels
         channels = self.db.list_alert_channels(
@@ -800,105 +845,203 @@ class AlertService:
         )
 
         # Build payload (for webhook and history)
-        payload = self._build_payload(event)
-        payload_json = json.dumps(payload)
-
-        # Send to each channel
-        results = []
-        muted_count = 0
+        payload_json = json.dumps(self._build_payload(event))
+        if dedup_key is None:
+            dedup_key = json.dumps(data, sort_keys=True, default=str)
+        fingerprint = hashlib.sha256(
+            f"{project_name}\0{event_type}\0{event_status}\0{dedup_key}".encode()
+        ).hexdigest()
 
+        deliveries = []
+        muted = []
         for ch in channels:
-            channel_type = ch["channel_type"]
-            config = self._parse_channel_config(ch["config"], channel_type)
-
-            # Check if channel is muted
-            muted_until = ch.get("muted_until")
-            if muted_until:
-                mute_time = datetime.fromisoformat(muted_until.replace("Z", "+00:00"))
-                is_muted = (
-                    datetime.utcnow() < mute_time.replace(tzinfo=None)
-                    if mute_time.tzinfo
-                    else datetime.utcnow() < mute_time
+            entry = {
+                "project_name": project_name,
+                "event_type": event_type,
+                "event_status": event_status,
+                "payload": payload_json,
+            }
+            if self._is_muted(ch.get("muted_until")):
+                # Record in history as muted
+                muted.append(
+                    {
+                        **entry,
+                        "channel_name": ch["name"],
+                        "notification_sent": False,
+                        "notification_error": "Channel is muted",
+                    }
                 )
-                if is_muted:
-                    muted_count += 1
-                    # Record in history as muted
-                    self.db.create_alert_history(
-                        project_name=project_name,
-                        event_type=event_type,
-                        event_status=event_status,
-                        channel_name=ch["name"],
-                        notification_sent=False,
-                        notification_error="Channel is muted",
-                        payload=payload_json,
-                    )
-                    results.append(
-                        {
-                            "channel": ch["name"],
-                            "success": False,
-                            "muted": True,
-                            "error": "Channel is muted",
-                        }
-                    )
-                    continue
-
-            # Send based on channel type
-            if channel_type == "webhook":
-                if isinstance(config, WebhookConfig):
-                    success, error = self._send_webhook(
-                        url=config.url,
-                        payload=payload,
-                        secret=config.secret,
-                        headers=config.headers,
-                    )
-                else:
-                    success, error = False, "Invalid webhook config"
-            elif channel_type == "email":
-                if isinstance(config, EmailConfig):
-                    success, error = self._send_email(config, event)
-                else:
-                    success, error = False, "Invalid email config"
-            elif channel_type == "slack":
-                if isinstance(config, SlackConfig):
-                    success, error = self._send_slack(config, event)
-                else:
-                    success, error = False, "Invalid slack config"
             else:
-                success = False
-                error = f"Unsupported channel type: {channel_type}"
-
-            # Record in history
-            self.db.create_alert_history(
-                project_name=project_name,
-                event_type=event_type,
-                event_status=event_status,
-                channel_name=ch["name"],
-                notification_sent=success,
-                notification_error=error,
-                payload=payload_json,
+                deliveries.append({**entry, "channel_id": ch["id"], "fingerprint": fingerprint})
+
+        counts = {"queued": 0, "coalesced": 0}
+        if deliveries:
+            window_start = datetime.utcnow() - timedelta(seconds=self.config.alert_coalesce_seconds)
+            counts = self.db.enqueue_alert_deliveries(deliveries, window_start.isoformat())
+        self.db.create_alert_history_batch(muted)
+
+        if counts["queued"]:
+            self._start_dispatcher()
+
+        return {
+            "project": project_name,
+            "event_type": event_type,
+            "event_status": event_status,
+            "channels_queued": counts["queued"],
+            "channels_coalesced": counts["coalesced"],
+            "channels_muted": len(muted),
+            "queued_at": datetime.utcnow().isoformat(),
+        }
+
+    def _is_muted(self, muted_until: str | None) -> bool:
+        """Check whether a channel's mute is still in effect."""
+        if not muted_until:
+            return False
+        mute_time = datetime.fromisoformat(muted_until.replace("Z", "+00:00"))
+        return datetime.utcnow() < mute_time.replace(tzinfo=None)
+
+    def _start_dispatcher(self) -> None:
+        """Start `hostkit alert dispatch` in the background without waiting for it."""
+        try:
+            subprocess.Popen(
+                [sys.executable, "-m", "hostkit", "alert", "dispatch"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
             )
+        except OSError:
+            pass  # The metrics timer dispatches on its next run
+
+    def dispatch(self, limit: int = 100) -> dict[str, Any]:
+        """Deliver due alerts from the outbox.
 
-            results.append(
+        Webhook and Slack deliveries go out in parallel over one pooled HTTP
+        session; emails share one SMTP connection. Failed deliveries are
+        retried after RETRY_DELAYS_SECONDS and given up after the last delay.
+        Outcomes and history are written in one transaction at the end.
+
+        Args:
+            limit: Maximum deliveries to claim in this run
+
+        Returns:
+            Dict with delivery counts
+        """
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=CLAIM_TIMEOUT_SECONDS)
+        rows = self.db.claim_alert_deliveries(uuid.uuid4().hex, stale_before.isoformat(), limit)
+
+        results: list[tuple[dict[str, Any], bool, str | None]] = []
+        if rows:
+            workers = max(1, self.config.alert_dispatch_workers)
+            emails = [r for r in rows if r["channel_type"] == "email"]
+            others = [r for r in rows if r["channel_type"] != "email"]
+
+            with requests.Session() as session, ThreadPoolExecutor(workers) as pool:
+                adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+
+                futures = [pool.submit(self._deliver_emails, emails)] if emails else []
+                futures += [pool.submit(self._deliver_row, row, session) for row in others]
+                for future in futures:
+                    results.extend(future.result())
+
+        updates = []
+        history = []
+        retry_at = datetime.utcnow()
+        for row, success, error in results:
+            attempts = row["attempts"] + 1
+            if success:
+                status = "delivered"
+                next_attempt = row["next_attempt_at"]
+            elif attempts > len(RETRY_DELAYS_SECONDS):
+                status = "failed"
+                next_attempt = row["next_attempt_at"]
+            else:
+                status = "pending"
+                delay = RETRY_DELAYS_SECONDS[attempts - 1]
+                next_attempt = (retry_at + timedelta(seconds=delay)).isoformat()
+
+            updates.append(
                 {
-                    "channel": ch["name"],
-                    "success": success,
+                    "id": row["id"],
+                    "status": status,
+                    "attempts": attempts,
+                    "next_attempt_at": next_attempt,
                     "error": error,
                 }
             )
+            if status != "pending":
+                history.append(
+                    {
+                        "project_name": row["project_name"],
+                        "event_type": row["event_type"],
+                        "event_status": row["event_status"],
+                        "channel_name": row["channel_name"],
+                        "notification_sent": success,
+                        "notification_error": error,
+                        "payload": row["payload"],
+                    }
+                )
+
+        if updates:
+            self.db.finish_alert_deliveries(updates, history)
+        purged = self.db.purge_alert_outbox(
+            (now - timedelta(days=OUTBOX_RETENTION_DAYS)).isoformat()
+        )
 
         return {
-            "project": project_name,
-            "event_type": event_type,
-            "event_status": event_status,
-            "channels_notified": sum(1 for r in results if r.get("success")),
-            "channels_failed": sum(
-                1 for r in results if not r.get("success") and not r.get("muted")
-            ),
-            "channels_muted": muted_count,
-            "results": results,
-            "sent_at": datetime.utcnow().isoformat(),
+            "claimed": len(rows),
+            "delivered": sum(1 for u in updates if u["status"] == "delivered"),
+            "retrying": sum(1 for u in updates if u["status"] == "pending"),
+            "failed": sum(1 for u in updates if u["status"] == "failed"),
+            "purged": purged,
         }
 
+    def _row_event(self, row: dict[str, Any]) -> tuple[AlertEvent, dict[str, Any]]:
+        """Rebuild the event and webhook payload of an outbox row."""
+        payload = json.loads(row["payload"])
+        data = payload.get("data") or {}
+        if row["occurrences"] > 1:
+            payload["event"]["occurrences"] = row["occurrences"]
+            data = {**data, "occurrences": row["occurrences"]}
+        event = AlertEvent(
+            event_type=row["event_type"],
+            event_status=row["event_status"],
+            project=row["project_name"],
+            data=data,
+            timestamp=payload["event"]["timestamp"],
+        )
+        return event, payload
+
+    def _deliver_row(
+        self, row: dict[str, Any], session: requests.Session
+    ) -> list[tuple[dict[str, Any], bool, str | None]]:
+        """Deliver one webhook or Slack outbox row."""
+        event, payload = self._row_event(row)
+        config = self._parse_channel_config(row["channel_config"], row["channel_type"])
+        success, error = self._deliver(row["channel_type"], config, event, payload, session)
+        return [(row, success, error)]
+
+    def _deliver_emails(
+        self, rows: list[dict[str, Any]]
+    ) -> list[tuple[dict[str, Any], bool, str | None]]:
+        """Deliver email outbox rows over a single SMTP connection."""
+        try:
+            smtp = smtplib.SMTP("localhost", 25, timeout=10)
+        except Exception as e:
+            return [(row, False, f"Email send failed: {e}") for row in rows]
+
+        results = []
+        with smtp:
+            for row in rows:
+                event, payload = self._row_event(row)
+                config = self._parse_channel_config(row["channel_config"], "email")
+                success, error = self._deliver("email", config, event, payload, smtp=smtp)
+                results.append((row, success, error))
+        return results
+
     def get_history(
         self,
         project_name: str,
@@ -934,20 +1077,22 @@ def send_alert(
     event_type: str,
     event_status: str,
     data: dict[str, Any],
+    dedup_key: str | None = None,
 ) -> dict[str, Any]:
-    """Send an alert to all enabled channels for a project.
+    """Queue an alert for all enabled channels of a project.
 
     This is a convenience function that creates an AlertService instance
-    and sends the alert. Use this from other modules like deploy.py.
+    and queues the alert. Use this from other modules like deploy.py.
 
     Args:
         project_name: Name of the project
         event_type: Type of event (deploy, migrate, health, etc.)
         event_status: Status (success, failure)
         data: Event-specific data
+        dedup_key: What makes two alerts identical (default: the whole data dict)
 
     Returns:
-        Dict with send results
+        Dict with queue results
     """
     service = AlertService()
-    return service.send_alert(project_name, event_type, event_status, data)
+    return service.send_alert(project_name, event_type, event_status, data, dedup_key)
@@ -4,6 +4,8 @@ Provides per-project authentication services with OAuth, email/password,
 magic links, and anonymous session support.
 """
 
+import fcntl
+import json
 import os
 import secrets
 import string
@@ -23,6 +25,10 @@ from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from hostkit.config import get_config
 from hostkit.database import get_db
 from hostkit.registry import CapabilitiesRegistry, ServiceMeta
+from hostkit.services.shared_runtime_service import SharedRuntimeError, SharedRuntimeService
+
+SHARED_AUTH_SERVICE = "hostkit-auth-shared"
+SHARED_AUTH_USER = "hostkit-auth"
 
 # Register auth service with capabilities registry
 CapabilitiesRegistry.register_service(
@@ -111,6 +117,20 @@ CREATE TABLE IF NOT EXISTS password_resets (
     used_at TIMESTAMPTZ
 );
 
+-- Outbound email queue (drained by the auth service's outbox worker)
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    to_email VARCHAR(255) NOT NULL,
+    subject TEXT NOT NULL,
+    html_body TEXT NOT NULL,
+    text_body TEXT,
+    status VARCHAR(16) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 CREATE INDEX IF NOT EXISTS idx_oauth_accounts_user_id ON oauth_accounts(user_id);
@@ -124,6 +144,8 @@ CREATE INDEX IF NOT EXISTS idx_magic_links_expires_at ON magic_links(expires_at)
 CREATE INDEX IF NOT EXISTS idx_email_verifications_token ON email_verifications(token_hash);
 CREATE INDEX IF NOT EXISTS idx_password_resets_token ON password_resets(token_hash);
 CREATE INDEX IF NOT EXISTS idx_password_resets_user_id ON password_resets(user_id);
+CREATE INDEX IF NOT EXISTS idx_email_outbox_pending
+    ON email_outbox(next_attempt_at) WHERE status = 'pending';
 """
 
 
@@ -233,10 +255,22 @@ class AuthService:
         safe_name = project.replace("-", "_")
         return f"{safe_name}_auth_user"
 
+    def _uses_shared_runtime(self, project: str) -> bool:
+        """Whether a project's auth is served by the shared multi-tenant runtime.
+
+        Fixed when auth is enabled and stored on the auth_services row, so
+        changing auth_multi_tenant later only affects newly enabled projects.
+        """
+        auth_service = self.hostkit_db.get_auth_service(project)
+        if auth_service:
+            return bool(auth_service["shared_runtime"])
+        return self.config.auth_multi_tenant
+
     def _auth_port(self, project: str) -> int:
         """Calculate auth service port from project port.
 
-        Auth service runs on project_port + 1000.
+        Auth service runs on project_port + 1000, or on the shared port when
+        the project uses the multi-tenant runtime.
         """
         project_data = self.hostkit_db.get_project(project)
         if not project_data:
@@ -245,8 +279,20 @@ class AuthService:
                 message=f"Project '{project}' does not exist",
                 suggestion="Create the project first with 'hostkit project create'",
             )
+        if self._uses_shared_runtime(project):
+            return self.config.auth_shared_port
         return project_data["port"] + 1000
 
+    def internal_auth_url(self, project: str, auth_port: int) -> str:
+        """URL the project's server-side code uses to reach its auth service.
+
+        The shared runtime routes by project name, which nginx supplies, so
+        shared-mode projects go through their hostname instead of a bare port.
+        """
+        if self._uses_shared_runtime(project):
+            return f"https://{project}.hostkit.dev"
+        return f"http://127.0.0.1:{auth_port}"
+
     def _auth_dir(self, project: str) -> Path:
         """Get the auth service directory for a project."""
         return Path(f"/home/{project}/.auth")
@@ -556,8 +602,8 @@ class AuthService:
             # Replace actual newlines with \n escape sequence for .env
             jwt_public_key_content = pem_content.replace("\n", "\\n")
 
-        # AUTH_URL is always the internal localhost URL for server-side calls
-        auth_url = f"http://127.0.0.1:{auth_port}"
+        # AUTH_URL is the internal URL for server-side calls
+        auth_url = self.internal_auth_url(project, auth_port)
 
         # NEXT_PUBLIC_AUTH_URL is the external domain URL for client-side calls
         db = get_db()
@@ -713,7 +759,7 @@ AUTH_JWT_PUBLIC_KEY="{jwt_public_key_content}"
             return None
 
         auth_dir = self._auth_dir(project)
-        auth_port = project_data["port"] + 1000
+        auth_port = self._auth_port(project)
 
         return AuthConfig(
             project=project,
@@ -765,10 +811,9 @@ AUTH_JWT_PUBLIC_KEY="{jwt_public_key_content}"
 
         Steps:
         1. Copy auth service template files to /home/{project}/.auth/
-        2. Create Python virtual environment
-        3. Install dependencies
-        4. Generate systemd service file
-        5. Create log files
+        2. Link the shared prebuilt virtual environment
+        3. Generate systemd service file (or install the shared runtime)
+        4. Create log files
         """
         import shutil
 
@@ -780,7 +825,7 @@ AUTH_JWT_PUBLIC_KEY="{jwt_public_key_content}"
             # Clear existing files (except jwt keys)
             for item in auth_dir.iterdir():
                 if item.name not in ("jwt_private.pem", "jwt_public.pem"):
-                    if item.is_dir():
+                    if item.is_dir() and not item.is_symlink():
                         shutil.rmtree(item)
                     else:
                         item.unlink()
@@ -842,68 +887,32 @@ LOG_LEVEL=INFO
         env_file.write_text(env_content)
         env_file.chmod(0o600)
 
-        # Step 2: Create virtual environment
-        venv_path = auth_dir / "venv"
+        # Step 2: Link the shared prebuilt runtime for this template
+        # (built once per requirements.txt hash, not per project)
         try:
-            subprocess.run(
-                ["python3", "-m", "venv", str(venv_path)],
-                check=True,
-                capture_output=True,
-                timeout=60,
-            )
-        except subprocess.CalledProcessError as e:
-            stderr = e.stderr.decode() if e.stderr else "unknown error"
-            raise AuthServiceError(
-                code="VENV_CREATE_FAILED",
-                message=f"Failed to create virtual environment: {stderr}",
-                suggestion="Ensure python3-venv is installed",
-            )
-
-        # Step 3: Install dependencies
-        pip_path = venv_path / "bin" / "pip"
-        requirements_path = auth_dir / "requirements.txt"
-        try:
-            subprocess.run(
-                [str(pip_path), "install", "-r", str(requirements_path)],
-                check=True,
-                capture_output=True,
-                timeout=300,  # 5 minutes for pip install
-            )
-        except subprocess.CalledProcessError as e:
-            stderr = e.stderr.decode() if e.stderr else "unknown error"
-            raise AuthServiceError(
-                code="PIP_INSTALL_FAILED",
-                message=f"Failed to install dependencies: {stderr}",
-                suggestion="Check requirements.txt and network connectivity",
+            SharedRuntimeService().link_venv(
+                "auth", auth_dir / "requirements.txt", auth_dir / "venv"
             )
+        except SharedRuntimeError as e:
+            raise AuthServiceError(code=e.code, message=e.message, suggestion=e.suggestion)
 
-        # Step 4: Generate systemd service file
-        service_template_path = (
-            Path(__file__).parent.parent.parent.parent / "templates" / "auth.service.j2"
-        )
-        if not service_template_path.exists():
-            service_template_path = Path("/var/lib/hostkit/templates/auth.service.j2")
-
-        if not service_template_path.exists():
-            raise AuthServiceError(
-                code="SERVICE_TEMPLATE_NOT_FOUND",
-                message="Auth service systemd template not found",
-                suggestion="Ensure HostKit is properly installed",
+        # Step 3: Generate systemd service file
+        if self._uses_shared_runtime(project):
+            # Served by the shared process; the tenant is registered on start
+            self._ensure_shared_auth_runtime()
+        else:
+            template = Template(self._service_template("auth.service.j2").read_text())
+            service_content = template.render(
+                project_name=project,
+                auth_port=auth_port,
+                auth_db_url=credentials.connection_url,
             )
 
-        auth_port = self._auth_port(project)
-        template = Template(service_template_path.read_text())
-        service_content = template.render(
-            project_name=project,
-            auth_port=auth_port,
-            auth_db_url=credentials.connection_url,
-        )
+            service_name = self._auth_service_name(project)
+            service_path = Path(f"/etc/systemd/system/{service_name}.service")
+            service_path.write_text(service_content)
 
-        service_name = self._auth_service_name(project)
-        service_path = Path(f"/etc/systemd/system/{service_name}.service")
-        service_path.write_text(service_content)
-
-        # Step 5: Create log files
+        # Step 4: Create log files
         log_dir = Path(f"/var/log/projects/{project}")
         log_dir.mkdir(parents=True, exist_ok=True)
         (log_dir / "auth.log").touch()
@@ -932,8 +941,166 @@ LOG_LEVEL=INFO
         # Reload systemd
         subprocess.run(["systemctl", "daemon-reload"], capture_output=True)
 
+    def _service_template(self, name: str) -> Path:
+        """Locate a systemd unit template."""
+        template_path = Path(__file__).parent.parent.parent.parent / "templates" / name
+        if not template_path.exists():
+            template_path = Path("/var/lib/hostkit/templates") / name
+
+        if not template_path.exists():
+            raise AuthServiceError(
+                code="SERVICE_TEMPLATE_NOT_FOUND",
+                message="Auth service systemd template not found",
+                suggestion="Ensure HostKit is properly installed",
+            )
+        return template_path
+
+    def _shared_auth_dir(self) -> Path:
+        """Directory of the shared multi-tenant auth runtime."""
+        return self.config.data_dir / "auth-shared"
+
+    def _ensure_shared_auth_runtime(self) -> None:
+        """Install and start the shared multi-tenant auth service.
+
+        The shared process runs the same template code as per-project services,
+        from one app directory, as an unprivileged user that is granted read
+        access to each tenant's .auth/.env and JWT keys on registration.
+        """
+        import shutil
+
+        shared_dir = self._shared_auth_dir()
+        app_dir = shared_dir / "app"
+        tenants_file = shared_dir / "tenants.json"
+
+        # Service user
+        result = subprocess.run(["getent", "passwd", SHARED_AUTH_USER], capture_output=True)
+        if result.returncode != 0:
+            subprocess.run(
+                [
+                    "useradd",
+                    "--system",
+                    "--no-create-home",
+                    "--shell",
+                    "/usr/sbin/nologin",
+                    SHARED_AUTH_USER,
+                ],
+                check=True,
+                capture_output=True,
+            )
+
+        # Template code and shared venv
+        app_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copytree(self._get_templates_dir(), app_dir, dirs_exist_ok=True)
+        try:
+            SharedRuntimeService().link_venv(
+                "auth", app_dir / "requirements.txt", app_dir / "venv"
+            )
+        except SharedRuntimeError as e:
+            raise AuthServiceError(code=e.code, message=e.message, suggestion=e.suggestion)
+
+        if not tenants_file.exists():
+            tenants_file.write_text(json.dumps({"tenants": []}, indent=2))
+        subprocess.run(["chmod", "-R", "a+rX,go-w", str(shared_dir)], capture_output=True)
+
+        # Systemd unit
+        log_dir = self.config.log_dir
+        log_dir.mkdir(parents=True, exist_ok=True)
+        for log_name in ("auth-shared.log", "auth-shared-error.log"):
+            (log_dir / log_name).touch()
+            subprocess.run(
+                ["chown", f"{SHARED_AUTH_USER}:{SHARED_AUTH_USER}", str(log_dir / log_name)],
+                capture_output=True,
+            )
+
+        template = Template(self._service_template("auth-shared.service.j2").read_text())
+        service_content = template.render(
+            app_dir=app_dir,
+            tenants_file=tenants_file,
+            auth_port=self.config.auth_shared_port,
+            workers=self.config.auth_shared_workers,
+            log_dir=log_dir,
+        )
+        service_path = Path(f"/etc/systemd/system/{SHARED_AUTH_SERVICE}.service")
+        if not service_path.exists() or service_path.read_text() != service_content:
+            service_path.write_text(service_content)
+            subprocess.run(["systemctl", "daemon-reload"], capture_output=True)
+            subprocess.run(
+                ["systemctl", "enable", f"{SHARED_AUTH_SERVICE}.service"], capture_output=True
+            )
+            subprocess.run(
+                ["systemctl", "restart", f"{SHARED_AUTH_SERVICE}.service"],
+                capture_output=True,
+                timeout=30,
+            )
+
+    def _update_shared_tenants(self, project: str, add: bool) -> None:
+        """Add or remove a project in the shared runtime's tenants file.
+
+        The running service picks the change up on its next request.
+        """
+        tenants_file = self._shared_auth_dir() / "tenants.json"
+        if not tenants_file.parent.exists():
+            return
+
+        with open(tenants_file.with_suffix(".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    tenants = set(json.loads(tenants_file.read_text()).get("tenants", []))
+                except (OSError, json.JSONDecodeError):
+                    tenants = set()
+                if add:
+                    tenants.add(project)
+                else:
+                    tenants.discard(project)
+                tmp_path = tenants_file.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps({"tenants": sorted(tenants)}, indent=2))
+                tmp_path.chmod(0o644)
+                tmp_path.replace(tenants_file)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _register_shared_tenant(self, project: str) -> None:
+        """Let the shared auth runtime serve a project."""
+        auth_dir = self._auth_dir(project)
+        acl_user = f"u:{SHARED_AUTH_USER}"
+        try:
+            # Traverse into the project home, read the tenant's settings and keys
+            subprocess.run(
+                ["setfacl", "-m", f"{acl_user}:x", f"/home/{project}", str(auth_dir)],
+                check=True,
+                capture_output=True,
+            )
+            subprocess.run(
+                [
+                    "setfacl",
+                    "-m",
+                    f"{acl_user}:r",
+                    str(auth_dir / ".env"),
+                    str(auth_dir / "jwt_private.pem"),
+                    str(auth_dir / "jwt_public.pem"),
+                ],
+                check=True,
+                capture_output=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, "stderr", None)
+            raise AuthServiceError(
+                code="SERVICE_START_FAILED",
+                message=(
+                    "Failed to grant the shared auth service access to project settings: "
+                    f"{stderr.decode() if stderr else e}"
+                ),
+                suggestion="Ensure the 'acl' package is installed (setfacl)",
+            )
+        self._update_shared_tenants(project, add=True)
+
     def _start_auth_service(self, project: str) -> None:
         """Start and enable the auth service."""
+        if self._uses_shared_runtime(project):
+            self._register_shared_tenant(project)
+            return
+
         service_name = self._auth_service_name(project)
 
         try:
@@ -978,7 +1145,13 @@ LOG_LEVEL=INFO
             pass  # May fail if service is not running
 
     def _restart_auth_service(self, project: str) -> None:
-        """Restart the auth service to pick up configuration changes."""
+        """Restart the auth service to pick up configuration changes.
+
+        The shared runtime reloads a tenant by itself when its .env changes.
+        """
+        if self._uses_shared_runtime(project):
+            return
+
         service_name = self._auth_service_name(project)
         service_path = Path(f"/etc/systemd/system/{service_name}.service")
 
@@ -1119,6 +1292,7 @@ LOG_LEVEL=INFO
 
         # Stop the service first
         self._stop_auth_service(project)
+        self._update_shared_tenants(project, add=False)
 
         # Remove systemd service file
         service_name = self._auth_service_name(project)
@@ -1273,7 +1447,8 @@ LOG_LEVEL=INFO
                 suggestion="Use 'hostkit auth disable' first to reset configuration",
             )
 
-        # Calculate auth port
+        # Runtime mode and port are fixed for the life of this project's auth
+        shared_runtime = self._uses_shared_runtime(project)
         auth_port = self._auth_port(project)
 
         # Step 1: Create auth database
@@ -1310,6 +1485,7 @@ LOG_LEVEL=INFO
                 email_enabled=email_enabled,
                 magic_link_enabled=magic_link_enabled,
                 anonymous_enabled=anonymous_enabled,
+                shared_runtime=shared_runtime,
             )
 
             # Step 8: Start the auth service
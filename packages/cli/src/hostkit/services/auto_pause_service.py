@@ -2,15 +2,76 @@
 
 Automatically pauses projects after repeated failures to prevent resource waste
 and AI agent thrashing.
+
+Also manages idle suspend (scale-to-zero): the project app and its sidecars
+move to internal ports, and a systemd socket on each public port starts the
+service on the first connection through ``systemd-socket-proxyd``. Services
+are stopped again once the project's Nginx access log has not advanced for
+``idle_minutes``.
 """
 
+import re
+import socket
+import subprocess
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 
+from hostkit.config import get_config
 from hostkit.database import get_db
 from hostkit.services.alert_service import send_alert
 
+# Suspended services listen on public_port + IDLE_PORT_OFFSET; the wake
+# socket owns the public port that Nginx proxies to
+IDLE_PORT_OFFSET = 30000
+IDLE_DROPIN_NAME = "hostkit-idle-suspend.conf"
+SOCKET_PROXYD = "/lib/systemd/systemd-socket-proxyd"
+SIDECAR_SUFFIXES = ("auth", "payment", "sms", "booking", "chatbot")
+WAKE_TIMEOUT_SECONDS = 60
+SYSTEMD_DIR = Path("/etc/systemd/system")
+
+WAKE_SOCKET_TEMPLATE = """[Unit]
+Description=HostKit wake socket: {unit}
+
+[Socket]
+ListenStream=127.0.0.1:{port}
+
+[Install]
+WantedBy=sockets.target
+"""
+
+WAKE_SERVICE_TEMPLATE = """[Unit]
+Description=HostKit wake proxy: {unit}
+Requires={unit}.service
+BindsTo={unit}.service
+After={unit}.service
+
+[Service]
+ExecStartPre=/usr/local/bin/hostkit autopause wake-wait {project} {unit} {internal_port}
+ExecStart={proxyd} 127.0.0.1:{internal_port}
+"""
+
+
+@dataclass
+class IdleUnit:
+    """A service that can be suspended, with its public and internal ports."""
+
+    unit: str
+    port: int
+    internal_port: int
+    sidecar: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON output."""
+        return {
+            "unit": self.unit,
+            "port": self.port,
+            "internal_port": self.internal_port,
+            "sidecar": self.sidecar,
+        }
+
 
 @dataclass
 class AutoPauseConfig:
@@ -25,6 +86,10 @@ class AutoPauseConfig:
     paused_reason: str | None
     created_at: str
     updated_at: str
+    idle_suspend: bool = False
+    idle_minutes: int = 30
+    last_activity_at: str | None = None
+    suspended_at: str | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AutoPauseConfig":
@@ -39,6 +104,10 @@ class AutoPauseConfig:
             paused_reason=data.get("paused_reason"),
             created_at=data["created_at"],
             updated_at=data["updated_at"],
+            idle_suspend=bool(data.get("idle_suspend", 0)),
+            idle_minutes=data.get("idle_minutes") or 30,
+            last_activity_at=data.get("last_activity_at"),
+            suspended_at=data.get("suspended_at"),
         )
 
     @classmethod
@@ -304,3 +373,351 @@ class AutoPauseService:
                     f"Run 'hostkit resume {project_name}' to continue. Paused at {paused_at}"
                 ),
             )
+
+    def _idle_units(self, project_name: str) -> list[IdleUnit]:
+        """Services of a project that idle suspend manages.
+
+        The app itself (unless static) plus any per-project sidecar unit;
+        sidecar ports are read from their unit's ``--port`` argument.
+        """
+        proj = self._validate_project(project_name)
+        units = []
+        if proj.get("runtime") != "static":
+            units.append(
+                IdleUnit(
+                    unit=f"hostkit-{project_name}",
+                    port=proj["port"],
+                    internal_port=proj["port"] + IDLE_PORT_OFFSET,
+                    sidecar=False,
+                )
+            )
+        for suffix in SIDECAR_SUFFIXES:
+            unit = f"hostkit-{project_name}-{suffix}"
+            unit_path = SYSTEMD_DIR / f"{unit}.service"
+            if not unit_path.exists():
+                continue
+            match = re.search(r"--port\s+(\d+)", unit_path.read_text())
+            if match:
+                port = int(match.group(1))
+                units.append(
+                    IdleUnit(
+                        unit=unit, port=port, internal_port=port + IDLE_PORT_OFFSET, sidecar=True
+                    )
+                )
+        return units
+
+    def _idle_env_path(self, unit: str) -> Path:
+        return get_config().data_dir / "idle" / f"{unit}.env"
+
+    def _write_idle_units(self, project_name: str, idle_unit: IdleUnit) -> None:
+        """Write the drop-in, wake socket and wake proxy for one service."""
+        unit = idle_unit.unit
+        dropin_lines = [
+            "# Managed by HostKit (idle suspend): the service listens on an internal",
+            f"# port and is started on demand by {unit}-wake.socket",
+            "[Service]",
+            "Restart=on-failure",
+        ]
+        if idle_unit.sidecar:
+            # Sidecars take their port on the command line
+            exec_start = ""
+            unit_text = (SYSTEMD_DIR / f"{unit}.service").read_text()
+            for line in unit_text.splitlines():
+                if line.startswith("ExecStart="):
+                    exec_start = line
+            exec_start = re.sub(
+                r"--port\s+\d+", f"--port {idle_unit.internal_port}", exec_start
+            )
+            dropin_lines += ["ExecStart=", exec_start]
+        else:
+            # Apps read PORT; a later EnvironmentFile overrides the project .env
+            env_path = self._idle_env_path(unit)
+            env_path.parent.mkdir(parents=True, exist_ok=True)
+            env_path.write_text(f"PORT={idle_unit.internal_port}\n")
+            dropin_lines.append(f"EnvironmentFile={env_path}")
+
+        dropin_dir = SYSTEMD_DIR / f"{unit}.service.d"
+        dropin_dir.mkdir(parents=True, exist_ok=True)
+        (dropin_dir / IDLE_DROPIN_NAME).write_text("\n".join(dropin_lines) + "\n")
+
+        (SYSTEMD_DIR / f"{unit}-wake.socket").write_text(
+            WAKE_SOCKET_TEMPLATE.format(unit=unit, port=idle_unit.port)
+        )
+        (SYSTEMD_DIR / f"{unit}-wake.service").write_text(
+            WAKE_SERVICE_TEMPLATE.format(
+                unit=unit,
+                project=project_name,
+                internal_port=idle_unit.internal_port,
+                proxyd=SOCKET_PROXYD,
+            )
+        )
+
+    def _remove_idle_units(self, idle_unit: IdleUnit) -> None:
+        unit = idle_unit.unit
+        for path in (
+            SYSTEMD_DIR / f"{unit}-wake.socket",
+            SYSTEMD_DIR / f"{unit}-wake.service",
+            SYSTEMD_DIR / f"{unit}.service.d" / IDLE_DROPIN_NAME,
+            self._idle_env_path(unit),
+        ):
+            path.unlink(missing_ok=True)
+
+    def enable_idle_suspend(self, project_name: str, idle_minutes: int | None = None) -> dict:
+        """Switch a project's services to socket-activated, idle-suspended mode.
+
+        Args:
+            project_name: Project name
+            idle_minutes: Minutes without requests before services are stopped
+
+        Returns:
+            Dict with the managed units
+        """
+        if not Path(SOCKET_PROXYD).exists():
+            raise AutoPauseError(
+                code="SOCKET_PROXYD_NOT_FOUND",
+                message=f"{SOCKET_PROXYD} is not available",
+                suggestion="Idle suspend requires systemd 246 or newer",
+            )
+        units = self._idle_units(project_name)
+        if not units:
+            raise AutoPauseError(
+                code="NO_SERVICES",
+                message=f"Project '{project_name}' has no services to suspend",
+                suggestion="Static projects are served by Nginx directly",
+            )
+
+        for idle_unit in units:
+            self._write_idle_units(project_name, idle_unit)
+        subprocess.run(["systemctl", "daemon-reload"], capture_output=True)
+
+        for idle_unit in units:
+            # Free the public port, then hand it to the wake socket
+            subprocess.run(
+                ["systemctl", "disable", "--now", f"{idle_unit.unit}.service"],
+                capture_output=True,
+                timeout=30,
+            )
+            subprocess.run(
+                ["systemctl", "enable", "--now", f"{idle_unit.unit}-wake.socket"],
+                capture_output=True,
+                timeout=30,
+            )
+
+        if not self.db.get_auto_pause_config(project_name):
+            self.db.create_auto_pause_config(project_name)
+        _, position = self._log_activity(project_name, 0)
+        now = datetime.utcnow().isoformat()
+        self.db.update_auto_pause_config(
+            project_name,
+            idle_suspend=True,
+            idle_minutes=idle_minutes,
+            idle_log_position=position,
+            last_activity_at=now,
+            suspended_at=now,
+        )
+
+        return {
+            "project": project_name,
+            "idle_suspend": True,
+            "idle_minutes": self.get_config(project_name).idle_minutes,
+            "units": [u.to_dict() for u in units],
+        }
+
+    def set_idle_minutes(self, project_name: str, idle_minutes: int) -> None:
+        """Change how long a project may be idle before it is suspended."""
+        self._validate_project(project_name)
+        if not self.db.get_auto_pause_config(project_name):
+            self.db.create_auto_pause_config(project_name)
+        self.db.update_auto_pause_config(project_name, idle_minutes=idle_minutes)
+
+    def disable_idle_suspend(self, project_name: str) -> dict[str, Any]:
+        """Return a project's services to always-on mode."""
+        units = self._idle_units(project_name)
+
+        for idle_unit in units:
+            subprocess.run(
+                [
+                    "systemctl",
+                    "disable",
+                    "--now",
+                    f"{idle_unit.unit}-wake.socket",
+                    f"{idle_unit.unit}-wake.service",
+                ],
+                capture_output=True,
+                timeout=30,
+            )
+            subprocess.run(
+                ["systemctl", "stop", f"{idle_unit.unit}.service"],
+                capture_output=True,
+                timeout=30,
+            )
+            self._remove_idle_units(idle_unit)
+        subprocess.run(["systemctl", "daemon-reload"], capture_output=True)
+
+        for idle_unit in units:
+            subprocess.run(
+                ["systemctl", "enable", "--now", f"{idle_unit.unit}.service"],
+                capture_output=True,
+                timeout=30,
+            )
+
+        if self.db.get_auto_pause_config(project_name):
+            self.db.update_auto_pause_config(
+                project_name, idle_suspend=False, clear_suspended=True
+            )
+
+        return {
+            "project": project_name,
+            "idle_suspend": False,
+            "units": [u.to_dict() for u in units],
+        }
+
+    def _log_activity(self, project_name: str, position: int) -> tuple[bool, int]:
+        from hostkit.services.metrics_service import MetricsService
+
+        return MetricsService().nginx_log_advanced(project_name, position)
+
+    def _unit_active(self, unit: str) -> bool:
+        try:
+            result = subprocess.run(
+                ["systemctl", "is-active", f"{unit}.service"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        except (subprocess.SubprocessError, OSError):
+            return False
+        return result.stdout.strip() in ("active", "activating")
+
+    def check_idle(self, project_name: str) -> dict[str, Any]:
+        """Suspend a project's services if no requests arrived for idle_minutes.
+
+        Activity is read from the Nginx access log: any growth since the last
+        recorded position counts as a request.
+        """
+        config = self.get_config(project_name)
+        result: dict[str, Any] = {"project": project_name, "action": "none"}
+        if not config.idle_suspend or config.paused:
+            return result
+
+        row = self.db.get_auto_pause_config(project_name) or {}
+        advanced, position = self._log_activity(project_name, row.get("idle_log_position") or 0)
+        now = datetime.utcnow()
+
+        if advanced:
+            self.db.update_auto_pause_config(
+                project_name, idle_log_position=position, last_activity_at=now.isoformat()
+            )
+            result["action"] = "active"
+            return result
+
+        last_activity = (
+            datetime.fromisoformat(config.last_activity_at) if config.last_activity_at else now
+        )
+        if now - last_activity < timedelta(minutes=config.idle_minutes):
+            return result
+
+        running = [u.unit for u in self._idle_units(project_name) if self._unit_active(u.unit)]
+        if not running:
+            return result
+
+        # Stopping the service also stops its wake proxy (BindsTo=); the
+        # socket keeps listening and wakes it again on the next connection
+        subprocess.run(
+            ["systemctl", "stop", *[f"{unit}.service" for unit in running]],
+            capture_output=True,
+            timeout=60,
+        )
+        self.db.update_auto_pause_config(project_name, suspended_at=now.isoformat())
+        result["action"] = "suspended"
+        result["units"] = running
+        return result
+
+    def check_all_idle(self) -> list[dict[str, Any]]:
+        """Run the idle check for every project with idle suspend enabled."""
+        results = []
+        for row in self.db.list_idle_suspend_configs():
+            try:
+                results.append(self.check_idle(row["project_name"]))
+            except (AutoPauseError, subprocess.SubprocessError, OSError) as e:
+                results.append(
+                    {"project": row["project_name"], "action": "error", "error": str(e)}
+                )
+        return results
+
+    def wait_for_wake(
+        self,
+        project_name: str,
+        unit: str,
+        internal_port: int,
+        timeout: float = WAKE_TIMEOUT_SECONDS,
+    ) -> int | None:
+        """Block until a woken service accepts connections; record the cold start.
+
+        Runs as the wake proxy's ExecStartPre, so the first proxied connection
+        is held until the service is ready instead of being refused.
+
+        Returns:
+            Cold start duration in ms, or None if the service was already up
+        """
+        started = time.monotonic()
+        started_at = datetime.utcnow().isoformat()
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                with socket.create_connection(("127.0.0.1", internal_port), timeout=1):
+                    break
+            except OSError:
+                if time.monotonic() - started > timeout:
+                    raise AutoPauseError(
+                        code="WAKE_TIMEOUT",
+                        message=f"{unit} did not accept connections within {timeout:.0f}s",
+                        suggestion=f"Check logs: journalctl -u {unit}.service",
+                    )
+                time.sleep(0.05)
+
+        now = datetime.utcnow().isoformat()
+        if attempts == 1:
+            # Already running (e.g. restarted by a deploy): not a cold start
+            return None
+
+        duration_ms = int((time.monotonic() - started) * 1000)
+        self.db.record_cold_start(project_name, unit, started_at, duration_ms)
+        self.db.update_auto_pause_config(
+            project_name, last_activity_at=now, clear_suspended=True
+        )
+        return duration_ms
+
+    def get_idle_status(self, project_name: str) -> dict[str, Any]:
+        """Idle suspend configuration, unit states and cold start statistics."""
+        config = self.get_config(project_name)
+        units = []
+        if config.idle_suspend:
+            for idle_unit in self._idle_units(project_name):
+                units.append({**idle_unit.to_dict(), "running": self._unit_active(idle_unit.unit)})
+
+        since = (datetime.utcnow() - timedelta(days=7)).isoformat()
+        cold_starts = self.db.list_cold_starts(project_name, since=since, limit=1000)
+        durations = sorted(c["duration_ms"] for c in cold_starts)
+        stats: dict[str, Any] = {"count_7d": len(durations)}
+        if durations:
+            stats.update(
+                {
+                    "last_ms": cold_starts[0]["duration_ms"],
+                    "last_at": cold_starts[0]["started_at"],
+                    "p50_ms": durations[len(durations) // 2],
+                    "p95_ms": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+                    "max_ms": durations[-1],
+                }
+            )
+
+        return {
+            "project": project_name,
+            "idle_suspend": config.idle_suspend,
+            "idle_minutes": config.idle_minutes,
+            "last_activity_at": config.last_activity_at,
+            "suspended_at": config.suspended_at,
+            "units": units,
+            "cold_starts": stats,
+        }
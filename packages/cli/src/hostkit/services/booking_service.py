@@ -15,6 +15,7 @@ from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from hostkit.config import get_config
 from hostkit.database import get_db
 from hostkit.registry import CapabilitiesRegistry, ServiceMeta
+from hostkit.services.shared_runtime_service import SharedRuntimeError, SharedRuntimeService
 
 # Register booking service with capabilities registry
 CapabilitiesRegistry.register_service(
@@ -319,10 +320,9 @@ class BookingService:
 
         Steps:
         1. Copy booking service template files to /home/{project}/.booking/
-        2. Create Python virtual environment
-        3. Install dependencies
-        4. Generate systemd service file
-        5. Create log files
+        2. Link the shared prebuilt virtual environment
+        3. Generate systemd service file
+        4. Create log files
         """
         import shutil
 
@@ -392,46 +392,16 @@ class BookingService:
                 else:
                     shutil.copy2(src_file, dest_file)
 
-        # Step 2: Create virtual environment
-        venv_path = booking_dir / "venv"
+        # Step 2: Link the shared prebuilt runtime for this template
+        # (built once per requirements.txt hash, not per project)
         try:
-            subprocess.run(
-                ["python3", "-m", "venv", str(venv_path)],
-                check=True,
-                capture_output=True,
-                timeout=60,
-            )
-        except subprocess.CalledProcessError as e:
-            raise BookingServiceError(
-                code="VENV_CREATE_FAILED",
-                message=(
-                    "Failed to create virtual environment: "
-                    + (e.stderr.decode() if e.stderr else "unknown error")
-                ),
-                suggestion="Ensure python3-venv is installed",
-            )
-
-        # Step 3: Install dependencies
-        pip_path = venv_path / "bin" / "pip"
-        requirements_path = booking_dir / "requirements.txt"
-        try:
-            subprocess.run(
-                [str(pip_path), "install", "-r", str(requirements_path)],
-                check=True,
-                capture_output=True,
-                timeout=300,  # 5 minutes for pip install
-            )
-        except subprocess.CalledProcessError as e:
-            raise BookingServiceError(
-                code="PIP_INSTALL_FAILED",
-                message=(
-                    "Failed to install dependencies: "
-                    + (e.stderr.decode() if e.stderr else "unknown error")
-                ),
-                suggestion="Check requirements.txt and network connectivity",
+            SharedRuntimeService().link_venv(
+                "booking", booking_dir / "requirements.txt", booking_dir / "venv"
             )
+        except SharedRuntimeError as e:
+            raise BookingServiceError(code=e.code, message=e.message, suggestion=e.suggestion)
 
-        # Step 4: Generate systemd service file
+        # Step 3: Generate systemd service file
         service_template_path = Path("/var/lib/hostkit/templates/booking.service.j2")
         if not service_template_path.exists():
             service_template_path = (
@@ -456,7 +426,7 @@ class BookingService:
         service_path = Path(f"/etc/systemd/system/{service_name}.service")
         service_path.write_text(service_content)
 
-        # Step 5: Create log files
+        # Step 4: Create log files
         log_dir = Path(f"/var/log/projects/{project}")
         log_dir.mkdir(parents=True, exist_ok=True)
         (log_dir / "booking.log").touch()
@@ -987,6 +957,10 @@ class BookingService:
             finally:
                 conn.close()
             booking_dir = self._booking_dir(project)
+            # Relink in case the template's requirements.txt changed
+            SharedRuntimeService().link_venv(
+                "booking", booking_dir / "requirements.txt", booking_dir / "venv"
+            )
             subprocess.run(
                 ["chown", "-R", f"{project}:{project}", str(booking_dir)], capture_output=True
             )
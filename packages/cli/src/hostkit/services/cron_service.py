@@ -13,6 +13,7 @@ from jinja2 import Template
 
 from hostkit.config import get_config
 from hostkit.database import get_db
+from hostkit.systemd import get_systemd
 
 
 @dataclass
@@ -106,6 +107,7 @@ class CronService:
     def __init__(self) -> None:
         self.config = get_config()
         self.db = get_db()
+        self.systemd = get_systemd()
         self.templates_dir = Path("/var/lib/hostkit/templates")
         self.systemd_dir = Path("/etc/systemd/system")
 
@@ -269,32 +271,8 @@ class CronService:
         Returns:
             Tuple of (is_active, is_enabled)
         """
-        active = False
-        enabled = False
-
-        try:
-            # Check active
-            result = subprocess.run(
-                ["systemctl", "is-active", f"{timer_name}.timer"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            active = result.returncode == 0
-
-            # Check enabled
-            result = subprocess.run(
-                ["systemctl", "is-enabled", f"{timer_name}.timer"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            enabled = result.stdout.strip() == "enabled"
-
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
-
-        return active, enabled
+        unit = self.systemd.unit(f"{timer_name}.timer")
+        return unit.is_active, unit.is_enabled
 
     def _create_systemd_units(self, task: ScheduledTask) -> None:
         """Create systemd service and timer unit files."""
@@ -336,6 +314,7 @@ class CronService:
             capture_output=True,
             timeout=10,
         )
+        self.systemd.invalidate()
 
     def _remove_systemd_units(self, project: str, task_name: str) -> None:
         """Remove systemd service and timer unit files."""
@@ -353,6 +332,7 @@ class CronService:
                 capture_output=True,
                 timeout=10,
             )
+            self.systemd.invalidate(f"{service_name}.timer")
         except subprocess.SubprocessError:
             pass
 
@@ -371,6 +351,7 @@ class CronService:
             capture_output=True,
             timeout=10,
         )
+        self.systemd.invalidate()
 
     def add_task(
         self,
@@ -441,6 +422,7 @@ class CronService:
                 capture_output=True,
                 timeout=10,
             )
+            self.systemd.invalidate(f"{service_name}.timer")
 
         # Update timer status
         timer_name = self._timer_name(project, name)
@@ -491,8 +473,12 @@ class CronService:
         """
         self._validate_project(project)
 
+        rows = self.db.list_scheduled_tasks(project)
+        # Fetch every task's timer state in one systemctl call
+        self.systemd.units(f"{self._timer_name(project, row['name'])}.timer" for row in rows)
+
         tasks = []
-        for row in self.db.list_scheduled_tasks(project):
+        for row in rows:
             task = ScheduledTask.from_db(row)
             # Get timer status
             timer_name = self._timer_name(project, task.name)
@@ -552,6 +538,7 @@ class CronService:
             capture_output=True,
             timeout=10,
         )
+        self.systemd.invalidate(f"{service_name}.timer")
 
         # Update database
         self.db.update_scheduled_task(project, name, enabled=True)
@@ -584,6 +571,7 @@ class CronService:
             capture_output=True,
             timeout=10,
         )
+        self.systemd.invalidate(f"{service_name}.timer")
 
         # Update database
         self.db.update_scheduled_task(project, name, enabled=False)
@@ -612,6 +600,7 @@ class CronService:
             text=True,
             timeout=3600,  # 1 hour max
         )
+        self.systemd.invalidate(f"{service_name}.service")
 
         exit_code = result.returncode
         status = "success" if exit_code == 0 else "failed"
@@ -687,22 +676,4 @@ class CronService:
             return None
 
         timer_name = self._timer_name(project, name)
-
-        try:
-            result = subprocess.run(
-                ["systemctl", "show", f"{timer_name}.timer", "--property=NextElapseUSecRealtime"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0:
-                for line in result.stdout.strip().split("\n"):
-                    if line.startswith("NextElapseUSecRealtime="):
-                        value = line.split("=", 1)[1]
-                        if value and value != "n/a":
-                            return value
-        except subprocess.SubprocessError:
-            pass
-
-        return None
+        return self.systemd.unit(f"{timer_name}.timer").next_elapse
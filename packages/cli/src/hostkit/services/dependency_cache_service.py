@@ -0,0 +1,378 @@
+"""Shared dependency cache for HostKit deploys.
+
+Installed dependency trees are cached host-wide, keyed by a hash of the
+lockfile plus the runtime version, so a release whose lockfile matches a
+previous deploy (of any project) is materialized from disk instead of being
+reinstalled from the network.
+
+- Node/Next.js: the installed ``node_modules`` tree, keyed by ``package-lock.json``.
+  Restored by reflink copy where the filesystem supports it, otherwise by a
+  plain copy, and chowned to the project either way.
+- Python: a wheelhouse built from ``requirements.txt``. The project venv lives
+  outside the release, so a hit means an offline ``pip install --no-index``.
+
+Entries are tracked in the ``dependency_cache`` table and evicted least
+recently used first once the cache exceeds ``dep_cache_max_bytes``.
+"""
+
+import hashlib
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from hostkit.config import get_config
+from hostkit.database import Database, get_db
+
+# Lockfile used as cache key, per ecosystem
+LOCKFILES = {
+    "node": "package-lock.json",
+    "python": "requirements.txt",
+}
+
+# Runtimes that share an ecosystem cache
+ECOSYSTEMS = {
+    "node": "node",
+    "nextjs": "node",
+    "python": "python",
+}
+
+# Marker written into the project venv recording the installed lockfile key
+VENV_MARKER = ".hostkit-deps-key"
+
+COPY_TIMEOUT = 300  # 5 minutes to copy a dependency tree
+
+
+@dataclass
+class DependencyCacheEntry:
+    """A cached dependency tree."""
+
+    cache_key: str
+    ecosystem: str
+    lockfile: str
+    path: str
+    size_bytes: int
+    hit_count: int
+    created_at: str
+    last_used_at: str
+    runtime_version: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DependencyCacheEntry":
+        """Create from database row."""
+        return cls(
+            cache_key=data["cache_key"],
+            ecosystem=data["ecosystem"],
+            lockfile=data["lockfile"],
+            path=data["path"],
+            size_bytes=data["size_bytes"],
+            hit_count=data["hit_count"],
+            created_at=data["created_at"],
+            last_used_at=data["last_used_at"],
+            runtime_version=data.get("runtime_version"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON output."""
+        return {
+            "cache_key": self.cache_key,
+            "ecosystem": self.ecosystem,
+            "lockfile": self.lockfile,
+            "runtime_version": self.runtime_version,
+            "path": self.path,
+            "size_bytes": self.size_bytes,
+            "hit_count": self.hit_count,
+            "created_at": self.created_at,
+            "last_used_at": self.last_used_at,
+        }
+
+
+class DependencyCacheError(Exception):
+    """Error raised by dependency cache operations."""
+
+    def __init__(self, code: str, message: str, suggestion: str | None = None):
+        self.code = code
+        self.message = message
+        self.suggestion = suggestion
+        super().__init__(message)
+
+
+class DependencyCacheService:
+    """Host-wide lockfile-keyed cache of installed dependencies."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_bytes: int | None = None,
+        db: Database | None = None,
+    ) -> None:
+        config = get_config()
+        self.cache_dir = cache_dir or config.dep_cache_dir
+        self.max_bytes = max_bytes if max_bytes is not None else config.dep_cache_max_bytes
+        self.db = db or get_db()
+        self._runtime_versions: dict[str, str] = {}
+
+    def ecosystem_for(self, runtime: str) -> str | None:
+        """Return the cache ecosystem for a project runtime (None if uncacheable)."""
+        return ECOSYSTEMS.get(runtime)
+
+    def runtime_version(self, ecosystem: str) -> str:
+        """Return the interpreter version that installed trees are tied to."""
+        if ecosystem not in self._runtime_versions:
+            cmd = ["node", "--version"] if ecosystem == "node" else ["python3", "--version"]
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                version = (result.stdout or result.stderr).strip() or "unknown"
+            except (OSError, subprocess.TimeoutExpired):
+                version = "unknown"
+            self._runtime_versions[ecosystem] = f"{version}-{platform.machine()}"
+        return self._runtime_versions[ecosystem]
+
+    def compute_key(self, runtime: str, app_dir: Path) -> str | None:
+        """Compute the cache key for an app directory.
+
+        Returns None when the runtime is not cacheable or the lockfile is missing.
+        """
+        ecosystem = self.ecosystem_for(runtime)
+        if ecosystem is None:
+            return None
+
+        lockfile = app_dir / LOCKFILES[ecosystem]
+        if not lockfile.is_file():
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(ecosystem.encode())
+        digest.update(b"\0")
+        digest.update(self.runtime_version(ecosystem).encode())
+        digest.update(b"\0")
+        digest.update(lockfile.read_bytes())
+        return digest.hexdigest()
+
+    def lookup(self, cache_key: str) -> DependencyCacheEntry | None:
+        """Find a cache entry whose payload is still on disk."""
+        row = self.db.get_dependency_cache_entry(cache_key)
+        if not row:
+            return None
+
+        if not Path(row["path"]).exists():
+            # Payload removed out from under us - forget the entry
+            self.db.delete_dependency_cache_entry(cache_key)
+            return None
+
+        return DependencyCacheEntry.from_dict(row)
+
+    def mark_used(self, cache_key: str) -> None:
+        """Bump an entry's LRU position after a hit."""
+        self.db.touch_dependency_cache_entry(cache_key)
+
+    def entry_dir(self, ecosystem: str, cache_key: str) -> Path:
+        """Directory holding the payload for a cache key."""
+        return self.cache_dir / ecosystem / cache_key
+
+    def restore_node_modules(self, entry: DependencyCacheEntry, app_dir: Path, project: str) -> str:
+        """Materialize a cached node_modules tree into a release.
+
+        Tries a reflink copy first (copy-on-write, near-free), falling back to
+        a full copy on filesystems without reflink support. Either way the
+        release gets its own files owned by the project, so a later
+        ``npm install`` run as the project user can modify them without
+        touching the shared, root-owned cache entry.
+
+        Returns:
+            The materialization method used ("reflink" or "copy")
+        """
+        source = Path(entry.path)
+        target = app_dir / "node_modules"
+        if target.exists():
+            shutil.rmtree(target)
+
+        error: Exception | None = None
+        for method, reflink in (("reflink", "always"), ("copy", "never")):
+            try:
+                subprocess.run(
+                    ["cp", "-a", f"--reflink={reflink}", str(source), str(target)],
+                    check=True,
+                    capture_output=True,
+                    timeout=COPY_TIMEOUT,
+                )
+                subprocess.run(
+                    ["chown", "-R", f"{project}:{project}", str(target)],
+                    check=True,
+                    capture_output=True,
+                )
+                return method
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+                error = e
+                shutil.rmtree(target, ignore_errors=True)
+
+        raise DependencyCacheError(
+            code="DEP_CACHE_RESTORE_FAILED",
+            message=f"Failed to materialize cached node_modules: {error}",
+            suggestion="Deploy with --force-install to bypass the cache",
+        )
+
+    def store_node_modules(self, cache_key: str, app_dir: Path) -> DependencyCacheEntry | None:
+        """Copy a freshly installed node_modules tree into the cache."""
+        source = app_dir / "node_modules"
+        if not source.is_dir():
+            return None
+
+        def populate(staging: Path) -> None:
+            subprocess.run(
+                ["cp", "-a", "--reflink=auto", str(source), str(staging)],
+                check=True,
+                capture_output=True,
+                timeout=COPY_TIMEOUT,
+            )
+
+        return self._store("node", cache_key, populate)
+
+    def build_wheelhouse(
+        self, cache_key: str, requirements: Path, project: str, timeout: int
+    ) -> DependencyCacheEntry | None:
+        """Build a wheelhouse for requirements.txt and add it to the cache.
+
+        ``pip wheel`` runs as the project user (it may execute package build
+        scripts), into a scratch directory that is then moved into the cache.
+        """
+        scratch = Path(tempfile.mkdtemp(prefix=f"hostkit-wheels-{project}-"))
+        try:
+            shutil.chown(scratch, project, project)
+            subprocess.run(
+                [
+                    "sudo",
+                    "-u",
+                    project,
+                    f"/home/{project}/venv/bin/pip",
+                    "wheel",
+                    "-r",
+                    str(requirements),
+                    "-w",
+                    str(scratch),
+                ],
+                check=True,
+                capture_output=True,
+                cwd=str(requirements.parent),
+                timeout=timeout,
+            )
+
+            def populate(staging: Path) -> None:
+                shutil.copytree(scratch, staging)
+
+            return self._store("python", cache_key, populate)
+        except (OSError, LookupError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            # Caller falls back to a plain network install
+            return None
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    def read_venv_marker(self, venv_dir: Path) -> str | None:
+        """Return the lockfile key the venv was last installed from."""
+        marker = venv_dir / VENV_MARKER
+        try:
+            return marker.read_text().strip() or None
+        except OSError:
+            return None
+
+    def write_venv_marker(self, venv_dir: Path, cache_key: str) -> None:
+        """Record which lockfile key the venv was installed from."""
+        try:
+            (venv_dir / VENV_MARKER).write_text(cache_key + "\n")
+        except OSError:
+            pass  # Marker is advisory only
+
+    def _store(
+        self, ecosystem: str, cache_key: str, populate: Callable[[Path], None]
+    ) -> DependencyCacheEntry | None:
+        """Populate a staging dir, then atomically publish it as a cache entry."""
+        final = self.entry_dir(ecosystem, cache_key)
+        try:
+            final.parent.mkdir(parents=True, exist_ok=True)
+            staging_root = Path(tempfile.mkdtemp(prefix=".staging-", dir=final.parent))
+        except OSError:
+            return None
+
+        staging = staging_root / "payload"
+        try:
+            populate(staging)
+            # Cached trees are shared between projects: root-owned, world-readable
+            subprocess.run(["chown", "-R", "root:root", str(staging)], capture_output=True)
+            subprocess.run(["chmod", "-R", "a+rX,go-w", str(staging)], capture_output=True)
+
+            try:
+                os.rename(staging, final)
+            except OSError:
+                # Another deploy published the same key first - keep theirs
+                if not final.exists():
+                    raise
+        except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return None
+        finally:
+            shutil.rmtree(staging_root, ignore_errors=True)
+
+        row = self.db.upsert_dependency_cache_entry(
+            cache_key=cache_key,
+            ecosystem=ecosystem,
+            lockfile=LOCKFILES[ecosystem],
+            path=str(final),
+            size_bytes=self._dir_size(final),
+            runtime_version=self.runtime_version(ecosystem),
+        )
+        self.evict(keep=cache_key)
+        return DependencyCacheEntry.from_dict(row)
+
+    def evict(self, max_bytes: int | None = None, keep: str | None = None) -> list[str]:
+        """Evict least recently used entries until the cache fits its budget.
+
+        Args:
+            max_bytes: Disk budget (defaults to the configured budget)
+            keep: Cache key that must not be evicted (the entry just stored)
+
+        Returns:
+            List of evicted cache keys
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.db.list_dependency_cache_entries()
+        total = sum(e["size_bytes"] for e in entries)
+
+        evicted: list[str] = []
+        for entry in entries:
+            if total <= budget:
+                break
+            if entry["cache_key"] == keep:
+                continue
+            shutil.rmtree(entry["path"], ignore_errors=True)
+            self.db.delete_dependency_cache_entry(entry["cache_key"])
+            total -= entry["size_bytes"]
+            evicted.append(entry["cache_key"])
+
+        return evicted
+
+    def stats(self) -> dict[str, Any]:
+        """Summarize cache contents."""
+        entries = [
+            DependencyCacheEntry.from_dict(e) for e in self.db.list_dependency_cache_entries()
+        ]
+        return {
+            "cache_dir": str(self.cache_dir),
+            "max_bytes": self.max_bytes,
+            "total_bytes": sum(e.size_bytes for e in entries),
+            "entries": [e.to_dict() for e in entries],
+        }
+
+    def _dir_size(self, path: Path) -> int:
+        """Total apparent size of regular files under a directory."""
+        total = 0
+        for root, _dirs, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.lstat(os.path.join(root, name)).st_size
+                except OSError:
+                    pass
+        return total
@@ -13,6 +13,10 @@ import click
 from hostkit.config import get_config
 from hostkit.database import get_db
 from hostkit.services.build_detector import BuildDetector, BuildType
+from hostkit.services.dependency_cache_service import (
+    DependencyCacheError,
+    DependencyCacheService,
+)
 from hostkit.services.release_service import Release, ReleaseService
 
 if TYPE_CHECKING:
@@ -45,6 +49,9 @@ class DeployResult:
     validation_message: str | None = field(default=None)
     app_built: bool = field(default=False)
     iron_session_installed: bool = field(default=False)
+    dependency_cache: str | None = field(default=None)
+    dependency_install_ms: int | None = field(default=None)
+    duration_ms: int | None = field(default=None)
 
 
 class DeployServiceError(Exception):
@@ -71,6 +78,7 @@ class DeployService:
         self.db = get_db()
         self.release_service = ReleaseService()
         self.build_detector = BuildDetector()
+        self.dep_cache = DependencyCacheService()
 
     def deploy(
         self,
@@ -350,8 +358,14 @@ class DeployService:
 
         # Step 6 (continued): Now install dependencies with symlink active
         iron_session_installed = False
+        dependency_cache = None
+        dependency_install_ms = None
         if install_deps:
-            deps_installed, iron_session_installed = self._install_dependencies(project, runtime, force=force_install)
+            deps_start = time.time()
+            deps_installed, iron_session_installed, dependency_cache = self._install_dependencies(
+                project, runtime, force=force_install
+            )
+            dependency_install_ms = int((time.time() - deps_start) * 1000)
 
         # Step 9: Inject secrets if requested
         secrets_injected = False
@@ -405,6 +419,9 @@ class DeployService:
             validation_message=validation_message,
             app_built=app_built,
             iron_session_installed=iron_session_installed,
+            dependency_cache=dependency_cache,
+            dependency_install_ms=dependency_install_ms,
+            duration_ms=duration_ms,
         )
 
     def deploy_from_git(
@@ -634,10 +651,14 @@ class DeployService:
             # Step 9: Install dependencies if requested
             deps_installed = False
             iron_session_installed = False
+            dependency_cache = None
+            dependency_install_ms = None
             if install_deps:
-                deps_installed, iron_session_installed = self._install_dependencies(
-                    project, runtime, force=force_install
+                deps_start = time.time()
+                deps_installed, iron_session_installed, dependency_cache = (
+                    self._install_dependencies(project, runtime, force=force_install)
                 )
+                dependency_install_ms = int((time.time() - deps_start) * 1000)
 
             # Step 10: Inject secrets if requested
             secrets_injected = False
@@ -692,6 +713,9 @@ class DeployService:
                 validation_message=validation_message,
                 app_built=app_built,
                 iron_session_installed=iron_session_installed,
+                dependency_cache=dependency_cache,
+                dependency_install_ms=dependency_install_ms,
+                duration_ms=duration_ms,
             )
 
         finally:
@@ -798,6 +822,11 @@ class DeployService:
                 return True, None
             if not venv_pip.exists():
                 return False, "venv not found"
+
+            # Venvs installed through the dependency cache record their lockfile key
+            installed_key = self.dep_cache.read_venv_marker(venv_dir)
+            if installed_key and installed_key != self.dep_cache.compute_key(runtime, app_dir):
+                return False, "requirements.txt changed since last install"
             return True, None
 
         elif runtime in ("node", "nextjs"):
@@ -836,18 +865,26 @@ class DeployService:
 
         return True, None
 
-    def _install_dependencies(self, project: str, runtime: str, force: bool = False) -> tuple[bool, bool]:
+    def _install_dependencies(
+        self, project: str, runtime: str, force: bool = False
+    ) -> tuple[bool, bool, str | None]:
         """Install dependencies based on runtime.
 
+        Installs go through the shared dependency cache when the project has a
+        lockfile (package-lock.json or requirements.txt): a hit is materialized
+        from disk, a miss installs from the network and populates the cache.
+
         For Next.js projects with auth enabled, also installs iron-session
         automatically to enable the session scaffolding.
 
         Returns:
-            Tuple of (deps_installed, iron_session_installed)
+            Tuple of (deps_installed, iron_session_installed, cache_status), where
+            cache_status is "hit", "miss" or None if the cache was not used
         """
         home_dir = Path(f"/home/{project}")
         app_dir = home_dir / "app"
         iron_session_installed = False
+        cache_status: str | None = None
 
         try:
             # Check if dependencies are already valid (unless force=True)
@@ -867,7 +904,10 @@ class DeployService:
                         iron_session_installed = self._install_iron_session_if_needed(
                             project, app_dir
                         )
-                    return True, iron_session_installed
+                    return True, iron_session_installed, None
+
+            cache_key = self.dep_cache.compute_key(runtime, app_dir)
+
             if runtime == "python":
                 venv_dir = home_dir / "venv"
                 venv_pip = venv_dir / "bin" / "pip"
@@ -899,51 +939,85 @@ class DeployService:
                         ),
                         err=True
                     )
+                    pip_cmd = ["sudo", "-u", project, str(venv_pip), "install"]
                     try:
+                        if cache_key:
+                            entry = self.dep_cache.lookup(cache_key)
+                            cache_status = "hit" if entry else "miss"
+                            if entry is None:
+                                # Build the wheelhouse once; this and later deploys install from it
+                                entry = self.dep_cache.build_wheelhouse(
+                                    cache_key, requirements, project, timeout=PIP_INSTALL_TIMEOUT
+                                )
+                            if entry is not None:
+                                pip_cmd += ["--no-index", "--find-links", entry.path]
+
                         subprocess.run(
-                            [
-                                "sudo",
-                                "-u",
-                                project,
-                                str(venv_pip),
-                                "install",
-                                "-r",
-                                str(requirements),
-                            ],
+                            pip_cmd + ["-r", str(requirements)],
                             check=True,
                             cwd=str(app_dir),
                             capture_output=True,
                             timeout=PIP_INSTALL_TIMEOUT,
                         )
-                        return True, False
+                        if cache_key:
+                            if cache_status == "hit":
+                                self.dep_cache.mark_used(cache_key)
+                            self.dep_cache.write_venv_marker(venv_dir, cache_key)
+                        return True, False, cache_status
                     except subprocess.TimeoutExpired:
-                        return False, False
+                        return False, False, cache_status
                 elif venv_pip.exists():
                     # Venv created but no requirements.txt - still counts as success
-                    return True, False
+                    return True, False, None
 
             elif runtime in ("node", "nextjs"):
                 # Both node and nextjs have package.json in app_dir
                 # npm install must run where package.json lives
                 package_json = app_dir / "package.json"
                 if package_json.exists():
-                    click.echo(
-                        click.style(
-                            f"⏳ Installing npm dependencies (timeout: {NPM_INSTALL_TIMEOUT // 60} min)...",
-                            fg="cyan"
-                        ),
-                        err=True
-                    )
-                    try:
-                        subprocess.run(
-                            ["sudo", "-u", project, "npm", "install"],
-                            check=True,
-                            cwd=str(app_dir),
-                            capture_output=True,
-                            timeout=NPM_INSTALL_TIMEOUT,
+                    entry = self.dep_cache.lookup(cache_key) if cache_key else None
+                    restored = False
+                    if entry is not None:
+                        try:
+                            method = self.dep_cache.restore_node_modules(entry, app_dir, project)
+                            self.dep_cache.mark_used(entry.cache_key)
+                            click.echo(
+                                click.style(
+                                    f"✓ Restored node_modules from dependency cache ({method})",
+                                    fg="green",
+                                ),
+                                err=True,
+                            )
+                            cache_status = "hit"
+                            restored = True
+                        except DependencyCacheError:
+                            pass  # Fall back to a network install
+
+                    if not restored:
+                        if cache_key:
+                            cache_status = "miss"
+                        click.echo(
+                            click.style(
+                                "⏳ Installing npm dependencies "
+                                f"(timeout: {NPM_INSTALL_TIMEOUT // 60} min)...",
+                                fg="cyan"
+                            ),
+                            err=True
                         )
-                    except subprocess.TimeoutExpired:
-                        return False, False
+                        try:
+                            subprocess.run(
+                                ["sudo", "-u", project, "npm", "install"],
+                                check=True,
+                                cwd=str(app_dir),
+                                capture_output=True,
+                                timeout=NPM_INSTALL_TIMEOUT,
+                            )
+                        except subprocess.TimeoutExpired:
+                            return False, False, cache_status
+
+                        # Populate the cache for the next deploy (before iron-session changes it)
+                        if cache_key:
+                            self.dep_cache.store_node_modules(cache_key, app_dir)
 
                     # For Next.js with auth, auto-install iron-session
                     if runtime == "nextjs":
@@ -951,11 +1025,11 @@ class DeployService:
                             project, app_dir
                         )
 
-                    return True, iron_session_installed
+                    return True, iron_session_installed, cache_status
 
-            return False, False
+            return False, False, cache_status
         except subprocess.CalledProcessError:
-            return False, iron_session_installed
+            return False, iron_session_installed, cache_status
 
     def _install_iron_session_if_needed(self, project: str, work_dir: Path) -> bool:
         """Install iron-session for Next.js projects with auth enabled.
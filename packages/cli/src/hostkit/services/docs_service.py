@@ -87,15 +87,24 @@ class DocsService:
         )
 
     def _chunk_claude_md(self, content: str) -> list[DocChunk]:
-        """Parse CLAUDE.md into semantic chunks by section."""
+        """Parse CLAUDE.md into semantic chunks by section.
+
+        Chunk IDs come from the section and title, not the position, so
+        editing one section leaves the other chunks' IDs (and stored
+        embeddings) alone.
+        """
         chunks: list[DocChunk] = []
+        seen_ids: dict[str, int] = {}
 
         # Split by ## and ### headers
         # Pattern: capture header level, title, and content until next header
         pattern = r"^(#{2,3})\s+(.+?)$\n(.*?)(?=^#{2,3}\s|\Z)"
         matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
 
-        for i, (level, title, body) in enumerate(matches):
+        current_section = "General"
+        for level, title, body in matches:
+            if level == "##":
+                current_section = title
             # Skip empty sections
             body = body.strip()
             if not body or len(body) < 50:
@@ -112,11 +121,16 @@ class DocsService:
             else:
                 chunk_type = "concept"
 
-            # Determine parent section (## level)
-            section = title if level == "##" else self._find_parent_section(content, title)
+            # Parent section (## level)
+            section = current_section
 
-            # Create chunk ID
-            chunk_id = f"claude-md-{i:03d}-{self._slugify(title)}"
+            # Create chunk ID, numbering repeated titles within a section
+            chunk_id = f"claude-md-{self._slugify(title)}"
+            if level != "##":
+                chunk_id = f"claude-md-{self._slugify(section)}--{self._slugify(title)}"
+            seen_ids[chunk_id] = seen_ids.get(chunk_id, 0) + 1
+            if seen_ids[chunk_id] > 1:
+                chunk_id = f"{chunk_id}-{seen_ids[chunk_id]}"
 
             # Truncate very long sections into sub-chunks
             if len(body) > 3000:
@@ -185,24 +199,6 @@ class DocsService:
 
         return chunks
 
-    def _find_parent_section(self, content: str, subsection_title: str) -> str:
-        """Find the parent ## section for a ### subsection."""
-        # Find position of subsection
-        pos = content.find(f"### {subsection_title}")
-        if pos == -1:
-            return "General"
-
-        # Look backwards for ## header
-        before = content[:pos]
-        match = re.search(r"^##\s+(.+?)$", before, re.MULTILINE)
-        if match:
-            # Get the last ## match before our position
-            matches = list(re.finditer(r"^##\s+(.+?)$", before, re.MULTILINE))
-            if matches:
-                return matches[-1].group(1)
-
-        return "General"
-
     def _slugify(self, text: str) -> str:
         """Convert text to URL-safe slug."""
         text = text.lower()
@@ -290,9 +286,28 @@ class DocsService:
 
         return chunks
 
+    def _format_chunk(self, chunk: DocChunk) -> str:
+        """Chunk text as stored, with metadata for better retrieval."""
+        return f"""---
+title: {chunk.title}
+section: {chunk.section}
+type: {chunk.chunk_type}
+source: {chunk.source}
+---
+
+{chunk.content}
+"""
+
     def index_docs(self, force: bool = False) -> dict[str, Any]:
         """Index CLAUDE.md and capabilities into vector store.
 
+        The index is updated incrementally: each chunk is stored as a
+        document named by its chunk ID, and the vector service compares
+        content hashes, so only new and changed chunks are embedded and
+        chunks that no longer exist are deleted, all in one request. A vector
+        service deployed before document sync existed gets each chunk
+        ingested with its own request instead.
+
         Args:
             force: If True, recreate collection even if it exists
 
@@ -350,43 +365,64 @@ class DocsService:
 
         all_chunks = claude_chunks + caps_chunks
 
-        # Ingest chunks
-        ingested = 0
+        # Sync chunks: unchanged ones keep their embeddings
         errors = 0
-
-        for chunk in all_chunks:
-            try:
-                # Format chunk with metadata for better retrieval
-                formatted_content = f"""---
-title: {chunk.title}
-section: {chunk.section}
-type: {chunk.chunk_type}
-source: {chunk.source}
----
-
-{chunk.content}
-"""
-                vector_service.ingest_text(
-                    project=self.SYSTEM_PROJECT,
-                    collection=self.COLLECTION_NAME,
-                    content=formatted_content,
-                    source_name=chunk.id,
+        try:
+            result = vector_service.sync_documents(
+                project=self.SYSTEM_PROJECT,
+                collection=self.COLLECTION_NAME,
+                documents=[
+                    {
+                        "source_name": chunk.id,
+                        "content": self._format_chunk(chunk),
+                        "metadata": {
+                            "section": chunk.section,
+                            "type": chunk.chunk_type,
+                            "source": chunk.source,
+                        },
+                    }
+                    for chunk in all_chunks
+                ],
+            )
+        except VectorServiceError as e:
+            if e.code != "SYNC_UNSUPPORTED":
+                raise DocsServiceError(
+                    code="INDEX_SYNC_FAILED",
+                    message=f"Could not update docs index: {e.message}",
+                    suggestion="Check 'hostkit vector status' and retry",
                 )
-                ingested += 1
-            except VectorServiceError:
-                errors += 1
+            # Older vector service: ingest every chunk on its own
+            result = {}
+            for chunk in all_chunks:
+                try:
+                    vector_service.ingest_text(
+                        project=self.SYSTEM_PROJECT,
+                        collection=self.COLLECTION_NAME,
+                        content=self._format_chunk(chunk),
+                        source_name=chunk.id,
+                    )
+                    result["added"] = result.get("added", 0) + 1
+                except VectorServiceError:
+                    errors += 1
+
+        ingested = result.get("added", 0) + result.get("updated", 0)
 
         # Store index metadata
         self._save_index_metadata(
             chunk_count=len(all_chunks),
             ingested=ingested,
+            unchanged=result.get("unchanged", 0),
+            removed=result.get("deleted", 0),
             errors=errors,
         )
 
         return {
             "chunks_total": len(all_chunks),
             "chunks_ingested": ingested,
+            "chunks_unchanged": result.get("unchanged", 0),
+            "chunks_removed": result.get("deleted", 0),
             "chunks_errors": errors,
+            "tokens_used": result.get("tokens_used", 0),
             "sources": {
                 "claude_md": len(claude_chunks),
                 "capabilities": len(caps_chunks),
@@ -394,12 +430,16 @@ source: {chunk.source}
             "indexed_at": datetime.utcnow().isoformat(),
         }
 
-    def _save_index_metadata(self, chunk_count: int, ingested: int, errors: int) -> None:
+    def _save_index_metadata(
+        self, chunk_count: int, ingested: int, unchanged: int, removed: int, errors: int
+    ) -> None:
         """Save index metadata for status command."""
         metadata_path = self.config.data_dir / "docs_index.json"
         metadata = {
             "chunk_count": chunk_count,
             "ingested": ingested,
+            "unchanged": unchanged,
+            "removed": removed,
             "errors": errors,
             "indexed_at": datetime.utcnow().isoformat(),
         }
@@ -2,6 +2,8 @@
 
 import json
 import os
+import time
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from typing import Any
@@ -75,6 +77,21 @@ class EventLevel:
     CRITICAL = "CRITICAL"
 
 
+# Follow mode polling bounds (seconds). The interval doubles while nothing
+# changes and drops back to the minimum as soon as an event arrives.
+FOLLOW_POLL_MIN = 0.1
+FOLLOW_POLL_MAX = 0.5
+FOLLOW_BATCH_SIZE = 500
+
+LEVELS = [
+    EventLevel.DEBUG,
+    EventLevel.INFO,
+    EventLevel.WARNING,
+    EventLevel.ERROR,
+    EventLevel.CRITICAL,
+]
+
+
 @dataclass
 class Event:
     """A structured event."""
@@ -206,6 +223,7 @@ class EventService:
         until: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        after_id: int | None = None,
     ) -> list[Event]:
         """Query events with filters.
 
@@ -217,12 +235,23 @@ class EventService:
             until: End time (ISO format or relative)
             limit: Maximum events to return
             offset: Skip first N events
+            after_id: Return the events after this one (cursor from the last
+                event of the previous page)
 
         Returns:
             List of events matching the filters
         """
         self._validate_project(project_name)
 
+        if after_id is not None:
+            cursor_event = self.db.get_event(after_id)
+            if not cursor_event or cursor_event["project_name"] != project_name:
+                raise EventServiceError(
+                    code="EVENT_NOT_FOUND",
+                    message=f"Event {after_id} not found for project '{project_name}'",
+                    suggestion="Use the id of the last event from the previous page",
+                )
+
         # Parse relative time strings
         since_iso = self._parse_time(since) if since else None
         until_iso = self._parse_time(until) if until else None
@@ -235,6 +264,7 @@ class EventService:
             until=until_iso,
             limit=limit,
             offset=offset,
+            after_id=after_id,
         )
         return [Event.from_dict(row) for row in rows]
 
@@ -260,9 +290,97 @@ class EventService:
             until=until_iso,
         )
 
-    def cleanup(self, older_than_days: int = 30) -> int:
-        """Delete old events. Returns count deleted."""
-        return self.db.delete_old_events(older_than_days)
+    def follow(
+        self,
+        project_name: str,
+        category: str | None = None,
+        level: str | None = None,
+        after_id: int | None = None,
+        timeout: float | None = None,
+        poll_min: float = FOLLOW_POLL_MIN,
+        poll_max: float = FOLLOW_POLL_MAX,
+    ) -> Iterator[Event]:
+        """Yield new events for a project as they are written, oldest first.
+
+        Tails the events table by id cursor. Between polls only
+        `PRAGMA data_version` is checked on one open connection; it changes
+        when any other connection commits, so the events table is only read
+        when something was written. Stops after timeout seconds if given.
+
+        Args:
+            project_name: Name of the project
+            category: Filter by category (comma-separated for multiple)
+            level: Minimum log level
+            after_id: Start after this event id (default: only new events)
+            timeout: Stop following after this many seconds
+            poll_min: Shortest wait between polls
+            poll_max: Longest wait between polls when idle
+        """
+        self._validate_project(project_name)
+
+        cursor = self.db.get_last_event_id() if after_id is None else after_id
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        interval = poll_min
+        data_version = None
+
+        with self.db.connection() as conn:
+            while True:
+                current = conn.execute("PRAGMA data_version").fetchone()[0]
+                if current != data_version:
+                    data_version = current
+                    rows = self.db.list_events_since_id(
+                        project_name,
+                        cursor,
+                        category=category,
+                        level=level,
+                        limit=FOLLOW_BATCH_SIZE,
+                    )
+                    for row in rows:
+                        cursor = row["id"]
+                        yield Event.from_dict(row)
+                    if len(rows) == FOLLOW_BATCH_SIZE:
+                        # More waiting; read again without sleeping
+                        data_version = None
+                        continue
+                    if rows:
+                        interval = poll_min
+
+                wait = interval
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    wait = min(wait, remaining)
+                time.sleep(wait)
+                interval = min(interval * 2, poll_max)
+
+    def stats(
+        self,
+        project_name: str,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> dict[str, Any]:
+        """Event totals by category and by exact level, from one query."""
+        self._validate_project(project_name)
+
+        since_iso = self._parse_time(since) if since else None
+        until_iso = self._parse_time(until) if until else None
+
+        by_category: dict[str, int] = {}
+        by_level = dict.fromkeys(LEVELS, 0)
+        for row in self.db.event_counts(project_name, since=since_iso, until=until_iso):
+            by_category[row["category"]] = by_category.get(row["category"], 0) + row["count"]
+            by_level[row["level"]] = by_level.get(row["level"], 0) + row["count"]
+
+        return {
+            "total_events": sum(by_category.values()),
+            "by_category": by_category,
+            "by_level": by_level,
+        }
+
+    def cleanup(self, older_than_days: int = 30, batch_size: int = 5000) -> int:
+        """Delete old events in bounded batches. Returns count deleted."""
+        return self.db.delete_old_events(older_than_days, batch_size=batch_size)
 
     def _parse_time(self, time_str: str) -> str:
         """Parse a time string into ISO format.
@@ -1,16 +1,23 @@
 """Health check service for HostKit projects."""
 
+import asyncio
+import functools
+import random
 import subprocess
 import time
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import psutil
 import requests
+from requests.adapters import HTTPAdapter
 
 from hostkit.database import get_db
+from hostkit.systemd import get_systemd
 
 
 @dataclass
@@ -48,6 +55,40 @@ class HealthCheck:
         }
 
 
+@dataclass
+class FleetReport:
+    """Result of checking every project at once."""
+
+    checks: list[HealthCheck]
+    checked_at: str
+    duration_ms: float
+
+    @property
+    def summary(self) -> dict[str, int]:
+        """Number of projects per overall status."""
+        counts = {"healthy": 0, "degraded": 0, "unhealthy": 0}
+        for check in self.checks:
+            counts[check.overall] = counts.get(check.overall, 0) + 1
+        return counts
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON output."""
+        return {
+            "checked_at": self.checked_at,
+            "duration_ms": self.duration_ms,
+            "total": len(self.checks),
+            "summary": self.summary,
+            "projects": [check.to_dict() for check in self.checks],
+        }
+
+
+# Fleet checks: projects probed at once, and how long to sample CPU usage
+FLEET_CONCURRENCY = 64
+CPU_SAMPLE_SECONDS = 0.1
+DATABASE_CHECK_TIMEOUT = 5
+HEALTH_SAMPLE_RETENTION_DAYS = 7
+
+
 class HealthServiceError(Exception):
     """Exception for health service errors."""
 
@@ -63,6 +104,9 @@ class HealthService:
 
     def __init__(self) -> None:
         self.db = get_db()
+        self.systemd = get_systemd()
+        self._http: requests.Session | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
     def _validate_project(self, project: str) -> dict[str, Any]:
         """Validate that the project exists and return project info."""
@@ -83,9 +127,13 @@ class HealthService:
         """Get the auth service name for a project."""
         return f"hostkit-{project}-auth"
 
-    def _check_process_status(self, service_name: str) -> dict[str, Any]:
+    def _check_process_status(
+        self, service_name: str, cpu_interval: float | None = 0.1
+    ) -> dict[str, Any]:
         """Check if a systemd service is running and get its process info.
 
+        With cpu_interval=None, CPU usage is not sampled (cpu_percent is None).
+
         Returns dict with:
             - running: bool
             - pid: int | None
@@ -101,33 +149,21 @@ class HealthService:
 
         try:
             # Check service status
-            status_result = subprocess.run(
-                ["systemctl", "is-active", service_name],
-                capture_output=True,
-                text=True,
-            )
-            result["running"] = status_result.returncode == 0
+            unit = self.systemd.unit(service_name)
+            result["running"] = unit.is_active
 
             if not result["running"]:
                 return result
 
-            # Get main PID
-            pid_result = subprocess.run(
-                ["systemctl", "show", "-p", "MainPID", service_name],
-                capture_output=True,
-                text=True,
-            )
-            if pid_result.returncode == 0:
-                pid_str = pid_result.stdout.strip().replace("MainPID=", "")
-                if pid_str and pid_str != "0":
-                    result["pid"] = int(pid_str)
+            result["pid"] = unit.main_pid
 
             # Get process metrics
             if result["pid"]:
                 try:
                     proc = psutil.Process(result["pid"])
                     result["memory_mb"] = round(proc.memory_info().rss / (1024 * 1024), 2)
-                    result["cpu_percent"] = proc.cpu_percent(interval=0.1)
+                    if cpu_interval is not None:
+                        result["cpu_percent"] = proc.cpu_percent(interval=cpu_interval)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     pass
 
@@ -143,6 +179,8 @@ class HealthService:
         endpoint: str = "/health",
         timeout: int = 10,
         expected_content: str | None = None,
+        session: requests.Session | None = None,
+        deadline: float | None = None,
     ) -> dict[str, Any]:
         """Check HTTP health endpoint.
 
@@ -159,6 +197,9 @@ class HealthService:
             - content_match: bool | None (if expected_content provided)
             - endpoint_used: str | None (which endpoint succeeded)
             - service_responding: bool (true if any endpoint responded)
+
+        Requests go through session when given. With deadline (a
+        time.monotonic() value), no request is allowed to run past it.
         """
         result: dict[str, Any] = {
             "status": None,
@@ -177,12 +218,21 @@ class HealthService:
         if endpoint != "/":
             endpoints_to_try.append("/")
 
+        http = session or requests
         for try_endpoint in endpoints_to_try:
             url = f"http://127.0.0.1:{port}{try_endpoint}"
 
+            request_timeout: float = timeout
+            if deadline is not None:
+                request_timeout = min(timeout, deadline - time.monotonic())
+                if request_timeout <= 0:
+                    if result["error"] is None:
+                        result["error"] = f"Timeout after {timeout}s"
+                    break
+
             try:
                 start_time = time.time()
-                response = requests.get(url, timeout=timeout)
+                response = http.get(url, timeout=request_timeout)
                 elapsed_ms = (time.time() - start_time) * 1000
 
                 # Any response means the service is responding
@@ -218,28 +268,30 @@ class HealthService:
 
         return result
 
-    def _check_database_connection(self, project: str) -> bool | None:
-        """Check if project can connect to its database.
-
-        Reads DATABASE_URL from .env and tries to connect.
-        Returns None if no database configured.
-        """
+    def _read_database_url(self, project: str) -> str | None:
+        """Read DATABASE_URL from the project's .env, if it has one."""
         env_path = Path(f"/home/{project}/.env")
         if not env_path.exists():
             return None
 
-        # Parse .env for DATABASE_URL
-        database_url = None
         try:
             content = env_path.read_text()
-            for line in content.splitlines():
-                line = line.strip()
-                if line.startswith("DATABASE_URL="):
-                    database_url = line.split("=", 1)[1].strip().strip('"').strip("'")
-                    break
         except OSError:
             return None
 
+        for line in content.splitlines():
+            line = line.strip()
+            if line.startswith("DATABASE_URL="):
+                return line.split("=", 1)[1].strip().strip('"').strip("'") or None
+        return None
+
+    def _check_database_connection(self, project: str) -> bool | None:
+        """Check if project can connect to its database.
+
+        Reads DATABASE_URL from .env and tries to connect.
+        Returns None if no database configured.
+        """
+        database_url = self._read_database_url(project)
         if not database_url:
             return None
 
@@ -277,37 +329,56 @@ class HealthService:
         port = project_info["port"]
         service_name = self._get_service_name(project)
 
-        checks: dict[str, Any] = {}
-
         # Check process status
         process_info = self._check_process_status(service_name)
-        checks["process"] = process_info
 
         # Check HTTP health
         http_info = self._check_http_health(project, port, endpoint, timeout, expected_content)
-        checks["http"] = http_info
 
         # Check database connectivity
         db_connected = self._check_database_connection(project)
-        checks["database"] = {"connected": db_connected}
 
         # Check auth service if enabled
+        auth_info = None
+        if self._auth_enabled(project):
+            auth_info = self._check_process_status(self._get_auth_service_name(project))
+
+        return self._build_health_check(
+            project, process_info, http_info, db_connected, auth_info, expected_content
+        )
+
+    def _auth_enabled(self, project: str) -> bool:
+        """Whether the project has the auth service enabled."""
         auth_service = self.db.get_auth_service(project)
+        return bool(auth_service and auth_service.get("enabled"))
+
+    def _build_health_check(
+        self,
+        project: str,
+        process_info: dict[str, Any],
+        http_info: dict[str, Any],
+        db_connected: bool | None,
+        auth_info: dict[str, Any] | None,
+        expected_content: str | None,
+    ) -> HealthCheck:
+        """Combine individual check results into a HealthCheck."""
+        checks: dict[str, Any] = {
+            "process": process_info,
+            "http": http_info,
+            "database": {"connected": db_connected},
+        }
         auth_running = None
-        if auth_service and auth_service.get("enabled"):
-            auth_service_name = self._get_auth_service_name(project)
-            auth_info = self._check_process_status(auth_service_name)
+        if auth_info is not None:
             auth_running = auth_info["running"]
             checks["auth_service"] = auth_info
 
-        # Determine overall status
         overall = self._determine_overall_status(
             process_running=process_info["running"],
             http_status=http_info["status"],
             http_error=http_info["error"],
             db_connected=db_connected,
             auth_running=auth_running,
-            auth_enabled=bool(auth_service and auth_service.get("enabled")),
+            auth_enabled=auth_info is not None,
             content_match=http_info.get("content_match"),
             expected_content=expected_content,
             service_responding=http_info.get("service_responding", False),
@@ -412,6 +483,8 @@ class HealthService:
         self._validate_project(project)
 
         while True:
+            # Re-read unit state on every check
+            self.systemd.invalidate()
             yield self.check_health(
                 project,
                 endpoint=endpoint,
@@ -419,3 +492,269 @@ class HealthService:
                 expected_content=expected_content,
             )
             time.sleep(interval)
+
+    # Fleet checks
+
+    def check_fleet(
+        self,
+        projects: list[str] | None = None,
+        endpoint: str = "/health",
+        timeout: int = 10,
+        expected_content: str | None = None,
+        concurrency: int = FLEET_CONCURRENCY,
+    ) -> FleetReport:
+        """Check the health of many projects concurrently.
+
+        Unit state for every project comes from one `systemctl show`, CPU
+        usage is sampled once for all processes, HTTP checks share one
+        connection pool and database checks run as concurrent psql
+        processes. Each project's HTTP checks must finish within timeout
+        seconds, so the whole fleet takes about as long as its slowest
+        project rather than the sum of all of them.
+
+        Args:
+            projects: Project names (default: all projects)
+            endpoint: HTTP endpoint to check
+            timeout: Per-project HTTP deadline in seconds
+            expected_content: Expected content in response bodies
+            concurrency: Maximum projects checked at the same time
+
+        Returns:
+            FleetReport with one HealthCheck per project, sorted by name
+        """
+        if projects is None:
+            rows = self.db.list_projects()
+        else:
+            rows = [self._validate_project(name) for name in projects]
+
+        started = time.monotonic()
+        checked_at = datetime.utcnow().isoformat()
+        checks = asyncio.run(
+            self._probe_fleet(rows, endpoint, timeout, expected_content, concurrency)
+        )
+        return FleetReport(
+            checks=sorted(checks, key=lambda c: c.project),
+            checked_at=checked_at,
+            duration_ms=round((time.monotonic() - started) * 1000, 2),
+        )
+
+    def watch_fleet(
+        self,
+        interval: int = 60,
+        jitter: float = 0,
+        record: bool = True,
+        **kwargs: Any,
+    ) -> Generator[FleetReport, None, None]:
+        """Continuously check every project, optionally recording samples.
+
+        Args:
+            interval: Seconds between rounds
+            jitter: Up to this many extra seconds added at random to each wait,
+                so several hosts (or timers) do not probe in lockstep
+            record: Store each round in the health_samples table
+            **kwargs: Passed to check_fleet
+
+        Yields:
+            A FleetReport per round
+        """
+        while True:
+            # Re-read unit state on every round
+            self.systemd.invalidate()
+            report = self.check_fleet(**kwargs)
+            if record:
+                self.record_samples(report)
+            yield report
+            time.sleep(interval + random.uniform(0, jitter))
+
+    def record_samples(self, report: FleetReport) -> None:
+        """Store a fleet report in hostkit.db and drop expired samples."""
+        self.db.create_health_samples(
+            [
+                {
+                    "project_name": check.project,
+                    "overall": check.overall,
+                    "http_status": check.http_status,
+                    "response_ms": check.http_response_ms,
+                    "process_running": check.process_running,
+                    "database_connected": check.database_connected,
+                    "error": check.error,
+                    "checked_at": report.checked_at,
+                }
+                for check in report.checks
+            ]
+        )
+        cutoff = datetime.utcnow() - timedelta(days=HEALTH_SAMPLE_RETENTION_DAYS)
+        self.db.delete_old_health_samples(cutoff.isoformat())
+
+    def _http_session(self, pool_size: int) -> requests.Session:
+        """Shared HTTP session, kept alive across watch rounds."""
+        if self._http is None:
+            self._http = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self._http.mount("http://", adapter)
+        return self._http
+
+    def _http_executor(self, workers: int) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="hostkit-health"
+            )
+        return self._executor
+
+    async def _probe_fleet(
+        self,
+        projects: list[dict[str, Any]],
+        endpoint: str,
+        timeout: int,
+        expected_content: str | None,
+        concurrency: int,
+    ) -> list[HealthCheck]:
+        names = [p["name"] for p in projects]
+        auth_enabled = {name for name in names if self._auth_enabled(name)}
+
+        # One systemctl call for every unit, and one CPU sample for every process
+        units = [self._get_service_name(n) for n in names]
+        units += [self._get_auth_service_name(n) for n in auth_enabled]
+        self.systemd.units(units)
+        processes = await self._process_status_all(units)
+
+        postgres_up = await self._postgres_accepting()
+        semaphore = asyncio.Semaphore(concurrency)
+        session = self._http_session(concurrency)
+        executor = self._http_executor(concurrency)
+
+        async def probe(project: dict[str, Any]) -> HealthCheck:
+            name = project["name"]
+            async with semaphore:
+                http_info, db_connected = await asyncio.gather(
+                    self._check_http_async(
+                        project, endpoint, timeout, expected_content, session, executor
+                    ),
+                    self._check_database_async(name, postgres_up),
+                )
+            auth_info = None
+            if name in auth_enabled:
+                auth_info = processes[self._get_auth_service_name(name)]
+            return self._build_health_check(
+                name,
+                processes[self._get_service_name(name)],
+                http_info,
+                db_connected,
+                auth_info,
+                expected_content,
+            )
+
+        return list(await asyncio.gather(*(probe(p) for p in projects)))
+
+    async def _process_status_all(self, service_names: list[str]) -> dict[str, dict[str, Any]]:
+        """Process info for several units, sampling CPU usage once for all."""
+        results = {
+            name: self._check_process_status(name, cpu_interval=None) for name in service_names
+        }
+
+        sampled: dict[str, psutil.Process] = {}
+        for name, info in results.items():
+            if info["pid"]:
+                try:
+                    proc = psutil.Process(info["pid"])
+                    proc.cpu_percent(interval=None)
+                    sampled[name] = proc
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+
+        if sampled:
+            await asyncio.sleep(CPU_SAMPLE_SECONDS)
+            for name, proc in sampled.items():
+                try:
+                    results[name]["cpu_percent"] = proc.cpu_percent(interval=None)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+        return results
+
+    async def _check_http_async(
+        self,
+        project: dict[str, Any],
+        endpoint: str,
+        timeout: int,
+        expected_content: str | None,
+        session: requests.Session,
+        executor: ThreadPoolExecutor,
+    ) -> dict[str, Any]:
+        """Run the HTTP check in the pool, bounded by a deadline of timeout seconds."""
+        loop = asyncio.get_running_loop()
+        check = functools.partial(
+            self._check_http_health,
+            project["name"],
+            project["port"],
+            endpoint,
+            timeout,
+            expected_content,
+            session=session,
+            deadline=time.monotonic() + timeout,
+        )
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(executor, check), timeout + 1)
+        except TimeoutError:
+            return {
+                "status": None,
+                "response_ms": None,
+                "body": None,
+                "error": f"Timeout after {timeout}s",
+                "content_match": None,
+                "endpoint_used": None,
+                "service_responding": False,
+            }
+
+    async def _postgres_accepting(self) -> bool | None:
+        """Ask the local PostgreSQL server once whether it accepts connections.
+
+        Returns None if that cannot be determined (pg_isready not installed).
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "pg_isready",
+                "-q",
+                "-t",
+                str(DATABASE_CHECK_TIMEOUT),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+        try:
+            code = await asyncio.wait_for(proc.wait(), DATABASE_CHECK_TIMEOUT + 1)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False
+        # 0: accepting, 1: rejecting (e.g. starting up), 2: no response
+        return code == 0
+
+    async def _check_database_async(self, project: str, postgres_up: bool | None) -> bool | None:
+        """Async version of _check_database_connection.
+
+        Skips the per-project psql when the server is known to be down.
+        """
+        database_url = self._read_database_url(project)
+        if not database_url:
+            return None
+        if postgres_up is False:
+            return False
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "psql",
+                database_url,
+                "-c",
+                "SELECT 1",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError:
+            return False
+        try:
+            return await asyncio.wait_for(proc.wait(), DATABASE_CHECK_TIMEOUT) == 0
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False
@@ -10,6 +10,7 @@ from typing import Any
 import psutil
 
 from hostkit.database import get_db
+from hostkit.systemd import get_systemd
 
 
 @dataclass
@@ -178,6 +179,7 @@ class MetricsService:
 
     def __init__(self) -> None:
         self.db = get_db()
+        self.systemd = get_systemd()
 
     def _validate_project(self, project: str) -> dict[str, Any]:
         """Validate that the project exists and return project info."""
@@ -359,32 +361,13 @@ class MetricsService:
         }
 
         # Check service status
-        try:
-            status_result = subprocess.run(
-                ["systemctl", "is-active", service_name],
-                capture_output=True,
-                text=True,
-            )
-            if status_result.returncode != 0:
-                return result
-
-            # Get main PID
-            pid_result = subprocess.run(
-                ["systemctl", "show", "-p", "MainPID", service_name],
-                capture_output=True,
-                text=True,
-            )
-            if pid_result.returncode != 0:
-                return result
-
-            pid_str = pid_result.stdout.strip().replace("MainPID=", "")
-            if not pid_str or pid_str == "0":
-                return result
-
-            pid = int(pid_str)
+        unit = self.systemd.unit(service_name)
+        if not unit.is_active or unit.main_pid is None:
+            return result
 
+        try:
             # Get process metrics including children
-            main_proc = psutil.Process(pid)
+            main_proc = psutil.Process(unit.main_pid)
             children = main_proc.children(recursive=True)
             all_procs = [main_proc] + children
             result["process_count"] = len(all_procs)
@@ -408,7 +391,7 @@ class MetricsService:
             if total_memory > 0:
                 result["memory_percent"] = round((total_rss / total_memory) * 100, 2)
 
-        except (subprocess.SubprocessError, psutil.NoSuchProcess, psutil.AccessDenied):
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
 
         # Get disk usage
@@ -501,6 +484,39 @@ class MetricsService:
 
         return result
 
+    def find_nginx_access_log(self, project: str) -> Path | None:
+        """Find the Nginx access log for a project."""
+        log_paths = [
+            Path(f"/var/log/nginx/{project}.access.log"),
+        ]
+        # Also check for nip.io dev domain logs (any IP)
+        nginx_log_dir = Path("/var/log/nginx")
+        if nginx_log_dir.exists():
+            log_paths.extend(nginx_log_dir.glob(f"{project}.*.nip.io.access.log"))
+
+        for p in log_paths:
+            if p.exists():
+                return p
+        return None
+
+    def nginx_log_advanced(self, project: str, position: int) -> tuple[bool, int]:
+        """Check whether a project's access log has grown past a position.
+
+        Cheaper than parsing: only the file size is compared. A log that
+        shrank was rotated, which also implies requests since ``position``.
+
+        Returns:
+            (advanced, new_position)
+        """
+        log_path = self.find_nginx_access_log(project)
+        if not log_path:
+            return False, position
+        try:
+            size = log_path.stat().st_size
+        except OSError:
+            return False, position
+        return size != position, size
+
     def _parse_nginx_logs(self, project: str, config: MetricsConfig) -> dict[str, Any]:
         """Parse Nginx access logs for application metrics.
 
@@ -528,21 +544,7 @@ class MetricsService:
             "new_position": config.nginx_log_position,
         }
 
-        # Find Nginx access log for this project
-        log_paths = [
-            Path(f"/var/log/nginx/{project}.access.log"),
-        ]
-        # Also check for nip.io dev domain logs (any IP)
-        nginx_log_dir = Path("/var/log/nginx")
-        if nginx_log_dir.exists():
-            log_paths.extend(nginx_log_dir.glob(f"{project}.*.nip.io.access.log"))
-
-        log_path = None
-        for p in log_paths:
-            if p.exists():
-                log_path = p
-                break
-
+        log_path = self.find_nginx_access_log(project)
         if not log_path:
             return result
 
@@ -743,6 +745,8 @@ class MetricsService:
                     "messages": messages,
                     "metrics": metrics_data,
                 },
+                # Values change every tick; the same metrics breaching is the same alert
+                dedup_key=",".join(sorted(metrics_data)),
             )
         except Exception:
             # Don't fail metrics collection if alerting fails
@@ -756,6 +760,9 @@ class MetricsService:
             cursor = conn.execute("SELECT project_name FROM metrics_config WHERE enabled = 1")
             projects = [row["project_name"] for row in cursor.fetchall()]
 
+        # Fetch every project's service state in one systemctl call
+        self.systemd.units(self._get_service_name(project) for project in projects)
+
         for project in projects:
             try:
                 sample = self.collect_metrics(project)
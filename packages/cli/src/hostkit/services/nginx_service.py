@@ -68,6 +68,7 @@ AUTH_LOCATION_TEMPLATE = (
         proxy_pass http://127.0.0.1:{{ auth_port }};
         proxy_http_version 1.1;
         proxy_set_header Host $host;
+        proxy_set_header X-HostKit-Project {{ project_name }};
         proxy_set_header X-Real-IP $remote_addr;
         proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
         proxy_set_header X-Forwarded-Proto $scheme;
@@ -574,7 +575,7 @@ class NginxService:
         auth_location = ""
         if auth_port:
             auth_template = Template(AUTH_LOCATION_TEMPLATE)
-            auth_location = auth_template.render(auth_port=auth_port)
+            auth_location = auth_template.render(auth_port=auth_port, project_name=project)
 
         # Generate payment location block if payments are enabled
         payment_location = ""
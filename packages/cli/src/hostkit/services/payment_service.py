@@ -16,6 +16,7 @@ from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from hostkit.config import get_config
 from hostkit.database import get_db
 from hostkit.registry import CapabilitiesRegistry, ServiceMeta
+from hostkit.services.shared_runtime_service import SharedRuntimeError, SharedRuntimeService
 
 # Register payment service with capabilities registry
 CapabilitiesRegistry.register_service(
@@ -168,6 +169,23 @@ class PaymentService:
                 suggestion="Use lowercase letters, numbers, hyphens, and underscores only",
             )
 
+    def _get_payment_db_connection(self, project: str) -> psycopg2.extensions.connection:
+        """Get a connection to a project's payment database as the admin user."""
+        try:
+            return psycopg2.connect(
+                host=self.config.postgres_host,
+                port=self.config.postgres_port,
+                user=self._admin_user,
+                password=self._admin_password,
+                database=self._payment_db_name(project),
+            )
+        except psycopg2.OperationalError as e:
+            raise PaymentServiceError(
+                code="PG_CONNECTION_FAILED",
+                message=f"Failed to connect to the payment database: {e}",
+                suggestion="Check PostgreSQL is running and credentials are correct",
+            )
+
     def _database_exists(self, project: str) -> bool:
         """Check if payment database exists for a project."""
         db_name = self._payment_db_name(project)
@@ -351,10 +369,9 @@ class PaymentService:
 
         Steps:
         1. Copy payment service template files to /home/{project}/.payment/
-        2. Create Python virtual environment
-        3. Install dependencies
-        4. Generate systemd service file
-        5. Create log files
+        2. Link the shared prebuilt virtual environment
+        3. Generate systemd service file
+        4. Create log files
         """
         import shutil
 
@@ -411,46 +428,16 @@ class PaymentService:
                 else:
                     shutil.copy2(src_file, dest_file)
 
-        # Step 2: Create virtual environment
-        venv_path = payment_dir / "venv"
+        # Step 2: Link the shared prebuilt runtime for this template
+        # (built once per requirements.txt hash, not per project)
         try:
-            subprocess.run(
-                ["python3", "-m", "venv", str(venv_path)],
-                check=True,
-                capture_output=True,
-                timeout=60,
-            )
-        except subprocess.CalledProcessError as e:
-            raise PaymentServiceError(
-                code="VENV_CREATE_FAILED",
-                message=(
-                    "Failed to create virtual environment: "
-                    f"{e.stderr.decode() if e.stderr else 'unknown error'}"
-                ),
-                suggestion="Ensure python3-venv is installed",
-            )
-
-        # Step 3: Install dependencies
-        pip_path = venv_path / "bin" / "pip"
-        requirements_path = payment_dir / "requirements.txt"
-        try:
-            subprocess.run(
-                [str(pip_path), "install", "-r", str(requirements_path)],
-                check=True,
-                capture_output=True,
-                timeout=300,  # 5 minutes for pip install
-            )
-        except subprocess.CalledProcessError as e:
-            raise PaymentServiceError(
-                code="PIP_INSTALL_FAILED",
-                message=(
-                    "Failed to install dependencies: "
-                    f"{e.stderr.decode() if e.stderr else 'unknown error'}"
-                ),
-                suggestion="Check requirements.txt and network connectivity",
+            SharedRuntimeService().link_venv(
+                "payment", payment_dir / "requirements.txt", payment_dir / "venv"
             )
+        except SharedRuntimeError as e:
+            raise PaymentServiceError(code=e.code, message=e.message, suggestion=e.suggestion)
 
-        # Step 4: Generate systemd service file
+        # Step 3: Generate systemd service file
         service_template_path = Path("/var/lib/hostkit/templates/payment.service.j2")
         if not service_template_path.exists():
             service_template_path = (
@@ -477,7 +464,7 @@ class PaymentService:
         service_path = Path(f"/etc/systemd/system/{service_name}.service")
         service_path.write_text(service_content)
 
-        # Step 5: Create log files
+        # Step 4: Create log files
         log_dir = Path(f"/var/log/projects/{project}")
         log_dir.mkdir(parents=True, exist_ok=True)
         (log_dir / "payment.log").touch()
@@ -907,3 +894,93 @@ class PaymentService:
             "payouts_enabled": payouts_enabled,
             "onboarding_url": onboarding_url,
         }
+
+    def replay_webhook_events(
+        self,
+        project: str,
+        event_ids: list[str] | None = None,
+        since: str | None = None,
+        event_type: str | None = None,
+    ) -> dict[str, Any]:
+        """Re-queue stored Stripe webhook events for processing.
+
+        By default, events that were given up on (status 'failed') are
+        re-queued. With ``event_ids`` or ``since``, processed events are
+        re-queued as well; event handlers are idempotent.
+
+        Args:
+            project: Project name
+            event_ids: Only these Stripe event IDs
+            since: Only events received within this window (e.g. 1h, 24h, 7d)
+            event_type: Only events of this type (e.g. charge.refunded)
+
+        Returns:
+            Dictionary with the number of re-queued events
+        """
+        import re
+
+        if not self.payment_is_enabled(project):
+            raise PaymentServiceError(
+                code="PAYMENT_NOT_ENABLED",
+                message=f"Payment service is not enabled for '{project}'",
+                suggestion=f"Enable payments first with 'hostkit payments enable {project}'",
+            )
+
+        conditions = []
+        params: list[Any] = []
+        if event_ids:
+            conditions.append("event_id = ANY(%s)")
+            params.append(list(event_ids))
+        if since:
+            match = re.match(r"^(\d+)([mhd])$", since.lower())
+            if not match:
+                raise PaymentServiceError(
+                    code="INVALID_DURATION",
+                    message=f"Invalid duration format: {since}",
+                    suggestion="Use formats like 30m, 24h, 7d",
+                )
+            unit = {"m": "minutes", "h": "hours", "d": "days"}[match.group(2)]
+            conditions.append(f"received_at >= NOW() - make_interval({unit} => %s)")
+            params.append(int(match.group(1)))
+        if event_type:
+            conditions.append("event_type = %s")
+            params.append(event_type)
+        if event_ids or since:
+            conditions.append("status IN ('processed', 'failed')")
+        else:
+            conditions.append("status = 'failed'")
+
+        conn = self._get_payment_db_connection(project)
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    UPDATE stripe_webhook_events
+                    SET status = 'pending',
+                        attempts = 0,
+                        last_error = NULL,
+                        next_attempt_at = NOW(),
+                        processed_at = NULL
+                    WHERE {" AND ".join(conditions)}
+                    """,
+                    params,
+                )
+                requeued = cur.rowcount
+                cur.execute("SELECT COUNT(*) FROM stripe_webhook_events WHERE status = 'pending'")
+                pending = cur.fetchone()[0]
+        except psycopg2.errors.UndefinedTable:
+            raise PaymentServiceError(
+                code="WEBHOOK_QUEUE_MISSING",
+                message="The payment database has no stripe_webhook_events table",
+                suggestion="Apply the webhook queue section of templates/payment/schema.sql",
+            )
+        except psycopg2.Error as e:
+            raise PaymentServiceError(
+                code="WEBHOOK_REPLAY_FAILED",
+                message=f"Failed to re-queue webhook events: {e}",
+                suggestion="Check the payment database",
+            )
+        finally:
+            conn.close()
+
+        return {"project": project, "requeued": requeued, "pending": pending}
@@ -10,6 +10,7 @@ from typing import Any
 
 from hostkit.config import get_config
 from hostkit.database import get_db
+from hostkit.systemd import get_systemd
 
 # Valid project name pattern: lowercase alphanumeric with hyphens, must start with letter,
 # end with letter/number (not hyphen), 3-32 chars
@@ -86,6 +87,7 @@ class ProjectService:
 
     def __init__(self) -> None:
         self.db = get_db()
+        self.systemd = get_systemd()
         self.config = get_config()
 
     def validate_project_name(self, name: str) -> None:
@@ -323,6 +325,9 @@ class ProjectService:
         projects = self.db.list_projects()
         result = []
 
+        # Fetch every project's service state in one systemctl call
+        self.systemd.units(f"hostkit-{p['name']}" for p in projects)
+
         for p in projects:
             # Get actual service status
             service_status = self._get_service_status(p["name"])
@@ -741,6 +746,7 @@ class ProjectService:
                 )
             except subprocess.CalledProcessError:
                 pass
+            self.systemd.invalidate()
 
         return stopped
 
@@ -1016,6 +1022,7 @@ NODE_ENV=production
 
         # Reload systemd
         subprocess.run(["systemctl", "daemon-reload"], check=True, capture_output=True)
+        self.systemd.invalidate(f"hostkit-{name}")
 
     def _remove_systemd_service(self, name: str) -> None:
         """Remove a project's systemd service file."""
@@ -1023,6 +1030,7 @@ NODE_ENV=production
         if service_path.exists():
             service_path.unlink()
             subprocess.run(["systemctl", "daemon-reload"], check=True, capture_output=True)
+            self.systemd.invalidate(f"hostkit-{name}")
 
     def _stop_systemd_service(self, name: str) -> None:
         """Stop a project's systemd service."""
@@ -1035,28 +1043,11 @@ NODE_ENV=production
         except subprocess.CalledProcessError:
             # Service might not be running or not exist
             pass
+        self.systemd.invalidate(f"hostkit-{name}")
 
     def _get_service_status(self, name: str) -> str:
         """Get the systemd service status for a project."""
-        try:
-            result = subprocess.run(
-                ["systemctl", "is-active", f"hostkit-{name}"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            status = result.stdout.strip()
-            # Map systemd status to our status
-            if status == "active":
-                return "running"
-            elif status == "inactive":
-                return "stopped"
-            elif status == "failed":
-                return "failed"
-            else:
-                return "stopped"
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return "stopped"
+        return self.systemd.unit(f"hostkit-{name}").status
 
     def _create_log_directory(self, name: str) -> None:
         """Create the centralized log directory for a project."""
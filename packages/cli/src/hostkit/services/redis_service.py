@@ -1,6 +1,9 @@
 """Redis management service for HostKit."""
 
-from dataclasses import dataclass
+import math
+import random
+import time
+from dataclasses import dataclass, field
 from typing import Any
 
 import redis
@@ -17,7 +20,7 @@ CapabilitiesRegistry.register_service(
         provision_flag=None,
         enable_command=None,
         env_vars_provided=["REDIS_URL"],
-        related_commands=["redis info", "redis flush"],
+        related_commands=["redis info", "redis profile", "redis flush"],
     )
 )
 
@@ -35,6 +38,71 @@ class RedisInfo:
     databases: dict[int, int]  # db_number -> key_count
 
 
+# Profiling defaults: keys per SCAN step, keys sampled, seconds and
+# commands per second the profiler may spend on the shared instance
+PROFILE_SCAN_COUNT = 100
+PROFILE_MAX_SAMPLES = 10_000
+PROFILE_TIME_BUDGET = 30.0
+PROFILE_MAX_OPS = 5_000
+PROFILE_BIG_KEY_BYTES = 1024 * 1024
+PROFILE_MAX_PREFIXES = 10_000
+# Share of sampled keys without a TTL that gets a prefix flagged
+PROFILE_NO_TTL_WARN = 0.5
+# z for 95% confidence bounds
+CONFIDENCE_Z = 1.96
+
+
+@dataclass
+class PrefixStats:
+    """Keys seen and sampled for one key prefix during a profile."""
+
+    prefix: str
+    seen: int = 0
+    sampled: int = 0
+    memory_sum: int = 0
+    memory_sum_sq: int = 0
+    max_memory: int = 0
+    no_ttl: int = 0
+    types: dict[str, int] = field(default_factory=dict)
+
+    def add_sample(self, memory: int, key_type: str, pttl: int) -> None:
+        self.sampled += 1
+        self.memory_sum += memory
+        self.memory_sum_sq += memory * memory
+        self.max_memory = max(self.max_memory, memory)
+        if pttl == -1:
+            self.no_ttl += 1
+        self.types[key_type] = self.types.get(key_type, 0) + 1
+
+    def estimate(self, keys: float) -> tuple[float, float | None]:
+        """Estimate total memory for `keys` keys from the samples.
+
+        Returns (estimate, margin) where margin is the half-width of a 95%
+        confidence interval (finite-population corrected), or None with
+        fewer than two samples.
+        """
+        if not self.sampled:
+            return 0.0, None
+        mean = self.memory_sum / self.sampled
+        if self.sampled >= keys:
+            return self.memory_sum, 0.0
+        if self.sampled < 2:
+            return keys * mean, None
+        variance = max(0.0, (self.memory_sum_sq - self.sampled * mean * mean) / (self.sampled - 1))
+        correction = 1 - self.sampled / keys
+        margin = CONFIDENCE_Z * keys * math.sqrt(variance / self.sampled * correction)
+        return keys * mean, margin
+
+
+def key_prefix(key: str, depth: int = 1, separator: str = ":") -> str:
+    """Group a key by its first `depth` separator-delimited segments."""
+    parts = key.split(separator, depth)
+    if len(parts) == 1:
+        return "(no prefix)"
+    # Keep at least one segment for the wildcard to stand for
+    return separator.join(parts[: min(depth, len(parts) - 1)]) + separator + "*"
+
+
 class RedisServiceError(Exception):
     """Base exception for Redis service errors."""
 
@@ -77,6 +145,25 @@ class RedisService:
                 suggestion="Check Redis configuration and logs",
             )
 
+    def _project_redis_db(self, project_name: str) -> int:
+        """Get a project's Redis database number."""
+        project = self.hostkit_db.get_project(project_name)
+        if not project:
+            raise RedisServiceError(
+                code="PROJECT_NOT_FOUND",
+                message=f"Project '{project_name}' does not exist",
+                suggestion="Run 'hostkit project list' to see available projects",
+            )
+
+        redis_db = project.get("redis_db")
+        if redis_db is None:
+            raise RedisServiceError(
+                code="NO_REDIS_DB",
+                message=f"Project '{project_name}' has no Redis database assigned",
+                suggestion="Redis database is assigned when project is created",
+            )
+        return redis_db
+
     def get_info(self) -> RedisInfo:
         """Get Redis server information."""
         client = self._get_connection()
@@ -106,22 +193,7 @@ class RedisService:
 
     def get_keys(self, project_name: str, pattern: str = "*", limit: int = 100) -> dict[str, Any]:
         """Get keys for a project's Redis database."""
-        # Get project's Redis database number
-        project = self.hostkit_db.get_project(project_name)
-        if not project:
-            raise RedisServiceError(
-                code="PROJECT_NOT_FOUND",
-                message=f"Project '{project_name}' does not exist",
-                suggestion="Run 'hostkit project list' to see available projects",
-            )
-
-        redis_db = project.get("redis_db")
-        if redis_db is None:
-            raise RedisServiceError(
-                code="NO_REDIS_DB",
-                message=f"Project '{project_name}' has no Redis database assigned",
-                suggestion="Redis database is assigned when project is created",
-            )
+        redis_db = self._project_redis_db(project_name)
 
         client = self._get_connection(db=redis_db)
         try:
@@ -152,6 +224,183 @@ class RedisService:
         finally:
             client.close()
 
+    def profile(
+        self,
+        project_name: str,
+        max_samples: int = PROFILE_MAX_SAMPLES,
+        scan_count: int = PROFILE_SCAN_COUNT,
+        time_budget: float = PROFILE_TIME_BUDGET,
+        max_ops: int = PROFILE_MAX_OPS,
+        depth: int = 1,
+        big_key_bytes: int = PROFILE_BIG_KEY_BYTES,
+        top: int = 20,
+    ) -> dict[str, Any]:
+        """Profile memory use in a project's Redis database by key prefix.
+
+        Walks the keyspace with SCAN (scan_count keys per step) and samples
+        about max_samples keys at random, reading MEMORY USAGE, TYPE and
+        PTTL for them in one pipeline per step. Every key name seen is
+        counted by prefix, so key counts are exact when the scan completes;
+        memory per prefix is estimated from the samples with 95% bounds.
+
+        The scan stops after time_budget seconds and sleeps to stay under
+        max_ops commands per second, so each call Redis runs is small and
+        other projects on the instance are not held up.
+        """
+        redis_db = self._project_redis_db(project_name)
+        client = self._get_connection(db=redis_db)
+        try:
+            total_keys = client.dbsize()
+            sample_rate = min(1.0, max_samples / total_keys) if total_keys else 1.0
+            rng = random.Random()
+            prefixes: dict[str, PrefixStats] = {}
+            big_keys: list[dict[str, Any]] = []
+            scanned = sampled = ops = 0
+            cursor = 0
+            started = time.monotonic()
+            deadline = started + time_budget
+
+            while True:
+                cursor, batch = client.scan(cursor=cursor, count=scan_count)
+                ops += 1
+                scanned += len(batch)
+
+                picked: list[tuple[str, PrefixStats]] = []
+                for key in batch:
+                    stats = self._prefix_stats(prefixes, key_prefix(key, depth))
+                    stats.seen += 1
+                    if rng.random() < sample_rate:
+                        picked.append((key, stats))
+
+                if picked:
+                    pipe = client.pipeline(transaction=False)
+                    for key, _ in picked:
+                        pipe.memory_usage(key)
+                        pipe.type(key)
+                        pipe.pttl(key)
+                    results = pipe.execute(raise_on_error=False)
+                    ops += len(picked) * 3
+
+                    for i, (key, stats) in enumerate(picked):
+                        memory, key_type, pttl = results[i * 3 : i * 3 + 3]
+                        # Deleted or expired since SCAN returned it
+                        if not isinstance(memory, int) or key_type == "none":
+                            continue
+                        stats.add_sample(memory, key_type, pttl)
+                        sampled += 1
+                        if memory >= big_key_bytes:
+                            big_keys.append(
+                                {
+                                    "key": key,
+                                    "type": key_type,
+                                    "memory_bytes": memory,
+                                    "ttl_seconds": pttl // 1000 if pttl >= 0 else None,
+                                }
+                            )
+
+                now = time.monotonic()
+                if cursor == 0 or now >= deadline:
+                    break
+                # Pace to max_ops commands per second
+                ahead = ops / max_ops - (now - started)
+                if ahead > 0:
+                    time.sleep(min(ahead, deadline - now))
+
+            elapsed = time.monotonic() - started
+            instance_memory = client.info("memory").get("used_memory", 0)
+        except redis.RedisError as e:
+            raise RedisServiceError(
+                code="REDIS_ERROR",
+                message=f"Redis error while profiling: {e}",
+                suggestion="Check Redis configuration and logs",
+            )
+        finally:
+            client.close()
+
+        complete = cursor == 0
+        # An unfinished scan saw a hash-ordered slice of the keyspace; scale it up
+        scale = total_keys / scanned if scanned and not complete else 1.0
+
+        rows = []
+        total_memory = 0.0
+        total_variance = 0.0
+        no_ttl_keys = 0.0
+        for stats in prefixes.values():
+            keys = stats.seen * scale
+            memory, margin = stats.estimate(keys)
+            total_memory += memory
+            # Single-sample prefixes have no spread to measure; count them as +/-100%
+            total_variance += (margin if margin is not None else memory) ** 2
+            no_ttl_share = stats.no_ttl / stats.sampled if stats.sampled else 0.0
+            no_ttl_keys += keys * no_ttl_share
+            rows.append(
+                {
+                    "prefix": stats.prefix,
+                    "keys": round(keys),
+                    "sampled": stats.sampled,
+                    "memory_bytes": round(memory),
+                    "memory_low": round(max(0.0, memory - margin)) if margin is not None else None,
+                    "memory_high": round(memory + margin) if margin is not None else None,
+                    "types": stats.types,
+                    "no_ttl_pct": round(no_ttl_share * 100, 1),
+                    "max_key_bytes": stats.max_memory,
+                }
+            )
+
+        rows.sort(key=lambda r: r["memory_bytes"], reverse=True)
+        for row in rows:
+            row["share_pct"] = (
+                round(row["memory_bytes"] / total_memory * 100, 1) if total_memory else 0.0
+            )
+        big_keys.sort(key=lambda k: k["memory_bytes"], reverse=True)
+        total_margin = math.sqrt(total_variance)
+
+        warnings = []
+        if not complete:
+            warnings.append(
+                f"Scan stopped at the {time_budget:g}s budget after {scanned} of {total_keys} "
+                "keys; key counts are scaled estimates"
+            )
+        for row in rows[:top]:
+            if row["sampled"] and row["no_ttl_pct"] >= PROFILE_NO_TTL_WARN * 100:
+                warnings.append(
+                    f"{row['prefix']}: {row['no_ttl_pct']:g}% of sampled keys have no TTL "
+                    f"(~{row['keys']} keys, ~{row['memory_bytes']} bytes)"
+                )
+        if big_keys:
+            warnings.append(
+                f"{len(big_keys)} sampled key(s) use at least {big_key_bytes} bytes each"
+            )
+
+        return {
+            "project": project_name,
+            "redis_db": redis_db,
+            "total_keys": total_keys,
+            "scanned_keys": scanned,
+            "sampled_keys": sampled,
+            "scan_complete": complete,
+            "elapsed_ms": round(elapsed * 1000),
+            "commands": ops,
+            "instance_used_memory": instance_memory,
+            "estimated_memory_bytes": round(total_memory),
+            "estimated_memory_low": round(max(0.0, total_memory - total_margin)),
+            "estimated_memory_high": round(total_memory + total_margin),
+            "estimated_no_ttl_keys": round(no_ttl_keys),
+            "prefixes": rows[:top],
+            "prefix_count": len(rows),
+            "big_keys": big_keys[:top],
+            "warnings": warnings,
+        }
+
+    @staticmethod
+    def _prefix_stats(prefixes: dict[str, PrefixStats], prefix: str) -> PrefixStats:
+        """Get the stats for a prefix, folding new ones into "(other)" past the cap."""
+        if prefix not in prefixes and len(prefixes) >= PROFILE_MAX_PREFIXES:
+            prefix = "(other)"
+        if prefix not in prefixes:
+            prefixes[prefix] = PrefixStats(prefix)
+        return prefixes[prefix]
+
     def flush_db(self, project_name: str, force: bool = False) -> dict[str, Any]:
         """Flush all keys in a project's Redis database."""
         if not force:
@@ -161,22 +410,7 @@ class RedisService:
                 suggestion="Add --force to confirm flushing all keys",
             )
 
-        # Get project's Redis database number
-        project = self.hostkit_db.get_project(project_name)
-        if not project:
-            raise RedisServiceError(
-                code="PROJECT_NOT_FOUND",
-                message=f"Project '{project_name}' does not exist",
-                suggestion="Run 'hostkit project list' to see available projects",
-            )
-
-        redis_db = project.get("redis_db")
-        if redis_db is None:
-            raise RedisServiceError(
-                code="NO_REDIS_DB",
-                message=f"Project '{project_name}' has no Redis database assigned",
-                suggestion="Redis database is assigned when project is created",
-            )
+        redis_db = self._project_redis_db(project_name)
 
         client = self._get_connection(db=redis_db)
         try:
@@ -11,6 +11,7 @@ from typing import Any
 import psutil
 
 from hostkit.database import get_db
+from hostkit.systemd import get_systemd
 
 
 @dataclass
@@ -94,6 +95,7 @@ class ResourceService:
 
     def __init__(self) -> None:
         self.db = get_db()
+        self.systemd = get_systemd()
 
     def _validate_project(self, project: str) -> dict[str, Any]:
         """Validate that the project exists and return project info."""
@@ -134,26 +136,13 @@ class ResourceService:
 
         try:
             # Check service status
-            status_result = subprocess.run(
-                ["systemctl", "is-active", service_name],
-                capture_output=True,
-                text=True,
-            )
-            result["running"] = status_result.returncode == 0
+            unit = self.systemd.unit(service_name)
+            result["running"] = unit.is_active
 
             if not result["running"]:
                 return result
 
-            # Get main PID
-            pid_result = subprocess.run(
-                ["systemctl", "show", "-p", "MainPID", service_name],
-                capture_output=True,
-                text=True,
-            )
-            if pid_result.returncode == 0:
-                pid_str = pid_result.stdout.strip().replace("MainPID=", "")
-                if pid_str and pid_str != "0":
-                    result["pid"] = int(pid_str)
+            result["pid"] = unit.main_pid
 
             # Get process metrics including child processes
             if result["pid"]:
@@ -489,5 +478,7 @@ class ResourceService:
         self._validate_project(project)
 
         while True:
+            # Re-read unit state on every check
+            self.systemd.invalidate()
             yield self.get_project_resources(project, thresholds)
             time.sleep(interval)
@@ -9,6 +9,7 @@ from jinja2 import Template
 
 from hostkit.config import get_config
 from hostkit.database import get_db
+from hostkit.systemd import get_systemd
 
 
 @dataclass
@@ -72,6 +73,7 @@ class ServiceService:
     def __init__(self) -> None:
         self.config = get_config()
         self.hostkit_db = get_db()
+        self.systemd = get_systemd()
 
     def _service_name(self, project: str, service_type: str = "app") -> str:
         """Generate systemd service name."""
@@ -81,78 +83,28 @@ class ServiceService:
 
     def _get_service_status(self, service_name: str) -> tuple[str, bool]:
         """Get service status and enabled state."""
-        try:
-            # Check active status
-            result = subprocess.run(
-                ["systemctl", "is-active", f"{service_name}.service"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            status_raw = result.stdout.strip()
-            if status_raw == "active":
-                status = "running"
-            elif status_raw == "inactive":
-                status = "stopped"
-            elif status_raw == "failed":
-                status = "failed"
-            else:
-                status = "stopped"
-
-            # Check enabled status
-            result = subprocess.run(
-                ["systemctl", "is-enabled", f"{service_name}.service"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            enabled = result.stdout.strip() == "enabled"
-
-            return status, enabled
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return "stopped", False
+        unit = self.systemd.unit(service_name)
+        return unit.status, unit.is_enabled
 
     def _get_service_details(self, service_name: str) -> dict[str, Any]:
         """Get detailed service information."""
-        details: dict[str, Any] = {"pid": None, "memory": None, "uptime": None}
-
-        try:
-            result = subprocess.run(
-                [
-                    "systemctl",
-                    "show",
-                    f"{service_name}.service",
-                    "--property=MainPID,MemoryCurrent,ActiveEnterTimestamp",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+        unit = self.systemd.unit(service_name)
+        details: dict[str, Any] = {
+            "pid": unit.main_pid,
+            "memory": None,
+            "uptime": unit.active_enter_timestamp,
+        }
 
-            if result.returncode == 0:
-                for line in result.stdout.strip().split("\n"):
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        if key == "MainPID" and value != "0":
-                            details["pid"] = int(value)
-                        elif key == "MemoryCurrent" and value != "[not set]":
-                            try:
-                                mem_bytes = int(value)
-                                if mem_bytes >= 1024 * 1024 * 1024:
-                                    details["memory"] = f"{mem_bytes / (1024**3):.1f} GB"
-                                elif mem_bytes >= 1024 * 1024:
-                                    details["memory"] = f"{mem_bytes / (1024**2):.1f} MB"
-                                elif mem_bytes >= 1024:
-                                    details["memory"] = f"{mem_bytes / 1024:.1f} KB"
-                                else:
-                                    details["memory"] = f"{mem_bytes} B"
-                            except ValueError:
-                                pass
-                        elif key == "ActiveEnterTimestamp" and value:
-                            details["uptime"] = value
-
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
+        mem_bytes = unit.memory_current
+        if mem_bytes is not None:
+            if mem_bytes >= 1024 * 1024 * 1024:
+                details["memory"] = f"{mem_bytes / (1024**3):.1f} GB"
+            elif mem_bytes >= 1024 * 1024:
+                details["memory"] = f"{mem_bytes / (1024**2):.1f} MB"
+            elif mem_bytes >= 1024:
+                details["memory"] = f"{mem_bytes / 1024:.1f} KB"
+            else:
+                details["memory"] = f"{mem_bytes} B"
 
         return details
 
@@ -172,6 +124,14 @@ class ServiceService:
         else:
             projects = self.hostkit_db.list_projects()
 
+        # Fetch every unit's state in one systemctl call
+        self.systemd.units(
+            self._service_name(proj["name"], service_type)
+            for proj in projects
+            if proj
+            for service_type in ("app", "worker")
+        )
+
         for proj in projects:
             if not proj:
                 continue
@@ -282,6 +242,7 @@ class ServiceService:
                 message=f"Failed to start service: {stderr}",
                 suggestion="Check logs with 'hostkit service logs'",
             )
+        self.systemd.invalidate(service.name)
 
         # Get updated status
         new_service = self.get_service(service.name)
@@ -315,6 +276,7 @@ class ServiceService:
                 code="SERVICE_STOP_FAILED",
                 message=f"Failed to stop service: {stderr}",
             )
+        self.systemd.invalidate(service.name)
 
         return {
             "name": service.name,
@@ -340,6 +302,7 @@ class ServiceService:
                 message=f"Failed to restart service: {stderr}",
                 suggestion="Check logs with 'hostkit service logs'",
             )
+        self.systemd.invalidate(service.name)
 
         # Get updated status
         new_service = self.get_service(service.name)
@@ -372,6 +335,7 @@ class ServiceService:
                 code="SERVICE_ENABLE_FAILED",
                 message=f"Failed to enable service: {stderr}",
             )
+        self.systemd.invalidate(service.name)
 
         return {
             "name": service.name,
@@ -401,6 +365,7 @@ class ServiceService:
                 code="SERVICE_DISABLE_FAILED",
                 message=f"Failed to disable service: {stderr}",
             )
+        self.systemd.invalidate(service.name)
 
         return {
             "name": service.name,
@@ -610,6 +575,7 @@ class ServiceService:
 
         # Reload systemd
         subprocess.run(["systemctl", "daemon-reload"], check=True, capture_output=True)
+        self.systemd.invalidate(worker_service)
 
         return {
             "service": worker_service,
@@ -657,6 +623,7 @@ class ServiceService:
 
         # Reload systemd
         subprocess.run(["systemctl", "daemon-reload"], check=True, capture_output=True)
+        self.systemd.invalidate(worker_service)
 
         return {
             "service": worker_service,
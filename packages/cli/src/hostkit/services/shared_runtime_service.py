@@ -0,0 +1,294 @@
+"""Prebuilt shared Python runtimes for per-project platform services.
+
+The auth, payment, SMS, booking and chatbot services all run from a template
+whose requirements are identical for every project. Instead of building a
+fresh virtualenv per project, HostKit builds one read-only venv per service
+template (keyed by a hash of its requirements.txt and the interpreter version)
+under ``<data_dir>/runtimes/`` and symlinks each project's ``venv`` to it:
+
+    /var/lib/hostkit/runtimes/
+    └── auth-3f9c2a.../
+        ├── .hostkit-ready        # Written last; build is complete
+        └── venv/                 # root-owned, world-readable
+    /home/{project}/.auth/venv -> /var/lib/hostkit/runtimes/auth-3f9c2a.../venv
+
+Per-project state (.env, keys, rendered config) stays in the project dir, so
+existing systemd units keep pointing at ``/home/{project}/.<service>/venv``.
+When a project is relinked to a newer runtime, runtimes of that service no
+project links to any more are pruned.
+"""
+
+import fcntl
+import hashlib
+import json
+import shutil
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from hostkit.config import get_config
+
+# Platform service templates that run from a shared runtime, with the
+# per-project directory (under /home/{project}) that links to it
+SHARED_RUNTIME_SERVICES = {
+    "auth": ".auth",
+    "payment": ".payment",
+    "sms": ".sms",
+    "booking": ".booking",
+    "chatbot": ".chatbot",
+}
+
+READY_MARKER = ".hostkit-ready"
+VENV_CREATE_TIMEOUT = 60
+PIP_INSTALL_TIMEOUT = 300  # 5 minutes for pip install
+
+
+@dataclass
+class SharedRuntime:
+    """A prebuilt, versioned runtime for one service template."""
+
+    service: str
+    requirements_hash: str
+    path: Path
+    python_version: str
+    created_at: str
+
+    @property
+    def venv_path(self) -> Path:
+        return self.path / "venv"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON output."""
+        return {
+            "service": self.service,
+            "requirements_hash": self.requirements_hash,
+            "path": str(self.path),
+            "python_version": self.python_version,
+            "created_at": self.created_at,
+        }
+
+
+class SharedRuntimeError(Exception):
+    """Error building or linking a shared runtime."""
+
+    def __init__(self, code: str, message: str, suggestion: str | None = None):
+        self.code = code
+        self.message = message
+        self.suggestion = suggestion
+        super().__init__(message)
+
+
+class SharedRuntimeService:
+    """Build and link shared virtualenvs for platform service templates."""
+
+    def __init__(self, runtimes_dir: Path | None = None, homes_dir: Path | None = None) -> None:
+        self.runtimes_dir = runtimes_dir or get_config().data_dir / "runtimes"
+        self.homes_dir = homes_dir or Path("/home")
+        self._python_version: str | None = None
+
+    def python_version(self) -> str:
+        """Version of the interpreter runtimes are built with."""
+        if self._python_version is None:
+            try:
+                result = subprocess.run(
+                    ["python3", "--version"], capture_output=True, text=True, timeout=10
+                )
+                self._python_version = result.stdout.strip() or "unknown"
+            except (OSError, subprocess.TimeoutExpired):
+                self._python_version = "unknown"
+        return self._python_version
+
+    def requirements_hash(self, requirements_path: Path) -> str:
+        """Hash identifying the runtime a requirements file needs."""
+        if not requirements_path.is_file():
+            raise SharedRuntimeError(
+                code="PIP_INSTALL_FAILED",
+                message=f"Requirements file not found: {requirements_path}",
+                suggestion="Ensure HostKit templates are properly installed",
+            )
+        digest = hashlib.sha256()
+        digest.update(self.python_version().encode())
+        digest.update(b"\0")
+        digest.update(requirements_path.read_bytes())
+        return digest.hexdigest()[:16]
+
+    def runtime_dir(self, service: str, requirements_hash: str) -> Path:
+        """Directory of the runtime for a service/requirements pair."""
+        return self.runtimes_dir / f"{service}-{requirements_hash}"
+
+    def ensure_runtime(self, service: str, requirements_path: Path) -> SharedRuntime:
+        """Return the shared runtime for a template, building it on first use.
+
+        Concurrent enables of the same service serialize on a lock file; every
+        caller after the first finds the ready marker and returns immediately.
+        """
+        req_hash = self.requirements_hash(requirements_path)
+        runtime_dir = self.runtime_dir(service, req_hash)
+
+        runtime = self._load(runtime_dir)
+        if runtime is not None:
+            return runtime
+
+        self.runtimes_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = self.runtimes_dir / f".{service}-{req_hash}.lock"
+        with open(lock_path, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # Another process may have finished the build while we waited
+                runtime = self._load(runtime_dir)
+                if runtime is not None:
+                    return runtime
+                return self._build(service, req_hash, requirements_path, runtime_dir)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def link_venv(self, service: str, requirements_path: Path, venv_link: Path) -> SharedRuntime:
+        """Point a project's service venv at the shared runtime.
+
+        Replaces a legacy per-project venv directory (or a link to an older
+        runtime) with a symlink to the current runtime. Moving off an older
+        runtime prunes the service's runtimes that are no longer linked.
+        """
+        runtime = self.ensure_runtime(service, requirements_path)
+
+        relinked = False
+        if venv_link.is_symlink():
+            if venv_link.resolve() == runtime.venv_path.resolve():
+                return runtime
+            venv_link.unlink()
+            relinked = True
+        elif venv_link.is_dir():
+            shutil.rmtree(venv_link)
+        elif venv_link.exists():
+            venv_link.unlink()
+
+        venv_link.parent.mkdir(parents=True, exist_ok=True)
+        venv_link.symlink_to(runtime.venv_path)
+        if relinked:
+            self.prune(service)
+        return runtime
+
+    def list_runtimes(self) -> list[SharedRuntime]:
+        """List all completed runtimes."""
+        if not self.runtimes_dir.exists():
+            return []
+        runtimes = []
+        for path in sorted(self.runtimes_dir.iterdir()):
+            runtime = self._load(path)
+            if runtime is not None:
+                runtimes.append(runtime)
+        return runtimes
+
+    def referenced_runtimes(self) -> set[Path]:
+        """Runtime dirs currently linked from any project."""
+        referenced: set[Path] = set()
+        for home in self.homes_dir.iterdir() if self.homes_dir.exists() else []:
+            for service_dir in SHARED_RUNTIME_SERVICES.values():
+                link = home / service_dir / "venv"
+                if link.is_symlink():
+                    referenced.add(link.resolve().parent)
+        return referenced
+
+    def prune(self, service: str | None = None) -> list[str]:
+        """Remove runtimes no project links to.
+
+        Args:
+            service: Only prune runtimes of this service template
+
+        Returns:
+            Names of removed runtime directories
+        """
+        referenced = self.referenced_runtimes()
+        removed = []
+        for runtime in self.list_runtimes():
+            if service and runtime.service != service:
+                continue
+            if runtime.path.resolve() in referenced:
+                continue
+            shutil.rmtree(runtime.path, ignore_errors=True)
+            removed.append(runtime.path.name)
+        return removed
+
+    def _load(self, runtime_dir: Path) -> SharedRuntime | None:
+        """Load a runtime if its build completed."""
+        marker = runtime_dir / READY_MARKER
+        if not marker.is_file():
+            return None
+        try:
+            data = json.loads(marker.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        return SharedRuntime(
+            service=data["service"],
+            requirements_hash=data["requirements_hash"],
+            path=runtime_dir,
+            python_version=data.get("python_version", "unknown"),
+            created_at=data.get("created_at", ""),
+        )
+
+    def _build(
+        self, service: str, req_hash: str, requirements_path: Path, runtime_dir: Path
+    ) -> SharedRuntime:
+        """Build a runtime in place (venvs are not relocatable)."""
+        if runtime_dir.exists():
+            # Leftover from an interrupted build
+            shutil.rmtree(runtime_dir)
+        runtime_dir.mkdir(parents=True)
+        venv_path = runtime_dir / "venv"
+
+        try:
+            subprocess.run(
+                ["python3", "-m", "venv", str(venv_path)],
+                check=True,
+                capture_output=True,
+                timeout=VENV_CREATE_TIMEOUT,
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            shutil.rmtree(runtime_dir, ignore_errors=True)
+            stderr = getattr(e, "stderr", None)
+            raise SharedRuntimeError(
+                code="VENV_CREATE_FAILED",
+                message=(
+                    "Failed to create virtual environment: "
+                    f"{stderr.decode() if stderr else 'unknown error'}"
+                ),
+                suggestion="Ensure python3-venv is installed",
+            )
+
+        try:
+            subprocess.run(
+                [str(venv_path / "bin" / "pip"), "install", "-r", str(requirements_path)],
+                check=True,
+                capture_output=True,
+                timeout=PIP_INSTALL_TIMEOUT,
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            shutil.rmtree(runtime_dir, ignore_errors=True)
+            stderr = getattr(e, "stderr", None)
+            raise SharedRuntimeError(
+                code="PIP_INSTALL_FAILED",
+                message=(
+                    "Failed to install dependencies: "
+                    f"{stderr.decode() if stderr else 'unknown error'}"
+                ),
+                suggestion="Check requirements.txt and network connectivity",
+            )
+
+        # Shared between projects: readable by every project user, writable by none
+        shutil.copy2(requirements_path, runtime_dir / "requirements.txt")
+        subprocess.run(["chown", "-R", "root:root", str(runtime_dir)], capture_output=True)
+        subprocess.run(["chmod", "-R", "a+rX,go-w", str(runtime_dir)], capture_output=True)
+
+        runtime = SharedRuntime(
+            service=service,
+            requirements_hash=req_hash,
+            path=runtime_dir,
+            python_version=self.python_version(),
+            created_at=datetime.utcnow().isoformat(),
+        )
+        marker_data = runtime.to_dict()
+        del marker_data["path"]
+        (runtime_dir / READY_MARKER).write_text(json.dumps(marker_data, indent=2))
+        return runtime
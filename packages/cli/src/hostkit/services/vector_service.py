@@ -97,6 +97,19 @@ class VectorService:
     VECTOR_SERVICE_DIR = "/var/lib/hostkit/vector"
     VECTOR_LOG_DIR = "/var/log/hostkit/vector"
 
+    VECTOR_ENV_FILE = "/etc/hostkit/vector.env"
+
+    # Defaults of the vector service's index settings (templates/vector/config.py),
+    # overridable in VECTOR_ENV_FILE
+    INDEX_SETTINGS = {
+        "VECTOR_INDEX_MIN_ROWS": 10000,
+        "HNSW_M": 16,
+        "HNSW_EF_CONSTRUCTION": 64,
+        "HNSW_LARGE_ROWS": 1000000,
+        "HNSW_LARGE_M": 32,
+        "HNSW_LARGE_EF_CONSTRUCTION": 128,
+    }
+
     def __init__(self):
         self.config = get_config()
         self._session = requests.Session()
@@ -685,6 +698,58 @@ class VectorService:
                 message=f"Vector service unavailable: {e}",
             )
 
+    def sync_documents(
+        self,
+        project: str,
+        collection: str,
+        documents: list[dict[str, Any]],
+        prune: bool = True,
+    ) -> dict[str, Any]:
+        """Make a collection's text documents match a set (sync).
+
+        Documents are matched by source_name; only new and changed ones are
+        embedded. With prune, stored documents not in the set are deleted.
+        """
+        api_key = self._get_api_key_for_project(project)
+
+        try:
+            response = self._session.post(
+                f"{self.VECTOR_SERVICE_URL}/v1/collections/{collection}/documents/sync",
+                headers={"Authorization": f"Bearer {api_key}"},
+                json={"documents": documents, "prune": prune},
+                timeout=300,
+            )
+
+            if response.status_code == 200:
+                return response.json().get("data", {})
+            elif response.status_code in (404, 405) and not self._is_api_error(response):
+                # No such route: the vector service predates document sync
+                raise VectorServiceError(
+                    code="SYNC_UNSUPPORTED",
+                    message="Vector service does not support document sync",
+                    suggestion="Redeploy the vector service to enable incremental sync",
+                )
+            else:
+                raise VectorServiceError(
+                    code="API_ERROR",
+                    message=f"Failed to sync documents: {response.text}",
+                )
+
+        except requests.RequestException as e:
+            raise VectorServiceError(
+                code="SERVICE_UNAVAILABLE",
+                message=f"Vector service unavailable: {e}",
+            )
+
+    @staticmethod
+    def _is_api_error(response: requests.Response) -> bool:
+        """True for errors raised by an endpoint, as opposed to a missing route."""
+        try:
+            body = response.json()
+        except ValueError:
+            return False
+        return isinstance(body, dict) and isinstance(body.get("detail"), dict)
+
     def ingest_url(self, project: str, collection: str, url: str) -> dict[str, Any]:
         """Ingest content from URL (async)."""
         api_key = self._get_api_key_for_project(project)
@@ -909,6 +974,134 @@ class VectorService:
                 message=f"Vector service unavailable: {e}",
             )
 
+    # =========================================================================
+    # Index Health
+    # =========================================================================
+
+    def get_index_health(self, project: str) -> dict[str, Any]:
+        """Report the vector index of each collection.
+
+        Collections below VECTOR_INDEX_MIN_ROWS chunks are searched exactly
+        and need no index; larger ones should have a valid partial HNSW
+        index whose parameters match their size tier. The vector worker
+        builds and retunes indexes after ingestion.
+        """
+        project_db = self._get_project_database(project)
+        limits = self._index_settings()
+
+        try:
+            conn = _get_pg_connection(project_db)
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+                    row = cur.fetchone()
+                    pgvector_version = row[0] if row else None
+
+                    cur.execute("SELECT id, name, chunk_count FROM collections ORDER BY name")
+                    collections = cur.fetchall()
+
+                    cur.execute("""
+                        SELECT ic.relname, am.amname, ic.reloptions, i.indisvalid,
+                               pg_relation_size(ic.oid), COALESCE(s.idx_scan, 0)
+                        FROM pg_index i
+                        JOIN pg_class ic ON ic.oid = i.indexrelid
+                        JOIN pg_am am ON am.oid = ic.relam
+                        LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = i.indexrelid
+                        WHERE i.indrelid = 'chunks'::regclass
+                          AND ic.relname LIKE 'idx_chunks_embedding%'
+                    """)
+                    indexes = {
+                        r[0]: {
+                            "method": r[1],
+                            "options": dict(opt.split("=", 1) for opt in r[2] or []),
+                            "valid": r[3],
+                            "size_bytes": r[4],
+                            "scans": r[5],
+                        }
+                        for r in cur.fetchall()
+                    }
+            finally:
+                conn.close()
+        except psycopg2.Error as e:
+            raise VectorServiceError(
+                code="DATABASE_ERROR",
+                message=f"Failed to read index information: {e}",
+            )
+
+        results = []
+        for collection_id, name, chunk_count in collections:
+            chunk_count = chunk_count or 0
+            index_name = f"idx_chunks_embedding_c{collection_id}"
+            index = indexes.get(index_name)
+
+            if chunk_count < limits["VECTOR_INDEX_MIN_ROWS"]:
+                target = None
+            elif chunk_count >= limits["HNSW_LARGE_ROWS"]:
+                target = (limits["HNSW_LARGE_M"], limits["HNSW_LARGE_EF_CONSTRUCTION"])
+            else:
+                target = (limits["HNSW_M"], limits["HNSW_EF_CONSTRUCTION"])
+
+            params = None
+            if index is None:
+                status = "build pending" if target else "ok (exact scan)"
+            elif not index["valid"]:
+                status = "invalid (build failed or in progress)"
+            else:
+                params = (
+                    int(index["options"].get("m", 16)),
+                    int(index["options"].get("ef_construction", 64)),
+                )
+                if target and (target[0] > params[0] or target[1] > params[1]):
+                    status = "retune pending"
+                else:
+                    status = "ok"
+
+            results.append(
+                {
+                    "collection": name,
+                    "chunks": chunk_count,
+                    "index": index_name if index else None,
+                    "m": params[0] if params else None,
+                    "ef_construction": params[1] if params else None,
+                    "size_bytes": index["size_bytes"] if index else 0,
+                    "scans": index["scans"] if index else 0,
+                    "status": status,
+                }
+            )
+
+        warnings = []
+        if "idx_chunks_embedding" in indexes:
+            warnings.append(
+                "Legacy ivfflat index idx_chunks_embedding is still present; "
+                "it is dropped on the next index build"
+            )
+        if pgvector_version and tuple(int(p) for p in pgvector_version.split(".")[:2]) < (0, 5):
+            warnings.append(f"pgvector {pgvector_version} has no HNSW support (needs 0.5.0+)")
+
+        return {
+            "project": project,
+            "database": project_db,
+            "pgvector_version": pgvector_version,
+            "min_rows": limits["VECTOR_INDEX_MIN_ROWS"],
+            "collections": results,
+            "warnings": warnings,
+        }
+
+    def _index_settings(self) -> dict[str, int]:
+        """Index settings of the vector service, including env file overrides."""
+        limits = dict(self.INDEX_SETTINGS)
+        env_file = Path(self.VECTOR_ENV_FILE)
+        if env_file.exists():
+            for line in env_file.read_text().splitlines():
+                key, sep, value = line.partition("=")
+                key = key.strip()
+                if sep and key in limits:
+                    try:
+                        limits[key] = int(value.strip().strip("\"'"))
+                    except ValueError:
+                        pass
+        return limits
+
     # =========================================================================
     # Internal Helpers
     # =========================================================================
@@ -926,6 +1119,23 @@ class VectorService:
 
         return hashlib.sha256(api_key.encode()).hexdigest()
 
+    def _get_project_database(self, project: str) -> str:
+        """Get the vector database name of a project."""
+        db = get_db()
+        with db.connection() as conn:
+            row = conn.execute(
+                "SELECT database_name FROM vector_projects WHERE project_name = ?",
+                (project,),
+            ).fetchone()
+
+        if not row:
+            raise VectorServiceError(
+                code="NOT_ENABLED",
+                message=f"Vector service not enabled for '{project}'",
+                suggestion=f"Enable first with 'hostkit vector enable {project}'",
+            )
+        return row[0]
+
     def _get_api_key_for_project(self, project: str) -> str:
         """Get the API key for a project from the database."""
         db = get_db()
@@ -1041,12 +1251,8 @@ class VectorService:
                 " ON chunks(collection_id, chunk_index)"
             )
 
-            # Create vector index (IVFFlat)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_chunks_embedding
-                ON chunks USING ivfflat (embedding vector_cosine_ops)
-                WITH (lists = 100)
-            """)
+            # No vector index yet: the worker builds a partial HNSW index per
+            # collection once it is big enough (see get_index_health)
 
             # Grant permissions to hostkit_vector user
             cursor.execute("GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO hostkit_vector")
@@ -12,6 +12,7 @@ from jinja2 import Template
 
 from hostkit.config import get_config
 from hostkit.database import get_db
+from hostkit.systemd import get_systemd
 
 
 @dataclass
@@ -120,6 +121,7 @@ class WorkerService:
     def __init__(self) -> None:
         self.config = get_config()
         self.db = get_db()
+        self.systemd = get_systemd()
         self.templates_dir = Path("/var/lib/hostkit/templates")
         self.systemd_dir = Path("/etc/systemd/system")
 
@@ -177,32 +179,8 @@ class WorkerService:
         Returns:
             Tuple of (is_active, is_enabled)
         """
-        active = False
-        enabled = False
-
-        try:
-            # Check active
-            result = subprocess.run(
-                ["systemctl", "is-active", f"{service_name}.service"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            active = result.returncode == 0
-
-            # Check enabled
-            result = subprocess.run(
-                ["systemctl", "is-enabled", f"{service_name}.service"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            enabled = result.stdout.strip() == "enabled"
-
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
-
-        return active, enabled
+        unit = self.systemd.unit(f"{service_name}.service")
+        return unit.is_active, unit.is_enabled
 
     def _create_worker_systemd_unit(self, worker: Worker) -> None:
         """Create systemd service unit file for worker."""
@@ -231,6 +209,7 @@ class WorkerService:
             capture_output=True,
             timeout=10,
         )
+        self.systemd.invalidate()
 
     def _create_beat_systemd_unit(
         self, project: str, beat: CeleryBeat, app_module: str = "app", loglevel: str = "info"
@@ -259,6 +238,7 @@ class WorkerService:
             capture_output=True,
             timeout=10,
         )
+        self.systemd.invalidate()
 
     def _remove_systemd_unit(self, service_name: str) -> None:
         """Remove systemd service unit file."""
@@ -274,6 +254,7 @@ class WorkerService:
                 capture_output=True,
                 timeout=10,
             )
+            self.systemd.invalidate(f"{service_name}.service")
         except subprocess.SubprocessError:
             pass
 
@@ -289,6 +270,7 @@ class WorkerService:
             capture_output=True,
             timeout=10,
         )
+        self.systemd.invalidate()
 
     def add_worker(
         self,
@@ -376,6 +358,7 @@ class WorkerService:
                 capture_output=True,
                 timeout=10,
             )
+            self.systemd.invalidate(f"{service_name}.service")
 
         # Update service status
         service_name = self._service_name(project, worker_name)
@@ -427,8 +410,14 @@ class WorkerService:
         """
         self._validate_project(project)
 
+        rows = self.db.list_workers(project)
+        # Fetch every worker's service state in one systemctl call
+        self.systemd.units(
+            f"{self._service_name(project, row['worker_name'])}.service" for row in rows
+        )
+
         workers = []
-        for row in self.db.list_workers(project):
+        for row in rows:
             worker = Worker.from_db(row)
             # Get service status
             service_name = self._service_name(project, worker.worker_name)
@@ -484,6 +473,7 @@ class WorkerService:
             text=True,
             timeout=30,
         )
+        self.systemd.invalidate(f"{service_name}.service")
 
         if result.returncode != 0:
             raise WorkerError(
@@ -515,6 +505,7 @@ class WorkerService:
             capture_output=True,
             timeout=30,
         )
+        self.systemd.invalidate(f"{service_name}.service")
 
         # Return updated worker
         return self.get_worker(project, worker_name)
@@ -540,6 +531,7 @@ class WorkerService:
             text=True,
             timeout=30,
         )
+        self.systemd.invalidate(f"{service_name}.service")
 
         if result.returncode != 0:
             raise WorkerError(
@@ -672,6 +664,7 @@ class WorkerService:
             capture_output=True,
             timeout=10,
         )
+        self.systemd.invalidate(f"{service_name}.service")
 
         # Update service status
         beat.service_active, beat.service_enabled = self._get_service_status(service_name)
@@ -709,6 +702,7 @@ class WorkerService:
             capture_output=True,
             timeout=10,
         )
+        self.systemd.invalidate(f"{service_name}.service")
 
         # Update database
         self.db.update_celery_beat(project, enabled=False)
@@ -0,0 +1,200 @@
+"""Systemd unit state for HostKit services.
+
+Reading unit state used to mean one `systemctl is-active`, `is-enabled` and
+`show` process per unit, so listing 30 projects forked a couple of hundred
+processes. SystemdClient fetches the state of any number of units with a
+single `systemctl show` and keeps the result for the rest of the CLI
+invocation. Anything that changes a unit (start, stop, enable, daemon-reload,
+...) must call invalidate() so later reads see the new state.
+"""
+
+import subprocess
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+PROPERTIES = (
+    "Id",
+    "LoadState",
+    "ActiveState",
+    "SubState",
+    "UnitFileState",
+    "MainPID",
+    "MemoryCurrent",
+    "CPUUsageNSec",
+    "ActiveEnterTimestamp",
+    "StateChangeTimestamp",
+    "NextElapseUSecRealtime",
+)
+
+# Placeholder values systemctl prints for unset properties
+_UNSET = frozenset({"", "[not set]", "n/a", "infinity"})
+
+SHOW_TIMEOUT = 10
+
+
+def unit_name(name: str) -> str:
+    """Full unit name, defaulting to a .service unit."""
+    if "." in name.rsplit("@", 1)[-1]:
+        return name
+    return f"{name}.service"
+
+
+def _int(value: str | None) -> int | None:
+    if value is None or value in _UNSET:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _str(value: str | None) -> str | None:
+    if value is None or value in _UNSET:
+        return None
+    return value
+
+
+@dataclass(frozen=True)
+class UnitState:
+    """State of one systemd unit as reported by `systemctl show`."""
+
+    name: str
+    load_state: str = "not-found"
+    active_state: str = "unknown"
+    sub_state: str = "unknown"
+    unit_file_state: str | None = None
+    main_pid: int | None = None
+    memory_current: int | None = None
+    cpu_usage_nsec: int | None = None
+    active_enter_timestamp: str | None = None
+    state_change_timestamp: str | None = None
+    next_elapse: str | None = None
+
+    @classmethod
+    def from_properties(cls, name: str, props: dict[str, str]) -> "UnitState":
+        return cls(
+            name=name,
+            load_state=props.get("LoadState") or "not-found",
+            active_state=props.get("ActiveState") or "unknown",
+            sub_state=props.get("SubState") or "unknown",
+            unit_file_state=_str(props.get("UnitFileState")),
+            main_pid=_int(props.get("MainPID")) or None,
+            memory_current=_int(props.get("MemoryCurrent")),
+            cpu_usage_nsec=_int(props.get("CPUUsageNSec")),
+            active_enter_timestamp=_str(props.get("ActiveEnterTimestamp")),
+            state_change_timestamp=_str(props.get("StateChangeTimestamp")),
+            next_elapse=_str(props.get("NextElapseUSecRealtime")),
+        )
+
+    @property
+    def exists(self) -> bool:
+        return self.load_state != "not-found"
+
+    @property
+    def is_active(self) -> bool:
+        """Matches `systemctl is-active` exiting 0."""
+        return self.active_state in ("active", "reloading")
+
+    @property
+    def is_enabled(self) -> bool:
+        """True when the unit file is enabled to start at boot."""
+        return self.unit_file_state == "enabled"
+
+    @property
+    def status(self) -> str:
+        """HostKit's running/stopped/failed status for the unit."""
+        if self.active_state == "active":
+            return "running"
+        if self.active_state == "failed":
+            return "failed"
+        return "stopped"
+
+
+def parse_show_output(output: str, names: list[str]) -> dict[str, UnitState]:
+    """Parse `systemctl show` output for several units.
+
+    systemctl prints one blank-line separated block of KEY=value lines per
+    unit, in the order the units were given.
+    """
+    blocks: list[dict[str, str]] = []
+    current: dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            if current:
+                blocks.append(current)
+                current = {}
+            continue
+        key, sep, value = line.partition("=")
+        if sep:
+            current[key] = value
+    if current:
+        blocks.append(current)
+
+    states: dict[str, UnitState] = {}
+    by_id = {block.get("Id"): block for block in blocks}
+    for index, name in enumerate(names):
+        # Aliased units report the Id of the unit they point to
+        block = by_id.get(name)
+        if block is None and len(blocks) == len(names):
+            block = blocks[index]
+        states[name] = UnitState.from_properties(name, block or {})
+    return states
+
+
+class SystemdClient:
+    """Batched, cached reads of systemd unit state."""
+
+    def __init__(self, timeout: int = SHOW_TIMEOUT) -> None:
+        self.timeout = timeout
+        self._cache: dict[str, UnitState] = {}
+        self.show_calls = 0
+
+    def units(self, names: Iterable[str]) -> dict[str, UnitState]:
+        """Get the state of several units, keyed by the names given.
+
+        Units not seen yet in this invocation are fetched with one
+        `systemctl show`. If systemctl is unavailable every unit is reported
+        as not found.
+        """
+        requested = list(dict.fromkeys(names))
+        missing = [unit_name(n) for n in requested if unit_name(n) not in self._cache]
+        missing = list(dict.fromkeys(missing))
+        if missing:
+            self._cache.update(self._show(missing))
+        return {name: self._cache[unit_name(name)] for name in requested}
+
+    def unit(self, name: str) -> UnitState:
+        """Get the state of a single unit."""
+        return self.units([name])[name]
+
+    def invalidate(self, *names: str) -> None:
+        """Forget cached state for the given units, or for every unit."""
+        if not names:
+            self._cache.clear()
+            return
+        for name in names:
+            self._cache.pop(unit_name(name), None)
+
+    def _show(self, names: list[str]) -> dict[str, UnitState]:
+        self.show_calls += 1
+        try:
+            result = subprocess.run(
+                ["systemctl", "show", f"--property={','.join(PROPERTIES)}", "--", *names],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+            )
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return {name: UnitState(name=name) for name in names}
+        return parse_show_output(result.stdout, names)
+
+
+_systemd: SystemdClient | None = None
+
+
+def get_systemd() -> SystemdClient:
+    """Get the global systemd client instance."""
+    global _systemd
+    if _systemd is None:
+        _systemd = SystemdClient()
+    return _systemd
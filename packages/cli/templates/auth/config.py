@@ -9,6 +9,8 @@ from pathlib import Path
 
 from pydantic_settings import BaseSettings
 
+from tenancy import MULTI_TENANT, current_tenant
+
 
 class AuthSettings(BaseSettings):
     """Auth service configuration."""
@@ -52,6 +54,15 @@ class AuthSettings(BaseSettings):
     magic_link_enabled: bool = True
     anonymous_enabled: bool = True
 
+    # Password hashing (existing hashes are upgraded on sign-in when changed)
+    bcrypt_rounds: int = 12
+
+    # Request caches (per process, see services/auth_cache.py)
+    token_cache_seconds: int = 300  # Verified access tokens; 0 disables
+    token_cache_size: int = 10000
+    user_cache_seconds: int = 0  # User rows; opt-in, stale across workers
+    user_cache_size: int = 10000
+
     # Logging
     log_level: str = "INFO"
 
@@ -115,6 +126,16 @@ Settings = AuthSettings
 
 
 @lru_cache
-def get_settings() -> AuthSettings:
-    """Get cached settings instance."""
+def _load_settings() -> AuthSettings:
     return AuthSettings()
+
+
+def get_settings() -> AuthSettings:
+    """Get settings for the current project.
+
+    In multi-tenant mode these are the settings of the tenant bound to the
+    current request; otherwise a cached process-wide instance.
+    """
+    if MULTI_TENANT:
+        return current_tenant().settings
+    return _load_settings()
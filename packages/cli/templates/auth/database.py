@@ -3,12 +3,22 @@
 Uses SQLAlchemy 2.0 async patterns with asyncpg.
 """
 
+import logging
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from config import get_settings
+from tenancy import MULTI_TENANT, current_tenant
+
+logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
@@ -17,30 +27,49 @@ class Base(DeclarativeBase):
     pass
 
 
-# Create async engine
-settings = get_settings()
+def build_engine(
+    auth_db_url: str, pool_size: int = 5, max_overflow: int = 10
+) -> AsyncEngine:
+    """Create an async engine for an auth database URL."""
+    # Convert postgresql:// to postgresql+asyncpg://
+    db_url = auth_db_url
+    if db_url.startswith("postgresql://"):
+        db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
 
-# Convert postgresql:// to postgresql+asyncpg://
-db_url = settings.auth_db_url
-if db_url.startswith("postgresql://"):
-    db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return create_async_engine(
+        db_url,
+        echo=False,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
 
-engine = create_async_engine(
-    db_url,
-    echo=False,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
 
-# Create session factory
-async_session_factory = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+def build_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create a session factory bound to an engine."""
+    return async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+# Single-tenant mode: one engine for the process. In multi-tenant mode each
+# tenant builds its own (see tenancy.Tenant.session_factory).
+engine: AsyncEngine | None = None
+async_session_factory: async_sessionmaker[AsyncSession] | None = None
+if not MULTI_TENANT:
+    engine = build_engine(get_settings().auth_db_url)
+    async_session_factory = build_session_factory(engine)
+
+
+async def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Session factory for the current project (e.g. for background tasks)."""
+    if MULTI_TENANT:
+        return await current_tenant().session_factory()
+    return async_session_factory
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -51,7 +80,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         async def get_users(db: AsyncSession = Depends(get_db)):
             ...
     """
-    async with async_session_factory() as session:
+    session_factory = await get_session_factory()
+
+    async with session_factory() as session:
         try:
             yield session
             await session.commit()
@@ -70,3 +101,87 @@ async def init_db() -> None:
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def run_migrations(engine: AsyncEngine) -> None:
+    """Run any pending database migrations.
+
+    Currently handles the one-time migration of adding last_used_at to sessions.
+    This runs on startup to ensure the schema is up-to-date.
+    """
+    logger.info("Starting database migrations...")
+    try:
+        async with engine.begin() as conn:
+            # Add last_used_at column if it doesn't exist
+            logger.debug("Adding last_used_at column to sessions table if needed...")
+            await conn.execute(text("""
+                ALTER TABLE sessions
+                ADD COLUMN IF NOT EXISTS last_used_at TIMESTAMP WITH TIME ZONE
+            """))
+
+            # Create email_verifications table if it doesn't exist
+            await conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS email_verifications (
+                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                    email VARCHAR(255),
+                    token_hash TEXT NOT NULL UNIQUE,
+                    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+                    verified_at TIMESTAMP WITH TIME ZONE
+                )
+            """))
+            # Add email column if table was created by older schema
+            await conn.execute(text("""
+                ALTER TABLE email_verifications
+                ADD COLUMN IF NOT EXISTS email VARCHAR(255)
+            """))
+            await conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_email_verifications_email
+                ON email_verifications (email)
+            """))
+
+            # Create password_resets table if it doesn't exist
+            await conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS password_resets (
+                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                    email VARCHAR(255),
+                    token_hash TEXT NOT NULL UNIQUE,
+                    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+                    used_at TIMESTAMP WITH TIME ZONE
+                )
+            """))
+            # Add email column if table was created by older schema
+            await conn.execute(text("""
+                ALTER TABLE password_resets
+                ADD COLUMN IF NOT EXISTS email VARCHAR(255)
+            """))
+            await conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_password_resets_email
+                ON password_resets (email)
+            """))
+
+            # Create email_outbox table (queued emails, see services/email_outbox.py)
+            await conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS email_outbox (
+                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                    to_email VARCHAR(255) NOT NULL,
+                    subject TEXT NOT NULL,
+                    html_body TEXT NOT NULL,
+                    text_body TEXT,
+                    status VARCHAR(16) NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                    next_attempt_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+                )
+            """))
+            await conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_email_outbox_pending
+                ON email_outbox (next_attempt_at) WHERE status = 'pending'
+            """))
+
+            logger.info("✓ Database migrations completed successfully")
+    except Exception as e:
+        logger.error(f"✗ Error running migrations: {e}", exc_info=True)
+        raise
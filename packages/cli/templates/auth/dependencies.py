@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
 from models.user import User
+from services.auth_cache import cache_user, get_cached_user
 from services.jwt_service import get_jwt_service
 
 # Bearer token security scheme
@@ -59,9 +60,22 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    try:
+        user_uuid = UUID(user_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: invalid user ID",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user = await get_cached_user(db, user_uuid)
+    if user is not None:
+        return user
+
     # Fetch user from database
     try:
-        result = await db.execute(select(User).where(User.id == UUID(user_id)))
+        result = await db.execute(select(User).where(User.id == user_uuid))
         user = result.scalar_one_or_none()
     except Exception:
         raise HTTPException(
@@ -77,6 +91,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cache_user(user)
     return user
 
 
@@ -8,6 +8,7 @@ Per-project authentication service providing:
 - JWT access/refresh tokens
 """
 
+import asyncio
 import logging
 import os
 import sys
@@ -34,74 +35,8 @@ logging.getLogger("uvicorn.access").setLevel(getattr(logging, log_level, logging
 logger = logging.getLogger(__name__)
 
 
-async def run_migrations():
-    """Run any pending database migrations.
-
-    Currently handles the one-time migration of adding last_used_at to sessions.
-    This runs on startup to ensure the schema is up-to-date.
-    """
-    logger.info("Starting database migrations...")
-    try:
-        async with engine.begin() as conn:
-            # Add last_used_at column if it doesn't exist
-            logger.debug("Adding last_used_at column to sessions table if needed...")
-            await conn.execute(text("""
-                ALTER TABLE sessions
-                ADD COLUMN IF NOT EXISTS last_used_at TIMESTAMP WITH TIME ZONE
-            """))
-
-            # Create email_verifications table if it doesn't exist
-            await conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS email_verifications (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    email VARCHAR(255),
-                    token_hash TEXT NOT NULL UNIQUE,
-                    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-                    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
-                    verified_at TIMESTAMP WITH TIME ZONE
-                )
-            """))
-            # Add email column if table was created by older schema
-            await conn.execute(text("""
-                ALTER TABLE email_verifications
-                ADD COLUMN IF NOT EXISTS email VARCHAR(255)
-            """))
-            await conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS ix_email_verifications_email
-                ON email_verifications (email)
-            """))
-
-            # Create password_resets table if it doesn't exist
-            await conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS password_resets (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    email VARCHAR(255),
-                    token_hash TEXT NOT NULL UNIQUE,
-                    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-                    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
-                    used_at TIMESTAMP WITH TIME ZONE
-                )
-            """))
-            # Add email column if table was created by older schema
-            await conn.execute(text("""
-                ALTER TABLE password_resets
-                ADD COLUMN IF NOT EXISTS email VARCHAR(255)
-            """))
-            await conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS ix_password_resets_email
-                ON password_resets (email)
-            """))
-
-            logger.info("✓ Database migrations completed successfully")
-    except Exception as e:
-        logger.error(f"✗ Error running migrations: {e}", exc_info=True)
-        raise
-
-
-from sqlalchemy import text
-
-from config import get_settings
-from database import engine
+from config import AuthSettings, get_settings
+from database import engine, run_migrations
 from routers import (
     auth_router,
     oauth_router,
@@ -116,6 +51,11 @@ from routers import (
     email_verification_router,
 )
 from middleware.request_logging import RequestLoggingMiddleware
+from middleware.tenant import TenantMiddleware
+from services.email_outbox import get_email_outbox
+from services.http_client import close_http_client
+from services.password_service import HASH_RETRY_AFTER_SECONDS, PasswordHashBusyError
+from tenancy import MULTI_TENANT, TENANTS_FILE, Tenant, registry
 
 
 @asynccontextmanager
@@ -124,6 +64,20 @@ async def lifespan(app: FastAPI):
 
     Runs startup and shutdown logic.
     """
+    if MULTI_TENANT:
+        # Tenants are loaded (and migrated) lazily on their first request
+        logger.info(f"Starting shared auth service (tenants file: {TENANTS_FILE})")
+        logger.info(f"Log level: {log_level}")
+        reaper = asyncio.create_task(registry.run_reaper())
+
+        yield
+
+        logger.info("Shutting down shared auth service")
+        reaper.cancel()
+        await registry.close()
+        await close_http_client()
+        return
+
     # Startup
     settings = get_settings()
     logger.info(f"Starting auth service for project: {settings.project_name}")
@@ -133,25 +87,62 @@ async def lifespan(app: FastAPI):
     # Run database migrations
     try:
         logger.info("LIFESPAN: About to run migrations...")
-        await run_migrations()
+        await run_migrations(engine)
         logger.info("LIFESPAN: Migrations completed")
     except Exception as e:
         logger.error(f"LIFESPAN: Migration failed: {e}", exc_info=True)
         # Don't re-raise - continue startup even if migration fails
         # The migration will be retried on next restart
 
+    # Deliver emails queued before the last shutdown
+    outbox = get_email_outbox()
+    outbox.notify()
+
     yield
 
     # Shutdown
     logger.info("Shutting down auth service")
+    await outbox.close()
+    await close_http_client()
+
+
+def cors_origins(settings: AuthSettings) -> list[str]:
+    """Allowed CORS origins for a project."""
+    origins = [
+        settings.base_url,
+        "http://localhost:3000",  # Local development
+    ]
+    # Add additional origins from AUTH_CORS_ORIGINS env var
+    if settings.auth_cors_origins:
+        origins.extend(
+            origin.strip() for origin in settings.auth_cors_origins.split(",") if origin.strip()
+        )
+    return origins
+
+
+def tenant_cors_app(app, tenant: Tenant) -> CORSMiddleware:
+    """Wrap the app in CORS middleware configured for one tenant."""
+    return CORSMiddleware(
+        app,
+        allow_origins=cors_origins(tenant.settings),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
-    settings = get_settings()
+    if MULTI_TENANT:
+        title = "HostKit Auth - shared"
+        log_service = "hostkit-auth-shared"
+    else:
+        settings = get_settings()
+        title = f"HostKit Auth - {settings.project_name}"
+        log_service = f"{settings.project_name}-auth"
 
     app = FastAPI(
-        title=f"HostKit Auth - {settings.project_name}",
+        title=title,
         description="Authentication service for HostKit projects",
         version="1.0.0",
         docs_url="/auth/docs",
@@ -160,27 +151,21 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # CORS middleware - configure for your domains
-    cors_origins = [
-        settings.base_url,
-        "http://localhost:3000",  # Local development
-    ]
-    # Add additional origins from AUTH_CORS_ORIGINS env var
-    if settings.auth_cors_origins:
-        cors_origins.extend(
-            origin.strip()
-            for origin in settings.auth_cors_origins.split(",")
-            if origin.strip()
+    if MULTI_TENANT:
+        # Resolves the project per request; CORS is applied per tenant
+        app.add_middleware(TenantMiddleware, cors_factory=tenant_cors_app)
+    else:
+        # CORS middleware - configure for your domains
+        origins = cors_origins(settings)
+        logger.info(f"CORS origins: {origins}")
+
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
         )
-    logger.info(f"CORS origins: {cors_origins}")
-
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=cors_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
 
     # Register routers
     app.include_router(health_router)
@@ -215,11 +200,26 @@ def create_app() -> FastAPI:
             content={
                 "error": "internal_server_error",
                 "message": "An unexpected error occurred",
-                "suggestion": f"Check service logs: hostkit service logs {settings.project_name}-auth --follow",
+                "suggestion": f"Check service logs: hostkit service logs {log_service} --follow",
                 "type": type(exc).__name__,
             },
         )
 
+    @app.exception_handler(PasswordHashBusyError)
+    async def password_hash_busy_handler(request: Request, exc: PasswordHashBusyError):
+        """Shed password logins/signups while the bcrypt pool is saturated."""
+        logger.warning(f"Password hashing saturated in {request.method} {request.url.path}: {exc}")
+
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": str(HASH_RETRY_AFTER_SECONDS)},
+            content={
+                "error": "password_hashing_busy",
+                "message": "Too many sign-in attempts in progress",
+                "suggestion": "Retry shortly",
+            },
+        )
+
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         """Handle request validation errors with structured response."""
@@ -245,10 +245,13 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
-    settings = get_settings()
+    if MULTI_TENANT:
+        port = int(os.environ.get("AUTH_SERVICE_PORT", "8950"))
+    else:
+        port = get_settings().auth_service_port
     uvicorn.run(
         "main:app",
         host="127.0.0.1",
-        port=settings.auth_service_port,
+        port=port,
         reload=False,
     )
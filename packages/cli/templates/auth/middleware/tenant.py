@@ -0,0 +1,67 @@
+"""Tenant routing middleware for multi-tenant mode."""
+
+from collections.abc import Callable
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from tenancy import (
+    Tenant,
+    UnknownTenantError,
+    bind_tenant,
+    registry,
+    resolve_project,
+    unbind_tenant,
+)
+
+SHARED_HEALTH_PATH = "/auth/shared/health"
+
+
+class TenantMiddleware:
+    """Bind each request to its project before it reaches the app.
+
+    CORS origins differ per project, so each tenant gets its own CORS-wrapped
+    copy of the downstream app (built by ``cors_factory``, cached on the tenant).
+    """
+
+    def __init__(self, app: ASGIApp, cors_factory: Callable[[ASGIApp, Tenant], ASGIApp]):
+        self.app = app
+        self.cors_factory = cors_factory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] == SHARED_HEALTH_PATH:
+            response = JSONResponse({"status": "ok", **registry.stats()})
+            await response(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        project = resolve_project(headers)
+        try:
+            if project is None:
+                raise UnknownTenantError("")
+            tenant = registry.get(project)
+        except UnknownTenantError:
+            response = JSONResponse(
+                status_code=404,
+                content={
+                    "error": "unknown_project",
+                    "message": f"No auth service for project '{project or ''}'",
+                    "suggestion": "Enable auth for the project: hostkit auth enable <project>",
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        app = tenant.services.get("_asgi_app")
+        if app is None:
+            app = tenant.services["_asgi_app"] = self.cors_factory(self.app, tenant)
+
+        token = bind_tenant(tenant)
+        try:
+            await app(scope, receive, send)
+        finally:
+            unbind_tenant(token)
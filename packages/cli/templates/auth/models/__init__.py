@@ -4,6 +4,7 @@ from models.user import User
 from models.session import Session
 from models.oauth import OAuthAccount
 from models.magic_link import MagicLink, EmailVerification, PasswordReset
+from models.email_outbox import OutboundEmail
 
 __all__ = [
     "User",
@@ -12,4 +13,5 @@ __all__ = [
     "MagicLink",
     "EmailVerification",
     "PasswordReset",
+    "OutboundEmail",
 ]
@@ -0,0 +1,70 @@
+"""Outbound email queue model."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from database import Base
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class OutboundEmail(Base):
+    """An email waiting to be delivered by the outbox worker.
+
+    Rows are inserted in the same transaction as the token they carry, so
+    an email is queued if and only if its magic link/reset token exists.
+    Bodies contain live tokens: rows are deleted once sent, and bodies are
+    cleared when delivery is given up.
+    """
+
+    __tablename__ = "email_outbox"
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+    )
+    to_email: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    subject: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+    html_body: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+    text_body: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    status: Mapped[str] = mapped_column(
+        String(16),
+        default="pending",
+        nullable=False,
+    )  # pending, failed
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboundEmail {self.id} to={self.to_email} status={self.status}>"
@@ -130,7 +130,7 @@ async def convert_anonymous(
 
     # Update user
     current_user.email = request.email
-    current_user.password_hash = password_service.hash_password(request.password)
+    current_user.password_hash = await password_service.hash_password_async(request.password)
     current_user.is_anonymous = False
     current_user.email_verified = False  # Needs verification
     current_user.updated_at = datetime.now(timezone.utc)
@@ -65,7 +65,7 @@ async def signup(
     # Create user
     user = User(
         email=request.email,
-        password_hash=password_service.hash_password(request.password),
+        password_hash=await password_service.hash_password_async(request.password),
         email_verified=False,
         is_anonymous=False,
         metadata_=request.metadata_,
@@ -141,12 +141,16 @@ async def signin(
         )
 
     # Verify password
-    if not password_service.verify_password(request.password, user.password_hash):
+    if not await password_service.verify_password_async(request.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
+    # Upgrade the hash if the bcrypt cost has changed since it was made
+    if password_service.needs_rehash(user.password_hash):
+        user.password_hash = await password_service.hash_password_async(request.password)
+
     # Update last sign in
     user.last_sign_in_at = datetime.now(timezone.utc)
 
@@ -71,9 +71,10 @@ async def send_verification(
         db.add(verification)
         await db.flush()
 
-        # Send email
+        # Queue email (sent by the outbox worker after commit)
         email_service = get_email_service()
         email_service.send_verification_email(
+            db,
             to_email=request.email,
             token=token,
             redirect_url=request.redirect_url,
@@ -42,7 +42,7 @@ async def send_magic_link(
 
     - Generates secure token
     - Stores hashed token in database
-    - Sends email with link
+    - Queues email with link
     - Returns success message (even if email doesn't exist, for security)
     """
     settings = get_settings()
@@ -71,15 +71,16 @@ async def send_magic_link(
         expires_at=expires_at,
     )
     db.add(magic_link)
-    await db.commit()
 
-    # Send magic link email
+    # Queue magic link email (sent by the outbox worker after commit)
     email_service = get_email_service()
     email_service.send_magic_link(
+        db,
         to_email=request.email,
         token=token,
         redirect_url=request.redirect_url,
     )
+    await db.commit()
 
     # Always return success to prevent email enumeration
     return MessageResponse(
@@ -86,9 +86,10 @@ async def forgot_password(
         db.add(password_reset)
         await db.flush()
 
-        # Send email
+        # Queue email (sent by the outbox worker after commit)
         email_service = get_email_service()
         email_service.send_password_reset(
+            db,
             to_email=request.email,
             token=token,
         )
@@ -163,7 +164,7 @@ async def reset_password(
         )
 
     # Update password
-    user.password_hash = password_service.hash_password(request.password)
+    user.password_hash = await password_service.hash_password_async(request.password)
 
     # Mark token as used
     reset.used_at = datetime.now(timezone.utc)
@@ -88,6 +88,8 @@ async def delete_me(
     - Requires authentication
     - Permanently deletes user and all associated data
     """
+    # A cached user comes without relationships; the delete cascade needs them
+    await db.refresh(current_user, attribute_names=["sessions", "oauth_accounts"])
     await db.delete(current_user)
     await db.commit()
 
@@ -0,0 +1,121 @@
+"""In-process caches for authenticated requests.
+
+Authenticated endpoints verify an RS256 signature and load the user row on
+every call. Both results can be cached per process (and per tenant in
+multi-tenant mode):
+
+- Verified access token payloads (see JWTService.decode_token), keyed by the
+  SHA-256 of the token and never kept past the token's ``exp``. Enabled by
+  default; TOKEN_CACHE_SECONDS=0 turns it off.
+- User rows (see dependencies.get_current_user), opt-in with
+  USER_CACHE_SECONDS. Entries are dropped whenever a User is updated or
+  deleted through the ORM (profile changes, account deletion, sign-ins via
+  the identity/OAuth services, ...), but only in the worker that made the
+  change: other workers may serve a stale record for up to
+  USER_CACHE_SECONDS.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+from config import get_settings
+from models.user import User
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from tenancy import tenant_singleton
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire at a given wall-clock time.
+
+    Only touched from the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> Any | None:
+        """Return a live entry, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, expires_at: float) -> None:
+        """Store an entry until ``expires_at`` (epoch seconds)."""
+        if expires_at <= time.time():
+            return
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _user_cache() -> TTLCache | None:
+    settings = get_settings()
+    if settings.user_cache_seconds <= 0:
+        return None
+    return tenant_singleton("user_cache", lambda: TTLCache(settings.user_cache_size))
+
+
+async def get_cached_user(db: AsyncSession, user_id: UUID) -> User | None:
+    """Return a cached user attached to ``db`` without querying, if present.
+
+    Relationships are not loaded on the returned instance.
+    """
+    cache = _user_cache()
+    if cache is None:
+        return None
+    row = cache.get(user_id)
+    if row is None:
+        return None
+
+    user = User(**copy.deepcopy(row))
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
+def cache_user(user: User) -> None:
+    """Remember a freshly loaded user's column values."""
+    cache = _user_cache()
+    if cache is None:
+        return
+    row = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    expires_at = time.time() + get_settings().user_cache_seconds
+    cache.set(user.id, copy.deepcopy(row), expires_at)
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """Drop a user from this process's cache."""
+    cache = _user_cache()
+    if cache is not None:
+        cache.pop(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_write(mapper: Any, connection: Any, target: User) -> None:
+    try:
+        invalidate_user(target.id)
+    except RuntimeError:
+        # Flush outside a request in multi-tenant mode: no tenant caches to touch
+        pass
@@ -0,0 +1,242 @@
+"""Outbox worker delivering queued emails.
+
+Routes queue emails in the email_outbox table, in the same transaction as
+the token they carry, and return without talking to the mail server. One
+worker task per project drains the table:
+
+- Due rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several
+  uvicorn workers never send the same email twice.
+- A batch is delivered over one authenticated SMTP session, which is kept
+  open across batches while mail keeps arriving.
+- Failures are retried with exponential backoff; after MAX_ATTEMPTS the row
+  is marked failed.
+
+The worker is started when a queueing transaction commits (and at startup in
+single-tenant mode, to pick up leftovers), and exits after IDLE_EXIT_SECONDS
+without mail, closing its SMTP session.
+"""
+
+import asyncio
+import logging
+import smtplib
+from datetime import datetime, timedelta, timezone
+
+from models.email_outbox import OutboundEmail
+from sqlalchemy import delete, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from tenancy import (
+    MULTI_TENANT,
+    UnknownTenantError,
+    bind_tenant,
+    current_tenant,
+    registry,
+    tenant_singleton,
+    unbind_tenant,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+POLL_SECONDS = 5.0
+IDLE_EXIT_SECONDS = 60.0
+MAX_ATTEMPTS = 6
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+
+SESSION_ERRORS = (
+    smtplib.SMTPConnectError,
+    smtplib.SMTPAuthenticationError,
+    smtplib.SMTPServerDisconnected,
+)
+
+
+def is_connection_error(error: Exception) -> bool:
+    """Failures that affect every message, not just the current one."""
+    if isinstance(error, SESSION_ERRORS):
+        return True
+    # smtplib.SMTPException subclasses OSError; plain OSErrors are socket-level
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt after ``attempts`` failures."""
+    return timedelta(seconds=min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS))
+
+
+class EmailOutbox:
+    """Background delivery of one project's queued emails."""
+
+    def __init__(self) -> None:
+        # The worker outlives the request that starts it; remember the project
+        self._project = current_tenant().project if MULTI_TENANT else None
+        self._task: asyncio.Task | None = None
+        self._retry: asyncio.TimerHandle | None = None
+        self._wake = asyncio.Event()
+        self._smtp = None  # services.email_service.SMTPConnection
+
+    def notify(self) -> None:
+        """Start the worker if needed and have it look for due mail now."""
+        self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def notify_on_commit(self, db: AsyncSession) -> None:
+        """Call notify() once ``db`` commits (queued rows are visible then)."""
+        session = db.sync_session
+        if session.info.get("email_outbox_notify"):
+            return
+        session.info["email_outbox_notify"] = True
+
+        def after_commit(session) -> None:
+            session.info.pop("email_outbox_notify", None)
+            self.notify()
+
+        event.listen(session, "after_commit", after_commit, once=True)
+
+    async def close(self) -> None:
+        """Stop the worker (shutdown). Unsent mail stays queued."""
+        if self._retry is not None:
+            self._retry.cancel()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self._close_smtp()
+
+    async def _run(self) -> None:
+        token = None
+        if self._project is not None:
+            try:
+                token = bind_tenant(registry.get(self._project))
+            except UnknownTenantError:
+                return  # Auth was disabled for the project
+
+        loop = asyncio.get_running_loop()
+        idle_since = loop.time()
+        try:
+            while True:
+                self._wake.clear()
+                try:
+                    sent, next_due = await self._drain()
+                except Exception:
+                    logger.exception("Email outbox delivery failed")
+                    await self._close_smtp()
+                    sent, next_due = 0, POLL_SECONDS
+
+                if sent:
+                    idle_since = loop.time()
+                    continue  # More may be due right away
+                if loop.time() - idle_since >= IDLE_EXIT_SECONDS:
+                    if next_due is not None:
+                        # Come back for retries scheduled further out
+                        self._retry = loop.call_later(next_due, self.notify)
+                    return
+
+                timeout = POLL_SECONDS
+                if next_due is not None:
+                    # Due rows we could not claim are locked by another process
+                    timeout = min(max(next_due, 1.0), POLL_SECONDS)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self._close_smtp()
+            if token is not None:
+                unbind_tenant(token)
+
+    async def _drain(self) -> tuple[int, float | None]:
+        """Deliver one batch of due emails.
+
+        Returns:
+            Tuple of (emails sent, seconds until the next pending email is
+            due or None if nothing is pending)
+        """
+        from database import get_session_factory
+
+        from services.email_service import get_email_service
+
+        email_service = get_email_service()
+        session_factory = await get_session_factory()
+        now = datetime.now(timezone.utc)
+
+        async with session_factory() as session, session.begin():
+            result = await session.execute(
+                select(OutboundEmail)
+                .where(OutboundEmail.status == "pending", OutboundEmail.next_attempt_at <= now)
+                .order_by(OutboundEmail.next_attempt_at)
+                .limit(BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+            emails = list(result.scalars())
+
+            if not emails:
+                next_at = await session.scalar(
+                    select(func.min(OutboundEmail.next_attempt_at)).where(
+                        OutboundEmail.status == "pending"
+                    )
+                )
+                if next_at is None:
+                    return 0, None
+                return 0, max((next_at - now).total_seconds(), 0.0)
+
+            messages = [
+                email_service.build_message(e.to_email, e.subject, e.html_body, e.text_body)
+                for e in emails
+            ]
+            if self._smtp is None:
+                self._smtp = email_service.open_connection()
+            errors = await asyncio.to_thread(self._deliver, messages)
+
+            sent_ids = []
+            for email, error in zip(emails, errors):
+                if error is None:
+                    sent_ids.append(email.id)
+                    continue
+                email.attempts += 1
+                email.last_error = error[:1000]
+                if email.attempts >= MAX_ATTEMPTS:
+                    logger.error(f"Giving up on email to {email.to_email}: {error}")
+                    email.status = "failed"
+                    # Tokens in the body are long expired; don't keep them around
+                    email.html_body = ""
+                    email.text_body = None
+                else:
+                    email.next_attempt_at = now + retry_delay(email.attempts)
+            if sent_ids:
+                await session.execute(delete(OutboundEmail).where(OutboundEmail.id.in_(sent_ids)))
+
+        logger.info(f"Sent {len(sent_ids)} of {len(emails)} queued email(s)")
+        return len(sent_ids), 0.0
+
+    def _deliver(self, messages: list) -> list[str | None]:
+        """Send messages over the shared SMTP session (runs in a thread)."""
+        errors: list[str | None] = []
+        for msg in messages:
+            try:
+                self._smtp.send(msg)
+                errors.append(None)
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                if is_connection_error(e):
+                    # Server unreachable or refusing us: retry the rest later
+                    self._smtp.close()
+                    errors.extend([error] * (len(messages) - len(errors)))
+                    break
+                errors.append(error)
+                if not isinstance(e, smtplib.SMTPResponseException | smtplib.SMTPRecipientsRefused):
+                    # Unknown state; start the next message on a fresh session
+                    self._smtp.close()
+        return errors
+
+    async def _close_smtp(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            await asyncio.to_thread(smtp.close)
+
+
+def get_email_outbox() -> EmailOutbox:
+    """Get the email outbox (per tenant in multi-tenant mode)."""
+    return tenant_singleton("email_outbox", EmailOutbox)
@@ -1,20 +1,75 @@
 """Email service for authentication emails.
 
 Sends magic links, verification emails, and password reset emails.
-Uses SMTP configuration from environment variables.
+Uses SMTP configuration from environment variables. Emails are queued in
+the email_outbox table and delivered by services/email_outbox.py, so
+requests never wait on the mail server.
 """
 
 import logging
-import os
 import smtplib
+from email.message import Message
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from urllib.parse import urlencode
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from config import get_settings
+from models.email_outbox import OutboundEmail
+from services.email_outbox import get_email_outbox
+from tenancy import getenv, tenant_singleton
 
 logger = logging.getLogger(__name__)
 
+SMTP_TIMEOUT_SECONDS = 30
+
+
+class SMTPConnection:
+    """An SMTP session reused for many messages.
+
+    Blocking; used from the outbox worker's thread. Connects (STARTTLS and
+    login unless talking to local Postfix on port 25) on first send and
+    reconnects once if the server dropped an idle session.
+    """
+
+    def __init__(self, host: str, port: int, user: str, password: str) -> None:
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self._server: smtplib.SMTP | None = None
+
+    def send(self, msg: Message) -> None:
+        if self._server is None:
+            self._connect()
+        try:
+            self._server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self._connect()
+            self._server.send_message(msg)
+
+    def close(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+
+    def _connect(self) -> None:
+        self.close()
+        server = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT_SECONDS)
+        try:
+            # Skip TLS and auth for local Postfix (port 25)
+            if self.port != 25:
+                server.starttls()
+                server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+
 
 class EmailService:
     """Service for sending authentication emails.
@@ -27,70 +82,78 @@ class EmailService:
 
     def __init__(self) -> None:
         self.settings = get_settings()
-        self.smtp_host = os.environ.get("SMTP_HOST", "")
-        self.smtp_port = int(os.environ.get("SMTP_PORT", "587"))
-        self.smtp_user = os.environ.get("SMTP_USER", "")
-        self.smtp_pass = os.environ.get("SMTP_PASS", "")
-        self.from_email = os.environ.get("SMTP_FROM", self.smtp_user)
-        self.from_name = os.environ.get("SMTP_FROM_NAME", "HostKit Auth")
+        self.smtp_host = getenv("SMTP_HOST", "")
+        self.smtp_port = int(getenv("SMTP_PORT", "587"))
+        self.smtp_user = getenv("SMTP_USER", "")
+        self.smtp_pass = getenv("SMTP_PASS", "")
+        self.from_email = getenv("SMTP_FROM", self.smtp_user)
+        self.from_name = getenv("SMTP_FROM_NAME", "HostKit Auth")
 
     @property
     def is_configured(self) -> bool:
         """Check if email is configured."""
         return bool(self.smtp_host and self.smtp_user and self.smtp_pass)
 
-    def _send_email(
+    def _queue_email(
         self,
+        db: AsyncSession,
         to_email: str,
         subject: str,
         html_body: str,
         text_body: str | None = None,
     ) -> bool:
-        """Send an email via SMTP.
+        """Queue an email in the outbox; it is sent once ``db`` commits.
 
         Args:
+            db: Session of the request creating the email's token
             to_email: Recipient email address
             subject: Email subject
             html_body: HTML email body
             text_body: Plain text body (optional fallback)
 
         Returns:
-            True if email was sent successfully
+            True if the email was queued
         """
         if not self.is_configured:
             logger.warning("Email not configured, skipping send")
             return False
 
-        try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = f"{self.from_name} <{self.from_email}>"
-            msg["To"] = to_email
-
-            # Add plain text version
-            if text_body:
-                msg.attach(MIMEText(text_body, "plain"))
-
-            # Add HTML version
-            msg.attach(MIMEText(html_body, "html"))
-
-            # Send via SMTP
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                # Skip TLS and auth for local Postfix (port 25)
-                if self.smtp_port != 25:
-                    server.starttls()
-                    server.login(self.smtp_user, self.smtp_pass)
-                server.send_message(msg)
-
-            logger.info(f"Email sent to {to_email}: {subject}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {e}")
-            return False
+        db.add(
+            OutboundEmail(
+                to_email=to_email,
+                subject=subject,
+                html_body=html_body,
+                text_body=text_body,
+            )
+        )
+        get_email_outbox().notify_on_commit(db)
+        logger.info(f"Email queued for {to_email}: {subject}")
+        return True
+
+    def build_message(
+        self, to_email: str, subject: str, html_body: str, text_body: str | None
+    ) -> MIMEMultipart:
+        """Build the MIME message for a queued email."""
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = f"{self.from_name} <{self.from_email}>"
+        msg["To"] = to_email
+
+        # Add plain text version
+        if text_body:
+            msg.attach(MIMEText(text_body, "plain"))
+
+        # Add HTML version
+        msg.attach(MIMEText(html_body, "html"))
+        return msg
+
+    def open_connection(self) -> SMTPConnection:
+        """Create a reusable SMTP connection with this project's settings."""
+        return SMTPConnection(self.smtp_host, self.smtp_port, self.smtp_user, self.smtp_pass)
 
     def send_magic_link(
         self,
+        db: AsyncSession,
         to_email: str,
         token: str,
         redirect_url: str | None = None,
@@ -98,12 +161,13 @@ class EmailService:
         """Send a magic link email.
 
         Args:
+            db: Session of the request creating the token
             to_email: Recipient email
             token: The magic link token
             redirect_url: URL to redirect after authentication
 
         Returns:
-            True if email was sent
+            True if email was queued
         """
         # Build magic link URL
         params = {"token": token}
@@ -147,10 +211,11 @@ Click this link to sign in (expires in 15 minutes):
 If you didn't request this email, you can safely ignore it.
         """
 
-        return self._send_email(to_email, subject, html_body, text_body)
+        return self._queue_email(db, to_email, subject, html_body, text_body)
 
     def send_verification_email(
         self,
+        db: AsyncSession,
         to_email: str,
         token: str,
         redirect_url: str | None = None,
@@ -158,12 +223,13 @@ If you didn't request this email, you can safely ignore it.
         """Send an email verification email.
 
         Args:
+            db: Session of the request creating the token
             to_email: Recipient email
             token: The verification token
             redirect_url: URL to redirect after verification
 
         Returns:
-            True if email was sent
+            True if email was queued
         """
         params = {"token": token}
         if redirect_url:
@@ -201,10 +267,11 @@ Click this link to verify your email (expires in 24 hours):
 {verify_link}
         """
 
-        return self._send_email(to_email, subject, html_body, text_body)
+        return self._queue_email(db, to_email, subject, html_body, text_body)
 
     def send_password_reset(
         self,
+        db: AsyncSession,
         to_email: str,
         token: str,
         redirect_url: str | None = None,
@@ -212,12 +279,13 @@ Click this link to verify your email (expires in 24 hours):
         """Send a password reset email.
 
         Args:
+            db: Session of the request creating the token
             to_email: Recipient email
             token: The reset token
             redirect_url: URL to redirect after reset
 
         Returns:
-            True if email was sent
+            True if email was queued
         """
         params = {"token": token}
         if redirect_url:
@@ -257,16 +325,9 @@ Click this link to reset your password (expires in 1 hour):
 If you didn't request a password reset, you can safely ignore this email.
         """
 
-        return self._send_email(to_email, subject, html_body, text_body)
-
-
-# Singleton instance
-_email_service: EmailService | None = None
+        return self._queue_email(db, to_email, subject, html_body, text_body)
 
 
 def get_email_service() -> EmailService:
-    """Get the email service singleton."""
-    global _email_service
-    if _email_service is None:
-        _email_service = EmailService()
-    return _email_service
+    """Get the email service singleton (per tenant in multi-tenant mode)."""
+    return tenant_singleton("email_service", EmailService)
@@ -0,0 +1,36 @@
+"""Shared outbound HTTP client.
+
+One httpx.AsyncClient per process keeps connections (and TLS sessions) to
+Google, Apple and the OAuth proxy alive between requests, instead of paying
+for a new pool and handshake on every token exchange or key fetch. HTTP/2
+is used when the h2 package is installed (httpx[http2]).
+"""
+
+import importlib.util
+
+import httpx
+
+TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=90)
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=TIMEOUT,
+            limits=LIMITS,
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close pooled connections (shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -13,7 +13,9 @@ from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import get_settings
+from services.http_client import get_http_client
 from services.oauth_service import OAuthUserInfo, OAuthResult, get_oauth_service
+from tenancy import tenant_singleton
 
 logger = logging.getLogger(__name__)
 
@@ -82,25 +84,24 @@ class IdentityService:
         logger.info(f"Fetching OAuth proxy public key from {self.oauth_proxy_url}")
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.oauth_proxy_url}/.well-known/hostkit-oauth-public-key"
+            response = await get_http_client().get(
+                f"{self.oauth_proxy_url}/.well-known/hostkit-oauth-public-key"
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    f"Failed to fetch OAuth proxy public key: "
+                    f"status={response.status_code}, body={response.text}"
+                )
+                raise IdentityError(
+                    "key_fetch_failed",
+                    f"Failed to fetch OAuth proxy public key: HTTP {response.status_code}",
                 )
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"Failed to fetch OAuth proxy public key: "
-                        f"status={response.status_code}, body={response.text}"
-                    )
-                    raise IdentityError(
-                        "key_fetch_failed",
-                        f"Failed to fetch OAuth proxy public key: HTTP {response.status_code}",
-                    )
-
-                self._public_key = response.text
-                self._public_key_fetched_at = now
-                logger.info("Successfully fetched and cached OAuth proxy public key")
-                return self._public_key
+            self._public_key = response.text
+            self._public_key_fetched_at = now
+            logger.info("Successfully fetched and cached OAuth proxy public key")
+            return self._public_key
 
         except httpx.RequestError as e:
             logger.error(f"Network error fetching OAuth proxy public key: {e}")
@@ -216,13 +217,6 @@ class IdentityService:
         return result
 
 
-# Singleton instance
-_identity_service: IdentityService | None = None
-
-
 def get_identity_service() -> IdentityService:
-    """Get the identity service singleton."""
-    global _identity_service
-    if _identity_service is None:
-        _identity_service = IdentityService()
-    return _identity_service
+    """Get the identity service singleton (per tenant in multi-tenant mode)."""
+    return tenant_singleton("identity_service", IdentityService)
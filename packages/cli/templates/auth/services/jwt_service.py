@@ -2,23 +2,55 @@
 
 import hashlib
 import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+from jose.constants import ALGORITHMS
+from jose.exceptions import JWKError
 
 from config import get_settings
+from services.auth_cache import TTLCache
+from tenancy import tenant_singleton
 
 
 class JWTService:
     """Service for creating and validating JWT tokens.
 
     Uses RS256 (RSA) for token signing with separate public/private keys.
+    The PEM files are parsed once into key objects, and verified access
+    token payloads are cached (keyed by token hash) until they expire or
+    TOKEN_CACHE_SECONDS pass, whichever comes first.
     """
 
     def __init__(self) -> None:
         self.settings = get_settings()
+        self._private_key: Key | None = None
+        self._public_key: Key | None = None
+        self._verified: TTLCache | None = None
+        if self.settings.token_cache_seconds > 0:
+            self._verified = TTLCache(self.settings.token_cache_size)
+
+    @property
+    def private_key(self) -> Key:
+        """Signing key, parsed from the PEM file on first use."""
+        if self._private_key is None:
+            self._private_key = jwk.construct(self.settings.jwt_private_key, ALGORITHMS.RS256)
+        return self._private_key
+
+    @property
+    def public_key(self) -> Key:
+        """Verification key, parsed from the PEM file on first use."""
+        if self._public_key is None:
+            try:
+                self._public_key = jwk.construct(self.settings.jwt_public_key, ALGORITHMS.RS256)
+            except JWKError as e:
+                # Surface as a token failure (401), as jwt.decode did with a bad PEM
+                raise JWTError(f"Invalid public key: {e}")
+        return self._public_key
 
     def create_access_token(
         self,
@@ -59,8 +91,8 @@ class JWTService:
 
         return jwt.encode(
             claims,
-            self.settings.jwt_private_key,
-            algorithm="RS256",
+            self.private_key,
+            algorithm=ALGORITHMS.RS256,
         )
 
     def create_refresh_token(
@@ -96,8 +128,8 @@ class JWTService:
 
         token = jwt.encode(
             claims,
-            self.settings.jwt_private_key,
-            algorithm="RS256",
+            self.private_key,
+            algorithm=ALGORITHMS.RS256,
         )
 
         # Hash the token for storage
@@ -122,21 +154,29 @@ class JWTService:
         Raises:
             JWTError: If token is invalid or wrong type
         """
-        try:
-            payload = jwt.decode(
-                token,
-                self.settings.jwt_public_key,
-                algorithms=["RS256"],
-            )
+        cache_key = None
+        if self._verified is not None and token_type == "access":
+            cache_key = hashlib.sha256(token.encode()).digest()
+            payload = self._verified.get(cache_key)
+            if payload is not None:
+                return dict(payload)
+
+        payload = jwt.decode(
+            token,
+            self.public_key,
+            algorithms=[ALGORITHMS.RS256],
+        )
 
-            # Verify token type
-            if payload.get("type") != token_type:
-                raise JWTError(f"Invalid token type: expected {token_type}")
+        # Verify token type
+        if payload.get("type") != token_type:
+            raise JWTError(f"Invalid token type: expected {token_type}")
 
-            return payload
+        if cache_key is not None and isinstance(payload.get("exp"), int):
+            # Never serve a cached payload past the token's own expiry
+            expires_at = min(payload["exp"], time.time() + self.settings.token_cache_seconds)
+            self._verified.set(cache_key, payload, expires_at)
 
-        except JWTError:
-            raise
+        return payload
 
     def verify_refresh_token_hash(self, token: str, stored_hash: str) -> bool:
         """Verify a refresh token against its stored hash.
@@ -166,13 +206,6 @@ class JWTService:
         return now + timedelta(minutes=self.settings.access_token_expire_minutes)
 
 
-# Singleton instance
-_jwt_service: JWTService | None = None
-
-
 def get_jwt_service() -> JWTService:
-    """Get the JWT service singleton."""
-    global _jwt_service
-    if _jwt_service is None:
-        _jwt_service = JWTService()
-    return _jwt_service
+    """Get the JWT service singleton (per tenant in multi-tenant mode)."""
+    return tenant_singleton("jwt_service", JWTService)
@@ -9,25 +9,26 @@ import logging
 import secrets
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-import httpx
+from config import Settings, get_settings
 from jose import JWTError, jwt
-
-logger = logging.getLogger(__name__)
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from config import get_settings, Settings
+from jose.backends.base import Key
 from models.oauth import OAuthAccount
 from models.session import Session
 from models.user import User
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from tenancy import tenant_singleton
 
-
+from services.http_client import get_http_client
+from services.jwks import JWKSCache, KeyFetchError
 from services.jwt_service import get_jwt_service
 
+logger = logging.getLogger(__name__)
+
 
 # OAuth provider constants
 class OAuthProvider:
@@ -131,13 +132,9 @@ class OAuthStateStore:
             self._states.pop(state, None)
 
 
-# Global state store
-_state_store = OAuthStateStore()
-
-
 def get_state_store() -> OAuthStateStore:
-    """Get the OAuth state store singleton."""
-    return _state_store
+    """Get the OAuth state store singleton (per tenant in multi-tenant mode)."""
+    return tenant_singleton("oauth_state_store", OAuthStateStore)
 
 
 # =============================================================================
@@ -155,10 +152,11 @@ class GoogleOAuthService:
 
     SCOPES = ["openid", "email", "profile"]
 
+    # Shared by all instances (and tenants)
+    keys = JWKSCache(GOOGLE_CERTS_URL, "Google")
+
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self._google_keys: dict[str, Any] | None = None
-        self._keys_fetched_at: float = 0
 
     def build_authorization_url(
         self,
@@ -214,45 +212,31 @@ class GoogleOAuthService:
         if not client_id:
             raise OAuthError("Google OAuth is not configured", provider="google")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.GOOGLE_TOKEN_URL,
-                data={
-                    "client_id": client_id,
-                    "client_secret": self.settings.google_client_secret,
-                    "code": code,
-                    "grant_type": "authorization_code",
-                    "redirect_uri": redirect_uri or self.settings.google_callback_url,
-                },
-            )
-
-            if response.status_code != 200:
-                raise OAuthError(
-                    f"Google token exchange failed: {response.text}",
-                    provider="google",
-                )
-
-            return response.json()
+        response = await get_http_client().post(
+            self.GOOGLE_TOKEN_URL,
+            data={
+                "client_id": client_id,
+                "client_secret": self.settings.google_client_secret,
+                "code": code,
+                "grant_type": "authorization_code",
+                "redirect_uri": redirect_uri or self.settings.google_callback_url,
+            },
+        )
 
-    async def _fetch_google_keys(self) -> dict[str, Any]:
-        """Fetch Google's public keys for JWT verification.
+        if response.status_code != 200:
+            raise OAuthError(
+                f"Google token exchange failed: {response.text}",
+                provider="google",
+            )
 
-        Keys are cached for 1 hour.
-        """
-        now = time.time()
-        if self._google_keys and (now - self._keys_fetched_at) < 3600:
-            return self._google_keys
+        return response.json()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.GOOGLE_CERTS_URL)
-            if response.status_code != 200:
-                raise OAuthError(
-                    "Failed to fetch Google public keys",
-                    provider="google",
-                )
-            self._google_keys = response.json()
-            self._keys_fetched_at = now
-            return self._google_keys
+    async def _signing_key(self, kid: str | None) -> Key | None:
+        """Google's public key for an ID token ``kid`` (cached, see services/jwks.py)."""
+        try:
+            return await self.keys.get_key(kid)
+        except KeyFetchError as e:
+            raise OAuthError(str(e), provider="google")
 
     async def validate_id_token(
         self,
@@ -275,19 +259,13 @@ class GoogleOAuthService:
         Raises:
             OAuthError: If token is invalid
         """
-        keys = await self._fetch_google_keys()
-
         try:
             # Decode header to get key ID
             unverified_header = jwt.get_unverified_header(id_token)
             kid = unverified_header.get("kid")
 
             # Find the matching key
-            key = None
-            for jwk in keys.get("keys", []):
-                if jwk.get("kid") == kid:
-                    key = jwk
-                    break
+            key = await self._signing_key(kid)
 
             if not key:
                 raise OAuthError(
@@ -336,28 +314,27 @@ class GoogleOAuthService:
         Returns:
             Normalized user info
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.GOOGLE_USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-
-            if response.status_code != 200:
-                raise OAuthError(
-                    f"Failed to fetch Google user info: {response.text}",
-                    provider="google",
-                )
+        response = await get_http_client().get(
+            self.GOOGLE_USERINFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
 
-            data = response.json()
-            return OAuthUserInfo(
-                provider=OAuthProvider.GOOGLE,
-                provider_user_id=data["sub"],
-                email=data.get("email"),
-                email_verified=data.get("email_verified", False),
-                name=data.get("name"),
-                picture=data.get("picture"),
+        if response.status_code != 200:
+            raise OAuthError(
+                f"Failed to fetch Google user info: {response.text}",
+                provider="google",
             )
 
+        data = response.json()
+        return OAuthUserInfo(
+            provider=OAuthProvider.GOOGLE,
+            provider_user_id=data["sub"],
+            email=data.get("email"),
+            email_verified=data.get("email_verified", False),
+            name=data.get("name"),
+            picture=data.get("picture"),
+        )
+
 
 # =============================================================================
 # Apple Sign-In
@@ -373,10 +350,16 @@ class AppleOAuthService:
 
     SCOPES = ["name", "email"]
 
+    CLIENT_SECRET_LIFETIME = timedelta(days=180)  # Max 6 months
+    CLIENT_SECRET_RENEW_BEFORE = timedelta(days=1)
+
+    # Shared by all instances (and tenants)
+    keys = JWKSCache(APPLE_KEYS_URL, "Apple")
+
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self._apple_keys: dict[str, Any] | None = None
-        self._keys_fetched_at: float = 0
+        self._client_secret: str | None = None
+        self._client_secret_renew_at: datetime | None = None
 
     def build_authorization_url(
         self,
@@ -417,8 +400,8 @@ class AppleOAuthService:
         Returns:
             Signed JWT client secret
         """
-        now = datetime.now(timezone.utc)
-        expire = now + timedelta(days=180)  # Max 6 months
+        now = datetime.now(UTC)
+        expire = now + self.CLIENT_SECRET_LIFETIME
 
         headers = {
             "alg": "ES256",
@@ -443,6 +426,16 @@ class AppleOAuthService:
 
         return jwt.encode(payload, private_key, algorithm="ES256", headers=headers)
 
+    def _get_client_secret(self) -> str:
+        """Apple client secret, re-signed only shortly before it expires."""
+        now = datetime.now(UTC)
+        if self._client_secret is None or now >= self._client_secret_renew_at:
+            self._client_secret = self._generate_client_secret()
+            self._client_secret_renew_at = (
+                now + self.CLIENT_SECRET_LIFETIME - self.CLIENT_SECRET_RENEW_BEFORE
+            )
+        return self._client_secret
+
     async def exchange_code(
         self,
         code: str,
@@ -464,47 +457,33 @@ class AppleOAuthService:
         if not callback_uri:
             callback_uri = f"{self.settings.base_url}/auth/oauth/apple/callback"
 
-        client_secret = self._generate_client_secret()
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.APPLE_TOKEN_URL,
-                data={
-                    "client_id": self.settings.apple_client_id,
-                    "client_secret": client_secret,
-                    "code": code,
-                    "grant_type": "authorization_code",
-                    "redirect_uri": callback_uri,
-                },
-            )
-
-            if response.status_code != 200:
-                raise OAuthError(
-                    f"Apple token exchange failed: {response.text}",
-                    provider="apple",
-                )
-
-            return response.json()
+        client_secret = self._get_client_secret()
+
+        response = await get_http_client().post(
+            self.APPLE_TOKEN_URL,
+            data={
+                "client_id": self.settings.apple_client_id,
+                "client_secret": client_secret,
+                "code": code,
+                "grant_type": "authorization_code",
+                "redirect_uri": callback_uri,
+            },
+        )
 
-    async def _fetch_apple_keys(self) -> dict[str, Any]:
-        """Fetch Apple's public keys for JWT verification.
+        if response.status_code != 200:
+            raise OAuthError(
+                f"Apple token exchange failed: {response.text}",
+                provider="apple",
+            )
 
-        Keys are cached for 1 hour.
-        """
-        now = time.time()
-        if self._apple_keys and (now - self._keys_fetched_at) < 3600:
-            return self._apple_keys
+        return response.json()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.APPLE_KEYS_URL)
-            if response.status_code != 200:
-                raise OAuthError(
-                    "Failed to fetch Apple public keys",
-                    provider="apple",
-                )
-            self._apple_keys = response.json()
-            self._keys_fetched_at = now
-            return self._apple_keys
+    async def _signing_key(self, kid: str | None) -> Key | None:
+        """Apple's public key for an ID token ``kid`` (cached, see services/jwks.py)."""
+        try:
+            return await self.keys.get_key(kid)
+        except KeyFetchError as e:
+            raise OAuthError(str(e), provider="apple")
 
     async def validate_id_token(
         self,
@@ -531,8 +510,6 @@ class AppleOAuthService:
             OAuthError: If token is invalid
         """
         logger.debug("Validating Apple ID token")
-        keys = await self._fetch_apple_keys()
-
         try:
             # Decode header to get key ID
             unverified_header = jwt.get_unverified_header(id_token)
@@ -540,11 +517,7 @@ class AppleOAuthService:
             logger.debug(f"Apple token key ID: {kid}")
 
             # Find the matching key
-            key = None
-            for jwk in keys.get("keys", []):
-                if jwk.get("kid") == kid:
-                    key = jwk
-                    break
+            key = await self._signing_key(kid)
 
             if not key:
                 logger.warning(f"No matching Apple key found for kid: {kid}")
@@ -666,7 +639,7 @@ class OAuthService:
             user = user_result.scalar_one()
 
             # Update last sign in
-            user.last_sign_in_at = datetime.now(timezone.utc)
+            user.last_sign_in_at = datetime.now(UTC)
 
             # Create session
             session, access_token, refresh_token = await self._create_session(
@@ -728,7 +701,7 @@ class OAuthService:
         db.add(oauth_account)
 
         # Update last sign in
-        user.last_sign_in_at = datetime.now(timezone.utc)
+        user.last_sign_in_at = datetime.now(UTC)
 
         # Create session
         session, access_token, refresh_token = await self._create_session(
@@ -800,12 +773,6 @@ class OAuthService:
 # =============================================================================
 
 
-_oauth_service: OAuthService | None = None
-
-
 def get_oauth_service() -> OAuthService:
-    """Get the OAuth service singleton."""
-    global _oauth_service
-    if _oauth_service is None:
-        _oauth_service = OAuthService()
-    return _oauth_service
+    """Get the OAuth service singleton (per tenant in multi-tenant mode)."""
+    return tenant_singleton("oauth_service", OAuthService)
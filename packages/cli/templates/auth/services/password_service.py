@@ -1,29 +1,96 @@
 """Password hashing and verification service."""
 
+import asyncio
 import hashlib
+import os
 import secrets
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 
 import bcrypt
+from config import get_settings
+
+# bcrypt releases the GIL while hashing, so a small thread pool hashes in
+# parallel without blocking the event loop. The pool is process-wide (shared
+# by all tenants in multi-tenant mode).
+HASH_WORKERS = int(os.environ.get("AUTH_PASSWORD_HASH_WORKERS", "0")) or min(
+    4, os.cpu_count() or 1
+)
+# Hashes running or waiting for a worker before new ones are refused
+HASH_QUEUE_LIMIT = int(os.environ.get("AUTH_PASSWORD_HASH_QUEUE", "32"))
+HASH_RETRY_AFTER_SECONDS = 1
+
+DEFAULT_BCRYPT_ROUNDS = 12
+
+T = TypeVar("T")
+
+
+class PasswordHashBusyError(Exception):
+    """Raised when the password hashing queue is full (login storm)."""
 
 
 class PasswordService:
     """Service for password hashing and secure token generation.
 
-    Uses bcrypt for password hashing with automatic salting.
+    Uses bcrypt for password hashing with automatic salting. Async routes
+    use hash_password_async/verify_password_async, which run bcrypt on a
+    bounded worker pool and fail fast with PasswordHashBusyError (503) once
+    HASH_QUEUE_LIMIT hashes are pending.
     """
 
-    def hash_password(self, password: str) -> str:
+    def __init__(self, workers: int = HASH_WORKERS, queue_limit: int = HASH_QUEUE_LIMIT) -> None:
+        self.queue_limit = max(queue_limit, workers)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Hashes currently running or queued."""
+        return self._pending
+
+    def hash_password(self, password: str, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> str:
         """Hash a password using bcrypt.
 
+        Blocks for the whole hash; async code should use hash_password_async.
+
         Args:
             password: Plain text password
+            rounds: bcrypt cost factor
 
         Returns:
             Bcrypt hash string
         """
-        salt = bcrypt.gensalt(rounds=12)
+        salt = bcrypt.gensalt(rounds=rounds)
         return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password on the worker pool with the configured cost.
+
+        Raises:
+            PasswordHashBusyError: If too many hashes are already pending
+        """
+        rounds = get_settings().bcrypt_rounds
+        return await self._offload(self.hash_password, password, rounds)
+
+    async def verify_password_async(self, password: str, password_hash: str) -> bool:
+        """Verify a password on the worker pool.
+
+        Raises:
+            PasswordHashBusyError: If too many hashes are already pending
+        """
+        return await self._offload(self.verify_password, password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Check whether a hash was made with a different cost than configured."""
+        parts = password_hash.split("$")
+        if len(parts) < 4:
+            return False
+        try:
+            return int(parts[2]) != get_settings().bcrypt_rounds
+        except ValueError:
+            return False
+
     def verify_password(self, password: str, password_hash: str) -> bool:
         """Verify a password against its hash.
 
@@ -42,6 +109,15 @@ class PasswordService:
         except Exception:
             return False
 
+    async def _offload(self, func: Callable[..., T], *args) -> T:
+        if self._pending >= self.queue_limit:
+            raise PasswordHashBusyError(f"{self._pending} password hashes pending")
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
     def generate_secure_token(self, length: int = 32) -> str:
         """Generate a cryptographically secure token.
 
@@ -0,0 +1,303 @@
+"""Multi-tenant mode: one auth process serving many HostKit projects.
+
+Enabled with AUTH_MULTI_TENANT=true (see auth-shared.service.j2). Requests are
+bound to a tenant by the X-HostKit-Project header nginx sets on /auth/*, with
+the <project>.hostkit.dev Host as a fallback. Only projects listed in the
+tenants file written by HostKit are served.
+
+Tenant settings are loaded lazily from /home/{project}/.auth/.env into a
+bounded LRU cache, together with that tenant's service singletons (JWT keys,
+OAuth state, ...). Each tenant gets its own small engine pool: overflow
+connections are closed as soon as they are returned, and the whole pool is
+disposed once the tenant has been idle for AUTH_TENANT_IDLE_SECONDS.
+
+In single-tenant mode (the default) nothing here changes behaviour: settings,
+the engine and service singletons are process-wide as before.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+MULTI_TENANT = os.environ.get("AUTH_MULTI_TENANT", "false").lower() == "true"
+TENANTS_FILE = Path(
+    os.environ.get("AUTH_TENANTS_FILE", "/var/lib/hostkit/auth-shared/tenants.json")
+)
+TENANT_ENV_PATH = os.environ.get("AUTH_TENANT_ENV_PATH", "/home/{project}/.auth/.env")
+TENANT_CACHE_SIZE = int(os.environ.get("AUTH_TENANT_CACHE_SIZE", "64"))
+TENANT_IDLE_SECONDS = int(os.environ.get("AUTH_TENANT_IDLE_SECONDS", "600"))
+TENANT_POOL_SIZE = int(os.environ.get("AUTH_TENANT_POOL_SIZE", "1"))
+TENANT_MAX_OVERFLOW = int(os.environ.get("AUTH_TENANT_MAX_OVERFLOW", "4"))
+
+# How often a cached tenant's .env is checked for changes (e.g. OAuth config)
+TENANT_RELOAD_SECONDS = 5
+REAP_INTERVAL_SECONDS = 60
+
+PROJECT_HEADER = "x-hostkit-project"
+HOST_SUFFIX = ".hostkit.dev"
+PROJECT_NAME_RE = re.compile(r"^[a-z][a-z0-9-]{1,30}[a-z0-9]$")
+
+T = TypeVar("T")
+
+
+class UnknownTenantError(LookupError):
+    """Raised when a request names a project this process does not serve."""
+
+
+def parse_env_file(path: Path) -> dict[str, str]:
+    """Parse a HostKit-generated .env file (KEY=value lines)."""
+    values: dict[str, str] = {}
+    for raw_line in path.read_text().splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export ") :].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        values[key] = value
+    return values
+
+
+@dataclass
+class Tenant:
+    """Settings, services and database pool of one project."""
+
+    project: str
+    settings: Any  # config.AuthSettings
+    environ: dict[str, str]
+    env_mtime: float
+    services: dict[str, Any] = field(default_factory=dict)
+    last_used: float = field(default_factory=time.monotonic)
+    checked_at: float = field(default_factory=time.monotonic)
+    migrated: bool = False
+    _engine: Any = None
+    _session_factory: Any = None
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def has_engine(self) -> bool:
+        return self._engine is not None
+
+    async def session_factory(self) -> Any:
+        """Session factory for this tenant, creating the pool on first use."""
+        if self._session_factory is not None:
+            return self._session_factory
+
+        async with self._lock:
+            if self._session_factory is None:
+                from database import build_engine, build_session_factory, run_migrations
+
+                engine = build_engine(
+                    self.settings.auth_db_url,
+                    pool_size=TENANT_POOL_SIZE,
+                    max_overflow=TENANT_MAX_OVERFLOW,
+                )
+                if not self.migrated:
+                    try:
+                        await run_migrations(engine)
+                        self.migrated = True
+                    except Exception:
+                        # Serve anyway; retried when the pool is next created
+                        logger.exception(f"Migrations failed for tenant {self.project}")
+                self._engine = engine
+                self._session_factory = build_session_factory(engine)
+        return self._session_factory
+
+    async def dispose(self) -> None:
+        """Close this tenant's pooled connections."""
+        engine = self._engine
+        self._engine = None
+        self._session_factory = None
+        if engine is not None:
+            await engine.dispose()
+
+
+class TenantRegistry:
+    """Bounded LRU cache of tenants, loaded on first request."""
+
+    def __init__(self, max_size: int = TENANT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._tenants: OrderedDict[str, Tenant] = OrderedDict()
+        self._allowed: frozenset[str] = frozenset()
+        self._allowed_mtime: float | None = None
+        self._retiring: set[asyncio.Task] = set()
+
+    def allowed(self) -> frozenset[str]:
+        """Projects HostKit has registered with the shared runtime."""
+        try:
+            mtime = TENANTS_FILE.stat().st_mtime
+        except OSError:
+            return frozenset()
+        if mtime != self._allowed_mtime:
+            try:
+                data = json.loads(TENANTS_FILE.read_text())
+                self._allowed = frozenset(data.get("tenants", []))
+                self._allowed_mtime = mtime
+            except (OSError, ValueError) as e:
+                logger.error(f"Could not read tenants file {TENANTS_FILE}: {e}")
+        return self._allowed
+
+    def get(self, project: str) -> Tenant:
+        """Return the tenant for a project, loading it if needed."""
+        if project not in self.allowed():
+            self._discard(project)
+            raise UnknownTenantError(project)
+
+        now = time.monotonic()
+        tenant = self._tenants.get(project)
+        if tenant is not None and now - tenant.checked_at > TENANT_RELOAD_SECONDS:
+            tenant.checked_at = now
+            if _env_mtime(project) != tenant.env_mtime:
+                logger.info(f"Configuration changed for tenant {project}, reloading")
+                self._discard(project)
+                tenant = None
+
+        if tenant is None:
+            tenant = self._load(project)
+            self._tenants[project] = tenant
+            while len(self._tenants) > self.max_size:
+                _, evicted = self._tenants.popitem(last=False)
+                self._retire(evicted)
+        else:
+            self._tenants.move_to_end(project)
+
+        tenant.last_used = now
+        return tenant
+
+    def stats(self) -> dict[str, Any]:
+        """Cache and pool counters for the shared health endpoint."""
+        return {
+            "tenants_allowed": len(self.allowed()),
+            "tenants_loaded": len(self._tenants),
+            "pools_open": sum(1 for t in self._tenants.values() if t.has_engine),
+        }
+
+    async def reap_idle(self) -> int:
+        """Dispose pools of tenants idle longer than TENANT_IDLE_SECONDS."""
+        cutoff = time.monotonic() - TENANT_IDLE_SECONDS
+        reaped = 0
+        for tenant in list(self._tenants.values()):
+            if tenant.has_engine and tenant.last_used < cutoff:
+                await tenant.dispose()
+                reaped += 1
+        if reaped:
+            logger.info(f"Closed {reaped} idle tenant pool(s)")
+        return reaped
+
+    async def run_reaper(self) -> None:
+        """Background task: periodically close idle tenant pools."""
+        while True:
+            await asyncio.sleep(REAP_INTERVAL_SECONDS)
+            try:
+                await self.reap_idle()
+            except Exception:
+                logger.exception("Tenant reaper failed")
+
+    async def close(self) -> None:
+        """Dispose every pool (shutdown)."""
+        for tenant in self._tenants.values():
+            await tenant.dispose()
+        self._tenants.clear()
+
+    def _load(self, project: str) -> Tenant:
+        from config import AuthSettings
+
+        env_path = Path(TENANT_ENV_PATH.format(project=project))
+        try:
+            environ = parse_env_file(env_path)
+            env_mtime = env_path.stat().st_mtime
+        except OSError as e:
+            logger.error(f"Cannot read auth settings for tenant {project}: {e}")
+            raise UnknownTenantError(project) from e
+
+        settings = AuthSettings(
+            _env_file=None, **{key.lower(): value for key, value in environ.items()}
+        )
+        if settings.project_name != project:
+            logger.error(f"Tenant {project} .env belongs to '{settings.project_name}'")
+            raise UnknownTenantError(project)
+
+        return Tenant(project=project, settings=settings, environ=environ, env_mtime=env_mtime)
+
+    def _discard(self, project: str) -> None:
+        tenant = self._tenants.pop(project, None)
+        if tenant is not None:
+            self._retire(tenant)
+
+    def _retire(self, tenant: Tenant) -> None:
+        """Dispose an evicted tenant's pool without blocking the request."""
+        if not tenant.has_engine:
+            return
+        task = asyncio.get_running_loop().create_task(tenant.dispose())
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+
+def _env_mtime(project: str) -> float | None:
+    try:
+        return Path(TENANT_ENV_PATH.format(project=project)).stat().st_mtime
+    except OSError:
+        return None
+
+
+registry = TenantRegistry()
+_current_tenant: ContextVar[Tenant | None] = ContextVar("auth_tenant", default=None)
+_process_singletons: dict[str, Any] = {}
+
+
+def resolve_project(headers: dict[str, str]) -> str | None:
+    """Project name for a request, from the nginx header or the Host."""
+    project = headers.get(PROJECT_HEADER, "").strip().lower()
+    if not project:
+        host = headers.get("host", "").split(":", 1)[0].lower()
+        if host.endswith(HOST_SUFFIX):
+            project = host[: -len(HOST_SUFFIX)]
+    return project if PROJECT_NAME_RE.match(project) else None
+
+
+def bind_tenant(tenant: Tenant):
+    """Bind a tenant to the current request context; returns a reset token."""
+    return _current_tenant.set(tenant)
+
+
+def unbind_tenant(token) -> None:
+    _current_tenant.reset(token)
+
+
+def current_tenant() -> Tenant:
+    """Tenant bound to the current request."""
+    tenant = _current_tenant.get()
+    if tenant is None:
+        raise RuntimeError("No tenant bound to this request (multi-tenant mode)")
+    return tenant
+
+
+def tenant_singleton(name: str, factory: Callable[[], T]) -> T:
+    """Per-tenant singleton in multi-tenant mode, process-wide otherwise."""
+    store = current_tenant().services if MULTI_TENANT else _process_singletons
+    instance = store.get(name)
+    if instance is None:
+        instance = store[name] = factory()
+    return instance
+
+
+def getenv(key: str, default: str = "") -> str:
+    """Read a setting that is not part of AuthSettings (e.g. SMTP_*)."""
+    if MULTI_TENANT:
+        return current_tenant().environ.get(key, default)
+    return os.environ.get(key, default)
@@ -34,11 +34,25 @@ class Settings(BaseSettings):
     # Rate Limiting (defaults)
     DEFAULT_RATE_LIMIT_RPM: int = 60  # requests per minute
     DEFAULT_DAILY_TOKEN_LIMIT: int = 1_000_000
+    RATE_LIMIT_REDIS: bool = False  # share limits across daemon processes via REDIS_URL
+    USAGE_FLUSH_INTERVAL_SECONDS: float = 5.0  # how often usage is written to the database
 
     # Tool Execution
     TOOL_TIMEOUT_SECONDS: int = 30
     TOOL_MAX_OUTPUT_SIZE: int = 100_000  # bytes
 
+    # Project database tools (db_read / db_write)
+    DB_TOOL_POOL_MAX_SIZE: int = 4  # connections per project pool
+    DB_TOOL_MAX_POOLS: int = 20  # least recently used pools beyond this are closed
+    DB_TOOL_POOL_IDLE_SECONDS: int = 300  # pools unused this long are closed
+    DB_TOOL_STATEMENT_TIMEOUT_MS: int = 15_000
+
+    # Cache tool (cache_flush)
+    REDIS_URL: str = "redis://127.0.0.1:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 10
+    CACHE_SCAN_COUNT: int = 1000  # keys per SCAN step
+    CACHE_TIME_BUDGET_SECONDS: float = 10.0  # per call; larger flushes resume with a cursor
+
     # Conversation Limits
     MAX_MESSAGES_PER_CONVERSATION: int = 1000
     MAX_CONVERSATIONS_PER_PROJECT: int = 1000
@@ -26,6 +26,9 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 from database import init_db, close_db
+from tools.cache import close_redis
+from tools.database import close_project_pools
+from services.quota_manager import start_usage_flusher, stop_usage_flusher
 from routers import (
     health_router,
     chat_router,
@@ -41,9 +44,13 @@ async def lifespan(app: FastAPI):
     # Startup
     print(f"Starting HostKit Claude Daemon on port {settings.PORT}")
     await init_db()
+    start_usage_flusher()
     yield
     # Shutdown
     print("Shutting down Claude Daemon")
+    await stop_usage_flusher()
+    await close_project_pools()
+    await close_redis()
     await close_db()
 
 
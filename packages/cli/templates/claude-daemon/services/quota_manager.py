@@ -1,15 +1,257 @@
 """Quota and rate limiting manager.
 
 Handles per-project rate limiting and daily token quotas.
+
+Usage is accumulated in memory and written to usage_tracking by a background
+task every USAGE_FLUSH_INTERVAL_SECONDS, one upsert per project and day, so
+database writes follow the flush interval rather than the request rate.
+Quota checks are served from the in-memory totals after the first read of
+the day. Rate limits use a sliding window counter shared by every request
+in the process, or by every daemon process when RATE_LIMIT_REDIS is set.
 """
 
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
 from datetime import date, datetime
+
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import settings
+from database import get_session
 from models.project_key import ProjectKey
 from models.usage import UsageTracking
 
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_WINDOW_SECONDS = 60
+
+# Atomic check-and-increment for the Redis limiter.
+# KEYS: current window, previous window. ARGV: previous weight, limit, ttl.
+_REDIS_LIMIT_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[1]) + current >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+@dataclass
+class UsageCounts:
+    """Usage counters for one project and day."""
+
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    tool_calls: int = 0
+
+    @property
+    def tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def add(self, other: "UsageCounts") -> None:
+        self.requests += other.requests
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.tool_calls += other.tool_calls
+
+
+class UsageAccumulator:
+    """Process-wide usage totals with write-behind to usage_tracking.
+
+    _pending holds deltas not yet written; _totals holds the full count
+    for a project and day (stored row plus everything recorded since) once
+    it has been loaded, so quota checks do not touch the database.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[str, date], UsageCounts] = {}
+        self._totals: dict[tuple[str, date], UsageCounts] = {}
+        # Keeps a flush from landing between a total's SELECT and its merge
+        self._lock = asyncio.Lock()
+
+    def record(self, project_name: str, counts: UsageCounts) -> None:
+        key = (project_name, date.today())
+        self._pending.setdefault(key, UsageCounts()).add(counts)
+        if key in self._totals:
+            self._totals[key].add(counts)
+
+    async def total(self, db: AsyncSession, project_name: str) -> UsageCounts:
+        """Get today's usage for a project, reading the stored row once a day."""
+        key = (project_name, date.today())
+        if key in self._totals:
+            return self._totals[key]
+
+        async with self._lock:
+            if key not in self._totals:
+                result = await db.execute(
+                    select(UsageTracking).where(
+                        UsageTracking.project_name == project_name,
+                        UsageTracking.date == key[1],
+                    )
+                )
+                usage = result.scalar_one_or_none()
+                total = UsageCounts()
+                if usage:
+                    total.add(
+                        UsageCounts(
+                            usage.requests,
+                            usage.input_tokens,
+                            usage.output_tokens,
+                            usage.tool_calls,
+                        )
+                    )
+                if key in self._pending:
+                    total.add(self._pending[key])
+                self._totals[key] = total
+        return self._totals[key]
+
+    async def flush(self) -> int:
+        """Write pending deltas with one upsert. Returns the rows written."""
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            # Totals from previous days are no longer checked
+            today = date.today()
+            self._totals = {k: v for k, v in self._totals.items() if k[1] >= today}
+            if not pending:
+                return 0
+
+            rows = [
+                {
+                    "project_name": project_name,
+                    "date": day,
+                    "requests": counts.requests,
+                    "input_tokens": counts.input_tokens,
+                    "output_tokens": counts.output_tokens,
+                    "tool_calls": counts.tool_calls,
+                    "updated_at": datetime.utcnow(),
+                }
+                for (project_name, day), counts in pending.items()
+            ]
+            stmt = insert(UsageTracking).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_project_date",
+                set_={
+                    "requests": UsageTracking.requests + stmt.excluded.requests,
+                    "input_tokens": UsageTracking.input_tokens + stmt.excluded.input_tokens,
+                    "output_tokens": UsageTracking.output_tokens + stmt.excluded.output_tokens,
+                    "tool_calls": UsageTracking.tool_calls + stmt.excluded.tool_calls,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+
+            try:
+                async for session in get_session():
+                    await session.execute(stmt)
+            except Exception:
+                # Keep the deltas for the next flush
+                for key, counts in pending.items():
+                    self._pending.setdefault(key, UsageCounts()).add(counts)
+                raise
+            return len(rows)
+
+
+class RateLimiter:
+    """Sliding window counter per project.
+
+    Keeps a count for the current and previous fixed window and weights the
+    previous one by how much of it still overlaps the sliding window, so a
+    check is O(1) in time and memory however many requests are in flight.
+    """
+
+    def __init__(self, window_seconds: int = RATE_LIMIT_WINDOW_SECONDS) -> None:
+        self.window = window_seconds
+        # project -> (window index, current count, previous count)
+        self._windows: dict[str, tuple[int, int, int]] = {}
+
+    def _position(self) -> tuple[int, float]:
+        now = time.time()
+        index = int(now // self.window)
+        previous_weight = 1 - (now - index * self.window) / self.window
+        return index, previous_weight
+
+    async def allow(self, project_name: str, limit: int) -> bool:
+        """Count a request if the project is under limit requests per window."""
+        if settings.RATE_LIMIT_REDIS:
+            try:
+                return await self._allow_redis(project_name, limit)
+            except Exception as e:
+                logger.warning(f"Redis rate limiter unavailable, using local counts: {e}")
+        return self._allow_local(project_name, limit)
+
+    def _allow_local(self, project_name: str, limit: int) -> bool:
+        index, previous_weight = self._position()
+        window, current, previous = self._windows.get(project_name, (index, 0, 0))
+        if window != index:
+            previous = current if window == index - 1 else 0
+            current = 0
+
+        allowed = previous * previous_weight + current < limit
+        if allowed:
+            current += 1
+        self._windows[project_name] = (index, current, previous)
+        return allowed
+
+    async def _allow_redis(self, project_name: str, limit: int) -> bool:
+        from tools.cache import get_redis
+
+        index, previous_weight = self._position()
+        prefix = f"hostkit-claude:rate:{project_name}"
+        allowed = await get_redis().eval(
+            _REDIS_LIMIT_SCRIPT,
+            2,
+            f"{prefix}:{index}",
+            f"{prefix}:{index - 1}",
+            previous_weight,
+            limit,
+            self.window * 2,
+        )
+        return bool(allowed)
+
+
+_usage = UsageAccumulator()
+_limiter = RateLimiter()
+_flush_task: asyncio.Task | None = None
+
+
+async def _flush_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.USAGE_FLUSH_INTERVAL_SECONDS)
+        try:
+            await _usage.flush()
+        except Exception:
+            logger.exception("Usage flush failed; retrying next interval")
+
+
+def start_usage_flusher() -> None:
+    """Start writing accumulated usage in the background."""
+    global _flush_task
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_loop())
+
+
+async def stop_usage_flusher() -> None:
+    """Stop the background flush and write whatever is still pending."""
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+    try:
+        await _usage.flush()
+    except Exception:
+        logger.exception("Final usage flush failed")
+
 
 class QuotaManager:
     """Manages rate limiting and usage quotas for projects."""
@@ -17,7 +259,6 @@ class QuotaManager:
     def __init__(self, db: AsyncSession):
         """Initialize quota manager with database session."""
         self.db = db
-        self._request_timestamps: dict[str, list[datetime]] = {}
 
     async def check_rate_limit(self, project: ProjectKey) -> tuple[bool, str | None]:
         """Check if project is within rate limit.
@@ -28,26 +269,8 @@ class QuotaManager:
         Returns:
             Tuple of (allowed, error_message)
         """
-        now = datetime.utcnow()
-        project_name = project.project_name
-
-        # Get request timestamps for this project
-        if project_name not in self._request_timestamps:
-            self._request_timestamps[project_name] = []
-
-        timestamps = self._request_timestamps[project_name]
-
-        # Remove timestamps older than 1 minute
-        one_minute_ago = now.timestamp() - 60
-        timestamps = [t for t in timestamps if t.timestamp() > one_minute_ago]
-        self._request_timestamps[project_name] = timestamps
-
-        # Check if under limit
-        if len(timestamps) >= project.rate_limit_rpm:
+        if not await _limiter.allow(project.project_name, project.rate_limit_rpm):
             return False, f"Rate limit exceeded ({project.rate_limit_rpm} requests/minute)"
-
-        # Add current timestamp
-        timestamps.append(now)
         return True, None
 
     async def check_daily_quota(self, project: ProjectKey) -> tuple[bool, int]:
@@ -59,22 +282,8 @@ class QuotaManager:
         Returns:
             Tuple of (has_quota, remaining_tokens)
         """
-        today = date.today()
-
-        result = await self.db.execute(
-            select(UsageTracking)
-            .where(
-                UsageTracking.project_name == project.project_name,
-                UsageTracking.date == today,
-            )
-        )
-        usage = result.scalar_one_or_none()
-
-        if not usage:
-            return True, project.daily_token_limit
-
-        total_used = usage.input_tokens + usage.output_tokens
-        remaining = project.daily_token_limit - total_used
+        usage = await _usage.total(self.db, project.project_name)
+        remaining = project.daily_token_limit - usage.tokens
 
         return remaining > 0, max(0, remaining)
 
@@ -87,35 +296,13 @@ class QuotaManager:
     ) -> None:
         """Record usage for a project.
 
+        The usage is counted immediately for quota checks and written to
+        usage_tracking by the next background flush.
+
         Args:
             project_name: Name of the project
             input_tokens: Number of input tokens used
             output_tokens: Number of output tokens used
             tool_calls: Number of tool calls made
         """
-        today = date.today()
-
-        result = await self.db.execute(
-            select(UsageTracking)
-            .where(
-                UsageTracking.project_name == project_name,
-                UsageTracking.date == today,
-            )
-        )
-        usage = result.scalar_one_or_none()
-
-        if usage:
-            usage.requests += 1
-            usage.input_tokens += input_tokens
-            usage.output_tokens += output_tokens
-            usage.tool_calls += tool_calls
-        else:
-            usage = UsageTracking(
-                project_name=project_name,
-                date=today,
-                requests=1,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                tool_calls=tool_calls,
-            )
-            self.db.add(usage)
+        _usage.record(project_name, UsageCounts(1, input_tokens, output_tokens, tool_calls))
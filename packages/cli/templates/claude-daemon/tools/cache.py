@@ -1,14 +1,50 @@
-"""Cache tool - Flush Redis cache for projects."""
+"""Cache tool - Flush Redis cache for projects.
+
+Keys are found with incremental SCAN (CACHE_SCAN_COUNT keys per step) and
+removed with pipelined UNLINK, so Redis is never blocked for more than one
+small step, however many keys match. Each call stops after
+CACHE_TIME_BUDGET_SECONDS; a larger flush returns a cursor to continue from.
+"""
 
-import asyncio
 import logging
 import re
+import time
 from typing import Any
 
+import redis.asyncio as redis
+from config import settings
 from tools.base import BaseTool, ToolResult, ToolTier
 
 logger = logging.getLogger(__name__)
 
+# Keys per UNLINK command in a pipeline
+UNLINK_BATCH = 500
+
+# Keys listed back when asking for confirmation
+SAMPLE_KEYS = 100
+
+_pool: redis.ConnectionPool | None = None
+
+
+def get_redis() -> redis.Redis:
+    """Get a client on the daemon's shared Redis connection pool."""
+    global _pool
+    if _pool is None:
+        _pool = redis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            decode_responses=True,
+        )
+    return redis.Redis(connection_pool=_pool)
+
+
+async def close_redis() -> None:
+    """Close the shared Redis connection pool."""
+    global _pool
+    if _pool is not None:
+        await _pool.disconnect()
+        _pool = None
+
 
 class CacheFlushTool(BaseTool):
     """Flush Redis cache for a project.
@@ -23,7 +59,8 @@ class CacheFlushTool(BaseTool):
     name = "cache_flush"
     description = (
         "Flush the project's Redis cache. Optionally specify a pattern "
-        "to flush specific keys only."
+        "to flush specific keys only. Large flushes stop after a time budget "
+        "and return a cursor; call again with it to continue."
     )
     tier = ToolTier.STATE_CHANGE
 
@@ -39,6 +76,13 @@ class CacheFlushTool(BaseTool):
                 "description": "Must be true to confirm the flush operation",
                 "default": False,
             },
+            "cursor": {
+                "type": "integer",
+                "description": (
+                    "Continue an unfinished flush from this cursor (returned by the previous call)"
+                ),
+                "default": 0,
+            },
         },
         "required": [],
     }
@@ -53,12 +97,23 @@ class CacheFlushTool(BaseTool):
             project_name: Project whose cache to flush
             pattern: Optional key pattern (default: project:*)
             confirm: Must be True to proceed
+            cursor: SCAN cursor to resume an unfinished flush from
 
         Returns:
             ToolResult with flush result
         """
         user_pattern = params.get("pattern", "")
         confirm = params.get("confirm", False)
+        try:
+            cursor = int(params.get("cursor") or 0)
+        except (TypeError, ValueError):
+            cursor = -1
+        if cursor < 0:
+            return ToolResult(
+                success=False,
+                output="",
+                error="Invalid cursor. Use the cursor returned by the previous cache_flush call.",
+            )
 
         # Build the full pattern (project-namespaced)
         if user_pattern:
@@ -73,13 +128,26 @@ class CacheFlushTool(BaseTool):
         else:
             full_pattern = f"{project_name}:*"
 
-        # First, count matching keys
         try:
-            count_result = await self._count_keys(full_pattern)
-            if not count_result.success:
-                return count_result
+            client = get_redis()
+
+            # Resuming an unfinished flush: skip counting, but still require confirm
+            if cursor:
+                if not confirm:
+                    return ToolResult(
+                        success=False,
+                        output="",
+                        error=(
+                            f"Resuming the flush of '{full_pattern}' deletes keys. "
+                            "Set confirm=true to proceed."
+                        ),
+                        data={"pattern": full_pattern, "requires_confirmation": True},
+                    )
+                return await self._flush_keys(client, full_pattern, cursor)
 
-            key_count = count_result.data.get("count", 0)
+            # First, count matching keys
+            count_result = await self._count_keys(client, full_pattern)
+            key_count = count_result.data["count"]
 
             if key_count == 0:
                 return ToolResult(
@@ -90,16 +158,34 @@ class CacheFlushTool(BaseTool):
 
             # If not confirmed and there are keys, ask for confirmation
             if not confirm:
+                counted = key_count if count_result.data["complete"] else f"at least {key_count}"
                 return ToolResult(
                     success=False,
                     output="",
-                    error=f"Found {key_count} key(s) matching '{full_pattern}'. Set confirm=true to proceed with flush.",
-                    data={"pattern": full_pattern, "key_count": key_count, "requires_confirmation": True},
+                    error=(
+                        f"Found {counted} key(s) matching '{full_pattern}'. "
+                        "Set confirm=true to proceed with flush."
+                    ),
+                    data={
+                        "pattern": full_pattern,
+                        "key_count": key_count,
+                        "count_complete": count_result.data["complete"],
+                        "keys": count_result.data["keys"],
+                        "requires_confirmation": True,
+                    },
                 )
 
             # Proceed with flush
-            return await self._flush_keys(full_pattern, key_count)
+            return await self._flush_keys(client, full_pattern, 0)
 
+        except redis.ConnectionError:
+            return ToolResult(
+                success=False,
+                output="",
+                error="Redis connection refused. Is Redis running?",
+            )
+        except redis.RedisError as e:
+            return ToolResult(success=False, output="", error=f"Redis error: {e}")
         except Exception as e:
             logger.exception(f"Cache flush failed for {project_name}")
             return ToolResult(
@@ -108,91 +194,76 @@ class CacheFlushTool(BaseTool):
                 error=self.format_error(e),
             )
 
-    async def _count_keys(self, pattern: str) -> ToolResult:
-        """Count keys matching pattern."""
-        # Use redis-cli to count keys
-        process = await asyncio.create_subprocess_exec(
-            "redis-cli",
-            "KEYS",
-            pattern,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
+    async def _count_keys(self, client: redis.Redis, pattern: str) -> ToolResult:
+        """Count keys matching pattern with SCAN, within the time budget."""
+        deadline = time.monotonic() + settings.CACHE_TIME_BUDGET_SECONDS
+        count = 0
+        sample: list[str] = []
+        cursor = 0
 
-        if process.returncode != 0:
-            error = stderr.decode().strip()
-
-            # Check for common Redis errors
-            if "connection refused" in error.lower():
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error="Redis connection refused. Is Redis running?",
-                )
-
-            return ToolResult(
-                success=False,
-                output="",
-                error=f"Redis error: {error}",
+        while True:
+            cursor, keys = await client.scan(
+                cursor=cursor, match=pattern, count=settings.CACHE_SCAN_COUNT
             )
-
-        # Count lines (each line is a key)
-        output = stdout.decode().strip()
-        keys = [k for k in output.splitlines() if k.strip()]
-        count = len(keys)
+            count += len(keys)
+            sample.extend(keys[: SAMPLE_KEYS - len(sample)])
+            if cursor == 0 or time.monotonic() >= deadline:
+                break
 
         return ToolResult(
             success=True,
             output=f"Found {count} key(s) matching pattern.",
-            data={"count": count, "keys": keys[:100]},  # Limit key list
+            data={"count": count, "keys": sample, "complete": cursor == 0},
         )
 
-    async def _flush_keys(self, pattern: str, expected_count: int) -> ToolResult:
-        """Flush keys matching pattern using DEL command with KEYS."""
-        # Use eval script for atomic delete
-        # KEYS pattern, then delete all matching
-        lua_script = """
-        local keys = redis.call('KEYS', ARGV[1])
-        local count = 0
-        for i, key in ipairs(keys) do
-            redis.call('DEL', key)
-            count = count + 1
-        end
-        return count
-        """
+    async def _flush_keys(self, client: redis.Redis, pattern: str, cursor: int) -> ToolResult:
+        """Delete keys matching pattern with SCAN + pipelined UNLINK.
 
-        process = await asyncio.create_subprocess_exec(
-            "redis-cli",
-            "EVAL",
-            lua_script,
-            "0",  # No keys in KEYS array
-            pattern,  # Pattern as ARGV[1]
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
+        UNLINK frees memory in a background thread, and every step touches
+        at most CACHE_SCAN_COUNT keys, so other clients are only ever kept
+        waiting for one short step. Stops when the scan completes or the
+        time budget runs out, returning the cursor to continue from.
+        """
+        started = time.monotonic()
+        deadline = started + settings.CACHE_TIME_BUDGET_SECONDS
+        deleted = 0
+        scanned_steps = 0
 
-        if process.returncode != 0:
-            error = stderr.decode().strip()
-            return ToolResult(
-                success=False,
-                output="",
-                error=f"Flush failed: {error}",
+        while True:
+            cursor, keys = await client.scan(
+                cursor=cursor, match=pattern, count=settings.CACHE_SCAN_COUNT
             )
+            scanned_steps += 1
+            if keys:
+                async with client.pipeline(transaction=False) as pipe:
+                    for i in range(0, len(keys), UNLINK_BATCH):
+                        pipe.unlink(*keys[i : i + UNLINK_BATCH])
+                    deleted += sum(await pipe.execute())
+            if cursor == 0 or time.monotonic() >= deadline:
+                break
 
-        # Parse count from output
-        output = stdout.decode().strip()
-        try:
-            deleted_count = int(output)
-        except ValueError:
-            deleted_count = expected_count  # Fallback
+        elapsed_ms = round((time.monotonic() - started) * 1000)
+        data = {
+            "pattern": pattern,
+            "flushed_count": deleted,
+            "scan_steps": scanned_steps,
+            "elapsed_ms": elapsed_ms,
+            "complete": cursor == 0,
+            "cursor": cursor,
+        }
 
+        if cursor == 0:
+            return ToolResult(
+                success=True,
+                output=f"Successfully flushed {deleted} key(s) matching pattern '{pattern}'.",
+                data=data,
+            )
         return ToolResult(
             success=True,
-            output=f"Successfully flushed {deleted_count} key(s) matching pattern '{pattern}'.",
-            data={
-                "pattern": pattern,
-                "flushed_count": deleted_count,
-            },
+            output=(
+                f"Flushed {deleted} key(s) matching pattern '{pattern}' in {elapsed_ms}ms; "
+                f"more remain. Call again with cursor={cursor}, confirm=true and the same "
+                "pattern to continue."
+            ),
+            data=data,
         )
@@ -1,15 +1,153 @@
-"""Database tools - Read and write to project databases."""
+"""Database tools - Read and write to project databases.
+
+Queries run on per-project asyncpg pools instead of a psql process per call.
+A pool is created the first time a project's database is used, connects with
+the project's own DATABASE_URL, and is closed again once it has been idle for
+DB_TOOL_POOL_IDLE_SECONDS or when more than DB_TOOL_MAX_POOLS projects are
+open (least recently used first). Every connection has a statement_timeout.
+"""
 
 import asyncio
-import json
 import logging
 import re
+import time
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
+import asyncpg
+from config import settings
 from tools.base import BaseTool, ToolResult, ToolTier
+from tools.env import parse_env_file
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip from a server-side cursor
+CURSOR_PREFETCH = 200
+
+
+class ProjectDatabaseError(Exception):
+    """The project's database cannot be reached from its configuration."""
+
+
+def project_dsn(project_name: str) -> str:
+    """Get the connection URL for a project's database from its .env."""
+    env_path = Path(f"/home/{project_name}/.env")
+    try:
+        env = parse_env_file(env_path.read_text())
+    except OSError as e:
+        raise ProjectDatabaseError(f"Cannot read {env_path}: {e.strerror}") from e
+
+    url = env.get("DATABASE_URL")
+    if not url:
+        raise ProjectDatabaseError(
+            f"No DATABASE_URL in {env_path}. Is a database enabled for {project_name}?"
+        )
+    # SQLAlchemy-style driver suffixes (postgresql+asyncpg://) are not understood by asyncpg
+    return re.sub(r"^postgres(?:ql)?(?:\+\w+)?://", "postgresql://", url)
+
+
+class ProjectPools:
+    """Lazily created, LRU-reaped asyncpg pools, one per project."""
+
+    def __init__(
+        self,
+        max_pools: int = settings.DB_TOOL_MAX_POOLS,
+        idle_seconds: float = settings.DB_TOOL_POOL_IDLE_SECONDS,
+        max_size: int = settings.DB_TOOL_POOL_MAX_SIZE,
+        statement_timeout_ms: int = settings.DB_TOOL_STATEMENT_TIMEOUT_MS,
+    ):
+        self.max_pools = max_pools
+        self.idle_seconds = idle_seconds
+        self.max_size = max_size
+        self.statement_timeout_ms = statement_timeout_ms
+        # project name -> (pool, last used), least recently used first
+        self._pools: OrderedDict[str, tuple[asyncpg.Pool, float]] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._closing: set[asyncio.Task] = set()
+
+    async def get(self, project_name: str) -> asyncpg.Pool:
+        """Get the project's pool, creating it on first use."""
+        async with self._lock:
+            now = time.monotonic()
+            self._reap(now)
+
+            entry = self._pools.get(project_name)
+            if entry is not None:
+                pool = entry[0]
+                self._pools.move_to_end(project_name)
+            else:
+                pool = await asyncpg.create_pool(
+                    project_dsn(project_name),
+                    min_size=0,
+                    max_size=self.max_size,
+                    max_inactive_connection_lifetime=self.idle_seconds,
+                    command_timeout=self.statement_timeout_ms / 1000 + 5,
+                    server_settings={
+                        "statement_timeout": str(self.statement_timeout_ms),
+                        "application_name": "hostkit-claude",
+                    },
+                )
+            self._pools[project_name] = (pool, now)
+
+            while len(self._pools) > self.max_pools:
+                _, (evicted, _) = self._pools.popitem(last=False)
+                self._close_later(evicted)
+            return pool
+
+    def _reap(self, now: float) -> None:
+        for name, (pool, last_used) in list(self._pools.items()):
+            if now - last_used > self.idle_seconds:
+                del self._pools[name]
+                self._close_later(pool)
+
+    def _close_later(self, pool: asyncpg.Pool) -> None:
+        # close() waits for connections in use to be released, so queries
+        # running on an evicted pool still finish
+        task = asyncio.create_task(self._close(pool))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(pool: asyncpg.Pool) -> None:
+        try:
+            await asyncio.wait_for(pool.close(), timeout=settings.TOOL_TIMEOUT_SECONDS)
+        except (asyncio.TimeoutError, OSError, asyncpg.PostgresError):
+            pool.terminate()
+
+    async def close(self) -> None:
+        """Close every pool (on shutdown)."""
+        async with self._lock:
+            pools = [pool for pool, _ in self._pools.values()]
+            self._pools.clear()
+        await asyncio.gather(*(self._close(pool) for pool in pools), *self._closing)
+
+
+_project_pools: ProjectPools | None = None
+
+
+def get_project_pools() -> ProjectPools:
+    """Get the shared project pool manager."""
+    global _project_pools
+    if _project_pools is None:
+        _project_pools = ProjectPools()
+    return _project_pools
+
+
+async def close_project_pools() -> None:
+    """Close all project database pools."""
+    global _project_pools
+    if _project_pools is not None:
+        await _project_pools.close()
+        _project_pools = None
+
+
+def _cell(value: Any) -> Any:
+    """Make a column value JSON serializable."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
 
 class DatabaseReadTool(BaseTool):
     """Execute read-only SQL queries against the project's database.
@@ -93,14 +231,12 @@ class DatabaseReadTool(BaseTool):
                     error=f"Query contains forbidden keyword. Use db:write for write operations.",
                 )
 
-        # Add LIMIT if not present
-        if not re.search(r"\bLIMIT\b", query, re.IGNORECASE):
-            query = f"{query.rstrip(';')} LIMIT {limit}"
-
-        # Execute via hostkit db shell
         try:
-            result = await self._execute_query(project_name, query)
-            return result
+            return await self._execute_query(project_name, query.rstrip().rstrip(";"), limit)
+        except asyncpg.PostgresError as e:
+            return ToolResult(success=False, output="", error=f"Query failed: {e}")
+        except ProjectDatabaseError as e:
+            return ToolResult(success=False, output="", error=str(e))
         except Exception as e:
             logger.exception(f"Database query failed for {project_name}")
             return ToolResult(
@@ -109,72 +245,52 @@ class DatabaseReadTool(BaseTool):
                 error=self.format_error(e),
             )
 
-    async def _execute_query(self, project_name: str, query: str) -> ToolResult:
-        """Execute query via psql."""
-        db_name = f"{project_name}_db"
-
-        # Use psql with JSON output for structured data
-        process = await asyncio.create_subprocess_exec(
-            "sudo",
-            "-u",
-            "postgres",
-            "psql",
-            "-d",
-            db_name,
-            "-c",
-            query,
-            "--no-align",
-            "--tuples-only",
-            "--field-separator=|",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error = stderr.decode().strip()
-            return ToolResult(
-                success=False,
-                output="",
-                error=f"Query failed: {error}",
-            )
+    async def _execute_query(self, project_name: str, query: str, limit: int) -> ToolResult:
+        """Run the query in a read-only transaction, streaming at most limit rows.
 
-        # Parse output
-        output = stdout.decode().strip()
+        Rows come from a server-side cursor, so a query that matches millions
+        of rows only ever transfers limit + 1 of them.
+        """
+        pool = await get_project_pools().get(project_name)
+
+        async with pool.acquire(timeout=settings.TOOL_TIMEOUT_SECONDS) as conn:
+            async with conn.transaction(readonly=True):
+                statement = await conn.prepare(query)
+                columns = [attr.name for attr in statement.get_attributes()]
+                rows: list[list[Any]] = []
+                has_more = False
+                async for record in statement.cursor(prefetch=min(limit + 1, CURSOR_PREFETCH)):
+                    if len(rows) == limit:
+                        has_more = True
+                        break
+                    rows.append([_cell(value) for value in record])
 
-        if not output:
+        if not rows:
             return ToolResult(
                 success=True,
                 output="Query returned no results.",
-                data={"rows": [], "row_count": 0},
+                data={"columns": columns, "rows": [], "row_count": 0},
             )
 
-        # Parse rows
-        rows = []
-        for line in output.splitlines():
-            if line.strip():
-                rows.append(line.split("|"))
-
-        # Get column names from a separate query
-        # For simplicity, we'll just show the raw output
-        # In production, we'd parse column names from the query
-
-        # Format as table
-        formatted = self._format_table(rows)
+        formatted = self._format_table([columns, *rows])
+        if has_more:
+            formatted += f"\n\n[Showing the first {limit} rows; the query returned more]"
         formatted, truncated = self.truncate_output(formatted)
 
         return ToolResult(
             success=True,
             output=formatted,
             data={
+                "columns": columns,
                 "rows": rows,
                 "row_count": len(rows),
+                "has_more": has_more,
             },
-            truncated=truncated,
+            truncated=truncated or has_more,
         )
 
-    def _format_table(self, rows: list[list[str]]) -> str:
-        """Format rows as a simple table."""
+    def _format_table(self, rows: list[list[Any]]) -> str:
+        """Format rows (the first one being column names) as a simple table."""
         if not rows:
             return "No results"
 
@@ -184,7 +300,7 @@ class DatabaseReadTool(BaseTool):
         for row in rows:
             for i, cell in enumerate(row):
                 if i < col_count:
-                    widths[i] = max(widths[i], len(str(cell)))
+                    widths[i] = max(widths[i], len(self._text(cell)))
 
         # Build table
         lines = []
@@ -192,11 +308,15 @@ class DatabaseReadTool(BaseTool):
             cells = []
             for i, cell in enumerate(row):
                 if i < col_count:
-                    cells.append(str(cell).ljust(widths[i]))
+                    cells.append(self._text(cell).ljust(widths[i]))
             lines.append(" | ".join(cells))
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _text(cell: Any) -> str:
+        return "NULL" if cell is None else str(cell)
+
 
 class DatabaseWriteTool(BaseTool):
     """Execute write SQL queries against the project's database.
@@ -274,8 +394,11 @@ class DatabaseWriteTool(BaseTool):
 
         # Execute query
         try:
-            result = await self._execute_query(project_name, query)
-            return result
+            return await self._execute_query(project_name, query)
+        except asyncpg.PostgresError as e:
+            return ToolResult(success=False, output="", error=f"Query failed: {e}")
+        except ProjectDatabaseError as e:
+            return ToolResult(success=False, output="", error=str(e))
         except Exception as e:
             logger.exception(f"Database write failed for {project_name}")
             return ToolResult(
@@ -285,32 +408,12 @@ class DatabaseWriteTool(BaseTool):
             )
 
     async def _execute_query(self, project_name: str, query: str) -> ToolResult:
-        """Execute write query via psql."""
-        db_name = f"{project_name}_db"
-
-        process = await asyncio.create_subprocess_exec(
-            "sudo",
-            "-u",
-            "postgres",
-            "psql",
-            "-d",
-            db_name,
-            "-c",
-            query,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error = stderr.decode().strip()
-            return ToolResult(
-                success=False,
-                output="",
-                error=f"Query failed: {error}",
-            )
+        """Execute the write query in its own transaction."""
+        pool = await get_project_pools().get(project_name)
 
-        output = stdout.decode().strip()
+        async with pool.acquire(timeout=settings.TOOL_TIMEOUT_SECONDS) as conn:
+            async with conn.transaction():
+                output = await conn.execute(query)
 
         # Parse affected rows from output like "UPDATE 5" or "INSERT 0 3"
         affected = 0
@@ -24,6 +24,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import get_settings
+from services.http_client import close_http_client
 from services.signing import get_signing_service
 
 # Configure logging based on LOG_LEVEL env var
@@ -67,6 +68,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down OAuth Proxy")
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
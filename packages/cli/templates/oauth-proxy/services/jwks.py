@@ -0,0 +1,108 @@
+"""Cached JSON Web Key Sets of OAuth providers.
+
+Provider keys rotate rarely, so they are fetched once, parsed into key
+objects memoized by ``kid`` and shared by every request.
+After FRESH_SECONDS the cached keys keep being served while a single
+background refresh runs (stale-while-revalidate); only a cold or very stale
+cache makes a request wait for the fetch. A token signed with an unknown
+``kid`` (a key rotation) triggers an immediate refresh, rate limited to one
+per MIN_REFRESH_INTERVAL_SECONDS.
+"""
+
+import asyncio
+import logging
+import time
+
+import httpx
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+from services.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+
+class KeyFetchError(Exception):
+    """Raised when a provider's keys cannot be fetched."""
+
+
+class JWKSCache:
+    """Signing keys published at a JWKS URL."""
+
+    FRESH_SECONDS = 3600
+    MAX_STALE_SECONDS = 86400
+    MIN_REFRESH_INTERVAL_SECONDS = 60
+
+    def __init__(self, url: str, name: str) -> None:
+        self.url = url
+        self.name = name
+        self._keys: dict[str, Key] = {}
+        self._fetched_at = 0.0
+        self._attempted_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
+
+    async def get_key(self, kid: str | None) -> Key | None:
+        """Key for a ``kid``, or None if the provider does not publish it.
+
+        Raises:
+            KeyFetchError: If there are no usable cached keys and the fetch fails
+        """
+        age = time.monotonic() - self._fetched_at
+        if not self._keys or age > self.MAX_STALE_SECONDS:
+            await self._refresh()
+        elif age > self.FRESH_SECONDS:
+            self._refresh_in_background()
+
+        key = self._keys.get(kid) if kid else None
+        since_attempt = time.monotonic() - self._attempted_at
+        if key is None and kid and since_attempt >= self.MIN_REFRESH_INTERVAL_SECONDS:
+            # Possibly a key the provider has just rotated in
+            try:
+                await self._refresh()
+            except KeyFetchError as e:
+                logger.warning(str(e))
+            key = self._keys.get(kid)
+        return key
+
+    def _start_refresh(self) -> asyncio.Task:
+        # Concurrent callers share one in-flight fetch
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._fetch())
+        return self._refresh_task
+
+    async def _refresh(self) -> None:
+        await asyncio.shield(self._start_refresh())
+
+    def _refresh_in_background(self) -> None:
+        task = self._start_refresh()
+        task.add_done_callback(self._log_failure)
+
+    def _log_failure(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"{task.exception()} (serving cached keys)")
+
+    async def _fetch(self) -> None:
+        self._attempted_at = time.monotonic()
+        try:
+            response = await get_http_client().get(self.url)
+            response.raise_for_status()
+            key_set = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise KeyFetchError(f"Failed to fetch {self.name} public keys: {e}")
+
+        keys: dict[str, Key] = {}
+        for data in key_set.get("keys", []):
+            kid = data.get("kid")
+            if not kid:
+                continue
+            if kid in self._keys:
+                keys[kid] = self._keys[kid]
+                continue
+            try:
+                keys[kid] = jwk.construct(data, data.get("alg", "RS256"))
+            except JWKError as e:
+                logger.warning(f"Skipping unusable {self.name} key {kid}: {e}")
+
+        self._keys = keys
+        self._fetched_at = time.monotonic()
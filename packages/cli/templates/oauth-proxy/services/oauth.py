@@ -4,15 +4,16 @@ Handles OAuth flow logic, token exchange, and ID token validation.
 """
 
 import logging
-import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-import httpx
 from jose import jwt, JWTError
+from jose.backends.base import Key
 
 from config import get_settings, Settings
+from services.http_client import get_http_client
+from services.jwks import JWKSCache, KeyFetchError
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,9 @@ class GoogleOAuthService:
 
     SCOPES = ["openid", "email", "profile"]
 
+    # Shared by all instances
+    keys = JWKSCache(GOOGLE_CERTS_URL, "Google")
+
     def __init__(self, settings: Settings) -> None:
         """Initialize the Google OAuth service.
 
@@ -54,8 +58,6 @@ class GoogleOAuthService:
             settings: Application settings
         """
         self.settings = settings
-        self._google_keys: dict[str, Any] | None = None
-        self._keys_fetched_at: float = 0
 
     def build_authorization_url(
         self,
@@ -110,49 +112,36 @@ class GoogleOAuthService:
         if not self.settings.google_client_id:
             raise OAuthError("Google OAuth is not configured", provider="google")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.GOOGLE_TOKEN_URL,
-                data={
-                    "client_id": self.settings.google_client_id,
-                    "client_secret": self.settings.google_client_secret,
-                    "code": code,
-                    "grant_type": "authorization_code",
-                    "redirect_uri": redirect_uri or self.settings.google_callback_url,
-                },
+        response = await get_http_client().post(
+            self.GOOGLE_TOKEN_URL,
+            data={
+                "client_id": self.settings.google_client_id,
+                "client_secret": self.settings.google_client_secret,
+                "code": code,
+                "grant_type": "authorization_code",
+                "redirect_uri": redirect_uri or self.settings.google_callback_url,
+            },
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Google token exchange failed: {response.text}")
+            raise OAuthError(
+                f"Google token exchange failed: {response.text}",
+                provider="google",
             )
 
-            if response.status_code != 200:
-                logger.error(f"Google token exchange failed: {response.text}")
-                raise OAuthError(
-                    f"Google token exchange failed: {response.text}",
-                    provider="google",
-                )
-
-            return response.json()
-
-    async def _fetch_google_keys(self) -> dict[str, Any]:
-        """Fetch Google's public keys for JWT verification.
+        return response.json()
 
-        Keys are cached for 1 hour.
+    async def _signing_key(self, kid: str | None) -> Key | None:
+        """Google's public key for an ID token kid (cached, see services/jwks.py).
 
-        Returns:
-            Google's JWKS response
+        Raises:
+            OAuthError: If the keys cannot be fetched
         """
-        now = time.time()
-        if self._google_keys and (now - self._keys_fetched_at) < 3600:
-            return self._google_keys
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.GOOGLE_CERTS_URL)
-            if response.status_code != 200:
-                raise OAuthError(
-                    "Failed to fetch Google public keys",
-                    provider="google",
-                )
-            self._google_keys = response.json()
-            self._keys_fetched_at = now
-            return self._google_keys
+        try:
+            return await self.keys.get_key(kid)
+        except KeyFetchError as e:
+            raise OAuthError(str(e), provider="google")
 
     async def validate_id_token(
         self,
@@ -171,19 +160,13 @@ class GoogleOAuthService:
         Raises:
             OAuthError: If token is invalid
         """
-        keys = await self._fetch_google_keys()
-
         try:
             # Decode header to get key ID
             unverified_header = jwt.get_unverified_header(id_token)
             kid = unverified_header.get("kid")
 
             # Find the matching key
-            key = None
-            for jwk in keys.get("keys", []):
-                if jwk.get("kid") == kid:
-                    key = jwk
-                    break
+            key = await self._signing_key(kid)
 
             if not key:
                 raise OAuthError(
@@ -232,6 +215,12 @@ class AppleOAuthService:
 
     SCOPES = ["name", "email"]
 
+    CLIENT_SECRET_LIFETIME = timedelta(days=180)  # Max 6 months
+    CLIENT_SECRET_RENEW_BEFORE = timedelta(days=1)
+
+    # Shared by all instances
+    keys = JWKSCache(APPLE_KEYS_URL, "Apple")
+
     def __init__(self, settings: Settings) -> None:
         """Initialize the Apple OAuth service.
 
@@ -239,8 +228,8 @@ class AppleOAuthService:
             settings: Application settings
         """
         self.settings = settings
-        self._apple_keys: dict[str, Any] | None = None
-        self._keys_fetched_at: float = 0
+        self._client_secret: str | None = None
+        self._client_secret_renew_at: datetime | None = None
 
     def build_authorization_url(
         self,
@@ -288,7 +277,7 @@ class AppleOAuthService:
             OAuthError: If Apple private key is not configured
         """
         now = datetime.now(timezone.utc)
-        expire = now + timedelta(days=180)  # Max 6 months
+        expire = now + self.CLIENT_SECRET_LIFETIME
 
         headers = {
             "alg": "ES256",
@@ -312,6 +301,16 @@ class AppleOAuthService:
 
         return jwt.encode(payload, private_key, algorithm="ES256", headers=headers)
 
+    def _get_client_secret(self) -> str:
+        """Apple client secret, re-signed only shortly before it expires."""
+        now = datetime.now(timezone.utc)
+        if self._client_secret is None or now >= self._client_secret_renew_at:
+            self._client_secret = self._generate_client_secret()
+            self._client_secret_renew_at = (
+                now + self.CLIENT_SECRET_LIFETIME - self.CLIENT_SECRET_RENEW_BEFORE
+            )
+        return self._client_secret
+
     async def exchange_code(
         self,
         code: str,
@@ -330,51 +329,38 @@ class AppleOAuthService:
             OAuthError: If token exchange fails
         """
         callback_uri = redirect_uri or self.settings.apple_callback_url
-        client_secret = self._generate_client_secret()
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.APPLE_TOKEN_URL,
-                data={
-                    "client_id": self.settings.apple_client_id,
-                    "client_secret": client_secret,
-                    "code": code,
-                    "grant_type": "authorization_code",
-                    "redirect_uri": callback_uri,
-                },
+        client_secret = self._get_client_secret()
+
+        response = await get_http_client().post(
+            self.APPLE_TOKEN_URL,
+            data={
+                "client_id": self.settings.apple_client_id,
+                "client_secret": client_secret,
+                "code": code,
+                "grant_type": "authorization_code",
+                "redirect_uri": callback_uri,
+            },
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Apple token exchange failed: {response.text}")
+            raise OAuthError(
+                f"Apple token exchange failed: {response.text}",
+                provider="apple",
             )
 
-            if response.status_code != 200:
-                logger.error(f"Apple token exchange failed: {response.text}")
-                raise OAuthError(
-                    f"Apple token exchange failed: {response.text}",
-                    provider="apple",
-                )
-
-            return response.json()
+        return response.json()
 
-    async def _fetch_apple_keys(self) -> dict[str, Any]:
-        """Fetch Apple's public keys for JWT verification.
+    async def _signing_key(self, kid: str | None) -> Key | None:
+        """Apple's public key for an ID token kid (cached, see services/jwks.py).
 
-        Keys are cached for 1 hour.
-
-        Returns:
-            Apple's JWKS response
+        Raises:
+            OAuthError: If the keys cannot be fetched
         """
-        now = time.time()
-        if self._apple_keys and (now - self._keys_fetched_at) < 3600:
-            return self._apple_keys
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.APPLE_KEYS_URL)
-            if response.status_code != 200:
-                raise OAuthError(
-                    "Failed to fetch Apple public keys",
-                    provider="apple",
-                )
-            self._apple_keys = response.json()
-            self._keys_fetched_at = now
-            return self._apple_keys
+        try:
+            return await self.keys.get_key(kid)
+        except KeyFetchError as e:
+            raise OAuthError(str(e), provider="apple")
 
     async def validate_id_token(
         self,
@@ -398,8 +384,6 @@ class AppleOAuthService:
         """
         import json
 
-        keys = await self._fetch_apple_keys()
-
         try:
             # Decode header to get key ID
             unverified_header = jwt.get_unverified_header(id_token)
@@ -407,11 +391,7 @@ class AppleOAuthService:
             logger.debug(f"Apple token key ID: {kid}")
 
             # Find the matching key
-            key = None
-            for jwk in keys.get("keys", []):
-                if jwk.get("kid") == kid:
-                    key = jwk
-                    break
+            key = await self._signing_key(kid)
 
             if not key:
                 logger.warning(f"No matching Apple key found for kid: {kid}")
@@ -464,12 +444,22 @@ class AppleOAuthService:
             )
 
 
-# Service factory functions
+# Singleton instances (the Apple client secret is cached per instance)
+_google_service: GoogleOAuthService | None = None
+_apple_service: AppleOAuthService | None = None
+
+
 def get_google_service() -> GoogleOAuthService:
-    """Get a Google OAuth service instance."""
-    return GoogleOAuthService(get_settings())
+    """Get the Google OAuth service singleton."""
+    global _google_service
+    if _google_service is None:
+        _google_service = GoogleOAuthService(get_settings())
+    return _google_service
 
 
 def get_apple_service() -> AppleOAuthService:
-    """Get an Apple OAuth service instance."""
-    return AppleOAuthService(get_settings())
+    """Get the Apple OAuth service singleton."""
+    global _apple_service
+    if _apple_service is None:
+        _apple_service = AppleOAuthService(get_settings())
+    return _apple_service
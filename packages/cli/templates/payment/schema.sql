@@ -232,6 +232,21 @@ CREATE TABLE IF NOT EXISTS payment_events (
     processed_at TIMESTAMPTZ
 );
 
+-- Stripe webhook ingestion queue (event id is the idempotency key)
+CREATE TABLE IF NOT EXISTS stripe_webhook_events (
+    event_id TEXT PRIMARY KEY,
+    event_type TEXT NOT NULL,
+    object_id TEXT NOT NULL,
+    event_created BIGINT NOT NULL,
+    payload JSONB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    received_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    processed_at TIMESTAMPTZ
+);
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_payment_accounts_project_id ON payment_accounts(project_id);
 CREATE INDEX IF NOT EXISTS idx_payment_accounts_stripe_account_id ON payment_accounts(stripe_account_id);
@@ -296,6 +311,10 @@ CREATE INDEX IF NOT EXISTS idx_payment_events_project_id ON payment_events(proje
 CREATE INDEX IF NOT EXISTS idx_payment_events_processed ON payment_events(processed_at) WHERE processed_at IS NULL;
 CREATE INDEX IF NOT EXISTS idx_payment_events_created_at ON payment_events(created_at DESC);
 
+CREATE INDEX IF NOT EXISTS idx_stripe_webhook_events_pending ON stripe_webhook_events(next_attempt_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_stripe_webhook_events_object ON stripe_webhook_events(object_id, event_created) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_stripe_webhook_events_processed_at ON stripe_webhook_events(processed_at) WHERE status = 'processed';
+
 -- Seed cancellation policy templates
 INSERT INTO cancellation_policies (name, is_template, rules) VALUES
     ('Flexible', true, '[{"window_hours": 24, "refund_percent": 100}, {"window_hours": 0, "refund_percent": 50}]'::jsonb),
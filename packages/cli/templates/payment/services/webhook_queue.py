@@ -0,0 +1,332 @@
+"""Background processing of stored Stripe webhook events.
+
+The webhook endpoint only verifies the signature and inserts the event into
+stripe_webhook_events (keyed by Stripe's event id, so redeliveries are
+no-ops), then acknowledges. This consumer applies the stored events:
+
+- Events are applied in batches, one transaction per batch, with a savepoint
+  per event so a failing event does not undo the others.
+- Events touching the same object (a payment intent and its charges) are
+  applied in Stripe's creation order. A failed event holds back later events
+  for its object until it succeeds or is given up on, and an advisory lock
+  per object keeps concurrent consumers apart.
+- Failures are retried with exponential backoff; after MAX_ATTEMPTS the
+  event is marked failed. `hostkit payments replay-webhooks` re-queues
+  failed (or any) events.
+
+Processed events are kept for RETENTION_DAYS to deduplicate late retries.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from database import get_cursor
+from psycopg2.extras import Json
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100
+IDLE_POLL_SECONDS = 30.0
+MAX_ATTEMPTS = 8
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+RETENTION_DAYS = 30
+CLEANUP_INTERVAL_SECONDS = 3600.0
+
+CLAIM_SQL = """
+    SELECT e.event_id, e.event_type, e.object_id, e.payload, e.attempts
+    FROM stripe_webhook_events e
+    WHERE e.status = 'pending'
+      AND e.next_attempt_at <= NOW()
+      AND NOT EXISTS (
+          SELECT 1 FROM stripe_webhook_events earlier
+          WHERE earlier.object_id = e.object_id
+            AND earlier.status = 'pending'
+            AND earlier.next_attempt_at > NOW()
+            AND (earlier.event_created, earlier.event_id) < (e.event_created, e.event_id)
+      )
+    ORDER BY e.event_created, e.event_id
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+"""
+
+
+def event_object_id(event: dict) -> str:
+    """Ordering key of an event: the payment intent it belongs to, if any.
+
+    Charge events carry their payment intent, so a refund is never applied
+    before the payment it refunds.
+    """
+    obj = event["data"]["object"]
+    return obj.get("payment_intent") or obj["id"]
+
+
+def enqueue_event(event: dict) -> bool:
+    """Store a verified webhook event for processing.
+
+    Returns:
+        True if the event was new, False for a duplicate delivery
+    """
+    with get_cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO stripe_webhook_events (
+                event_id, event_type, object_id, event_created, payload
+            )
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (event_id) DO NOTHING
+            """,
+            (
+                event["id"],
+                event["type"],
+                event_object_id(event),
+                event["created"],
+                Json(event["data"]["object"]),
+            ),
+        )
+        return cur.rowcount == 1
+
+
+def handle_payment_succeeded(cur, payment_intent: dict) -> None:
+    """Handle successful payment intent."""
+    cur.execute(
+        """
+        UPDATE payment_transactions
+        SET status = 'succeeded',
+            stripe_charge_id = %s,
+            updated_at = NOW()
+        WHERE stripe_payment_intent_id = %s
+        """,
+        (payment_intent.get("latest_charge"), payment_intent["id"]),
+    )
+
+
+def handle_payment_failed(cur, payment_intent: dict) -> None:
+    """Handle failed payment intent."""
+    failure_message = payment_intent.get("last_payment_error", {}).get("message", "Unknown error")
+
+    cur.execute(
+        """
+        UPDATE payment_transactions
+        SET status = 'failed',
+            failure_reason = %s,
+            updated_at = NOW()
+        WHERE stripe_payment_intent_id = %s
+        """,
+        (failure_message, payment_intent["id"]),
+    )
+
+
+def handle_charge_refunded(cur, charge: dict) -> None:
+    """Handle charge refund."""
+    refund = charge["refunds"]["data"][0]
+
+    # Find transaction by charge ID; the refund ID is unique, so replays are no-ops
+    cur.execute(
+        """
+        INSERT INTO refunds (
+            transaction_id, stripe_refund_id,
+            amount_cents, reason, status
+        )
+        SELECT id, %s, %s, %s, 'succeeded'
+        FROM payment_transactions
+        WHERE stripe_charge_id = %s
+        ON CONFLICT (stripe_refund_id) DO NOTHING
+        """,
+        (
+            refund["id"],
+            charge["amount_refunded"],
+            refund.get("reason", "requested_by_customer"),
+            charge["id"],
+        ),
+    )
+
+
+def handle_account_updated(cur, account: dict) -> None:
+    """Handle account update (onboarding completion, etc)."""
+    logger.info(
+        f"Account updated: {account['id']} "
+        f"(charges enabled: {account.get('charges_enabled')}, "
+        f"payouts enabled: {account.get('payouts_enabled')})"
+    )
+
+    cur.execute(
+        """
+        UPDATE payment_accounts
+        SET status = CASE
+                WHEN %s AND %s THEN 'active'
+                ELSE 'pending'
+            END,
+            updated_at = NOW()
+        WHERE stripe_account_id = %s
+        """,
+        (account.get("charges_enabled"), account.get("payouts_enabled"), account["id"]),
+    )
+
+
+EVENT_HANDLERS: dict[str, Callable[..., None]] = {
+    "payment_intent.succeeded": handle_payment_succeeded,
+    "payment_intent.payment_failed": handle_payment_failed,
+    "charge.refunded": handle_charge_refunded,
+    "account.updated": handle_account_updated,
+}
+
+
+def retry_delay_seconds(attempts: int) -> int:
+    """Backoff before the next attempt after ``attempts`` failures."""
+    return min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+
+
+def process_batch(limit: int = BATCH_SIZE) -> int:
+    """Apply one batch of due events in a single transaction.
+
+    Returns:
+        Number of events processed or rescheduled
+    """
+    with get_cursor() as cur:
+        cur.execute(CLAIM_SQL, (limit,))
+        events = cur.fetchall()
+        if not events:
+            return 0
+
+        locked: dict[str, bool] = {}
+        blocked: set[str] = set()
+        processed: list[str] = []
+        rescheduled = 0
+        for event in events:
+            object_id = event["object_id"]
+            if object_id not in locked:
+                cur.execute("SELECT pg_try_advisory_xact_lock(hashtext(%s)) AS ok", (object_id,))
+                locked[object_id] = cur.fetchone()["ok"]
+            if not locked[object_id] or object_id in blocked:
+                # Another consumer owns the object, or an earlier event failed
+                continue
+
+            handler = EVENT_HANDLERS.get(event["event_type"])
+            if handler is None:
+                logger.info(f"Unhandled event type: {event['event_type']}")
+                processed.append(event["event_id"])
+                continue
+
+            cur.execute("SAVEPOINT webhook_event")
+            try:
+                handler(cur, event["payload"])
+            except Exception as e:
+                cur.execute("ROLLBACK TO SAVEPOINT webhook_event")
+                blocked.add(object_id)
+                attempts = event["attempts"] + 1
+                error = str(e) or type(e).__name__
+                if attempts >= MAX_ATTEMPTS:
+                    logger.error(f"Giving up on webhook event {event['event_id']}: {error}")
+                    status = "failed"
+                else:
+                    logger.warning(f"Webhook event {event['event_id']} failed: {error}")
+                    status = "pending"
+                cur.execute(
+                    """
+                    UPDATE stripe_webhook_events
+                    SET status = %s,
+                        attempts = %s,
+                        last_error = %s,
+                        next_attempt_at = NOW() + make_interval(secs => %s)
+                    WHERE event_id = %s
+                    """,
+                    (
+                        status,
+                        attempts,
+                        error[:1000],
+                        retry_delay_seconds(attempts),
+                        event["event_id"],
+                    ),
+                )
+                rescheduled += 1
+                continue
+            cur.execute("RELEASE SAVEPOINT webhook_event")
+            processed.append(event["event_id"])
+
+        if processed:
+            cur.execute(
+                """
+                UPDATE stripe_webhook_events
+                SET status = 'processed', processed_at = NOW(), last_error = NULL
+                WHERE event_id = ANY(%s)
+                """,
+                (processed,),
+            )
+
+    if processed:
+        logger.info(f"Processed {len(processed)} of {len(events)} webhook event(s)")
+    return len(processed) + rescheduled
+
+
+def purge_processed(retention_days: int = RETENTION_DAYS) -> int:
+    """Delete processed events older than the retention window."""
+    with get_cursor() as cur:
+        cur.execute(
+            """
+            DELETE FROM stripe_webhook_events
+            WHERE status = 'processed'
+              AND processed_at < NOW() - make_interval(days => %s)
+            """,
+            (retention_days,),
+        )
+        return cur.rowcount
+
+
+class WebhookConsumer:
+    """Single background task applying stored webhook events."""
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def notify(self) -> None:
+        """Have the consumer look for due events now."""
+        self._wake.set()
+        self.start()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        last_cleanup = 0.0
+        while True:
+            self._wake.clear()
+            try:
+                # psycopg2 blocks; keep the event loop free for webhook acks
+                handled = await asyncio.to_thread(process_batch)
+                if loop.time() - last_cleanup >= CLEANUP_INTERVAL_SECONDS:
+                    last_cleanup = loop.time()
+                    await asyncio.to_thread(purge_processed)
+            except Exception:
+                logger.exception("Webhook event processing failed")
+                handled = 0
+
+            if handled:
+                continue  # More may be due right away
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=IDLE_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+
+_consumer: WebhookConsumer | None = None
+
+
+def get_webhook_consumer() -> WebhookConsumer:
+    """Get the process-wide webhook consumer."""
+    global _consumer
+    if _consumer is None:
+        _consumer = WebhookConsumer()
+    return _consumer
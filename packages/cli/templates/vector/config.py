@@ -30,6 +30,10 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "text-embedding-3-small"
     OPENAI_EMBEDDING_DIMENSIONS: int = 1536
+    OPENAI_MAX_CONCURRENCY: int = 8  # Embedding batches in flight per call
+    # Starting budget; replaced by the x-ratelimit-* headers of the first response
+    OPENAI_RPM_LIMIT: int = 3000
+    OPENAI_TPM_LIMIT: int = 1000000
 
     # Security
     SECRET_KEY: str = "change-me-in-production"
@@ -41,11 +45,29 @@ class Settings(BaseSettings):
     MAX_COLLECTIONS_PER_PROJECT: int = 100
     MAX_FILE_SIZE_MB: int = 50
 
+    # Worker
+    WORKER_PROJECT_ENGINES: int = 8  # Project DB engines kept open per worker process
+
     # Chunking
     CHUNK_TARGET_TOKENS: int = 500
     CHUNK_OVERLAP_TOKENS: int = 50
     CHUNK_MIN_TOKENS: int = 100
 
+    # Query embedding cache (see services/query_cache.py)
+    QUERY_CACHE_SIZE: int = 10000  # In-process entries; 0 disables the cache
+    QUERY_CACHE_TTL_DAYS: int = 30  # Persistent entries unused this long are pruned; 0 disables
+
+    # Vector indexes (per-collection partial HNSW, see services/vector_index.py)
+    VECTOR_INDEX_MIN_ROWS: int = 10000  # Smaller collections are searched exactly
+    VECTOR_INDEX_MAINTENANCE_WORK_MEM: str = "512MB"
+    HNSW_M: int = 16
+    HNSW_EF_CONSTRUCTION: int = 64
+    HNSW_LARGE_ROWS: int = 1000000
+    HNSW_LARGE_M: int = 32
+    HNSW_LARGE_EF_CONSTRUCTION: int = 128
+    HNSW_EF_SEARCH: int = 40
+    HNSW_FILTERED_EF_SEARCH: int = 200  # With a metadata filter (post-filtered)
+
 
 @lru_cache
 def get_settings() -> Settings:
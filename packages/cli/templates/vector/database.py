@@ -70,6 +70,13 @@ async def get_service_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+@asynccontextmanager
+async def service_session_context() -> AsyncGenerator[AsyncSession, None]:
+    """Context manager for service database session."""
+    async for session in get_service_session():
+        yield session
+
+
 def get_project_database_url(project_name: str) -> str:
     """Get database URL for a project."""
     # Extract password from service URL
@@ -150,18 +157,10 @@ async def create_project_database(project_name: str):
         # Enable pgvector extension
         conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
 
-    # Create tables
+    # Create tables. No vector index yet: collections get a partial HNSW
+    # index once they are big enough (see services/vector_index.py)
     ProjectBase.metadata.create_all(project_engine)
 
-    # Create vector index
-    with project_engine.connect() as conn:
-        conn.execute(text("""
-            CREATE INDEX IF NOT EXISTS idx_chunks_embedding
-            ON chunks USING ivfflat (embedding vector_cosine_ops)
-            WITH (lists = 100)
-        """))
-        conn.commit()
-
     project_engine.dispose()
 
 
@@ -1,7 +1,7 @@
 """Database models."""
 
 from .base import ServiceBase, ProjectBase
-from .service import VectorProject, VectorJob, VectorAuditLog
+from .service import VectorProject, VectorJob, VectorAuditLog, QueryEmbedding
 from .project import Collection, Document, Chunk
 
 __all__ = [
@@ -10,6 +10,7 @@ __all__ = [
     "VectorProject",
     "VectorJob",
     "VectorAuditLog",
+    "QueryEmbedding",
     "Collection",
     "Document",
     "Chunk",
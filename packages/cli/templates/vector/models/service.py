@@ -3,7 +3,7 @@
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Boolean, DateTime, Text,
-    ForeignKey, Index
+    ForeignKey, Index, LargeBinary
 )
 from sqlalchemy.dialects.postgresql import JSONB, INET
 from sqlalchemy.sql import func
@@ -115,3 +115,21 @@ class VectorAuditLog(ServiceBase):
     details = Column(JSONB, default=dict)
     ip_address = Column(INET)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+
+class QueryEmbedding(ServiceBase):
+    """Persistent cache of search query embeddings.
+
+    Keyed by a hash of (model, dimensions, normalized query text); the text
+    itself is not stored. Shared by all projects.
+    """
+
+    __tablename__ = "vector_query_embeddings"
+
+    key_hash = Column(String(64), primary_key=True)
+    model = Column(String(100), nullable=False)
+    dimensions = Column(Integer, nullable=False)
+    embedding = Column(LargeBinary, nullable=False)  # float32 array
+    token_count = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -1,5 +1,5 @@
 """API routers."""
 
-from . import health, collections, documents, search, jobs
+from . import health, collections, documents, document_sync, search, jobs
 
-__all__ = ["health", "collections", "documents", "search", "jobs"]
+__all__ = ["health", "collections", "documents", "document_sync", "search", "jobs"]
@@ -0,0 +1,71 @@
+"""Document sync API router."""
+
+from dependencies import ProjectCtx
+from fastapi import APIRouter, HTTPException, status
+from schemas.common import SuccessResponse
+from schemas.documents import DocumentSyncRequest, DocumentSyncResponse
+from services import collections as collection_service
+from services import documents as document_service
+
+router = APIRouter()
+
+
+@router.post("/collections/{collection_name}/documents/sync")
+async def sync_documents(
+    collection_name: str,
+    data: DocumentSyncRequest,
+    ctx: ProjectCtx,
+) -> SuccessResponse:
+    """
+    Make the collection's text documents match the given set.
+
+    Documents are matched by source_name and compared by content hash:
+    only new and changed documents are embedded (in one batch), and with
+    prune, documents missing from the set are deleted.
+    """
+    collection = await collection_service.get_collection_by_name(
+        ctx.session, collection_name
+    )
+    if not collection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": f"Collection '{collection_name}' not found",
+                }
+            }
+        )
+
+    try:
+        result = await document_service.sync_documents(
+            ctx.session,
+            collection,
+            [item.model_dump() for item in data.documents],
+            prune=data.prune,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": {
+                    "code": "VALIDATION_ERROR",
+                    "message": str(e),
+                }
+            }
+        )
+
+    return SuccessResponse(
+        data=DocumentSyncResponse(
+            unchanged=result.unchanged,
+            added=result.added,
+            updated=result.updated,
+            deleted=result.deleted,
+            chunks_created=result.chunks_created,
+            chunks_deleted=result.chunks_deleted,
+            tokens_used=result.tokens_used,
+            changed_sources=result.changed_sources,
+        )
+    )
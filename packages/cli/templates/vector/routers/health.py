@@ -5,6 +5,7 @@ from sqlalchemy import text
 
 from config import settings
 from database import get_service_session
+from services.query_cache import get_query_cache
 
 router = APIRouter()
 
@@ -50,4 +51,5 @@ async def health_check():
         "status": status,
         "version": "1.0.0",
         "services": services,
+        "query_cache": get_query_cache().stats(),
     }
@@ -69,3 +69,28 @@ class DocumentIngestAsyncResponse(BaseModel):
 class DocumentDeleteResponse(BaseModel):
     """Schema for document delete response."""
     chunks_deleted: int
+
+
+class DocumentSyncItem(BaseModel):
+    """One document of a sync request, identified by source_name."""
+    source_name: str = Field(..., min_length=1, max_length=1024)
+    content: str = Field(..., min_length=1)
+    metadata: Optional[dict] = None
+
+
+class DocumentSyncRequest(BaseModel):
+    """Schema for making a collection's text documents match a set."""
+    documents: list[DocumentSyncItem] = Field(..., max_length=5000)
+    prune: bool = True  # Delete documents not in the set
+
+
+class DocumentSyncResponse(BaseModel):
+    """Schema for sync response."""
+    unchanged: int
+    added: int
+    updated: int
+    deleted: int
+    chunks_created: int
+    chunks_deleted: int
+    tokens_used: int
+    changed_sources: list[str]
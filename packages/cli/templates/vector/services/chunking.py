@@ -6,14 +6,30 @@ Splits text into semantically meaningful chunks while respecting:
 - Sentence boundaries
 - Token limits
 - Overlap for context continuity
+
+The normalized document is tokenized once. Segments, sentences and chunks
+are character spans into it; their token counts come from the token start
+offsets by binary search, and forced splits and overlaps are cut at token
+offsets. No piece of text is tokenized again, so chunking is linear in the
+document size.
 """
 
 import re
+from bisect import bisect_right
+from itertools import accumulate
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from config import settings
-from .tokenizer import count_tokens, get_tokenizer
+from .tokenizer import get_tokenizer
+
+# (start, end) character offsets into the normalized text
+Span = Tuple[int, int]
+
+SEGMENT_BOUNDARY = re.compile(r'\n\n+|^(?=#{1,6}\s)', re.MULTILINE)
+# Simple sentence splitting - handles common cases
+# Could be enhanced with nltk or spacy for better accuracy
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
 
 
 @dataclass
@@ -25,6 +41,29 @@ class Chunk:
     extra_data: dict
 
 
+class _TokenizedText:
+    """A text with the character offset at which each of its tokens starts."""
+
+    def __init__(self, text: str, tokenizer, token_chars: Dict[int, int]):
+        self.text = text
+        tokens = tokenizer.encode(text)
+        # Characters starting in each token (UTF-8 lead bytes), cached by
+        # token id; much cheaper than decode_with_offsets on large texts
+        for token in set(tokens).difference(token_chars):
+            data = tokenizer.decode_single_token_bytes(token)
+            token_chars[token] = sum(1 for byte in data if not 0x80 <= byte < 0xC0)
+        self.offsets = list(accumulate(map(token_chars.__getitem__, tokens), initial=0))
+        self.offsets.pop()
+
+    def token_at(self, char: int) -> int:
+        """Index of the token covering character ``char``."""
+        return max(0, bisect_right(self.offsets, char) - 1)
+
+    def count(self, span: Span) -> int:
+        """Number of tokens overlapping the span."""
+        return self.token_at(span[1] - 1) - self.token_at(span[0]) + 1
+
+
 class ChunkingService:
     """
     Service for splitting documents into chunks.
@@ -46,6 +85,7 @@ class ChunkingService:
         self.overlap_tokens = overlap_tokens or settings.CHUNK_OVERLAP_TOKENS
         self.min_tokens = min_tokens or settings.CHUNK_MIN_TOKENS
         self.tokenizer = get_tokenizer()
+        self._token_chars: Dict[int, int] = {}
 
     def chunk_text(
         self,
@@ -65,17 +105,17 @@ class ChunkingService:
         if not text or not text.strip():
             return []
 
-        # Clean and normalize text
-        text = self._normalize_text(text)
+        # Clean and normalize text, then tokenize it once
+        doc = _TokenizedText(self._normalize_text(text), self.tokenizer, self._token_chars)
 
         # Split into initial segments
-        segments = self._split_into_segments(text)
+        segments = self._split_into_segments(doc)
 
         # Merge small segments, split large ones
-        balanced_segments = self._balance_segments(segments)
+        balanced_segments = self._balance_segments(doc, segments)
 
         # Create chunks with overlap
-        chunks = self._create_chunks_with_overlap(balanced_segments)
+        chunks = self._create_chunks_with_overlap(doc, balanced_segments)
 
         # Add extra_data
         for i, chunk in enumerate(chunks):
@@ -95,146 +135,119 @@ class ChunkingService:
         text = text.strip()
         return text
 
-    def _split_into_segments(self, text: str) -> List[str]:
+    @staticmethod
+    def _strip(text: str, start: int, end: int) -> Optional[Span]:
+        """Span without surrounding whitespace, or None if it is blank."""
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return (start, end) if start < end else None
+
+    def _cut(self, text: str, start: int, end: int, pattern: re.Pattern) -> List[Span]:
+        """Non-blank spans of text[start:end] between matches of pattern."""
+        spans = []
+        for match in pattern.finditer(text, start, end):
+            span = self._strip(text, start, match.start())
+            if span:
+                spans.append(span)
+            start = match.end()
+        span = self._strip(text, start, end)
+        if span:
+            spans.append(span)
+        return spans
+
+    def _split_into_segments(self, doc: _TokenizedText) -> List[Span]:
         """Split text into initial segments by major boundaries."""
-        segments = []
-
         # Split by double newlines (paragraphs) or markdown headers
-        pattern = r'(?:\n\n+|(?=^#{1,6}\s))'
-        parts = re.split(pattern, text, flags=re.MULTILINE)
-
-        for part in parts:
-            part = part.strip()
-            if part:
-                segments.append(part)
+        return self._cut(doc.text, 0, len(doc.text), SEGMENT_BOUNDARY)
 
-        return segments
+    def _pack(self, doc: _TokenizedText, spans: List[Span], limit: int) -> List[Span]:
+        """Merge consecutive spans while they fit in ``limit`` tokens.
 
-    def _balance_segments(self, segments: List[str]) -> List[str]:
-        """Balance segment sizes - merge small ones, split large ones."""
-        balanced = []
-        current = ""
+        Oversized spans are split further: segments by sentences, sentences
+        by token count.
+        """
+        packed = []
+        current: Optional[Span] = None
         current_tokens = 0
 
-        for segment in segments:
-            segment_tokens = count_tokens(segment)
+        for span in spans:
+            span_tokens = doc.count(span)
 
-            # If segment alone is larger than target, split it
-            if segment_tokens > self.target_tokens * 1.5:
+            # If span alone is larger than the limit, split it
+            if span_tokens > limit:
                 # First, flush current buffer
                 if current:
-                    balanced.append(current)
-                    current = ""
+                    packed.append(current)
+                    current = None
                     current_tokens = 0
-
-                # Split large segment by sentences
-                split_segments = self._split_large_segment(segment)
-                balanced.extend(split_segments)
+                packed.extend(self._split_large_span(doc, span, span_tokens))
                 continue
 
-            # If adding this segment would exceed target, start new chunk
-            if current_tokens + segment_tokens > self.target_tokens:
+            # If adding this span would exceed the target, start a new chunk
+            if current_tokens + span_tokens > self.target_tokens:
                 if current:
-                    balanced.append(current)
-                current = segment
-                current_tokens = segment_tokens
+                    packed.append(current)
+                current = span
+                current_tokens = span_tokens
             else:
-                # Merge with current
-                if current:
-                    current = current + "\n\n" + segment
-                else:
-                    current = segment
-                current_tokens += segment_tokens
+                # Merge with current (separators in between are kept)
+                current = (current[0], span[1]) if current else span
+                current_tokens += span_tokens
 
         # Don't forget the last buffer
         if current:
-            balanced.append(current)
-
-        return balanced
-
-    def _split_large_segment(self, text: str) -> List[str]:
-        """Split a large segment by sentences."""
-        # Split into sentences
-        sentences = self._split_into_sentences(text)
-
-        segments = []
-        current = ""
-        current_tokens = 0
-
-        for sentence in sentences:
-            sentence_tokens = count_tokens(sentence)
-
-            # Single sentence too long - force split by tokens
-            if sentence_tokens > self.target_tokens:
-                if current:
-                    segments.append(current)
-                    current = ""
-                    current_tokens = 0
-
-                # Split by token count
-                token_chunks = self._split_by_token_limit(sentence)
-                segments.extend(token_chunks)
-                continue
-
-            if current_tokens + sentence_tokens > self.target_tokens:
-                if current:
-                    segments.append(current)
-                current = sentence
-                current_tokens = sentence_tokens
-            else:
-                if current:
-                    current = current + " " + sentence
-                else:
-                    current = sentence
-                current_tokens += sentence_tokens
-
-        if current:
-            segments.append(current)
+            packed.append(current)
 
-        return segments
+        return packed
 
-    def _split_into_sentences(self, text: str) -> List[str]:
-        """Split text into sentences."""
-        # Simple sentence splitting - handles common cases
-        # Could be enhanced with nltk or spacy for better accuracy
-        pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-        sentences = re.split(pattern, text)
-        return [s.strip() for s in sentences if s.strip()]
-
-    def _split_by_token_limit(self, text: str) -> List[str]:
-        """Force split text by token limit."""
-        tokens = self.tokenizer.encode(text)
-        chunks = []
-
-        for i in range(0, len(tokens), self.target_tokens):
-            chunk_tokens = tokens[i:i + self.target_tokens]
-            chunk_text = self.tokenizer.decode(chunk_tokens)
-            chunks.append(chunk_text)
-
-        return chunks
-
-    def _create_chunks_with_overlap(self, segments: List[str]) -> List[Chunk]:
+    def _balance_segments(self, doc: _TokenizedText, segments: List[Span]) -> List[Span]:
+        """Balance segment sizes - merge small ones, split large ones."""
+        return self._pack(doc, segments, int(self.target_tokens * 1.5))
+
+    def _split_large_span(self, doc: _TokenizedText, span: Span, tokens: int) -> List[Span]:
+        sentences = self._cut(doc.text, span[0], span[1], SENTENCE_BOUNDARY)
+        if len(sentences) > 1:
+            # Split large segment by sentences
+            return self._pack(doc, sentences, self.target_tokens)
+        # Single sentence too long - force split by tokens
+        return self._split_by_token_limit(doc, span)
+
+    def _split_by_token_limit(self, doc: _TokenizedText, span: Span) -> List[Span]:
+        """Force split a span every target_tokens tokens."""
+        first, last = doc.token_at(span[0]), doc.token_at(span[1] - 1)
+        step = self.target_tokens
+        cuts = [span[0], *(doc.offsets[t] for t in range(first + step, last + 1, step)), span[1]]
+        spans = []
+        for start, end in zip(cuts, cuts[1:]):
+            piece = self._strip(doc.text, start, end)
+            if piece:
+                spans.append(piece)
+        return spans
+
+    def _create_chunks_with_overlap(
+        self, doc: _TokenizedText, segments: List[Span]
+    ) -> List[Chunk]:
         """Create final chunks with overlap between adjacent chunks."""
         if not segments:
             return []
 
         chunks = []
 
-        for i, segment in enumerate(segments):
-            token_count = count_tokens(segment)
+        for i, (start, end) in enumerate(segments):
+            first = doc.token_at(start)
 
-            # For all but the first chunk, prepend overlap from previous
+            # For all but the first chunk, start overlap_tokens into the previous one
             if i > 0 and self.overlap_tokens > 0:
-                prev_segment = segments[i - 1]
-                overlap_text = self._get_tail_tokens(prev_segment, self.overlap_tokens)
-                if overlap_text:
-                    segment = overlap_text + " " + segment
-                    token_count = count_tokens(segment)
+                prev_first = doc.token_at(segments[i - 1][0])
+                first = max(prev_first, first - self.overlap_tokens)
+                start = self._strip(doc.text, min(start, doc.offsets[first]), end)[0]
 
             chunk = Chunk(
-                content=segment,
+                content=doc.text[start:end],
                 index=i,
-                token_count=token_count,
+                token_count=doc.token_at(end - 1) - first + 1,
                 extra_data={
                     "has_overlap": i > 0 and self.overlap_tokens > 0,
                 }
@@ -243,15 +256,6 @@ class ChunkingService:
 
         return chunks
 
-    def _get_tail_tokens(self, text: str, num_tokens: int) -> str:
-        """Get the last N tokens of text."""
-        tokens = self.tokenizer.encode(text)
-        if len(tokens) <= num_tokens:
-            return text
-
-        tail_tokens = tokens[-num_tokens:]
-        return self.tokenizer.decode(tail_tokens)
-
 
 # Singleton instance
 _chunking_service = None
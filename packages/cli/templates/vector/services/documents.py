@@ -2,7 +2,9 @@
 
 import hashlib
 from typing import Optional, List
-from sqlalchemy import select, func
+from dataclasses import dataclass, field
+
+from sqlalchemy import delete, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import settings
@@ -76,7 +78,9 @@ async def ingest_text(
     # Generate embeddings
     embedding_service = get_embedding_service()
     texts = [cd.content for cd in chunk_data_list]
-    embedding_result = await embedding_service.embed_texts(texts)
+    embedding_result = await embedding_service.embed_texts(
+        texts, token_counts=[cd.token_count for cd in chunk_data_list]
+    )
 
     # Create chunk records
     chunks = []
@@ -166,3 +170,145 @@ async def delete_document(
     await session.flush()
 
     return chunks_deleted
+
+
+@dataclass
+class SyncResult:
+    """Outcome of sync_documents."""
+    unchanged: int = 0
+    added: int = 0
+    updated: int = 0
+    deleted: int = 0
+    chunks_created: int = 0
+    chunks_deleted: int = 0
+    tokens_used: int = 0
+    changed_sources: List[str] = field(default_factory=list)
+
+
+async def sync_documents(
+    session: AsyncSession,
+    collection: Collection,
+    documents: List[dict],
+    prune: bool = True,
+) -> SyncResult:
+    """
+    Make a collection's text documents match the given set, by source_name.
+
+    Documents whose content hash matches the stored one are left alone.
+    Changed documents are replaced, new ones added and, with ``prune``,
+    documents missing from the set are deleted. Chunks of all added and
+    changed documents are embedded together in one embed_texts call.
+
+    Args:
+        session: Database session
+        collection: Target collection
+        documents: Dicts with source_name, content and optional metadata
+        prune: Delete stored documents that are not in ``documents``
+
+    Returns:
+        SyncResult with counts
+    """
+    wanted: dict[str, tuple[dict, str]] = {}
+    for item in documents:
+        name = item["source_name"]
+        if name in wanted:
+            raise ValueError(f"Duplicate source_name in sync request: {name}")
+        content_hash = hashlib.sha256(item["content"].encode()).hexdigest()
+        wanted[name] = (item, content_hash)
+
+    stored = (await session.execute(
+        select(Document.id, Document.source_name, Document.content_hash, Document.chunk_count)
+        .where(Document.collection_id == collection.id, Document.source_type == "text")
+    )).all()
+
+    result = SyncResult()
+    keep: set[str] = set()
+    stale: list = []
+    for row in stored:
+        entry = wanted.get(row.source_name)
+        if entry is not None and entry[1] == row.content_hash and row.source_name not in keep:
+            keep.add(row.source_name)
+        elif entry is not None or prune:
+            # Changed, a leftover duplicate, or no longer wanted
+            stale.append(row)
+    result.unchanged = len(keep)
+
+    stale_names = {row.source_name for row in stale}
+    to_ingest = [(name, item, h) for name, (item, h) in wanted.items() if name not in keep]
+    result.updated = sum(1 for name, _, _ in to_ingest if name in stale_names)
+    result.added = len(to_ingest) - result.updated
+    result.deleted = len(stale_names - set(wanted))
+
+    for _, item, _ in to_ingest:
+        tokens = count_tokens(item["content"])
+        if tokens > settings.MAX_SYNC_TEXT_TOKENS:
+            raise ValueError(
+                f"Document '{item['source_name']}' exceeds sync limit "
+                f"({tokens} > {settings.MAX_SYNC_TEXT_TOKENS} tokens)"
+            )
+
+    if stale:
+        # Chunks go with their documents (ON DELETE CASCADE)
+        await session.execute(delete(Document).where(Document.id.in_([r.id for r in stale])))
+        result.chunks_deleted = sum(r.chunk_count or 0 for r in stale)
+        collection.document_count -= len(stale)
+        collection.chunk_count -= result.chunks_deleted
+
+    # Create document records and chunk them
+    chunking_service = get_chunking_service()
+    pending: list[tuple[Document, str]] = []
+    for name, item, content_hash in to_ingest:
+        document = Document(
+            collection_id=collection.id,
+            source_type="text",
+            source_name=name,
+            content_hash=content_hash,
+            extra_data=item.get("metadata") or {},
+        )
+        session.add(document)
+        pending.append((document, item["content"]))
+    await session.flush()  # Get document IDs
+
+    new_documents: list[tuple[Document, List[ChunkData]]] = [
+        (
+            document,
+            chunking_service.chunk_text(content, source_extra_data={"document_id": document.id}),
+        )
+        for document, content in pending
+    ]
+
+    # Generate embeddings for every new chunk at once
+    all_chunk_data = [cd for _, chunk_data_list in new_documents for cd in chunk_data_list]
+    embedding_result = await get_embedding_service().embed_texts(
+        [cd.content for cd in all_chunk_data],
+        token_counts=[cd.token_count for cd in all_chunk_data],
+    )
+    embeddings = iter(embedding_result.embeddings)
+
+    # Create chunk records
+    for document, chunk_data_list in new_documents:
+        chunks = [
+            Chunk(
+                collection_id=collection.id,
+                document_id=document.id,
+                content=chunk_data.content,
+                embedding=next(embeddings),
+                chunk_index=i,
+                token_count=chunk_data.token_count,
+                extra_data=chunk_data.extra_data,
+            )
+            for i, chunk_data in enumerate(chunk_data_list)
+        ]
+        session.add_all(chunks)
+        document.chunk_count = len(chunks)
+        document.token_count = sum(c.token_count for c in chunks)
+        result.chunks_created += len(chunks)
+
+    collection.document_count += len(new_documents)
+    collection.chunk_count += result.chunks_created
+    result.tokens_used = embedding_result.tokens_used
+    result.changed_sources = [name for name, _, _ in to_ingest]
+
+    await session.flush()
+
+    return result
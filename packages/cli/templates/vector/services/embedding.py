@@ -2,15 +2,21 @@
 OpenAI embedding service.
 
 Handles embedding generation with:
-- Batching for efficiency
-- Retry logic for transient errors
+- Batching for efficiency, with batches sent concurrently
+- A shared request/token budget kept in step with the API's
+  x-ratelimit-* response headers, so concurrent batches pace themselves
+  instead of running into 429s
+- Retry with jittered exponential backoff, honouring Retry-After
 - Token tracking
 """
 
 import asyncio
+import logging
+import random
+import re
+import time
 from typing import List, Optional
 from dataclasses import dataclass
-import logging
 
 from openai import AsyncOpenAI, APIError, RateLimitError, APIConnectionError
 
@@ -19,6 +25,139 @@ from .tokenizer import count_tokens
 
 logger = logging.getLogger(__name__)
 
+BACKOFF_MAX_SECONDS = 60.0
+
+# Durations in rate-limit headers look like "1s", "6m0s", "250ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Seconds in a rate-limit duration header ("6m0s", "20ms", "1.5")."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _header_int(headers, name: str) -> Optional[int]:
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after_seconds(headers) -> Optional[float]:
+    """How long a 429 response asks us to wait, if it says."""
+    if headers is None:
+        return None
+    retry_ms = headers.get("retry-after-ms")
+    if retry_ms is not None:
+        seconds = parse_duration(retry_ms)
+        return seconds / 1000 if seconds is not None else None
+    # x-ratelimit-reset-* say when the bucket is full again, not when a
+    # request fits; the budget works that out from the remaining counts
+    return parse_duration(headers.get("retry-after"))
+
+
+def backoff_seconds(attempt: int) -> float:
+    """Jittered exponential backoff, so parallel retries do not line up."""
+    return random.uniform(0.5, 1.0) * min(2 ** (attempt + 1), BACKOFF_MAX_SECONDS)
+
+
+class RateLimitBudget:
+    """
+    Requests-per-minute and tokens-per-minute budget shared by all batches.
+
+    Modelled as two token buckets refilling at limit/60 per second. The
+    limits start from settings and are replaced by the x-ratelimit-limit-*
+    headers; x-ratelimit-remaining-* caps what we think is left, so usage by
+    other processes on the same API key is accounted for. A 429 pauses all
+    batches until the provider's reset time.
+
+    Holds no asyncio primitives, so one budget can outlive event loops.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.request_limit = float(requests_per_minute)
+        self.token_limit = float(tokens_per_minute)
+        self.requests = self.request_limit
+        self.tokens = self.token_limit
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self.requests = min(self.request_limit, self.requests + elapsed * self.request_limit / 60)
+        self.tokens = min(self.token_limit, self.tokens + elapsed * self.token_limit / 60)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request of ``tokens`` tokens fits the budget."""
+        while True:
+            self._refill()
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            # A batch bigger than the whole budget goes once the bucket is full
+            needed = min(float(tokens), self.token_limit)
+            if self.requests >= 1 and self.tokens >= needed:
+                self.requests -= 1
+                self.tokens -= tokens
+                return
+            wait = max(
+                (1 - self.requests) * 60 / self.request_limit,
+                (needed - self.tokens) * 60 / self.token_limit,
+                0.01,
+            )
+            await asyncio.sleep(wait)
+
+    def update(self, headers) -> None:
+        """Sync the budget with a response's x-ratelimit-* headers."""
+        if headers is None:
+            return
+        request_limit = _header_int(headers, "x-ratelimit-limit-requests")
+        token_limit = _header_int(headers, "x-ratelimit-limit-tokens")
+        if request_limit:
+            self.request_limit = float(request_limit)
+        if token_limit:
+            self.token_limit = float(token_limit)
+
+        self._refill()
+        remaining_requests = _header_int(headers, "x-ratelimit-remaining-requests")
+        remaining_tokens = _header_int(headers, "x-ratelimit-remaining-tokens")
+        if remaining_requests is not None:
+            self.requests = min(self.requests, float(remaining_requests))
+        if remaining_tokens is not None:
+            self.tokens = min(self.tokens, float(remaining_tokens))
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every batch for ``seconds`` (after a 429)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+# Shared by every EmbeddingService in the process: the limits are per API key
+_rate_limit_budget: Optional[RateLimitBudget] = None
+
+
+def get_rate_limit_budget() -> RateLimitBudget:
+    """Get or create the process-wide rate limit budget."""
+    global _rate_limit_budget
+    if _rate_limit_budget is None:
+        _rate_limit_budget = RateLimitBudget(
+            requests_per_minute=settings.OPENAI_RPM_LIMIT,
+            tokens_per_minute=settings.OPENAI_TPM_LIMIT,
+        )
+    return _rate_limit_budget
+
 
 @dataclass
 class EmbeddingResult:
@@ -28,12 +167,19 @@ class EmbeddingResult:
     model: str
 
 
+@dataclass
+class _Batch:
+    texts: List[str]
+    tokens: int  # Estimated with the local tokenizer, for the budget
+
+
 class EmbeddingService:
     """
     Service for generating embeddings via OpenAI API.
 
     Features:
-    - Async batch processing
+    - Async batch processing, up to max_concurrency batches in flight
+    - Rate limiting from the API's own headers
     - Automatic retry with exponential backoff
     - Token usage tracking
     """
@@ -42,22 +188,30 @@ class EmbeddingService:
     MAX_BATCH_SIZE = 100
     MAX_TOKENS_PER_BATCH = 8191  # text-embedding-3-small limit
 
-    def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    def __init__(self, max_concurrency: Optional[int] = None):
+        # Retries are ours: the client's own would hide 429s from the budget
+        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, max_retries=0)
         self.model = settings.OPENAI_MODEL
         self.dimensions = settings.OPENAI_EMBEDDING_DIMENSIONS
+        self.max_concurrency = max(1, max_concurrency or settings.OPENAI_MAX_CONCURRENCY)
+        self.budget = get_rate_limit_budget()
 
     async def embed_texts(
         self,
         texts: List[str],
         retry_count: int = 3,
+        token_counts: Optional[List[int]] = None,
     ) -> EmbeddingResult:
         """
         Generate embeddings for a list of texts.
 
+        Batches are sent concurrently; embeddings are returned in input order.
+
         Args:
             texts: List of texts to embed
             retry_count: Number of retries on failure
+            token_counts: Token count of each text if already known (chunks
+                carry theirs), to skip tokenizing them again
 
         Returns:
             EmbeddingResult with embeddings and usage info
@@ -66,13 +220,29 @@ class EmbeddingService:
             return EmbeddingResult(embeddings=[], tokens_used=0, model=self.model)
 
         # Split into batches
-        batches = self._create_batches(texts)
+        batches = self._create_batches(texts, token_counts)
+
+        if len(batches) == 1:
+            return await self._embed_batch(batches[0], retry_count)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch: _Batch) -> EmbeddingResult:
+            async with semaphore:
+                return await self._embed_batch(batch, retry_count)
+
+        tasks = [asyncio.ensure_future(run(batch)) for batch in batches]
+        try:
+            # gather() keeps task order, so embeddings line up with texts
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
         all_embeddings = []
         total_tokens = 0
-
-        for batch in batches:
-            result = await self._embed_batch(batch, retry_count)
+        for result in results:
             all_embeddings.extend(result.embeddings)
             total_tokens += result.tokens_used
 
@@ -92,21 +262,25 @@ class EmbeddingService:
         result = await self.embed_texts([text])
         return result.embeddings[0], result.tokens_used
 
-    def _create_batches(self, texts: List[str]) -> List[List[str]]:
+    def _create_batches(
+        self, texts: List[str], token_counts: Optional[List[int]] = None
+    ) -> List[_Batch]:
         """Split texts into batches respecting size limits."""
+        if token_counts is None:
+            token_counts = [count_tokens(text) for text in texts]
+
         batches = []
         current_batch = []
         current_tokens = 0
 
-        for text in texts:
-            text_tokens = count_tokens(text)
+        for text, text_tokens in zip(texts, token_counts):
 
             # Check if adding this text would exceed limits
             if (len(current_batch) >= self.MAX_BATCH_SIZE or
                 current_tokens + text_tokens > self.MAX_TOKENS_PER_BATCH):
 
                 if current_batch:
-                    batches.append(current_batch)
+                    batches.append(_Batch(current_batch, current_tokens))
                 current_batch = [text]
                 current_tokens = text_tokens
             else:
@@ -114,25 +288,29 @@ class EmbeddingService:
                 current_tokens += text_tokens
 
         if current_batch:
-            batches.append(current_batch)
+            batches.append(_Batch(current_batch, current_tokens))
 
         return batches
 
     async def _embed_batch(
         self,
-        texts: List[str],
+        batch: _Batch,
         retry_count: int,
     ) -> EmbeddingResult:
         """Embed a single batch with retry logic."""
         last_error = None
 
         for attempt in range(retry_count):
+            tries = f"attempt {attempt + 1}/{retry_count}"
+            await self.budget.acquire(batch.tokens)
             try:
-                response = await self.client.embeddings.create(
-                    input=texts,
+                raw = await self.client.embeddings.with_raw_response.create(
+                    input=batch.texts,
                     model=self.model,
                     dimensions=self.dimensions,
                 )
+                self.budget.update(raw.headers)
+                response = raw.parse()
 
                 embeddings = [item.embedding for item in response.data]
                 tokens_used = response.usage.total_tokens
@@ -144,22 +322,29 @@ class EmbeddingService:
                 )
 
             except RateLimitError as e:
+                if e.code == "insufficient_quota":
+                    # Billing, not pacing: waiting will not help
+                    raise
                 last_error = e
-                wait_time = 2 ** attempt  # Exponential backoff
-                logger.warning(f"Rate limited, waiting {wait_time}s (attempt {attempt + 1}/{retry_count})")
-                await asyncio.sleep(wait_time)
+                headers = e.response.headers if e.response is not None else None
+                self.budget.update(headers)
+                wait_time = retry_after_seconds(headers) or backoff_seconds(attempt)
+                # Pause every batch, not just this one: they share the limit
+                self.budget.pause(wait_time)
+                logger.warning(f"Rate limited, waiting {wait_time:.1f}s ({tries})")
 
             except APIConnectionError as e:
                 last_error = e
-                wait_time = 2 ** attempt
-                logger.warning(f"Connection error, waiting {wait_time}s (attempt {attempt + 1}/{retry_count})")
+                wait_time = backoff_seconds(attempt)
+                logger.warning(f"Connection error, waiting {wait_time:.1f}s ({tries})")
                 await asyncio.sleep(wait_time)
 
             except APIError as e:
                 last_error = e
-                if e.status_code >= 500:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Server error, waiting {wait_time}s (attempt {attempt + 1}/{retry_count})")
+                status_code = getattr(e, "status_code", None)
+                if status_code is not None and status_code >= 500:
+                    wait_time = backoff_seconds(attempt)
+                    logger.warning(f"Server error, waiting {wait_time:.1f}s ({tries})")
                     await asyncio.sleep(wait_time)
                 else:
                     # Client error, don't retry
@@ -0,0 +1,211 @@
+"""
+Query embedding cache.
+
+Search queries repeat a lot (agents re-ask the same questions), and every
+uncached query costs an OpenAI round trip. Query embeddings are cached at
+two levels, keyed by SHA-256 of (model, dimensions, normalized text):
+
+- An in-process LRU of QUERY_CACHE_SIZE entries
+- The vector_query_embeddings table in the service database, shared by
+  workers and restarts; entries unused for QUERY_CACHE_TTL_DAYS are pruned
+
+Concurrent requests for the same uncached query share one API call.
+Cache hits report 0 query tokens, since no tokens were spent.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from config import settings
+from models.service import QueryEmbedding
+from .embedding import get_embedding_service
+
+logger = logging.getLogger(__name__)
+
+# Refresh last_used_at on persistent hits at most this often
+TOUCH_INTERVAL = timedelta(days=1)
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+def normalize_query(text: str) -> str:
+    """Canonical form of a query: NFC, whitespace collapsed and trimmed."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class QueryEmbeddingCache:
+    """Two-level cache with request coalescing for query embeddings."""
+
+    def __init__(self, max_size: int, ttl_days: int):
+        self.max_size = max_size
+        self.ttl_days = ttl_days
+        self._entries: OrderedDict[str, List[float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._background: set[asyncio.Task] = set()
+        self._last_prune = 0.0
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _key(self, text: str) -> str:
+        service = get_embedding_service()
+        raw = f"{service.model}\x00{service.dimensions}\x00{text}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def embed(self, query: str) -> tuple[List[float], int]:
+        """
+        Embed a search query, using the cache.
+
+        Returns:
+            Tuple of (embedding vector, tokens used)
+        """
+        text = normalize_query(query)
+        key = self._key(text)
+
+        embedding = self._entries.get(key)
+        if embedding is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding, 0
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            embedding, _ = await asyncio.shield(task)
+            return embedding, 0
+
+        task = asyncio.create_task(self._load(key, text))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded: a cancelled request must not fail the others waiting on it
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, text: str) -> tuple[List[float], int]:
+        embedding = await self._read_persistent(key)
+        if embedding is not None:
+            self.persistent_hits += 1
+            self._remember(key, embedding)
+            return embedding, 0
+
+        self.misses += 1
+        embedding, tokens = await get_embedding_service().embed_single(text)
+        self._remember(key, embedding)
+        self._spawn(self._write_persistent(key, embedding, tokens))
+        return embedding, tokens
+
+    def _remember(self, key: str, embedding: List[float]) -> None:
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _read_persistent(self, key: str) -> Optional[List[float]]:
+        if self.ttl_days <= 0:
+            return None
+        from database import service_session_context
+
+        try:
+            async with service_session_context() as session:
+                row = (await session.execute(
+                    select(QueryEmbedding.embedding, QueryEmbedding.last_used_at)
+                    .where(QueryEmbedding.key_hash == key)
+                )).first()
+                if row is None:
+                    return None
+                now = datetime.now(timezone.utc)
+                if row.last_used_at is None or now - row.last_used_at > TOUCH_INTERVAL:
+                    await session.execute(
+                        update(QueryEmbedding)
+                        .where(QueryEmbedding.key_hash == key)
+                        .values(last_used_at=now)
+                    )
+                return array("f", row.embedding).tolist()
+        except Exception as e:
+            # The cache is an optimization; fall back to the API
+            logger.warning(f"Query cache read failed: {e}")
+            return None
+
+    async def _write_persistent(self, key: str, embedding: List[float], tokens: int) -> None:
+        if self.ttl_days <= 0:
+            return
+        from database import service_session_context
+
+        service = get_embedding_service()
+        try:
+            async with service_session_context() as session:
+                await session.execute(
+                    insert(QueryEmbedding)
+                    .values(
+                        key_hash=key,
+                        model=service.model,
+                        dimensions=service.dimensions,
+                        embedding=array("f", embedding).tobytes(),
+                        token_count=tokens,
+                    )
+                    .on_conflict_do_nothing(index_elements=["key_hash"])
+                )
+                if time.monotonic() - self._last_prune > PRUNE_INTERVAL_SECONDS:
+                    self._last_prune = time.monotonic()
+                    cutoff = datetime.now(timezone.utc) - timedelta(days=self.ttl_days)
+                    await session.execute(
+                        delete(QueryEmbedding).where(QueryEmbedding.last_used_at < cutoff)
+                    )
+        except Exception as e:
+            logger.warning(f"Query cache write failed: {e}")
+
+    def stats(self) -> dict:
+        """Cache counters since process start."""
+        # Coalesced requests waited for another request's API call: hits too
+        hits = self.hits + self.persistent_hits + self.coalesced
+        lookups = hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_size,
+            "hits": self.hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+# Singleton instance
+_query_cache: Optional[QueryEmbeddingCache] = None
+
+
+def get_query_cache() -> QueryEmbeddingCache:
+    """Get or create the query embedding cache singleton."""
+    global _query_cache
+    if _query_cache is None:
+        _query_cache = QueryEmbeddingCache(
+            max_size=settings.QUERY_CACHE_SIZE,
+            ttl_days=settings.QUERY_CACHE_TTL_DAYS,
+        )
+    return _query_cache
+
+
+async def embed_query(query: str) -> tuple[List[float], int]:
+    """
+    Embed a search query, through the cache unless it is disabled.
+
+    Returns:
+        Tuple of (embedding vector, tokens used; 0 on cache hits)
+    """
+    if settings.QUERY_CACHE_SIZE <= 0:
+        return await get_embedding_service().embed_single(query)
+    return await get_query_cache().embed(query)
@@ -1,13 +1,15 @@
 """Semantic search service."""
 
+import json
 import time
 from typing import Optional, List
 from dataclasses import dataclass
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .embedding import get_embedding_service
+from .query_cache import embed_query
 from .tokenizer import count_tokens
+from .vector_index import ef_search_for
 
 
 @dataclass
@@ -21,6 +23,47 @@ class SearchResultItem:
     extra_data: dict
 
 
+def _vector_literal(embedding: List[float]) -> str:
+    """Format an embedding as a pgvector text literal."""
+    return "[" + ",".join(str(x) for x in embedding) + "]"
+
+
+def _collection_knn_sql(collection_id: int, filtered: bool) -> str:
+    """Nearest chunks of one collection, closest first.
+
+    The collection id is inlined (it is an integer from our own table) so
+    the planner can match the collection's partial HNSW index, which it
+    cannot do for a bind parameter in a generic plan. The distance is
+    computed once, by the index scan, and the similarity threshold is
+    applied by the caller on the top-k rows.
+    """
+    metadata_clause = (
+        "AND c.extra_data @> CAST(:metadata_filter AS jsonb)" if filtered else ""
+    )
+    return f"""
+        SELECT
+            c.id AS chunk_id,
+            c.collection_id,
+            c.content,
+            c.extra_data,
+            c.document_id,
+            c.embedding <=> CAST(:embedding AS vector) AS distance
+        FROM chunks c
+        WHERE c.collection_id = {int(collection_id)}
+          {metadata_clause}
+        ORDER BY c.embedding <=> CAST(:embedding AS vector)
+        LIMIT :limit
+    """
+
+
+async def _set_ef_search(session: AsyncSession, ef_search: int) -> None:
+    """Set hnsw.ef_search for the current transaction only."""
+    await session.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+        {"ef_search": str(ef_search)},
+    )
+
+
 async def search_collection(
     session: AsyncSession,
     collection_id: int,
@@ -29,6 +72,7 @@ async def search_collection(
     threshold: float = 0.0,
     include_metadata: bool = True,
     metadata_filter: Optional[dict] = None,
+    ef_search: Optional[int] = None,
 ) -> tuple[List[SearchResultItem], int, int]:
     """
     Perform semantic search within a collection.
@@ -40,49 +84,43 @@ async def search_collection(
         limit: Maximum results
         threshold: Minimum similarity score (0-1)
         include_metadata: Whether to include chunk metadata
-        metadata_filter: Optional metadata filter
+        metadata_filter: Optional metadata filter (JSONB containment)
+        ef_search: HNSW candidate list size (defaults from settings)
 
     Returns:
         Tuple of (results, query_tokens, search_time_ms)
     """
     start_time = time.time()
 
-    # Get query embedding
-    embedding_service = get_embedding_service()
-    query_embedding, query_tokens = await embedding_service.embed_single(query)
+    # Get query embedding (cached)
+    query_embedding, query_tokens = await embed_query(query)
 
-    # Build search query
-    # Using pgvector's cosine distance operator (<=>)
-    # Similarity = 1 - distance
+    # Using pgvector's cosine distance operator (<=>); similarity = 1 - distance
     # Note: Using CAST syntax instead of :: to avoid SQLAlchemy parameter parsing issues
-    sql = text("""
+    sql = text(f"""
         SELECT
-            c.id AS chunk_id,
-            c.content,
-            c.extra_data,
-            c.document_id,
+            k.chunk_id,
+            k.content,
+            k.extra_data,
+            k.document_id,
             d.source_name,
-            1 - (c.embedding <=> CAST(:embedding AS vector)) AS similarity
-        FROM chunks c
-        JOIN documents d ON c.document_id = d.id
-        WHERE c.collection_id = :collection_id
-          AND 1 - (c.embedding <=> CAST(:embedding AS vector)) >= :threshold
-        ORDER BY c.embedding <=> CAST(:embedding AS vector)
-        LIMIT :limit
+            1 - k.distance AS similarity
+        FROM ({_collection_knn_sql(collection_id, bool(metadata_filter))}) k
+        JOIN documents d ON k.document_id = d.id
+        WHERE 1 - k.distance >= :threshold
+        ORDER BY k.distance
     """)
 
-    # Convert embedding to string format for pgvector
-    embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
-
-    result = await session.execute(
-        sql,
-        {
-            "embedding": embedding_str,
-            "collection_id": collection_id,
-            "threshold": threshold,
-            "limit": limit,
-        }
-    )
+    params = {
+        "embedding": _vector_literal(query_embedding),
+        "threshold": threshold,
+        "limit": limit,
+    }
+    if metadata_filter:
+        params["metadata_filter"] = json.dumps(metadata_filter)
+
+    await _set_ef_search(session, ef_search_for(limit, bool(metadata_filter), ef_search))
+    result = await session.execute(sql, params)
 
     rows = result.fetchall()
 
@@ -108,75 +146,68 @@ async def search_all_collections(
     limit: int = 10,
     collection_names: Optional[List[str]] = None,
     threshold: float = 0.0,
+    ef_search: Optional[int] = None,
 ) -> tuple[List[tuple[str, SearchResultItem]], int, int]:
     """
     Search across multiple collections.
 
+    Each collection is searched through its own index and the per-collection
+    top-k lists are merged.
+
     Args:
         session: Database session
         query: Search query
         limit: Maximum results
         collection_names: Optional list of collection names to search
         threshold: Minimum similarity
+        ef_search: HNSW candidate list size (defaults from settings)
 
     Returns:
         Tuple of (results with collection names, query_tokens, search_time_ms)
     """
     start_time = time.time()
 
-    # Get query embedding
-    embedding_service = get_embedding_service()
-    query_embedding, query_tokens = await embedding_service.embed_single(query)
-    embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
+    # Get query embedding (cached)
+    query_embedding, query_tokens = await embed_query(query)
 
-    # Build query
     if collection_names:
-        sql = text("""
-            SELECT
-                col.name AS collection_name,
-                c.id AS chunk_id,
-                c.content,
-                c.extra_data,
-                c.document_id,
-                d.source_name,
-                1 - (c.embedding <=> CAST(:embedding AS vector)) AS similarity
-            FROM chunks c
-            JOIN documents d ON c.document_id = d.id
-            JOIN collections col ON c.collection_id = col.id
-            WHERE col.name = ANY(:collection_names)
-              AND 1 - (c.embedding <=> CAST(:embedding AS vector)) >= :threshold
-            ORDER BY c.embedding <=> CAST(:embedding AS vector)
-            LIMIT :limit
-        """)
-        params = {
-            "embedding": embedding_str,
-            "collection_names": collection_names,
-            "threshold": threshold,
-            "limit": limit,
-        }
+        result = await session.execute(
+            text("SELECT id FROM collections WHERE name = ANY(:collection_names)"),
+            {"collection_names": collection_names},
+        )
     else:
-        sql = text("""
-            SELECT
-                col.name AS collection_name,
-                c.id AS chunk_id,
-                c.content,
-                c.extra_data,
-                c.document_id,
-                d.source_name,
-                1 - (c.embedding <=> CAST(:embedding AS vector)) AS similarity
-            FROM chunks c
-            JOIN documents d ON c.document_id = d.id
-            JOIN collections col ON c.collection_id = col.id
-            WHERE 1 - (c.embedding <=> CAST(:embedding AS vector)) >= :threshold
-            ORDER BY c.embedding <=> CAST(:embedding AS vector)
-            LIMIT :limit
-        """)
-        params = {
-            "embedding": embedding_str,
-            "threshold": threshold,
-            "limit": limit,
-        }
+        result = await session.execute(text("SELECT id FROM collections"))
+    collection_ids = [row.id for row in result.fetchall()]
+
+    if not collection_ids:
+        return [], query_tokens, int((time.time() - start_time) * 1000)
+
+    per_collection = " UNION ALL ".join(
+        f"({_collection_knn_sql(collection_id, False)})" for collection_id in collection_ids
+    )
+    sql = text(f"""
+        SELECT
+            col.name AS collection_name,
+            k.chunk_id,
+            k.content,
+            k.extra_data,
+            k.document_id,
+            d.source_name,
+            1 - k.distance AS similarity
+        FROM ({per_collection}) k
+        JOIN documents d ON k.document_id = d.id
+        JOIN collections col ON k.collection_id = col.id
+        WHERE 1 - k.distance >= :threshold
+        ORDER BY k.distance
+        LIMIT :limit
+    """)
+    params = {
+        "embedding": _vector_literal(query_embedding),
+        "threshold": threshold,
+        "limit": limit,
+    }
 
+    await _set_ef_search(session, ef_search_for(limit, ef_search=ef_search))
     result = await session.execute(sql, params)
     rows = result.fetchall()
 
@@ -0,0 +1,215 @@
+"""HNSW index management for chunk embeddings.
+
+Each collection gets its own partial HNSW index
+(``idx_chunks_embedding_c<id> ... WHERE collection_id = <id>``) once it
+holds VECTOR_INDEX_MIN_ROWS chunks. Smaller collections are searched exactly
+through idx_chunks_collection, which is fast at that size and has perfect
+recall. Index parameters grow with the collection: past HNSW_LARGE_ROWS the
+index is rebuilt with HNSW_LARGE_M / HNSW_LARGE_EF_CONSTRUCTION.
+
+Indexes are built with CREATE INDEX CONCURRENTLY by the worker
+(maintain_vector_index task), so ingestion and search continue meanwhile.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from config import settings
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+INDEX_PREFIX = "idx_chunks_embedding_c"
+# Global ivfflat index created by earlier versions (built on an empty table)
+LEGACY_INDEX = "idx_chunks_embedding"
+# pg_try_advisory_lock(LOCK_NAMESPACE, collection_id)
+LOCK_NAMESPACE = 7351
+
+# pgvector defaults when the index was created without WITH (...)
+DEFAULT_M = 16
+DEFAULT_EF_CONSTRUCTION = 64
+
+
+@dataclass(frozen=True)
+class IndexParams:
+    """HNSW build parameters."""
+    m: int
+    ef_construction: int
+
+
+@dataclass
+class IndexInfo:
+    """An embedding index found in the catalog."""
+    name: str
+    method: str
+    params: Optional[IndexParams]
+    valid: bool
+    size_bytes: int
+
+
+def index_name(collection_id: int) -> str:
+    return f"{INDEX_PREFIX}{int(collection_id)}"
+
+
+def target_params(chunk_count: int) -> Optional[IndexParams]:
+    """HNSW parameters a collection of this size should be indexed with."""
+    if chunk_count < settings.VECTOR_INDEX_MIN_ROWS:
+        return None
+    if chunk_count >= settings.HNSW_LARGE_ROWS:
+        return IndexParams(settings.HNSW_LARGE_M, settings.HNSW_LARGE_EF_CONSTRUCTION)
+    return IndexParams(settings.HNSW_M, settings.HNSW_EF_CONSTRUCTION)
+
+
+def plan_index(chunk_count: int, current: Optional[IndexInfo]) -> str:
+    """Decide what to do with a collection's index.
+
+    Returns one of "keep", "build", "rebuild" or "drop". Indexes are only
+    rebuilt to grow their parameters, and dropped once the collection has
+    shrunk to half the threshold, so sizes hovering around a threshold
+    do not cause repeated builds.
+    """
+    target = target_params(chunk_count)
+    if current is None or not current.valid:
+        return "build" if target else ("drop" if current else "keep")
+    if target is None:
+        return "drop" if chunk_count < settings.VECTOR_INDEX_MIN_ROWS // 2 else "keep"
+    params = current.params or IndexParams(DEFAULT_M, DEFAULT_EF_CONSTRUCTION)
+    if target.m > params.m or target.ef_construction > params.ef_construction:
+        return "rebuild"
+    return "keep"
+
+
+def ef_search_for(limit: int, filtered: bool = False, ef_search: Optional[int] = None) -> int:
+    """hnsw.ef_search for a query returning ``limit`` rows.
+
+    The index returns at most ef_search candidates, and a metadata filter is
+    applied after the index scan, so filtered queries search wider.
+    """
+    if ef_search is None:
+        ef_search = settings.HNSW_FILTERED_EF_SEARCH if filtered else settings.HNSW_EF_SEARCH
+    return max(ef_search, limit)
+
+
+def _parse_params(reloptions: Optional[list[str]]) -> IndexParams:
+    options = dict(opt.split("=", 1) for opt in reloptions or [])
+    return IndexParams(
+        m=int(options.get("m", DEFAULT_M)),
+        ef_construction=int(options.get("ef_construction", DEFAULT_EF_CONSTRUCTION)),
+    )
+
+
+def list_indexes(conn: Connection) -> dict[str, IndexInfo]:
+    """Embedding indexes on the chunks table, by name."""
+    rows = conn.execute(text("""
+        SELECT ic.relname AS name,
+               am.amname AS method,
+               ic.reloptions,
+               i.indisvalid AS valid,
+               pg_relation_size(ic.oid) AS size_bytes
+        FROM pg_index i
+        JOIN pg_class ic ON ic.oid = i.indexrelid
+        JOIN pg_am am ON am.oid = ic.relam
+        WHERE i.indrelid = 'chunks'::regclass
+          AND ic.relname LIKE 'idx_chunks_embedding%'
+    """)).fetchall()
+    return {
+        row.name: IndexInfo(
+            name=row.name,
+            method=row.method,
+            params=_parse_params(row.reloptions) if row.method == "hnsw" else None,
+            valid=row.valid,
+            size_bytes=row.size_bytes,
+        )
+        for row in rows
+    }
+
+
+def needs_maintenance(conn: Connection, collection_id: int, chunk_count: int) -> bool:
+    """Cheap check whether maintain_collection_index would do anything."""
+    indexes = list_indexes(conn)
+    if LEGACY_INDEX in indexes:
+        return True
+    return plan_index(chunk_count, indexes.get(index_name(collection_id))) != "keep"
+
+
+def _create_index(conn: Connection, name: str, collection_id: int, params: IndexParams) -> None:
+    # Identifiers and parameters are integers we produced; DDL takes no bind params
+    conn.execute(text(f"""
+        CREATE INDEX CONCURRENTLY {name}
+        ON chunks USING hnsw (embedding vector_cosine_ops)
+        WITH (m = {int(params.m)}, ef_construction = {int(params.ef_construction)})
+        WHERE collection_id = {int(collection_id)}
+    """))
+
+
+def maintain_collection_index(engine: Engine, collection_id: int) -> str:
+    """Build, rebuild or drop a collection's index as its size requires.
+
+    Returns:
+        The action taken ("keep", "build", "rebuild", "drop"), or "busy" if
+        another worker is maintaining the collection
+    """
+    name = index_name(collection_id)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        locked = conn.execute(
+            text("SELECT pg_try_advisory_lock(:ns, :cid)"),
+            {"ns": LOCK_NAMESPACE, "cid": collection_id},
+        ).scalar()
+        if not locked:
+            return "busy"
+
+        try:
+            indexes = list_indexes(conn)
+            legacy = indexes.get(LEGACY_INDEX)
+            if legacy is not None and legacy.method == "ivfflat":
+                logger.info(f"Dropping legacy index {LEGACY_INDEX}")
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {LEGACY_INDEX}"))
+
+            chunk_count = conn.execute(
+                text("SELECT chunk_count FROM collections WHERE id = :cid"),
+                {"cid": collection_id},
+            ).scalar()
+            current = indexes.get(name)
+            if chunk_count is None:
+                # Collection deleted; its partial index may linger
+                action = "drop" if current else "keep"
+            else:
+                action = plan_index(chunk_count, current)
+
+            if action == "keep":
+                return action
+
+            if action == "drop" or (current is not None and not current.valid):
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                if action == "drop":
+                    logger.info(f"Dropped index {name} ({chunk_count} chunks)")
+                    return action
+
+            params = target_params(chunk_count)
+            conn.execute(
+                text("SELECT set_config('maintenance_work_mem', :mem, false)"),
+                {"mem": settings.VECTOR_INDEX_MAINTENANCE_WORK_MEM},
+            )
+            logger.info(
+                f"Building index {name} for {chunk_count} chunks "
+                f"(m={params.m}, ef_construction={params.ef_construction})"
+            )
+            if action == "rebuild":
+                # Build the replacement first so searches keep an index throughout
+                new_name = f"{name}_new"
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {new_name}"))
+                _create_index(conn, new_name, collection_id, params)
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                conn.execute(text(f"ALTER INDEX {new_name} RENAME TO {name}"))
+            else:
+                _create_index(conn, name, collection_id, params)
+            return action
+        finally:
+            # The connection goes back to the worker's pool
+            conn.execute(text("RESET maintenance_work_mem"))
+            conn.execute(
+                text("SELECT pg_advisory_unlock(:ns, :cid)"),
+                {"ns": LOCK_NAMESPACE, "cid": collection_id},
+            )
@@ -0,0 +1,106 @@
+"""Tests for token-offset chunking."""
+
+import re
+from unittest.mock import patch
+
+import pytest
+from config import settings
+from services.chunking import ChunkingService
+
+WORD_TOKEN = re.compile(r"\s*\S+|\s+")
+
+
+class WordTokenizer:
+    """Deterministic tokenizer: one token per word, with its leading whitespace."""
+
+    def __init__(self):
+        self.vocab = {}
+        self.pieces = {}
+
+    def encode(self, text):
+        tokens = []
+        for piece in WORD_TOKEN.findall(text):
+            token = self.vocab.setdefault(piece, len(self.vocab))
+            self.pieces[token] = piece
+            tokens.append(token)
+        return tokens
+
+    def decode_single_token_bytes(self, token):
+        return self.pieces[token].encode()
+
+
+@pytest.fixture
+def tokenizer():
+    return WordTokenizer()
+
+
+@pytest.fixture
+def chunker(tokenizer):
+    with patch("services.chunking.get_tokenizer", return_value=tokenizer):
+        yield ChunkingService()
+
+
+def paragraphs(count, sentences, words):
+    """Numbered words, so any span of a chunk can be located in the input."""
+    n = 0
+    text = []
+    for _ in range(count):
+        paragraph = []
+        for _ in range(sentences):
+            paragraph.append(" ".join(f"w{n + i}" for i in range(words)).capitalize() + ".")
+            n += words
+        text.append(" ".join(paragraph))
+    return "\n\n".join(text)
+
+
+def without_overlap(chunks, overlap):
+    return [c.content.split()[overlap if i else 0 :] for i, c in enumerate(chunks)]
+
+
+def test_chunks_start_and_end_on_token_boundaries(chunker):
+    text = paragraphs(count=12, sentences=6, words=17)
+    chunks = chunker.chunk_text(text)
+
+    assert len(chunks) > 2
+    for chunk in chunks:
+        start = text.index(chunk.content)
+        end = start + len(chunk.content)
+        assert start == 0 or text[start - 1].isspace()
+        assert end == len(text) or text[end].isspace()
+
+
+def test_overlap_is_exactly_configured_tokens(chunker):
+    overlap = settings.CHUNK_OVERLAP_TOKENS
+    chunks = chunker.chunk_text(paragraphs(count=12, sentences=6, words=17))
+
+    assert not chunks[0].extra_data["has_overlap"]
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.extra_data["has_overlap"]
+        assert chunk.content.split()[:overlap] == previous.content.split()[-overlap:]
+
+
+def test_overlong_paragraph_is_force_split(chunker):
+    target, overlap = settings.CHUNK_TARGET_TOKENS, settings.CHUNK_OVERLAP_TOKENS
+    # One paragraph, no sentence boundaries
+    text = " ".join(f"w{i}" for i in range(target * 2 + 200))
+
+    chunks = chunker.chunk_text(text)
+
+    assert [len(words) for words in without_overlap(chunks, overlap)] == [target, target, 200]
+    assert [c.token_count for c in chunks] == [target, target + overlap, 200 + overlap]
+
+
+def test_token_count_matches_tokenizer(chunker, tokenizer):
+    chunks = chunker.chunk_text(paragraphs(count=12, sentences=6, words=17))
+
+    for chunk in chunks:
+        assert chunk.token_count == len(tokenizer.encode(chunk.content))
+
+
+def test_chunks_without_overlap_reproduce_input(chunker):
+    text = paragraphs(count=12, sentences=6, words=17)
+    chunks = chunker.chunk_text(text)
+
+    pieces = without_overlap(chunks, settings.CHUNK_OVERLAP_TOKENS)
+    assert [word for words in pieces for word in words] == text.split()
+    assert [c.index for c in chunks] == list(range(len(chunks)))
@@ -73,4 +73,5 @@ celery_app.conf.update(
 # Task routing
 celery_app.conf.task_routes = {
     "worker.tasks.process_ingestion": {"queue": "vector_ingestion"},
+    "worker.tasks.maintain_vector_index": {"queue": "vector_ingestion"},
 }
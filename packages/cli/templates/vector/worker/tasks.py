@@ -1,15 +1,18 @@
 """Celery tasks for document processing."""
 
+import asyncio
 import hashlib
 import logging
 import os
 import sys
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 
 from celery import shared_task
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
 
 # Ensure parent directory is in path for imports
 _parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -35,39 +38,96 @@ settings = _config.settings
 logger = logging.getLogger(__name__)
 
 
+# Engines live as long as the worker process, so tasks reuse pooled
+# connections instead of opening new ones. Project engines are kept in LRU
+# order; the least recently used is disposed past WORKER_PROJECT_ENGINES.
+_service_engine: Optional[Engine] = None
+_project_engines: "OrderedDict[str, Engine]" = OrderedDict()
+
+# The event loop the embedding client lives on (its HTTP connection pool is
+# bound to the loop it was first used on)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _create_sync_engine(db_url: str) -> Engine:
+    # A worker process runs one task at a time: one connection per database
+    # covers it, the overflow one covers the post-ingestion index check
+    return create_engine(
+        db_url,
+        pool_pre_ping=True,
+        pool_size=1,
+        max_overflow=1,
+        pool_recycle=3600,
+    )
+
+
+def get_sync_service_engine() -> Engine:
+    """Get the worker process's service database engine."""
+    global _service_engine
+    if _service_engine is None:
+        _service_engine = _create_sync_engine(
+            settings.SERVICE_DATABASE_URL.replace("+asyncpg", "")
+        )
+    return _service_engine
+
+
+def get_sync_project_engine(project_name: str) -> Engine:
+    """Get the worker process's engine for a project database."""
+    engine = _project_engines.get(project_name)
+    if engine is not None:
+        _project_engines.move_to_end(project_name)
+        return engine
+
+    engine = _create_sync_engine(get_sync_project_database_url(project_name))
+    _project_engines[project_name] = engine
+    while len(_project_engines) > settings.WORKER_PROJECT_ENGINES:
+        evicted_name, evicted = _project_engines.popitem(last=False)
+        logger.debug(f"Disposing engine for project {evicted_name}")
+        evicted.dispose()
+    return engine
+
+
+def run_async(coro):
+    """Run a coroutine to completion on the worker process's event loop."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
+
 def get_sync_service_session() -> Session:
     """Get synchronous service database session for Celery tasks."""
-    db_url = settings.SERVICE_DATABASE_URL.replace("+asyncpg", "")
-    engine = create_engine(db_url, pool_pre_ping=True)
-    SessionLocal = sessionmaker(bind=engine)
-    return SessionLocal()
+    return Session(bind=get_sync_service_engine())
 
 
-def get_sync_project_session(project_name: str) -> Session:
-    """Get synchronous project database session for Celery tasks."""
+def get_sync_project_database_url(project_name: str) -> str:
+    """Get synchronous project database URL for Celery tasks."""
     # Extract password from service URL
     password = settings.SERVICE_DATABASE_URL.split(":")[-1].split("@")[0]
-    db_url = settings.PROJECT_DATABASE_TEMPLATE.format(
+    return settings.PROJECT_DATABASE_TEMPLATE.format(
         project=project_name,
         password=password,
     ).replace("+asyncpg", "")
-    engine = create_engine(db_url, pool_pre_ping=True)
-    SessionLocal = sessionmaker(bind=engine)
-    return SessionLocal()
+
+
+def get_sync_project_session(project_name: str) -> Session:
+    """Get synchronous project database session for Celery tasks."""
+    return Session(bind=get_sync_project_engine(project_name))
 
 
 def _get_models():
     """Lazy load models to avoid import chain issues."""
     from models.service import VectorJob
-    from models.project import Collection, Document, Chunk
-    return VectorJob, Collection, Document, Chunk
+    from models.project import Collection, Document
+    return VectorJob, Collection, Document
 
 
 def _get_services():
     """Lazy load services to avoid import chain issues."""
     from services.chunking import get_chunking_service
-    from services.embedding import EmbeddingService
-    return get_chunking_service, EmbeddingService
+    from services.embedding import get_embedding_service
+    return get_chunking_service, get_embedding_service
 
 
 @shared_task(
@@ -102,8 +162,9 @@ def process_ingestion(
     7. Updates job status to completed
     """
     # Lazy load models and services
-    VectorJob, Collection, Document, Chunk = _get_models()
-    get_chunking_service, EmbeddingService = _get_services()
+    VectorJob, Collection, Document = _get_models()
+    get_chunking_service, get_embedding_service = _get_services()
+    from services.chunk_store import ChunkRow, copy_chunks
 
     service_session = get_sync_service_session()
     project_session = get_sync_project_session(project_name)
@@ -192,29 +253,20 @@ def process_ingestion(
         service_session.commit()
 
         # Generate embeddings (run async in sync context)
-        import asyncio
-        embedding_service = EmbeddingService()
+        embedding_service = get_embedding_service()
         texts = [cd.content for cd in chunk_data_list]
-
-        # Run async embedding in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            embedding_result = loop.run_until_complete(
-                embedding_service.embed_texts(texts)
+        embedding_result = run_async(
+            embedding_service.embed_texts(
+                texts, token_counts=[cd.token_count for cd in chunk_data_list]
             )
-        finally:
-            loop.close()
+        )
 
         job.progress = 80
         service_session.commit()
 
-        # Create chunk records
-        chunks = []
-        for i, (chunk_data, embedding) in enumerate(
-            zip(chunk_data_list, embedding_result.embeddings)
-        ):
-            chunk = Chunk(
+        # Create chunk records with one binary COPY, in the session's transaction
+        chunks = [
+            ChunkRow(
                 collection_id=collection.id,
                 document_id=document.id,
                 content=chunk_data.content,
@@ -223,9 +275,11 @@ def process_ingestion(
                 token_count=chunk_data.token_count,
                 extra_data=chunk_data.extra_data,
             )
-            chunks.append(chunk)
-
-        project_session.add_all(chunks)
+            for i, (chunk_data, embedding) in enumerate(
+                zip(chunk_data_list, embedding_result.embeddings)
+            )
+        ]
+        copy_chunks(project_session.connection().connection.dbapi_connection, chunks)
 
         # Update document stats
         document.chunk_count = len(chunks)
@@ -248,6 +302,16 @@ def process_ingestion(
 
         logger.info(f"Job {job_id} completed: {len(chunks)} chunks created")
 
+        # Build or retune the collection's vector index if it crossed a threshold
+        from services.vector_index import needs_maintenance
+        try:
+            if needs_maintenance(
+                project_session.connection(), collection.id, collection.chunk_count
+            ):
+                maintain_vector_index.delay(project_name, collection.id)
+        except Exception as e:
+            logger.warning(f"Index check for collection {collection.id} failed: {e}")
+
         return {
             "job_id": job_id,
             "document_id": document.id,
@@ -277,6 +341,21 @@ def process_ingestion(
         project_session.close()
 
 
+@shared_task(time_limit=4 * 3600, soft_time_limit=4 * 3600 - 60)
+def maintain_vector_index(project_name: str, collection_id: int):
+    """Build, retune or drop a collection's HNSW index.
+
+    Builds run CONCURRENTLY and can take a while on large collections,
+    hence the long time limit.
+    """
+    from services.vector_index import maintain_collection_index
+
+    action = maintain_collection_index(get_sync_project_engine(project_name), collection_id)
+
+    logger.info(f"Vector index for {project_name} collection {collection_id}: {action}")
+    return {"project": project_name, "collection_id": collection_id, "action": action}
+
+
 def fetch_url_content(url: str) -> tuple[str, dict]:
     """
     Fetch and parse content from URL.
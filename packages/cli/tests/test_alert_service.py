@@ -0,0 +1,101 @@
+"""Tests for queued alert delivery."""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hostkit.config import HostKitConfig
+from hostkit.database import Database
+from hostkit.services.alert_service import AlertService
+
+
+@pytest.fixture
+def db():
+    """Create a temporary database with one project and two channels."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "hostkit.db")
+        db.initialize()
+        db.create_project(name="myapp", port=8001)
+        db.create_alert_channel("myapp", "hook", "webhook", json.dumps({"url": "https://a"}))
+        db.create_alert_channel("myapp", "chat", "slack", json.dumps({"webhook_url": "https://b"}))
+        yield db
+
+
+@pytest.fixture
+def service(db):
+    with (
+        patch("hostkit.services.alert_service.get_config", return_value=HostKitConfig()),
+        patch("hostkit.services.alert_service.get_db", return_value=db),
+        patch.object(AlertService, "_start_dispatcher") as start_dispatcher,
+    ):
+        service = AlertService()
+        service.start_dispatcher = start_dispatcher
+        yield service
+
+
+def test_send_alert_queues_without_delivering(service):
+    with patch.object(AlertService, "_deliver") as deliver:
+        result = service.send_alert("myapp", "deploy", "failure", {"error": "boom"})
+
+    deliver.assert_not_called()
+    service.start_dispatcher.assert_called_once()
+    assert result["channels_queued"] == 2
+
+
+def test_identical_alerts_are_coalesced(service):
+    for value in (91.0, 95.5, 97.2):
+        result = service.send_alert(
+            "myapp", "metrics", "failure", {"cpu": value}, dedup_key="cpu_percent"
+        )
+    assert result["channels_coalesced"] == 2
+
+    with patch.object(AlertService, "_deliver", return_value=(True, None)) as deliver:
+        stats = service.dispatch()
+
+    assert stats["delivered"] == 2
+    event, payload = deliver.call_args.args[2:4]
+    assert event.data == {"cpu": 97.2, "occurrences": 3}
+    assert payload["event"]["occurrences"] == 3
+
+    # Already sent within the window: suppressed, not queued again
+    result = service.send_alert("myapp", "metrics", "failure", {"cpu": 99.0}, "cpu_percent")
+    assert result["channels_queued"] == 0
+
+
+def test_failed_delivery_is_retried_later(service, db):
+    service.send_alert("myapp", "deploy", "failure", {"error": "boom"})
+
+    def deliver(channel_type, *args, **kwargs):
+        return (True, None) if channel_type == "slack" else (False, "HTTP 503: Unavailable")
+
+    with patch.object(AlertService, "_deliver", side_effect=deliver):
+        stats = service.dispatch()
+        assert (stats["delivered"], stats["retrying"]) == (1, 1)
+        # Not due again until the first retry delay has passed
+        assert service.dispatch()["claimed"] == 0
+
+    history = db.list_alert_history("myapp")
+    assert [(h["channel_name"], h["notification_sent"]) for h in history] == [("chat", 1)]
+
+
+def test_failure_after_recovery_is_sent_again(service):
+    failure = {"overall": "unhealthy"}
+    recovery = {"overall": "healthy", "message": "Service has recovered"}
+
+    service.send_alert("myapp", "health", "failure", failure, dedup_key="/health:unhealthy")
+    service.send_alert("myapp", "health", "success", recovery, dedup_key="/health")
+    with patch.object(AlertService, "_deliver", return_value=(True, None)):
+        assert service.dispatch()["delivered"] == 4
+
+    # Down again within the coalesce window: not folded into the first failure
+    result = service.send_alert(
+        "myapp", "health", "failure", failure, dedup_key="/health:unhealthy"
+    )
+    assert (result["channels_queued"], result["channels_coalesced"]) == (2, 0)
+
+    with patch.object(AlertService, "_deliver", return_value=(True, None)) as deliver:
+        assert service.dispatch()["delivered"] == 2
+    assert deliver.call_args.args[2].event_status == "failure"
@@ -0,0 +1,70 @@
+"""Tests for the per-project auth runtime mode."""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hostkit.config import HostKitConfig
+from hostkit.database import Database
+from hostkit.services.auth_service import AuthDatabaseCredentials, AuthService
+
+
+@pytest.fixture
+def service():
+    """An AuthService over a temporary database with one project."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "hostkit.db")
+        db.initialize()
+        db.create_project(name="myapp", port=8001)
+        with (
+            patch("hostkit.services.auth_service.get_config", return_value=HostKitConfig()),
+            patch("hostkit.services.auth_service.get_db", return_value=db),
+        ):
+            yield AuthService()
+
+
+def enable(service: AuthService) -> None:
+    """Run enable_auth with the PostgreSQL, filesystem and nginx steps stubbed."""
+    credentials = AuthDatabaseCredentials(
+        database="myapp_auth_db",
+        username="myapp_auth_user",
+        password="secret",
+        host="localhost",
+        port=5432,
+    )
+    keys = (Path("/tmp/jwt_private.pem"), Path("/tmp/jwt_public.pem"))
+    with (
+        patch.object(AuthService, "auth_is_enabled", return_value=False),
+        patch.object(AuthService, "_create_auth_database", return_value=credentials),
+        patch.object(AuthService, "_apply_schema"),
+        patch.object(AuthService, "_generate_rsa_keypair", return_value=keys),
+        patch.object(AuthService, "_update_project_env"),
+        patch.object(AuthService, "_deploy_auth_service"),
+        patch.object(AuthService, "_configure_nginx_auth"),
+        patch.object(AuthService, "_start_auth_service"),
+        patch.object(AuthService, "_auto_configure_oauth_from_platform"),
+        patch("hostkit.services.project_service.ProjectService._regenerate_nginx_port_mappings"),
+    ):
+        service.enable_auth("myapp")
+
+
+def test_enabled_project_keeps_dedicated_runtime_when_flag_changes(service):
+    enable(service)
+    assert service.hostkit_db.get_auth_service("myapp")["shared_runtime"] == 0
+
+    service.config.auth_multi_tenant = True
+
+    assert service._auth_port("myapp") == 9001
+    assert service.internal_auth_url("myapp", 9001) == "http://127.0.0.1:9001"
+    with (
+        patch.object(Path, "exists", return_value=True),
+        patch("hostkit.services.auth_service.subprocess.run") as run,
+    ):
+        service._restart_auth_service("myapp")
+    assert run.call_args.args[0] == ["systemctl", "restart", "hostkit-myapp-auth.service"]
+
+    # Projects enabled from now on use the shared runtime
+    service.hostkit_db.create_project(name="other", port=8002)
+    assert service._auth_port("other") == service.config.auth_shared_port
@@ -0,0 +1,108 @@
+"""Tests for idle suspend (scale-to-zero) in the auto-pause service."""
+
+import socket
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hostkit.database import Database
+from hostkit.services.auto_pause_service import AutoPauseService
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary working directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+@pytest.fixture
+def service(temp_dir):
+    """AutoPauseService backed by a temporary database with one project."""
+    db = Database(db_path=temp_dir / "hostkit.db")
+    db.initialize()
+    db.create_project("myapp", runtime="python", port=8001)
+    db.create_auto_pause_config("myapp")
+    db.update_auto_pause_config(
+        "myapp",
+        idle_suspend=True,
+        idle_minutes=30,
+        idle_log_position=100,
+        last_activity_at=datetime.utcnow().isoformat(),
+    )
+    with patch("hostkit.services.auto_pause_service.get_db", return_value=db):
+        yield AutoPauseService()
+
+
+class TestCheckIdle:
+    """Tests for suspending idle projects."""
+
+    def test_log_growth_counts_as_activity(self, service):
+        """A grown access log records activity and never suspends."""
+        with patch.object(service, "_log_activity", return_value=(True, 250)):
+            result = service.check_idle("myapp")
+
+        assert result["action"] == "active"
+        assert service.db.get_auto_pause_config("myapp")["idle_log_position"] == 250
+
+    def test_suspends_after_idle_period(self, service):
+        """Running units are stopped once idle_minutes pass without requests."""
+        stale = (datetime.utcnow() - timedelta(minutes=45)).isoformat()
+        service.db.update_auto_pause_config("myapp", last_activity_at=stale)
+
+        with (
+            patch.object(service, "_log_activity", return_value=(False, 100)),
+            patch.object(service, "_unit_active", return_value=True),
+            patch("hostkit.services.auto_pause_service.subprocess.run") as run,
+        ):
+            result = service.check_idle("myapp")
+
+        assert result["action"] == "suspended"
+        assert result["units"] == ["hostkit-myapp"]
+        assert run.call_args[0][0] == ["systemctl", "stop", "hostkit-myapp.service"]
+        assert service.get_config("myapp").suspended_at is not None
+
+    def test_recent_activity_keeps_running(self, service):
+        """Nothing is stopped inside the idle window."""
+        with (
+            patch.object(service, "_log_activity", return_value=(False, 100)),
+            patch("hostkit.services.auto_pause_service.subprocess.run") as run,
+        ):
+            result = service.check_idle("myapp")
+
+        assert result["action"] == "none"
+        run.assert_not_called()
+
+
+class TestWakeWait:
+    """Tests for cold start measurement."""
+
+    def test_records_cold_start(self, service):
+        """Waiting for a late listener records the cold start duration."""
+        listener = socket.socket()
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+
+        def listen_later():
+            time.sleep(0.2)
+            listener.listen()
+
+        thread = threading.Thread(target=listen_later)
+        thread.start()
+        try:
+            duration_ms = service.wait_for_wake("myapp", "hostkit-myapp", port, timeout=5)
+        finally:
+            thread.join()
+            listener.close()
+
+        assert duration_ms is not None and duration_ms >= 150
+        cold_starts = service.db.list_cold_starts("myapp")
+        assert len(cold_starts) == 1
+        assert cold_starts[0]["unit"] == "hostkit-myapp"
+        assert service.get_idle_status("myapp")["cold_starts"]["count_7d"] == 1
@@ -0,0 +1,154 @@
+"""Tests for the shared dependency cache service."""
+
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hostkit.database import Database
+from hostkit.services.dependency_cache_service import DependencyCacheService
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary working directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+@pytest.fixture
+def cache_service(temp_dir):
+    """Create a DependencyCacheService backed by a temporary database."""
+    db = Database(db_path=temp_dir / "hostkit.db")
+    db.initialize()
+    service = DependencyCacheService(cache_dir=temp_dir / "cache", max_bytes=1024, db=db)
+    # Pin runtime versions so keys don't depend on the test host
+    service._runtime_versions = {"node": "v20.0.0-x86_64", "python": "Python 3.11-x86_64"}
+    return service
+
+
+def _make_app(root: Path, lockfile: str, content: str) -> Path:
+    app_dir = root / "app"
+    app_dir.mkdir(parents=True, exist_ok=True)
+    (app_dir / lockfile).write_text(content)
+    return app_dir
+
+
+class TestCacheKey:
+    """Tests for lockfile-derived cache keys."""
+
+    def test_same_lockfile_same_key(self, cache_service, temp_dir):
+        """Identical lockfiles in different projects share a key."""
+        a = _make_app(temp_dir / "a", "package-lock.json", '{"lockfileVersion": 3}')
+        b = _make_app(temp_dir / "b", "package-lock.json", '{"lockfileVersion": 3}')
+
+        assert cache_service.compute_key("node", a) == cache_service.compute_key("nextjs", b)
+
+    def test_lockfile_change_changes_key(self, cache_service, temp_dir):
+        """Editing the lockfile produces a new key."""
+        app = _make_app(temp_dir, "requirements.txt", "fastapi==0.110.0\n")
+        before = cache_service.compute_key("python", app)
+        (app / "requirements.txt").write_text("fastapi==0.111.0\n")
+
+        assert cache_service.compute_key("python", app) != before
+
+    def test_runtime_version_in_key(self, cache_service, temp_dir):
+        """A different interpreter version invalidates cached trees."""
+        app = _make_app(temp_dir, "package-lock.json", "{}")
+        before = cache_service.compute_key("node", app)
+        cache_service._runtime_versions["node"] = "v22.0.0-x86_64"
+
+        assert cache_service.compute_key("node", app) != before
+
+    def test_missing_lockfile_or_runtime(self, cache_service, temp_dir):
+        """No key without a lockfile or for uncacheable runtimes."""
+        app = _make_app(temp_dir, "package.json", "{}")
+
+        assert cache_service.compute_key("node", app) is None
+        assert cache_service.compute_key("static", app) is None
+
+
+class TestStoreAndEvict:
+    """Tests for populating and evicting cache entries."""
+
+    def _store(self, service: DependencyCacheService, app_dir: Path, key: str, size: int):
+        modules = app_dir / "node_modules" / "pkg"
+        modules.mkdir(parents=True, exist_ok=True)
+        (modules / "index.js").write_bytes(b"x" * size)
+        # chown to root is not possible in the test sandbox; it is best-effort
+        with patch("hostkit.services.dependency_cache_service.subprocess.run") as run:
+            run.side_effect = lambda cmd, **kw: _copy_only(cmd)
+            return service.store_node_modules(key, app_dir)
+
+    def test_store_then_lookup(self, cache_service, temp_dir):
+        """A stored tree is found by key and its hit count increments."""
+        app = _make_app(temp_dir, "package-lock.json", "{}")
+        entry = self._store(cache_service, app, "k1", 100)
+
+        assert entry is not None
+        assert (Path(entry.path) / "pkg" / "index.js").exists()
+
+        cache_service.mark_used("k1")
+        found = cache_service.lookup("k1")
+        assert found is not None
+        assert found.hit_count == 1
+
+    def test_lookup_forgets_missing_payload(self, cache_service, temp_dir):
+        """Entries whose payload was deleted are dropped."""
+        app = _make_app(temp_dir, "package-lock.json", "{}")
+        entry = self._store(cache_service, app, "k1", 10)
+        shutil.rmtree(entry.path)
+
+        assert cache_service.lookup("k1") is None
+        assert cache_service.db.get_dependency_cache_entry("k1") is None
+
+    def test_lru_eviction_by_budget(self, cache_service, temp_dir):
+        """Least recently used entries are evicted once over budget."""
+        app = _make_app(temp_dir, "package-lock.json", "{}")
+        self._store(cache_service, app, "old", 600)
+        self._store(cache_service, app, "new", 600)
+
+        # Budget is 1024 bytes: storing "new" evicts "old"
+        assert cache_service.lookup("old") is None
+        assert cache_service.lookup("new") is not None
+
+
+class TestRestore:
+    """Tests for materializing a cached node_modules tree."""
+
+    def test_restore_gives_release_its_own_project_owned_files(self, cache_service, temp_dir):
+        """Without reflink support the tree is copied, not linked, and chowned."""
+        app = _make_app(temp_dir / "build", "package-lock.json", "{}")
+        entry = TestStoreAndEvict()._store(cache_service, app, "k1", 10)
+        release = _make_app(temp_dir / "release", "package-lock.json", "{}")
+
+        calls = []
+
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            if "--reflink=always" in cmd:
+                raise subprocess.CalledProcessError(1, cmd)
+            return _copy_only(cmd)
+
+        with patch("hostkit.services.dependency_cache_service.subprocess.run", side_effect=run):
+            method = cache_service.restore_node_modules(entry, release, "myapp")
+
+        assert method == "copy"
+        assert calls[-1] == ["chown", "-R", "myapp:myapp", str(release / "node_modules")]
+        restored = release / "node_modules" / "pkg" / "index.js"
+        cached = Path(entry.path) / "pkg" / "index.js"
+        assert restored.read_bytes() == cached.read_bytes()
+        assert restored.stat().st_ino != cached.stat().st_ino
+
+
+_real_run = subprocess.run
+
+
+def _copy_only(cmd):
+    """Execute cp invocations for real and skip chown/chmod."""
+    if cmd[0] == "cp":
+        return _real_run(cmd, check=True, capture_output=True)
+    return subprocess.CompletedProcess(cmd, 0)
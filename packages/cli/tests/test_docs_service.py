@@ -0,0 +1,78 @@
+"""Tests for docs index chunking and syncing."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hostkit.services.docs_service import DocsService
+from hostkit.services.vector_service import VectorServiceError
+
+BODY = "Some explanation of the feature that is long enough to be indexed as a chunk."
+
+CLAUDE_MD = f"""# HostKit
+
+## Deploying
+
+{BODY}
+
+### Rollback
+
+{BODY}
+
+## Databases
+
+{BODY}
+
+### Rollback
+
+{BODY}
+"""
+
+
+@pytest.fixture
+def service():
+    with (
+        patch("hostkit.services.docs_service.get_config"),
+        patch("hostkit.services.docs_service.get_db"),
+    ):
+        yield DocsService()
+
+
+def test_chunk_ids_do_not_depend_on_position(service):
+    """Adding a section must not rename (and re-embed) the chunks after it."""
+    before = {c.id: c.content for c in service._chunk_claude_md(CLAUDE_MD)}
+    edited = CLAUDE_MD.replace("## Deploying", f"## Getting Started\n\n{BODY}\n\n## Deploying")
+    after = {c.id: c.content for c in service._chunk_claude_md(edited)}
+
+    assert set(after) - set(before) == {"claude-md-getting-started"}
+    assert all(after[chunk_id] == content for chunk_id, content in before.items())
+
+
+def test_chunk_ids_are_unique(service):
+    ids = [c.id for c in service._chunk_claude_md(CLAUDE_MD + f"\n## Deploying\n\n{BODY}\n")]
+
+    assert len(ids) == len(set(ids))
+    assert "claude-md-deploying--rollback" in ids
+    assert "claude-md-databases--rollback" in ids
+
+
+def test_index_falls_back_to_ingest_without_sync_endpoint(service, tmp_path):
+    claude_md = tmp_path / "CLAUDE.md"
+    claude_md.write_text(CLAUDE_MD)
+    service.config.data_dir = tmp_path
+    vector = MagicMock()
+    vector.sync_documents.side_effect = VectorServiceError(
+        code="SYNC_UNSUPPORTED", message="Vector service does not support document sync"
+    )
+
+    with (
+        patch("hostkit.services.vector_service.VectorService", return_value=vector),
+        patch.object(DocsService, "_ensure_system_project"),
+        patch.object(DocsService, "_get_claude_md_path", return_value=claude_md),
+        patch.object(DocsService, "_chunk_capabilities", return_value=[]),
+    ):
+        result = service.index_docs()
+
+    assert vector.ingest_text.call_count == result["chunks_total"] == 4
+    assert result["chunks_ingested"] == 4
+    assert result["chunks_errors"] == 0
@@ -0,0 +1,86 @@
+"""Tests for event queries."""
+
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hostkit.database import Database
+from hostkit.services.event_service import EventService, EventServiceError
+
+
+@pytest.fixture
+def db():
+    """Create a temporary database with one project."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "hostkit.db")
+        db.initialize()
+        db.create_project(name="myapp", port=8001)
+        yield db
+
+
+@pytest.fixture
+def service(db):
+    with patch("hostkit.services.event_service.get_db", return_value=db):
+        yield EventService()
+
+
+def test_after_id_pages_through_events(service, db):
+    ids = [
+        db.create_event("myapp", "deploy", "started", f"event {i}", created_by="test")
+        for i in range(7)
+    ]
+
+    seen = []
+    after_id = None
+    while page := service.query("myapp", limit=3, after_id=after_id):
+        seen.extend(e.id for e in page)
+        after_id = page[-1].id
+
+    assert seen == ids[::-1]
+
+    with pytest.raises(EventServiceError):
+        service.query("myapp", after_id=9999)
+
+
+def test_follow_yields_only_new_matching_events(service, db):
+    db.create_event("myapp", "deploy", "started", "before follow")
+
+    def write():
+        db.create_event("myapp", "health", "passed", "other category")
+        db.create_event("myapp", "deploy", "completed", "deploy done")
+
+    writer = threading.Timer(0.2, write)
+    writer.start()
+    followed = list(service.follow("myapp", category="deploy", timeout=0.8, poll_min=0.05))
+    writer.join()
+
+    assert [e.message for e in followed] == ["deploy done"]
+
+
+def test_stats_counts_exact_levels(service, db):
+    for category, level in [
+        ("deploy", "INFO"),
+        ("deploy", "ERROR"),
+        ("health", "ERROR"),
+        ("health", "DEBUG"),
+    ]:
+        db.create_event("myapp", category, "completed", "msg", level=level)
+
+    stats = service.stats("myapp", since="1h")
+
+    assert stats["total_events"] == 4
+    assert stats["by_category"] == {"deploy": 2, "health": 2}
+    assert stats["by_level"] == {"DEBUG": 1, "INFO": 1, "WARNING": 0, "ERROR": 2, "CRITICAL": 0}
+
+
+def test_cleanup_deletes_in_batches(db):
+    for i in range(5):
+        db.create_event("myapp", "deploy", "started", f"event {i}")
+    with db.transaction() as conn:
+        conn.execute("UPDATE events SET created_at = '2000-01-01T00:00:00' WHERE id <= 4")
+
+    assert db.delete_old_events(older_than_days=30, batch_size=2) == 4
+    assert db.count_events("myapp") == 1
@@ -0,0 +1,84 @@
+"""Tests for fleet health checks."""
+
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hostkit.database import Database
+from hostkit.services.health_service import HealthService
+from hostkit.systemd import SystemdClient, UnitState
+
+
+class Handler(BaseHTTPRequestHandler):
+    delay = 0.0
+
+    def do_GET(self):  # noqa: N802
+        time.sleep(self.delay)
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(delay: float) -> ThreadingHTTPServer:
+    handler = type("DelayedHandler", (Handler,), {"delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class RunningUnits(SystemdClient):
+    def _show(self, names):
+        return {
+            name: UnitState(name=name, load_state="loaded", active_state="active") for name in names
+        }
+
+
+@pytest.fixture
+def servers():
+    servers = {"fast": serve(0), "hung-a": serve(3), "hung-b": serve(3)}
+    yield servers
+    for server in servers.values():
+        server.shutdown()
+
+
+@pytest.fixture
+def service(servers):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "hostkit.db")
+        db.initialize()
+        for name, server in servers.items():
+            db.create_project(name=name, port=server.server_address[1])
+        with (
+            patch("hostkit.services.health_service.get_db", return_value=db),
+            patch("hostkit.services.health_service.get_systemd", return_value=RunningUnits()),
+        ):
+            yield HealthService()
+
+
+def test_fleet_check_runs_projects_concurrently(service):
+    report = service.check_fleet(timeout=1)
+
+    by_name = {check.project: check for check in report.checks}
+    assert by_name["fast"].overall == "healthy"
+    assert by_name["hung-a"].overall == "unhealthy"
+    assert by_name["hung-b"].error == "Timeout after 1s"
+    assert report.summary == {"healthy": 1, "degraded": 0, "unhealthy": 2}
+    # Hung projects wait out their deadlines side by side, not one after another
+    assert report.duration_ms < 1900
+
+
+def test_recorded_samples(service):
+    service.record_samples(service.check_fleet(projects=["fast"], timeout=1))
+
+    with service.db.connection() as conn:
+        rows = conn.execute("SELECT project_name, overall, http_status FROM health_samples")
+        assert [tuple(r) for r in rows] == [("fast", "healthy", 200)]
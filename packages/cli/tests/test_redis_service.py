@@ -0,0 +1,119 @@
+"""Tests for the Redis memory profiler."""
+
+import random
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hostkit.config import HostKitConfig
+from hostkit.database import Database
+from hostkit.services.redis_service import RedisService, key_prefix
+
+
+class FakeRedis:
+    """Just enough of a Redis client for profiling: key -> (type, bytes, pttl)."""
+
+    def __init__(self, keys: dict[str, tuple[str, int, int]]) -> None:
+        self.keys = keys
+        self.scan_counts: list[int] = []
+
+    def dbsize(self) -> int:
+        return len(self.keys)
+
+    def scan(self, cursor: int = 0, count: int = 10) -> tuple[int, list[str]]:
+        self.scan_counts.append(count)
+        names = sorted(self.keys)[cursor : cursor + count]
+        next_cursor = cursor + count
+        return (next_cursor if next_cursor < len(self.keys) else 0), names
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    def info(self, section: str) -> dict:
+        return {"used_memory": 123456}
+
+    def close(self) -> None:
+        pass
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis) -> None:
+        self.client = client
+        self.results: list = []
+
+    def memory_usage(self, key: str):
+        self.results.append(self.client.keys[key][1])
+
+    def type(self, key: str):
+        self.results.append(self.client.keys[key][0])
+
+    def pttl(self, key: str):
+        self.results.append(self.client.keys[key][2])
+
+    def execute(self, raise_on_error: bool = True) -> list:
+        return self.results
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "hostkit.db")
+        db.initialize()
+        db.create_project(name="myapp", port=8001, redis_db=3)
+        yield db
+
+
+def profile(db, keys, **kwargs):
+    client = FakeRedis(keys)
+    with (
+        patch("hostkit.services.redis_service.get_config", return_value=HostKitConfig()),
+        patch("hostkit.services.redis_service.get_db", return_value=db),
+        patch.object(RedisService, "_get_connection", return_value=client),
+    ):
+        return RedisService().profile("myapp", **kwargs), client
+
+
+def test_key_prefix():
+    assert key_prefix("session:abc") == "session:*"
+    assert key_prefix("cache:user:1:profile", depth=2) == "cache:user:*"
+    assert key_prefix("cache:user", depth=2) == "cache:*"
+    assert key_prefix("counter") == "(no prefix)"
+
+
+def test_profile_groups_by_prefix_and_flags_problems(db):
+    keys = {f"session:{i}": ("string", 100, -1) for i in range(250)}
+    keys.update({f"cache:{i}": ("hash", 40, 60_000) for i in range(50)})
+    keys["blob:report"] = ("string", 2 * 1024 * 1024, -1)
+
+    result, client = profile(db, keys, scan_count=40)
+
+    # Every key sampled: totals are exact and bounds collapse
+    assert result["scan_complete"] and result["sampled_keys"] == 301
+    assert result["estimated_memory_bytes"] == 250 * 100 + 50 * 40 + 2 * 1024 * 1024
+    assert result["estimated_memory_low"] == result["estimated_memory_high"]
+    assert set(client.scan_counts) == {40}
+
+    rows = {row["prefix"]: row for row in result["prefixes"]}
+    assert rows["session:*"]["keys"] == 250
+    assert rows["session:*"]["no_ttl_pct"] == 100.0
+    assert rows["cache:*"]["types"] == {"hash": 50}
+    assert result["prefixes"][0]["prefix"] == "blob:*"
+    assert [k["key"] for k in result["big_keys"]] == ["blob:report"]
+    assert any(w.startswith("session:*") for w in result["warnings"])
+    assert not any(w.startswith("cache:*") for w in result["warnings"])
+
+
+def test_profile_samples_and_bounds_estimate(db):
+    keys = {f"event:{i}": ("string", 50 + i % 100, 30_000) for i in range(5000)}
+
+    with patch("hostkit.services.redis_service.random.Random", return_value=random.Random(7)):
+        result, _ = profile(db, keys, max_samples=500)
+
+    row = result["prefixes"][0]
+    assert row["keys"] == 5000
+    assert 200 < row["sampled"] < 1000
+    actual = sum(memory for _, memory, _ in keys.values())
+    assert row["memory_low"] < actual < row["memory_high"]
+    assert row["memory_high"] - row["memory_low"] < actual * 0.2
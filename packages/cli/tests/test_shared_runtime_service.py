@@ -0,0 +1,109 @@
+"""Tests for prebuilt shared service runtimes."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hostkit.services.shared_runtime_service import (
+    READY_MARKER,
+    SharedRuntimeError,
+    SharedRuntimeService,
+)
+
+
+class FakeBuilds:
+    """Stand-in for subprocess.run: venv creation makes the venv dir, the rest no-ops."""
+
+    def __init__(self) -> None:
+        self.venvs_created = 0
+        self.fail_venv: Exception | None = None
+
+    def __call__(self, cmd, **kwargs):
+        if cmd[1:3] == ["-m", "venv"]:
+            if self.fail_venv:
+                raise self.fail_venv
+            self.venvs_created += 1
+            (Path(cmd[3]) / "bin").mkdir(parents=True)
+        return subprocess.CompletedProcess(cmd, 0, b"", b"")
+
+
+@pytest.fixture
+def builds():
+    fake = FakeBuilds()
+    with patch("hostkit.services.shared_runtime_service.subprocess.run", side_effect=fake):
+        yield fake
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = SharedRuntimeService(runtimes_dir=tmp_path / "runtimes", homes_dir=tmp_path / "home")
+    service._python_version = "Python 3.11.7"
+    return service
+
+
+@pytest.fixture
+def requirements(tmp_path):
+    path = tmp_path / "template" / "requirements.txt"
+    path.parent.mkdir()
+    path.write_text("fastapi==0.110.0\n")
+    return path
+
+
+def test_runtime_is_built_once_and_reused(service, requirements, builds):
+    first = service.ensure_runtime("auth", requirements)
+    second = service.ensure_runtime("auth", requirements)
+
+    assert builds.venvs_created == 1
+    assert second.path == first.path
+    assert (first.path / READY_MARKER).is_file()
+
+
+def test_link_venv_replaces_project_venv_with_symlink(service, requirements, builds, tmp_path):
+    venv = tmp_path / "home" / "myapp" / ".auth" / "venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / "bin" / "python").write_text("")
+
+    runtime = service.link_venv("auth", requirements, venv)
+
+    assert venv.is_symlink()
+    assert venv.resolve() == runtime.venv_path.resolve()
+
+
+def test_interrupted_build_is_rebuilt(service, requirements, builds):
+    runtime_dir = service.runtime_dir("auth", service.requirements_hash(requirements))
+    (runtime_dir / "venv").mkdir(parents=True)
+    (runtime_dir / "venv" / "partial").write_text("")
+
+    runtime = service.ensure_runtime("auth", requirements)
+
+    assert builds.venvs_created == 1
+    assert not (runtime.venv_path / "partial").exists()
+    assert (runtime_dir / READY_MARKER).is_file()
+
+
+def test_venv_timeout_cleans_up(service, requirements, builds):
+    builds.fail_venv = subprocess.TimeoutExpired(["python3"], 60)
+
+    with pytest.raises(SharedRuntimeError) as exc:
+        service.ensure_runtime("auth", requirements)
+
+    assert exc.value.code == "VENV_CREATE_FAILED"
+    assert list(service.runtimes_dir.glob("auth-*")) == []
+
+
+def test_relinking_prunes_unreferenced_runtimes(service, requirements, builds, tmp_path):
+    homes = tmp_path / "home"
+    old_a = service.link_venv("auth", requirements, homes / "a" / ".auth" / "venv")
+    service.link_venv("auth", requirements, homes / "b" / ".auth" / "venv")
+
+    requirements.write_text("fastapi==0.111.0\n")
+    new = service.link_venv("auth", requirements, homes / "a" / ".auth" / "venv")
+
+    # b still links to the old runtime
+    assert {r.path for r in service.list_runtimes()} == {old_a.path, new.path}
+
+    service.link_venv("auth", requirements, homes / "b" / ".auth" / "venv")
+
+    assert [r.path for r in service.list_runtimes()] == [new.path]
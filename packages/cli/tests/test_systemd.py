@@ -0,0 +1,69 @@
+"""Tests for the systemd state client."""
+
+import subprocess
+from unittest.mock import patch
+
+from hostkit.systemd import SystemdClient, parse_show_output
+
+SHOW_OUTPUT = """Id=hostkit-blog.service
+LoadState=loaded
+ActiveState=active
+SubState=running
+UnitFileState=enabled
+MainPID=4242
+MemoryCurrent=52428800
+CPUUsageNSec=1250000000
+ActiveEnterTimestamp=Sun 2026-10-18 09:12:03 UTC
+
+Id=hostkit-shop.service
+LoadState=loaded
+ActiveState=failed
+SubState=failed
+UnitFileState=disabled
+MainPID=0
+MemoryCurrent=[not set]
+CPUUsageNSec=[not set]
+ActiveEnterTimestamp=
+
+Id=hostkit-gone.service
+LoadState=not-found
+ActiveState=inactive
+SubState=dead
+UnitFileState=
+MainPID=0
+"""
+
+NAMES = ["hostkit-blog.service", "hostkit-shop.service", "hostkit-gone.service"]
+
+
+def test_parse_show_output():
+    units = parse_show_output(SHOW_OUTPUT, NAMES)
+
+    blog = units["hostkit-blog.service"]
+    assert (blog.status, blog.is_enabled, blog.main_pid) == ("running", True, 4242)
+    assert blog.memory_current == 52428800
+    assert blog.cpu_usage_nsec == 1250000000
+    assert blog.active_enter_timestamp == "Sun 2026-10-18 09:12:03 UTC"
+
+    shop = units["hostkit-shop.service"]
+    assert (shop.status, shop.is_active, shop.is_enabled) == ("failed", False, False)
+    assert shop.main_pid is None
+    assert shop.memory_current is None
+    assert shop.active_enter_timestamp is None
+
+    assert not units["hostkit-gone.service"].exists
+
+
+def test_units_are_fetched_once_per_invocation():
+    completed = subprocess.CompletedProcess([], 0, stdout=SHOW_OUTPUT, stderr="")
+    client = SystemdClient()
+
+    with patch("hostkit.systemd.subprocess.run", return_value=completed) as run:
+        client.units(["hostkit-blog", "hostkit-shop", "hostkit-gone"])
+        assert client.unit("hostkit-blog").is_active
+        assert run.call_count == 1
+        assert run.call_args.args[0][-3:] == NAMES
+
+        client.invalidate("hostkit-blog")
+        client.unit("hostkit-blog")
+        assert run.call_count == 2
@@ -0,0 +1,150 @@
+"""Tests for concurrent pre-deployment validation."""
+
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import hostkit.commands.validate as validate
+from hostkit.database import Database
+from hostkit.systemd import SystemdClient, UnitState
+
+
+class FakeSystemd(SystemdClient):
+    """Units are stopped, except the ones listed as active."""
+
+    def __init__(self, active: set[str]) -> None:
+        super().__init__()
+        self.active = active
+
+    def _show(self, names: list[str]) -> dict[str, UnitState]:
+        self.show_calls += 1
+        return {
+            name: UnitState(
+                name=name,
+                load_state="loaded",
+                active_state="active" if name in self.active else "inactive",
+            )
+            for name in names
+        }
+
+
+@pytest.fixture
+def fleet():
+    """Two python projects with homes; shop also has auth enabled."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        db = Database(db_path=root / "hostkit.db")
+        db.initialize()
+        for name, port in (("blog", 8001), ("shop", 8002)):
+            db.create_project(name=name, port=port)
+            home = root / name
+            (home / "app").mkdir(parents=True)
+            (home / "app" / "main.py").write_text("")
+            (home / ".env").write_text(f"PORT={port}\nAUTH_URL=http://127.0.0.1:9001\n")
+        (root / "shop" / ".auth").mkdir()
+
+        systemd = FakeSystemd(active={"hostkit-blog.service"})
+        listeners = {8002: "LISTEN 0 511 0.0.0.0:8002 0.0.0.0:* users:((nginx))"}
+        with (
+            patch.object(validate, "get_db", return_value=db),
+            patch.object(validate, "get_systemd", return_value=systemd),
+            patch.object(validate, "_get_project_home", side_effect=lambda name: root / name),
+            patch.object(validate, "_listening_sockets", return_value=listeners) as sockets,
+        ):
+            yield systemd, sockets
+
+
+def test_validate_all_shares_host_lookups(fleet):
+    systemd, sockets = fleet
+
+    report = validate.validate_all()
+
+    assert report.summary == {"total": 2, "valid": 1, "invalid": 1}
+    blog, shop = report.results
+    assert blog.valid and set(blog.checks_passed) == {name for name, _ in validate.CHECKS}
+    assert [i.category for i in shop.issues] == ["services", "port"]
+    assert set(shop.to_dict()["timings_ms"]) == {name for name, _ in validate.CHECKS}
+
+    # One systemctl show and one ss for the whole fleet
+    assert systemd.show_calls == 1
+    assert sockets.call_count == 1
+
+
+def test_slow_check_times_out_without_holding_up_the_rest(fleet):
+    release = threading.Event()
+
+    def hang(ctx):
+        release.wait(5)
+        return []
+
+    checks = [(name, hang if name == "database" else fn) for name, fn in validate.CHECKS]
+    started = time.monotonic()
+    try:
+        with patch.object(validate, "CHECKS", checks):
+            result = validate.validate_project("blog", timeout=0.2)
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 2
+    assert "database" not in result.checks_passed
+    assert "entrypoint" in result.checks_passed
+    assert [i.message for i in result.issues] == ["Check timed out after 0.2s"]
+    assert result.valid
+
+
+HANGING_VALIDATE = """
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import hostkit.commands.validate as validate
+from hostkit.database import Database
+from hostkit.output import OutputFormatter
+
+root = Path(sys.argv[1])
+db = Database(db_path=root / "hostkit.db")
+db.initialize()
+db.create_project(name="blog", port=8001)
+(root / "blog" / "app").mkdir(parents=True)
+
+def hang(ctx):
+    time.sleep(30)
+    return []
+
+checks = [(name, hang if name == "database" else fn) for name, fn in validate.CHECKS]
+with (
+    patch.object(validate, "CHECKS", checks),
+    patch.object(validate, "get_db", return_value=db),
+    patch.object(validate, "_get_project_home", side_effect=lambda name: root / name),
+    patch.object(validate, "_listening_sockets", return_value={}),
+    patch.object(validate, "require_project_access"),
+):
+    validate.validate.main(
+        ["blog", "--timeout", "0.5"],
+        obj={"formatter": OutputFormatter(json_mode=True), "json_mode": True},
+    )
+"""
+
+
+def test_hung_check_does_not_delay_exit(tmp_path):
+    script = tmp_path / "hang.py"
+    script.write_text(textwrap.dedent(HANGING_VALIDATE))
+
+    started = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, str(script), str(tmp_path)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert time.monotonic() - started < 10
+    assert "Check timed out after 0.5s" in result.stdout
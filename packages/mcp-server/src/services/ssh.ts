@@ -205,6 +205,75 @@ export class SSHManager {
     return output;
   }
 
+  /**
+   * Run a streaming HostKit command (e.g. `events list --follow`) and hand
+   * each line of stdout to onLine as it arrives. Returning false from onLine
+   * closes the stream. Resolves with the exit code once the command ends,
+   * is closed, or timeoutMs passes (the stream is then closed).
+   */
+  async streamHostkit(
+    command: string,
+    onLine: (line: string) => boolean | void,
+    options: { json?: boolean; timeoutMs?: number } = {}
+  ): Promise<number | null> {
+    const config = getConfig();
+    const { json = true, timeoutMs = COMMAND_TIMEOUT } = options;
+    const sshUser = config.project || config.vps.user;
+    const jsonFlag = json ? '--json ' : '';
+    const fullCommand = `sudo hostkit ${jsonFlag}${command}`;
+
+    logger.info(`HostKit stream: ${command}`, { user: sshUser, timeoutMs });
+
+    const client = await getConnection(sshUser);
+
+    return new Promise((resolve, reject) => {
+      client.exec(fullCommand, (err, stream) => {
+        if (err) {
+          reject(err);
+          return;
+        }
+
+        let buffer = '';
+        let closed = false;
+        const stop = () => {
+          if (!closed) {
+            closed = true;
+            stream.close();
+          }
+        };
+        const timeout = setTimeout(stop, timeoutMs);
+
+        stream.on('data', (data: Buffer) => {
+          if (closed) return;
+          buffer += data.toString();
+          let newline = buffer.indexOf('\n');
+          while (newline !== -1) {
+            const line = buffer.slice(0, newline).trim();
+            buffer = buffer.slice(newline + 1);
+            if (line && onLine(line) === false) {
+              stop();
+              return;
+            }
+            newline = buffer.indexOf('\n');
+          }
+        });
+
+        stream.stderr.on('data', (data: Buffer) => {
+          logger.debug('HostKit stream stderr', data.toString());
+        });
+
+        stream.on('close', (code: number | null) => {
+          clearTimeout(timeout);
+          const rest = buffer.trim();
+          if (rest && !closed) {
+            onLine(rest);
+          }
+          resolve(code ?? null);
+        });
+      });
+    });
+  }
+
   /**
    * Close all SSH connections.
    */
@@ -22,6 +22,16 @@ export interface WaitHealthyParams {
   interval?: number;
 }
 
+export interface WatchEventsParams {
+  project: string;
+  category?: string;
+  level?: string;
+  after_id?: number;
+  until?: string[];
+  max_events?: number;
+  timeout?: number;
+}
+
 export interface EnvSetParams {
   project: string;
   variables: Record<string, string>;
@@ -402,6 +412,121 @@ export async function handleWaitHealthy(
   }
 }
 
+/**
+ * Watch a project's events over one `hostkit events list --follow` stream
+ * instead of polling `events list`. Returns when an event with a type in
+ * `until` arrives, after max_events, or at the timeout.
+ */
+export async function handleWatchEvents(
+  params: WatchEventsParams
+): Promise<ToolResponse> {
+  const project = params.project || getProjectContext();
+  const {
+    category,
+    level,
+    after_id,
+    until = [],
+    max_events = 100,
+    timeout = 120000,
+  } = params;
+
+  if (!project) {
+    return {
+      success: false,
+      error: {
+        code: 'MISSING_PROJECT',
+        message: 'Project name is required',
+      },
+    };
+  }
+
+  // Arguments go into a shell command line; only allow plain values
+  if (
+    !/^[a-z0-9-]+$/.test(project) ||
+    (category && !/^[a-z_,]+$/.test(category)) ||
+    (level && !/^[A-Za-z]+$/.test(level)) ||
+    (after_id !== undefined && !Number.isInteger(after_id))
+  ) {
+    return {
+      success: false,
+      error: {
+        code: 'INVALID_ARGUMENT',
+        message: 'project, category, level or after_id has an invalid value',
+      },
+    };
+  }
+
+  const args = [`events list ${project} --follow --timeout ${Math.ceil(timeout / 1000)}`];
+  if (category) args.push(`--category ${category}`);
+  if (level) args.push(`--level ${level}`);
+  if (after_id !== undefined) args.push(`--after-id ${after_id}`);
+
+  logger.info('Watch events request', { project, category, level, after_id, until, timeout });
+
+  const ssh = getSSHManager();
+  const startTime = Date.now();
+  const events: Array<Record<string, unknown>> = [];
+  const other: string[] = [];
+  let matched = null as Record<string, unknown> | null;
+
+  try {
+    const exitCode = await ssh.streamHostkit(
+      args.join(' '),
+      (line) => {
+        let event: Record<string, unknown>;
+        try {
+          event = JSON.parse(line);
+        } catch {
+          other.push(line);
+          return true;
+        }
+        events.push(event);
+        if (until.includes(String(event.event_type))) {
+          matched = event;
+          return false;
+        }
+        return events.length < max_events;
+      },
+      // Let the CLI's own --timeout end the stream; this is a backstop
+      { timeoutMs: timeout + 15000 }
+    );
+
+    if (exitCode && events.length === 0) {
+      return {
+        success: false,
+        error: {
+          code: 'WATCH_EVENTS_ERROR',
+          message: `events list --follow exited with code ${exitCode}`,
+          details: { output: other.join('\n') },
+        },
+      };
+    }
+
+    const lastEvent = events[events.length - 1];
+    return {
+      success: true,
+      data: {
+        events,
+        matched,
+        stopped: matched ? 'matched' : events.length >= max_events ? 'max_events' : 'timeout',
+        // Pass back as after_id to continue watching without gaps
+        last_id: lastEvent ? lastEvent.id : after_id ?? null,
+        elapsed_ms: Date.now() - startTime,
+      },
+    };
+  } catch (error) {
+    logger.error('Watch events failed', error);
+    return {
+      success: false,
+      error: {
+        code: 'WATCH_EVENTS_ERROR',
+        message: error instanceof Error ? error.message : String(error),
+        details: { events_received: events.length },
+      },
+    };
+  }
+}
+
 /**
  * Set environment variables for a project with optional restart.
  */
@@ -14,6 +14,7 @@ import { handleDeployLocal } from './deploy-local.js';
 import {
   handleCapabilities,
   handleWaitHealthy,
+  handleWatchEvents,
   handleEnvSet,
   handleEnvGet,
   handleValidate,
@@ -327,6 +328,49 @@ export const TOOLS: Tool[] = [
       },
     },
   },
+  {
+    name: 'hostkit_watch_events',
+    description:
+      "Watch a project's HostKit events (deploys, health checks, migrations...) as they happen over one stream, instead of polling. Returns when an event with a type in 'until' arrives (e.g. ['completed', 'failed'] to follow a deploy), after max_events, or at the timeout.",
+    inputSchema: {
+      type: 'object' as const,
+      properties: {
+        project: {
+          type: 'string',
+          description: 'Project name. Defaults to HOSTKIT_PROJECT if configured.',
+        },
+        category: {
+          type: 'string',
+          description: 'Only these categories (e.g. deploy, health). Comma-separate for multiple.',
+        },
+        level: {
+          type: 'string',
+          enum: ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+          description: 'Minimum log level',
+        },
+        after_id: {
+          type: 'number',
+          description:
+            'Start after this event id (last_id from a previous call). Default: only new events.',
+        },
+        until: {
+          type: 'array',
+          items: { type: 'string' },
+          description: 'Stop as soon as an event with one of these event types arrives',
+        },
+        max_events: {
+          type: 'number',
+          description: 'Stop after this many events (default: 100)',
+          default: 100,
+        },
+        timeout: {
+          type: 'number',
+          description: 'Maximum wait time in milliseconds (default: 120000 = 2 minutes)',
+          default: 120000,
+        },
+      },
+    },
+  },
   {
     name: 'hostkit_env_set',
     description:
@@ -459,6 +503,10 @@ export async function handleToolCall(
         result = await handleWaitHealthy(args as Parameters<typeof handleWaitHealthy>[0]);
         break;
 
+      case 'hostkit_watch_events':
+        result = await handleWatchEvents(args as Parameters<typeof handleWatchEvents>[0]);
+        break;
+
       case 'hostkit_env_set':
         result = await handleEnvSet(args as Parameters<typeof handleEnvSet>[0]);
         break;
@@ -196,6 +196,16 @@ export interface WaitHealthyParams {
   interval?: number;
 }
 
+export interface WatchEventsParams {
+  project: string;
+  category?: string;
+  level?: string;
+  after_id?: number;
+  until?: string[];
+  max_events?: number;
+  timeout?: number;
+}
+
 export interface EnvSetParams {
   project: string;
   variables: Record<string, string>;